@@ -1,15 +1,11 @@
-import numpy
+import importlib.util
 
-try:
-    from pyscipopt import Model as ScipModel
-except ImportError:
-    pass
+import numpy
 
-try:
-    from gurobipy import Model as GrbModel
-    from gurobipy import GRB
-except ImportError:
-    pass
+# solver interfaces are imported on first use by load_solver()
+ScipModel = None
+GrbModel = None
+GRB = None
 
 ####################################################################################################
 #
@@ -17,11 +13,38 @@ except ImportError:
 #
 ####################################################################################################
 
+def default_solver():
+    '''
+    returns the name of an installed solver ("scip" is preferred) or None if no solver is found;
+    the solver interfaces are not imported
+    '''
+    if importlib.util.find_spec("pyscipopt") is not None:
+        return "scip"
+    if importlib.util.find_spec("gurobipy") is not None:
+        return "gurobi"
+    return None
+
+def load_solver(solver):
+    '''
+    imports the Python interface of a solver if this has not been done yet
+    solver - solver to be used
+    '''
+    global ScipModel, GrbModel, GRB
+
+    if solver == "scip":
+        if ScipModel is None:
+            from pyscipopt import Model as ScipModel
+    elif GrbModel is None:
+        from gurobipy import Model as GrbModel
+        from gurobipy import GRB
+
+
 def create_num_model(solver):
     '''
     creates empty model with low numerical precision
     solver - solver to be used
     '''
+    load_solver(solver)
     if solver == "scip":
         model = ScipModel()
         model.setRealParam("numerics/feastol", 0.0001)
@@ -36,12 +59,31 @@ def create_model(solver):
     creates empty model
     solver - solver to be used
     '''
+    load_solver(solver)
     if solver == "scip":
         return ScipModel()
     return GrbModel();
 
+def copy_model(model, solver):
+    '''
+    returns a copy of a model (that has not been transformed) together with the list of its
+    variables in the order in which they have been created
+    model  - model to be copied
+    solver - solver to be used
+    '''
+    load_solver(solver)
+    if solver == "scip":
+        copy = ScipModel(sourceModel=model, origcopy=True)
+        copy.hideOutput()
+        return copy, copy.getVars()
+
+    copy = model.copy()
+    copy.Params.OutputFlag = 0
+    copy.update()
+    return copy, copy.getVars()
+
 
-def create_var(model, solver, vtype="B", obj=0.0, name="", lb=0.0):
+def create_var(model, solver, vtype="B", obj=0.0, name="", lb=0.0, ub=None):
     '''
     creates variable and adds it to a model
     model  - model to which variable is added
@@ -50,9 +92,11 @@ def create_var(model, solver, vtype="B", obj=0.0, name="", lb=0.0):
     obj    - (optional) objective coefficient
     name   - (optional) variable name
     lb     - (optional) lower bound
+    ub     - (optional) upper bound (None if unbounded or implied by the type)
     '''
     if solver == "scip":
-        return model.addVar(vtype=vtype, obj=obj, name=name, lb=lb)
+        model.freeTransform()
+        return model.addVar(vtype=vtype, obj=obj, name=name, lb=lb, ub=ub)
     else:
         mytype = GRB.BINARY
         if vtype == "I":
@@ -60,7 +104,9 @@ def create_var(model, solver, vtype="B", obj=0.0, name="", lb=0.0):
         elif vtype == "C":
             mytype = GRB.CONTINUOUS
 
-        return model.addVar(vtype=mytype, obj=obj, name=name, lb=lb)
+        if ub is None:
+            return model.addVar(vtype=mytype, obj=obj, name=name, lb=lb)
+        return model.addVar(vtype=mytype, obj=obj, name=name, lb=lb, ub=ub)
 
 def add_cons(model, solver, expr, name):
     '''
@@ -71,6 +117,7 @@ def add_cons(model, solver, expr, name):
     name   - constraint name
     '''
     if solver == "scip":
+        model.freeTransform()
         model.addCons(expr, name=name)
     else:
         model.addConstr(expr, name=name)
@@ -89,6 +136,58 @@ def add_cut(model, solver, expr, name):
     else:
         model.addConstr(expr, name=name)
 
+def fix_var(model, solver, var, value):
+    '''
+    fixes a variable of a model to a value
+    model  - model containing the variable
+    solver - solver to be used
+    var    - variable to be fixed
+    value  - value of the variable
+    '''
+    if solver == "scip":
+        model.freeTransform()
+        model.chgVarLb(var, value)
+        model.chgVarUb(var, value)
+    else:
+        var.LB = value
+        var.UB = value
+
+def remove_conss(model, solver, names):
+    '''
+    removes all constraints with given names from a model
+    model  - model from which constraints are removed
+    solver - solver to be used
+    names  - set of constraint names
+    '''
+    if solver == "scip":
+        model.freeTransform()
+        for cons in model.getConss():
+            if cons.name in names:
+                model.delCons(cons)
+    else:
+        model.update()
+        for cons in model.getConstrs():
+            if cons.ConstrName in names:
+                model.remove(cons)
+
+def add_cons_coeff(model, solver, name, var, coef):
+    '''
+    adds a variable to the linear constraint with a given name
+    model  - model containing the constraint
+    solver - solver to be used
+    name   - constraint name
+    var    - variable to be added
+    coef   - coefficient of the variable
+    '''
+    if solver == "scip":
+        model.freeTransform()
+        for cons in model.getConss():
+            if cons.name == name:
+                model.addConsCoeff(cons, var, coef)
+    else:
+        model.update()
+        model.chgCoeff(model.getConstrByName(name), var, coef)
+
 def set_model_sense(model, solver, sense):
     '''
     sets the objective sense of the model
@@ -118,6 +217,88 @@ def hide_output(model, solver):
     else:
         model.Params.OutputFlag = 0
 
+def set_time_limit(model, solver, timelimit):
+    '''
+    sets the time limit of the next solves of a model
+    model     - model whose time limit is set
+    solver    - solver to be used
+    timelimit - time limit in seconds (None if unlimited)
+    '''
+    if solver == "scip":
+        model.setRealParam("limits/time", 1e20 if timelimit is None else max(timelimit, 0.0))
+    else:
+        model.Params.TimeLimit = GRB.INFINITY if timelimit is None else max(timelimit, 0.0)
+
+def set_mip_gap(model, solver, gap):
+    '''
+    sets the relative gap at which the next solves of a model stop
+    model  - model whose gap is set
+    solver - solver to be used
+    gap    - relative gap (None for the default gap of the solver)
+    '''
+    if solver == "scip":
+        if gap is None:
+            model.resetParam("limits/gap")
+        else:
+            model.setRealParam("limits/gap", gap)
+    else:
+        model.Params.MIPGap = 1e-4 if gap is None else gap
+
+def set_objective_stop(model, solver, value):
+    '''
+    sets the objective value at which the next solves of a maximization model stop as soon as a
+    solution at least as good has been found
+    model  - model whose limit is set
+    solver - solver to be used
+    value  - objective value (None if the solves shall not stop early)
+    '''
+    if solver == "scip":
+        if value is None:
+            model.resetParam("limits/primal")
+        else:
+            model.setRealParam("limits/primal", value)
+    else:
+        model.Params.BestObjStop = GRB.INFINITY if value is None else value
+
+def get_status(model, solver):
+    '''
+    returns "optimal", "timelimit", "interrupted", or "other" depending on why the last solve of a
+    model has stopped
+    model  - model whose status is returned
+    solver - solver to be used
+    '''
+    if solver == "scip":
+        status = model.getStatus()
+        if status in ["optimal", "timelimit"]:
+            return status
+        if status == "userinterrupt":
+            return "interrupted"
+        return "other"
+
+    if model.Status == GRB.OPTIMAL:
+        return "optimal"
+    if model.Status == GRB.TIME_LIMIT:
+        return "timelimit"
+    if model.Status == GRB.INTERRUPTED:
+        return "interrupted"
+    return "other"
+
+def get_incumbent_val(model, solver):
+    '''
+    returns the objective value of the best solution found by the last solve, which need not have
+    been solved to optimality (nan if no solution has been found)
+    model  - model to extract objective value from
+    solver - solver to be used
+    '''
+    if solver == "scip":
+        if model.getNSols() == 0:
+            return numpy.nan
+        return model.getObjVal()
+
+    if model.SolCount == 0:
+        return numpy.nan
+    return model.ObjVal
+
 def update_model(model, solver):
     '''
     update model by previous changes
@@ -138,7 +319,7 @@ def get_obj_val(model, solver):
             return numpy.nan
         return model.getObjVal()
 
-    if model.Status > 2:
+    if model.Status > 2 and model.Status != GRB.USER_OBJ_LIMIT:
         return numpy.nan
     return model.ObjVal
 
@@ -0,0 +1,242 @@
+import numpy
+
+####################################################################################################
+#
+# CHEAP UPDATES OF q BY AN EXPLICIT CONVEX COMBINATION
+#
+####################################################################################################
+#
+# Between fully corrective steps, the packing algorithm moves q on the line segment towards the
+# new cut (or towards 0), which forgets how q is combined from the cuts. The active set instead
+# stores q as an explicit convex combination p = sum_i w_i a_i of atoms a_i (the origin and cuts)
+# and moves p by Frank-Wolfe type steps with exact line search:
+#
+# - a toward step moves p towards the new atom s, i.e., p + t (s - p) with 0 <= t <= 1,
+# - an away step moves p away from an active atom v, i.e., p + t (p - v) with
+#   0 <= t <= w_v / (1 - w_v),
+# - a pairwise step moves weight from v to s, i.e., p + t (s - v) with 0 <= t <= w_v,
+#
+# where v is the active atom of smallest inner product with f - q. Mode "away" performs the toward
+# or away step, whichever promises more progress, and mode "pairwise" performs pairwise steps. In
+# contrast to the line segment steps, weight can be removed from bad cuts, which are dropped from
+# the active set once their weight becomes 0.
+#
+# For down-closed regions, q = min(p, f) is the closest point to f below p, so the steps minimize
+# ||(f - p)_+||^2, which is convex and piecewise quadratic along the step direction; its minimum
+# is computed exactly from the sorted breakpoints. Otherwise, q = p and ||f - p||^2 is minimized.
+
+# modes of updating q between fully corrective steps
+UPDATE_MODES = ["linesegment", "away", "pairwise"]
+
+# atoms whose weight drops below this value are removed from the active set
+ACTIVESET_MINWEIGHT = 1e-12
+
+
+def linesearch_positive_part(residual, direction, tmax):
+    '''
+    returns t in [0, tmax] minimizing ||(residual - t * direction)_+||^2
+    residual  - numpy array
+    direction - numpy array
+    tmax      - maximum step length
+    '''
+    nonzero = direction != 0
+    r = residual[nonzero]
+    d = direction[nonzero]
+
+    # entries with positive part just after t = 0
+    active = (r > 0) | ((r == 0) & (d < 0))
+    slope = numpy.dot(d[active], r[active])
+    curvature = numpy.dot(d[active], d[active])
+
+    # entries leave (d > 0) or enter (d < 0) the positive part at t = r / d
+    events = ((r > 0) & (d > 0)) | ((r < 0) & (d < 0))
+    breakpoints = r[events] / d[events]
+    order = numpy.argsort(breakpoints)
+    breakpoints = breakpoints[order]
+    signs = numpy.where(d[events] > 0, -1.0, 1.0)[order]
+    slopes = slope + numpy.concatenate(([0.0], numpy.cumsum(signs * (d * r)[events][order])))
+    curvatures = curvature + numpy.concatenate(([0.0], numpy.cumsum(signs *
+                                                                    (d * d)[events][order])))
+    lower = numpy.concatenate(([0.0], breakpoints))
+    upper = numpy.concatenate((breakpoints, [numpy.inf]))
+
+    # the derivative -2 (slope - t * curvature) is nondecreasing in t, so the minimum lies on the
+    # first piece at whose end the derivative is nonnegative
+    ends = numpy.flatnonzero(slopes[:-1] <= breakpoints * curvatures[:-1])
+    k = ends[0] if len(ends) > 0 else len(lower) - 1
+
+    # the slope and curvature of the piece are recomputed to avoid cancellation in the sums
+    middle = (lower[k] + upper[k]) / 2 if k < len(breakpoints) else lower[k] + 1
+    active = r - middle * d > 0
+    curvature = numpy.dot(d[active], d[active])
+    if curvature <= 0:
+        return min(lower[k], tmax)
+    t = numpy.dot(d[active], r[active]) / curvature
+    return min(max(t, lower[k]), upper[k], tmax)
+
+
+class ACTIVESET:
+    '''
+    point p given as convex combination of atoms that is updated by toward, away, and pairwise
+    steps (see above); the atoms are stored as rows of a matrix whose capacity is doubled when
+    it is full, and removed atoms are replaced by the last row
+
+    class variables:
+    mode        - "away" or "pairwise"
+    down_closed - whether q = min(p, f) (True) or q = p (False)
+    matrix      - numpy array whose first size rows are the atoms
+    weights     - numpy array whose first size entries are the weights of the atoms
+    size        - number of atoms
+    keys        - list of the atoms as tuples
+    indices     - dictionary mapping atoms (as tuples) to their row
+    point       - p as numpy array
+    ntoward     - number of toward steps
+    naway       - number of away steps
+    npairwise   - number of pairwise steps
+    ndrop       - number of atoms removed since their weight became 0
+    '''
+
+    def __init__(self, mode, down_closed, point):
+        '''
+        initializes the active set by a single atom
+        mode        - "away" or "pairwise"
+        down_closed - whether q = min(p, f) (True) or q = p (False)
+        point       - initial atom, e.g., the origin
+        '''
+        self.mode = mode
+        self.down_closed = down_closed
+        self.ntoward = 0
+        self.naway = 0
+        self.npairwise = 0
+        self.ndrop = 0
+        self.reset([point], [1.0])
+
+    def reset(self, atoms, weights):
+        '''
+        replaces the convex combination, e.g., by the multipliers of a fully corrective step
+        atoms   - list of atoms
+        weights - list of their weights (nonnegative and summing up to 1)
+        '''
+        self.matrix = numpy.zeros((max(len(atoms), 16), len(atoms[0])))
+        self.weights = numpy.zeros(self.matrix.shape[0])
+        self.size = 0
+        self.keys = []
+        self.indices = {}
+        for (atom, weight) in zip(atoms, weights):
+            self.weights[self.get_index(atom)] += max(weight, 0.0)
+        self.prune()
+        self.point = self.weights[:self.size] @ self.matrix[:self.size]
+
+    def get_index(self, atom):
+        '''
+        returns the row of an atom, which is added with weight 0 if it is not contained yet
+        atom - list of values
+        '''
+        key = tuple(atom)
+        if key in self.indices:
+            return self.indices[key]
+
+        if self.size == self.matrix.shape[0]:
+            self.matrix = numpy.concatenate((self.matrix, numpy.zeros_like(self.matrix)))
+            self.weights = numpy.concatenate((self.weights, numpy.zeros_like(self.weights)))
+        self.matrix[self.size] = atom
+        self.weights[self.size] = 0.0
+        self.keys.append(key)
+        self.indices[key] = self.size
+        self.size += 1
+        return self.size - 1
+
+    def prune(self):
+        '''
+        removes atoms of weight below ACTIVESET_MINWEIGHT and rescales the weights to sum up to 1;
+        returns whether an atom has been removed
+        '''
+        removed = numpy.flatnonzero(self.weights[:self.size] < ACTIVESET_MINWEIGHT)
+        for i in removed[::-1]:
+            last = self.size - 1
+            del self.indices[self.keys[i]]
+            if i < last:
+                self.matrix[i] = self.matrix[last]
+                self.weights[i] = self.weights[last]
+                self.keys[i] = self.keys[last]
+                self.indices[self.keys[i]] = i
+            self.keys.pop()
+            self.size -= 1
+
+        self.ndrop += len(removed)
+        self.weights[:self.size] /= self.weights[:self.size].sum()
+        return len(removed) > 0
+
+    def get_q(self, target):
+        '''
+        returns q for a target point f as numpy array
+        target - target point f as numpy array
+        '''
+        if self.down_closed:
+            return numpy.minimum(self.point, target)
+        return self.point.copy()
+
+    def get_step_length(self, residual, direction, tmax):
+        '''
+        returns the step length in [0, tmax] along a direction minimizing the distance of q to f
+        residual  - f - p as numpy array
+        direction - direction of the step as numpy array
+        tmax      - maximum step length
+        '''
+        if self.down_closed:
+            return linesearch_positive_part(residual, direction, tmax)
+
+        curvature = numpy.dot(direction, direction)
+        if curvature <= 0:
+            return 0.0
+        return min(max(numpy.dot(residual, direction) / curvature, 0.0), tmax)
+
+    def step(self, atom, target, toward=False):
+        '''
+        performs a step with toward atom s and returns the new q as numpy array
+        atom   - toward atom s, e.g., a new cut or the origin
+        target - target point f
+        toward - (optional) whether a toward step is enforced
+        '''
+        target = numpy.asarray(target, dtype=numpy.float64)
+        s = self.get_index(atom)
+        residual = target - self.point
+
+        # the negative gradient of the squared distance is 2 (f - q); the away atom has the
+        # smallest inner product with f - q among the other atoms of positive weight
+        descent = numpy.maximum(residual, 0.0) if self.down_closed else residual
+        products = self.matrix[:self.size] @ descent
+        candidates = numpy.where(self.weights[:self.size] > 0, products, numpy.inf)
+        candidates[s] = numpy.inf
+        v = int(numpy.argmin(candidates))
+        if candidates[v] == numpy.inf or toward:
+            v = None
+        pointproduct = numpy.dot(self.point, descent)
+
+        if v is not None and self.mode == "pairwise":
+            direction = self.matrix[s] - self.matrix[v]
+            t = self.get_step_length(residual, direction, self.weights[v])
+            self.weights[s] += t
+            self.weights[v] -= t
+            self.npairwise += 1
+        elif v is not None and pointproduct - products[v] > products[s] - pointproduct and \
+                self.weights[v] < 1:
+            direction = self.point - self.matrix[v]
+            t = self.get_step_length(residual, direction,
+                                     self.weights[v] / (1 - self.weights[v]))
+            self.weights[:self.size] *= 1 + t
+            self.weights[v] -= t
+            self.naway += 1
+        else:
+            direction = self.matrix[s] - self.point
+            t = self.get_step_length(residual, direction, 1.0)
+            self.weights[:self.size] *= 1 - t
+            self.weights[s] += t
+            self.ntoward += 1
+
+        # p is updated along the direction unless atoms have been removed
+        if self.prune():
+            self.point = self.weights[:self.size] @ self.matrix[:self.size]
+        else:
+            self.point = self.point + t * direction
+        return self.get_q(target)
@@ -1,3 +1,13 @@
+import bz2
+import gzip
+import hashlib
+import importlib.util
+import io
+import os
+import signal
+import threading
+import time
+
 import numpy
 
 from MIP import *
@@ -8,32 +18,163 @@ from MIP import *
 #
 ####################################################################################################
 
-def read_graph_from_file(filename):
+def open_instance_file(filename):
     """
-    reads a (possibly) weighted graph in DIMACS format from file
-    filename - path to file encoding instance
+    opens a file for reading bytes; files compressed by gzip or bzip2 are decompressed
+    transparently (detected by their first bytes)
+    filename - path to file
     """
 
-    f = open(filename, "r")
+    f = open(filename, "rb")
+    magic = f.read(3)
+    f.close()
 
-    nodes = []
-    edge_list = []
-    obj = []
+    if magic[:2] == b"\x1f\x8b":
+        return gzip.open(filename, "rb")
+    if magic == b"BZh":
+        return bz2.open(filename, "rb")
+    return open(filename, "rb")
 
-    for line in f:
-        line = line.strip()
-        if line.startswith("p"):
-            nodes = list(range(1, int(line.split(" ")[2]) + 1))
-        if line.startswith("e"):
-            data = line.split(" ")
-            i = int(data[1])
-            j = int(data[2])
-            e = (i, j) if i < j else (j, i)
-            objcoef = 1.0 if len(data) <= 3 else float(data[3])
-            edge_list.append(e)
-            obj.append(objcoef)
+
+def hash_file(filename):
+    """
+    returns the SHA-1 hash of the content of a file (as stored on disk)
+    filename - path to file
+    """
+
+    h = hashlib.sha1()
+    f = open(filename, "rb")
+    for block in iter(lambda: f.read(1 << 20), b""):
+        h.update(block)
+    f.close()
+
+    return h.hexdigest()
+
+
+def parse_graph(data):
+    """
+    parses a (possibly) weighted graph in DIMACS format and returns the number of nodes,
+    an array of edges (i,j) with i < j, and an array of edge weights
+    data - bytes encoding the graph
+    """
+
+    # the problem line has the form "p edge <nnodes> <nedges>"
+    nnodes = 0
+    pos = 0 if data.startswith(b"p") else data.find(b"\np") + 1
+    if pos > 0 or data.startswith(b"p"):
+        end = data.find(b"\n", pos)
+        nnodes = int(data[pos:end if end >= 0 else len(data)].split()[2])
+
+    # fast path: all lines after the first edge line are edges, either all weighted or all
+    # unweighted; the parsed numbers are only accepted if their count matches
+    values = None
+    start = 0 if data.startswith(b"e") else data.find(b"\ne")
+    if start >= 0:
+        body = data[start:].lstrip(b"\n")
+        nedges = body.count(b"\ne") + 1
+        end = body.find(b"\n")
+        nfields = len(body[:end if end >= 0 else len(body)].split())
+        try:
+            numbers = numpy.loadtxt(io.BytesIO(body), comments="c", usecols=range(1, nfields),
+                                    ndmin=2) if nfields in [3, 4] else None
+        except ValueError:
+            numbers = None
+        if numbers is not None and len(numbers) == nedges:
+            values = numpy.ones((nedges, 3))
+            values[:, :nfields - 1] = numbers
+
+    if values is None:
+        elines = [line for line in data.splitlines() if line.startswith(b"e")]
+        if len(elines) == 0:
+            return nnodes, numpy.zeros((0, 2), dtype=numpy.int64), numpy.zeros(0)
+
+        # a default weight of 1 is appended to each line, which is ignored if a weight is given
+        values = numpy.loadtxt(io.BytesIO(b" 1\n".join(elines) + b" 1\n"), usecols=(1, 2, 3),
+                               ndmin=2)
+
+    ends = values[:, :2].astype(numpy.int64)
+    edges = numpy.empty_like(ends)
+    edges[:, 0] = ends.min(axis=1)
+    edges[:, 1] = ends.max(axis=1)
+
+    return nnodes, edges, values[:, 2].copy()
+
+
+def parse_edge_csv(data):
+    """
+    parses a weighted graph given by lines "i,j,w" (the format of the max-cut instances of the
+    Julia code) and returns the number of nodes, an array of edges (i,j) with i < j, and an array
+    of edge weights; as in the Julia code, repeated edges are ignored
+    data - bytes encoding the graph
+    """
+
+    values = numpy.loadtxt(io.BytesIO(data), delimiter=",", ndmin=2)
+    if values.size == 0:
+        return 0, numpy.zeros((0, 2), dtype=numpy.int64), numpy.zeros(0)
+
+    ends = values[:, :2].astype(numpy.int64)
+    edges = numpy.empty_like(ends)
+    edges[:, 0] = ends.min(axis=1)
+    edges[:, 1] = ends.max(axis=1)
+
+    # keep the first occurrence of each edge
+    unique, first = numpy.unique(edges, axis=0, return_index=True)
+    first.sort()
+
+    return int(ends.max()), edges[first], values[first, 2].copy()
+
+
+def read_graph_arrays(filename, cachedir=None):
+    """
+    reads a (possibly) weighted and compressed graph in DIMACS format (or, if the file name ends
+    with .csv, in the format of parse_edge_csv) from file and returns the number of nodes, an
+    array of edges (i,j) with i < j, and an array of edge weights;
+    if a cache directory is given, the arrays are stored there in binary format (keyed by the
+    hash of the file) and memory-mapped when the same file is read again
+    filename - path to file encoding instance
+    cachedir - (optional) directory of binary cache
+    """
+
+    if cachedir is not None:
+        basename = os.path.join(cachedir, hash_file(filename))
+        if os.path.exists(basename + ".meta.npy"):
+            nnodes = int(numpy.load(basename + ".meta.npy")[0])
+            edges = numpy.load(basename + ".edges.npy", mmap_mode="r")
+            weights = numpy.load(basename + ".weights.npy", mmap_mode="r")
+            return nnodes, edges, weights
+
+    f = open_instance_file(filename)
+    if filename.endswith((".csv", ".csv.gz", ".csv.bz2")):
+        nnodes, edges, weights = parse_edge_csv(f.read())
+    else:
+        nnodes, edges, weights = parse_graph(f.read())
     f.close()
 
+    if cachedir is not None:
+        if not os.path.exists(cachedir):
+            os.makedirs(cachedir, exist_ok=True)
+
+        # the meta file is written last and marks complete entries
+        for (ext, arr) in [(".edges.npy", edges), (".weights.npy", weights),
+                           (".meta.npy", numpy.array([nnodes], dtype=numpy.int64))]:
+            write_cache_array(basename, ext, arr)
+
+    return nnodes, edges, weights
+
+
+def read_graph_from_file(filename, cachedir=None):
+    """
+    reads a (possibly) weighted and compressed graph in DIMACS format from file
+    filename - path to file encoding instance
+    cachedir - (optional) directory of binary cache (see read_graph_arrays)
+    """
+
+    nnodes, edges, weights = read_graph_arrays(filename, cachedir)
+
+    nodes = list(range(1, nnodes + 1))
+    edge_list = list(zip(edges[:, 0].tolist(), edges[:, 1].tolist()))
+    obj = weights.tolist()
+
     return nodes, edge_list, obj
 
 
@@ -93,15 +234,34 @@ def compute_node_weights(nodes, edges):
     return obj
 
 
-def get_ub_conss(dim):
+def compute_complement_edges(nodes, edges):
     '''
-    get list of left-hand sides of upper bound constraints for a specified dimension
-    dim - dimension
+    computes the edges [u,v] with u < v of the complement of a graph
+    nodes - list of nodes (assumption: nodes are labeled 1,...,n)
+    edges - list of edges of the graph
+    '''
+    edge_set = set((min(u,v), max(u,v)) for (u,v) in edges)
+
+    counter_edges = []
+    for u in range(1,len(nodes)+1):
+        for v in range(u+1,len(nodes)+1):
+            if not (u,v) in edge_set:
+                counter_edges.append([u,v])
+
+    return counter_edges
+
+
+def get_ub_conss(dim, upper_bounds=None):
+    '''
+    get list of left-hand sides of upper bound constraints x_i / ub_i <= 1 for a specified
+    dimension (the left-hand side of an infinite bound is 0)
+    dim          - dimension
+    upper_bounds - (optional) list of upper bounds ub_i (None if all bounds are 1)
     '''
     conss = []
     for i in range(dim):
         cons = dim * [0]
-        cons[i] = 1
+        cons[i] = 1 if upper_bounds is None else 1 / upper_bounds[i]
         conss.append(cons)
 
     return conss
@@ -139,6 +299,124 @@ def compute_edge_conss(nodes, edge_list):
 
     return conss
 
+####################################################################################################
+#
+# FUNCTIONS RELATED TO LPBOOST DATASETS
+#
+####################################################################################################
+
+# number of samples that are parsed or multiplied at once
+LPBOOST_CHUNKSIZE = 65536
+
+def write_cache_array(basename, ext, arr):
+    """
+    stores an array in a binary cache file; the file is written under a temporary name first, so
+    readers never see incomplete files
+    basename - path of cache entry without extension
+    ext      - extension of the file (e.g., ".labels.npy")
+    arr      - array to store
+    """
+
+    tmpname = "%s%s.%d.tmp" % (basename, ext, os.getpid())
+    tmpfile = open(tmpname, "wb")
+    numpy.save(tmpfile, arr)
+    tmpfile.close()
+    os.replace(tmpname, basename + ext)
+
+
+def read_lpboost_arrays(filename, cachedir=None, float32=False):
+    """
+    reads an LPBoost dataset in the format of the Julia code, i.e., the first line contains the
+    parameter nu and each further line contains a label in {-1,1} followed by the features of a
+    sample (separated by commas), and returns nu, the array of labels, and the (samples,features)
+    array of margins y_i x_ij / max_k |x_kj|, i.e., the values y_i h_j(x_i) of the hypotheses
+    h_j(x) = x_j / max_k |x_kj|;
+    the file is streamed in chunks of LPBOOST_CHUNKSIZE lines; if a cache directory is given, the
+    margins are written to it in binary format (keyed by the hash of the file and the precision)
+    and memory-mapped when the same file is read again
+    filename - path to file encoding dataset
+    cachedir - (optional) directory of binary cache
+    float32  - (optional) whether the margins are stored in single precision
+    """
+
+    dtype = numpy.float32 if float32 else numpy.float64
+    if cachedir is not None:
+        basename = os.path.join(cachedir, "%s.lpboost%d" % (hash_file(filename),
+                                                            8 * numpy.dtype(dtype).itemsize))
+        if os.path.exists(basename + ".meta.npy"):
+            nu = float(numpy.load(basename + ".meta.npy")[0])
+            labels = numpy.load(basename + ".labels.npy", mmap_mode="r")
+            margins = numpy.load(basename + ".margins.npy", mmap_mode="r")
+            return nu, labels, margins
+
+    # the first pass determines the size of the arrays
+    f = open_instance_file(filename)
+    nu = float(f.readline())
+    nsamples = 0
+    nfeatures = 0
+    for line in f:
+        if line.strip():
+            if nsamples == 0:
+                nfeatures = line.count(b",")
+            nsamples += 1
+    f.close()
+
+    # the margins are written directly to the cache (if any) to bound the memory
+    if cachedir is not None:
+        os.makedirs(cachedir, exist_ok=True)
+        tmpname = "%s.margins.npy.%d.tmp" % (basename, os.getpid())
+        margins = numpy.lib.format.open_memmap(tmpname, mode="w+", dtype=dtype,
+                                               shape=(nsamples, nfeatures))
+    else:
+        margins = numpy.empty((nsamples, nfeatures), dtype=dtype)
+    labels = numpy.empty(nsamples)
+    scale = numpy.zeros(nfeatures)
+
+    def store(lines, start):
+        values = numpy.loadtxt(io.BytesIO(b"".join(lines)), delimiter=",", ndmin=2)
+        if values.shape[1] != nfeatures + 1:
+            raise ValueError("samples of %s have different numbers of features" % filename)
+        if not numpy.all(numpy.abs(values[:, 0]) == 1):
+            raise ValueError("labels of %s are not in {-1,1}" % filename)
+
+        stop = start + len(values)
+        labels[start:stop] = values[:, 0]
+        margins[start:stop] = values[:, 1:] * values[:, :1]
+        numpy.maximum(scale, numpy.abs(values[:, 1:]).max(axis=0), out=scale)
+        return stop
+
+    # the second pass parses the samples chunkwise
+    f = open_instance_file(filename)
+    f.readline()
+    lines = []
+    start = 0
+    for line in f:
+        if line.strip():
+            lines.append(line)
+            if len(lines) == LPBOOST_CHUNKSIZE:
+                start = store(lines, start)
+                lines = []
+    if len(lines) > 0:
+        store(lines, start)
+    f.close()
+
+    # scale the hypotheses to [-1,1]
+    scale[scale == 0] = 1
+    for start in range(0, nsamples, LPBOOST_CHUNKSIZE):
+        margins[start:start + LPBOOST_CHUNKSIZE] /= scale
+
+    if cachedir is not None:
+        margins.flush()
+        del margins
+        os.replace(tmpname, basename + ".margins.npy")
+
+        # the meta file is written last and marks complete entries
+        write_cache_array(basename, ".labels.npy", labels)
+        write_cache_array(basename, ".meta.npy", numpy.array([nu]))
+        margins = numpy.load(basename + ".margins.npy", mmap_mode="r")
+
+    return nu, labels, margins
+
 ####################################################################################################
 #
 # FUNCTIONS FOR SETTING UP SEPARATION MODELS
@@ -193,7 +471,7 @@ def matching_create_sepamodel(nodes, edge_list, solver):
     return model, nodevars, edgevars, parvar
 
 
-def stableset_create_sepamodel(nodes, edges, solver):
+def stableset_create_sepamodel(nodes, edges, solver, counter_edges=None):
     """
     Creates an IP model to separate clique inequalities for the stable set polytope.
     To separate a point x, the used model is
@@ -205,24 +483,15 @@ def stableset_create_sepamodel(nodes, edges, solver):
     Note that the objective in the model below is not correct, because it will be adapted
     when a separation candidate is specified.
 
-    nodes  - list of nodes
-    edges  - list of edges of graph (assumption: nodes are labeled 1,...,n)
-    solver - solver used by the separation oracle
+    nodes         - list of nodes
+    edges         - list of edges of graph (assumption: nodes are labeled 1,...,n)
+    solver        - solver used by the separation oracle
+    counter_edges - (optional) list of edges of complement graph if already known
     """
 
     # computes edges of complement graph
-    local_edges = list(edges)
-    for i in range(len(local_edges)):
-        pair = list(local_edges[i])
-        pair.sort()
-        local_edges[i] = pair
-    local_edges.sort()
-
-    counter_edges = []
-    for u in range(1,len(nodes)+1):
-        for v in range(u+1,len(nodes)+1):
-            if not [u,v] in local_edges:
-                counter_edges.append([u,v])
+    if counter_edges is None:
+        counter_edges = compute_complement_edges(nodes, edges)
 
     model = create_model(solver)
 
@@ -284,6 +553,87 @@ def matching_create_model(nodes, edge_list, objcoefs, solver, initconss):
 
     return model, edgevars
 
+def polytope_create_model(objcoefs, solver, initconss, upper_bounds=None):
+    """
+    Creates a superpolytope of an explicit packing polytope, which only consists of nonnegativity
+    and (for initconss >= 1) upper bound constraints; the rows of the matrix are added as cuts.
+    objcoefs     - objective coefficients
+    solver       - solver used to solve relaxation
+    initconss    - {0,1,2} to encode whether no/box/box constraints shall be used
+                   to initialize the superpolytope
+    upper_bounds - (optional) upper bounds 1 / max_i A_ij implied by the matrix (see
+                   POLYTOPE.get_upper_bounds, infinite bounds are omitted); None if all bounds
+                   are 1
+    """
+
+    model = create_model(solver)
+
+    # add variables to the model; box constraints are added as bounds (there may be many)
+    ubs = [None] * len(objcoefs)
+    if initconss >= 1:
+        ubs = [1.0 if upper_bounds is None else
+               (upper_bounds[i] if numpy.isfinite(upper_bounds[i]) else None)
+               for i in range(len(objcoefs))]
+    vars = [create_var(model, solver, vtype="C", obj=objcoefs[i], name="x%d" % i, ub=ubs[i])
+            for i in range(len(objcoefs))]
+
+    set_model_sense(model, solver, 1)
+    hide_output(model, solver)
+    update_model(model, solver)
+
+    return model, vars
+
+def lpboost_create_model(nsamples, nu, solver, initconss):
+    """
+    Creates the initial relaxation of the LPBoost problem max { gamma : gamma + sum_i lambda_i
+    y_i h(x_i) <= 0 for all hypotheses h, 0 <= lambda_i <= 1 / (n nu), sum_i lambda_i = 1 } in the
+    coordinates z = (gamma + 2, n lambda - 1) of LPBOOSTORACLE, which consists of the bounds and
+    the equation sum_i z_i = 0 (and gamma <= 1 to bound the relaxation); the hypotheses are added
+    by the cut loop.
+    nsamples  - number of samples n
+    nu        - parameter nu of LPBoost
+    solver    - solver used to solve relaxation
+    initconss - {0,1,2} to encode whether no/box/box constraints shall be used to initialize
+                the relaxation (not used, the bounds define the problem)
+    """
+
+    model = create_model(solver)
+
+    gammavar = create_var(model, solver, vtype="C", obj=1.0, name="gamma",
+                          lb=-infinity(model, solver), ub=3.0)
+    lambdavars = [create_var(model, solver, vtype="C", obj=0.0, name="lambda%d" % i,
+                             lb=-1.0, ub=1 / nu - 1) for i in range(nsamples)]
+    add_cons(model, solver, sum(lambdavars) == 0, "distribution")
+
+    set_model_sense(model, solver, 1)
+    hide_output(model, solver)
+    update_model(model, solver)
+
+    return model, [gammavar] + lambdavars
+
+def maxcut_create_model(objcoefs, solver, initconss):
+    """
+    Creates a superset of the projection of the elliptope {X psd : X_ii = 1} onto the entries
+    X_ij, i < j, which consists of the bounds -1 <= X_ij (and X_ij <= 1 for initconss >= 1); the
+    eigenvalue cuts are added by the cut loop.
+    objcoefs  - objective coefficients
+    solver    - solver used to solve relaxation
+    initconss - {0,1,2} to encode whether no/box/box constraints shall be used
+                to initialize the superset
+    """
+
+    model = create_model(solver)
+
+    ub = 1.0 if initconss >= 1 else None
+    vars = [create_var(model, solver, vtype="C", obj=objcoefs[i], name="x%d" % i, lb=-1.0, ub=ub)
+            for i in range(len(objcoefs))]
+
+    set_model_sense(model, solver, 1)
+    hide_output(model, solver)
+    update_model(model, solver)
+
+    return model, vars
+
 def stableset_create_model(nodes, edge_list, objcoefs, solver, initconss):
     """
     Creates a superpolytope of the stable set polytope using constraints from a specified list.
@@ -322,14 +672,202 @@ def stableset_create_model(nodes, edge_list, objcoefs, solver, initconss):
 
     return model, nodevars
 
+####################################################################################################
+#
+# TIME LIMITS AND SIGNALS
+#
+####################################################################################################
+
+class DEADLINE:
+    '''
+    wall-clock and CPU time limits of a run, which are measured from the creation of the object
+
+    class variables:
+    timelimit    - wall-clock time limit in seconds (nonpositive if unlimited)
+    cputimelimit - CPU time limit of the process in seconds (nonpositive if unlimited)
+    walltime     - wall-clock time at creation
+    cputime      - CPU time of the process at creation
+    '''
+
+    def __init__(self, timelimit=-1, cputimelimit=-1):
+        '''
+        starts measuring the time
+        timelimit    - (optional) wall-clock time limit in seconds (nonpositive if unlimited)
+        cputimelimit - (optional) CPU time limit in seconds (nonpositive if unlimited)
+        '''
+        self.timelimit = timelimit
+        self.cputimelimit = cputimelimit
+        self.walltime = time.time()
+        self.cputime = time.process_time()
+
+    def get_remaining(self):
+        '''
+        returns the remaining time in seconds until the first limit is reached (None if unlimited)
+        '''
+        remaining = []
+        if self.timelimit > 0:
+            remaining.append(self.timelimit - (time.time() - self.walltime))
+        if self.cputimelimit > 0:
+            remaining.append(self.cputimelimit - (time.process_time() - self.cputime))
+
+        return min(remaining) if len(remaining) > 0 else None
+
+    def get_remaining_limits(self):
+        '''
+        returns the remaining wall-clock and CPU time limits in seconds in the format of the
+        constructor (nonpositive if unlimited, a tiny positive limit if the limit is reached),
+        e.g., to pass them to a subroutine
+        '''
+        timelimit = -1
+        cputimelimit = -1
+        if self.timelimit > 0:
+            timelimit = max(self.timelimit - (time.time() - self.walltime), 1e-6)
+        if self.cputimelimit > 0:
+            cputimelimit = max(self.cputimelimit - (time.process_time() - self.cputime), 1e-6)
+
+        return timelimit, cputimelimit
+
+    def get_status(self):
+        '''
+        returns "timelimit" or "cputimelimit" if the respective limit is reached, otherwise None
+        '''
+        if self.timelimit > 0 and time.time() - self.walltime >= self.timelimit:
+            return "timelimit"
+        if self.cputimelimit > 0 and time.process_time() - self.cputime >= self.cputimelimit:
+            return "cputimelimit"
+        return None
+
+
+class INTERRUPTHANDLER:
+    '''
+    context manager that records SIGINT and SIGTERM instead of terminating the program, such that
+    loops can stop after the current iteration and return their results; a second signal raises
+    KeyboardInterrupt; signals can only be caught in the main thread
+
+    class variables:
+    interrupted - whether a signal has been received
+    handlers    - dictionary of previous handlers of the signals
+    '''
+
+    def __init__(self):
+        '''
+        initializes the handler
+        '''
+        self.interrupted = False
+        self.handlers = {}
+
+    def handle(self, signum, frame):
+        '''
+        records the arrival of a signal
+        '''
+        if self.interrupted:
+            raise KeyboardInterrupt
+        self.interrupted = True
+
+    def __enter__(self):
+        if threading.current_thread() is threading.main_thread():
+            for signum in [signal.SIGINT, signal.SIGTERM]:
+                self.handlers[signum] = signal.signal(signum, self.handle)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        for signum, handler in self.handlers.items():
+            signal.signal(signum, handler)
+        self.handlers = {}
+        return False
+
+
 ####################################################################################################
 #
 # MISCELLANEOUS FUNCTIONS
 #
 ####################################################################################################
 
+# matrices up to this size are decomposed completely by smallest_eigenpair
+LANCZOS_MINSIZE = 60
 
 
+def get_run_suffix(precision, corr_freq, initconss, solver, problemtype, lbopt=-1,
+                   heuristic_freq=0, adaptive_corrective=False, continuation=None,
+                   update="linesegment", cheap_dual=False):
+    '''
+    returns the parameter description of a run of compare.py used in plot titles and log names
+    precision      - precision used in the run
+    corr_freq      - frequency of fully corrective steps
+    initconss      - {0,1,2} to encode which initial constraints are used
+    solver         - solver used in the run
+    problemtype    - type of problem
+    lbopt          - (optional) lower bound on the optimal objective value (negative if unused)
+    heuristic_freq - (optional) frequency of rounding separation candidates (0 if unused)
+    adaptive_corrective - (optional) whether fully corrective steps are scheduled adaptively
+    continuation   - (optional) initial separation tolerance of a precision continuation (None if
+                     unused)
+    update         - (optional) how q is updated between fully corrective steps
+    cheap_dual     - (optional) whether dual bounds are derived from q
+    '''
+    corrfreq = "adaptive" if adaptive_corrective else "%d" % corr_freq
+    suffix = " prec_%f corrfreq_%s initconss_%d solver_%s %s" %\
+        (precision, corrfreq, initconss, solver, problemtype)
+    if lbopt >= 0:
+        suffix += " lbopt_%d" % lbopt
+    if heuristic_freq > 0:
+        suffix += " heurfreq_%d" % heuristic_freq
+    if continuation is not None:
+        suffix += " continuation_%g" % continuation
+    if update != "linesegment":
+        suffix += " update_%s" % update
+    if cheap_dual:
+        suffix += " cheapdual"
+
+    return suffix
+
+def get_run_name(instancefile, precision, corr_freq, initconss, solver, problemtype, lbopt=-1,
+                 heuristic_freq=0, adaptive_corrective=False, continuation=None,
+                 update="linesegment", cheap_dual=False):
+    '''
+    returns the name under which plots and logs of a run of compare.py are stored
+    instancefile   - path to file encoding instance
+    precision      - precision used in the run
+    corr_freq      - frequency of fully corrective steps
+    initconss      - {0,1,2} to encode which initial constraints are used
+    solver         - solver used in the run
+    problemtype    - type of problem
+    lbopt          - (optional) lower bound on the optimal objective value (negative if unused)
+    heuristic_freq - (optional) frequency of rounding separation candidates (0 if unused)
+    adaptive_corrective - (optional) whether fully corrective steps are scheduled adaptively
+    continuation   - (optional) initial separation tolerance of a precision continuation (None if
+                     unused)
+    update         - (optional) how q is updated between fully corrective steps
+    cheap_dual     - (optional) whether dual bounds are derived from q
+    '''
+    suffix = get_run_suffix(precision, corr_freq, initconss, solver, problemtype, lbopt,
+                            heuristic_freq, adaptive_corrective, continuation, update,
+                            cheap_dual)
+
+    return (instancefile.split('/')[-1] + suffix).replace(" ", "_")
+
+def smallest_eigenpair(matrix, start=None):
+    '''
+    returns the smallest eigenvalue of a symmetric matrix and a corresponding unit eigenvector;
+    matrices with more than LANCZOS_MINSIZE rows are handled by the Lanczos method of scipy (if
+    installed), which only needs matrix-vector products and converges quickly if it is started
+    from an approximate eigenvector, e.g., the one of the previous call for a nearby matrix;
+    otherwise, or if the Lanczos method fails, a full decomposition is computed
+    matrix - symmetric (n,n) array
+    start  - (optional) starting vector of the Lanczos method
+    '''
+    if matrix.shape[0] > LANCZOS_MINSIZE and importlib.util.find_spec("scipy") is not None:
+        from scipy.sparse.linalg import eigsh, ArpackError
+
+        try:
+            vals, vecs = eigsh(matrix, k=1, which="SA", v0=start)
+            return vals[0], vecs[:, 0]
+        except ArpackError:
+            pass
+
+    vals, vecs = numpy.linalg.eigh(matrix)
+    return vals[0], vecs[:, 0]
+
 def inner_radius_simplex(dim):
     """
     computes the inner radius of the standard simplex in dimension dim
@@ -355,23 +893,24 @@ def isGE(a, b, precision):
     precision - precision to use
     '''
 
-    if min( list((a[i] - b[i]) for i in range(len(a))) ) >= -precision:
-        return True
-
-    return False
+    return bool(numpy.min(numpy.subtract(a, b)) >= -precision)
 
 def closest_point_linesegment(a, b, target):
     '''
-    computes the point on a line segment that is closest to a target point
+    computes the point on a line segment that is closest to a target point and returns it as
+    numpy array
     a      - first end point of line segment
     b      - second end point of line segment
     target - target vector
     '''
+    a = numpy.asarray(a, dtype=numpy.float64)
+    b = numpy.asarray(b, dtype=numpy.float64)
+    direction = b - a
 
     # compute closest point on line
-    num = sum((b[i] - a[i])*(target[i] - a[i]) for i in range(len(a)))
+    num = numpy.dot(direction, numpy.asarray(target, dtype=numpy.float64) - a)
 
-    denom = sum((b[i] - a[i])**2 for i in range(len(a)))
+    denom = numpy.dot(direction, direction)
 
     # handle the case that a and b are the same
     if denom <= 0.00001:
@@ -379,6 +918,17 @@ def closest_point_linesegment(a, b, target):
 
     alpha = num / denom
 
+    # the closest point is contained on the line segment
+    if alpha <= 1 and alpha >= 0:
+        return (1 - alpha) * a + alpha * b
+
+    # closest point is on the boundary of line segment
+    if alpha > 1:
+        return b
+    return a
+
+    alpha = num / denom
+
     # the closest point is contained on the line segment
     if alpha <= 1 and alpha >= 0:
         return [((1-alpha) * a[i] + alpha * b[i]) for i in range(len(a))]
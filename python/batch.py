@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+from auxiliary import get_run_name
+from resultstore import *
+
+import sys
+import os
+import glob
+import itertools
+import resource
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+####################################################################################################
+#
+# GENERATION AND EXECUTION OF JOBS
+#
+####################################################################################################
+
+
+def read_opt_values(filename):
+    '''
+    reads optimal values of instances from a file containing lines "<instance name> <value>"
+    filename - path to file
+    '''
+    opt_vals = {}
+    f = open(filename, 'r')
+    for line in f:
+        data = line.split()
+        if len(data) >= 2 and not line.startswith("#"):
+            opt_vals[data[0]] = float(data[1])
+    f.close()
+
+    return opt_vals
+
+
+def expand_grid(instances, grid, opt_vals):
+    '''
+    returns list of jobs defined by all combinations of instances and parameter values
+    instances - list of paths to instance files
+    grid      - dictionary mapping job parameters (except instance) to list of values;
+                the value "opt" of lbopt is replaced by the optimal value of the instance
+    opt_vals  - dictionary mapping instance names to optimal values
+    '''
+    params = [p for p in JOB_PARAMETERS if p != "instance"]
+    jobs = []
+
+    for instance in instances:
+        for values in itertools.product(*[grid[p] for p in params]):
+            job = dict(zip(params, values))
+            job["instance"] = instance
+
+            if job["lbopt"] == "opt":
+                name = os.path.basename(instance)
+                if not name in opt_vals:
+                    print("WARNING no optimal value known for %s, skipping job" % name)
+                    continue
+                job["lbopt"] = opt_vals[name]
+
+            jobs.append(normalize_job(job))
+
+    return jobs
+
+
+def parse_output(output):
+    '''
+    extracts statistics of a run from the output of compare.py
+    output - output of compare.py
+    '''
+    keys = {"nDHHWiterations": ("niter", int), "nPrimalDHHWiterations": ("nprimaliter", int),
+            "nDualDHHWiterations": ("ndualiter", int), "DHHWtime": ("dhhwtime", float),
+            "nLPiterations": ("nlpiter", int), "LPtime": ("lptime", float)}
+    result = {}
+
+    for line in output.splitlines():
+        data = line.split()
+        if len(data) == 2 and data[0] in keys:
+            name, conv = keys[data[0]]
+            result[name] = conv(data[1])
+        elif line.startswith("best primal value found by packing algorithm:"):
+            result["primal"] = float(data[-1])
+
+    return result
+
+
+def run_job(job, workdir, timelimit, memlimit):
+    '''
+    runs compare.py for a single job in a separate process and returns its result
+    job       - dictionary containing the values of JOB_PARAMETERS
+    workdir   - directory in which plots and logs are stored
+    timelimit - time limit in seconds (nonpositive if unlimited)
+    memlimit  - memory limit in MB (nonpositive if unlimited)
+    '''
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "compare.py")
+    args = [sys.executable, script, "--file=%s" % job["instance"],
+            "--type=%s" % job["problemtype"], "--precision=%s" % job["precision"],
+            "--maxiter=%d" % job["maxiter"], "--corrfreq=%d" % job["corrfreq"],
+            "--initconss=%d" % job["initconss"], "--solver=%s" % job["solver"]]
+    if job["lbopt"] >= 0:
+        args.append("--lbopt=%s" % job["lbopt"])
+
+    def set_limits():
+        if memlimit > 0:
+            nbytes = int(memlimit) * 1024 * 1024
+            resource.setrlimit(resource.RLIMIT_AS, (nbytes, nbytes))
+
+    starttime = time.time()
+    try:
+        proc = subprocess.run(args, cwd=workdir, stdout=subprocess.PIPE,
+                              stderr=subprocess.STDOUT, universal_newlines=True,
+                              timeout=timelimit if timelimit > 0 else None,
+                              preexec_fn=set_limits)
+        output = proc.stdout
+        returncode = proc.returncode
+        if returncode == 0:
+            status = "done"
+        elif "MemoryError" in output or "std::bad_alloc" in output:
+            status = "memout"
+        else:
+            status = "error"
+    except subprocess.TimeoutExpired as e:
+        # the partial output of a timed out process is not decoded by subprocess
+        output = e.output or ""
+        if isinstance(output, bytes):
+            output = output.decode(errors="replace")
+        returncode = None
+        status = "timeout"
+
+    result = parse_output(output)
+    result["status"] = status
+    result["returncode"] = returncode
+    result["walltime"] = time.time() - starttime
+    result["output"] = output
+    result["logfile"] = os.path.join(workdir, "logs",
+                                     get_run_name(job["instance"], job["precision"],
+                                                  job["corrfreq"], job["initconss"],
+                                                  job["solver"], job["problemtype"],
+                                                  job["lbopt"]) + ".jsonl")
+
+    return result
+
+
+def run_batch(jobs, store, njobs, workdir, timelimit, memlimit):
+    '''
+    runs all jobs that are not finished yet in a pool of processes and stores their results
+    jobs      - list of jobs
+    store     - RESULTSTORE to write results to
+    njobs     - number of jobs run in parallel
+    workdir   - directory in which plots and logs are stored
+    timelimit - time limit per job in seconds (nonpositive if unlimited)
+    memlimit  - memory limit per job in MB (nonpositive if unlimited)
+    '''
+    todo = [job for job in jobs if not store.is_finished(job)]
+    print("%d jobs, %d already finished, %d to run" % (len(jobs), len(jobs) - len(todo), len(todo)))
+
+    # each worker thread only waits for its compare.py process, results are written by main thread
+    with ThreadPoolExecutor(max_workers=njobs) as pool:
+        futures = {pool.submit(run_job, job, workdir, timelimit, memlimit): job for job in todo}
+        cnt = 0
+        for future in as_completed(futures):
+            job = futures[future]
+            result = future.result()
+            store.save_result(job, result)
+            cnt += 1
+            print("[%d/%d] %s %s: %s (%.1fs)" % (cnt, len(todo), os.path.basename(job["instance"]),
+                                                 get_job_key(job), result["status"],
+                                                 result["walltime"]))
+
+
+
+####################################################################################################
+#
+# MAIN METHOD
+#
+####################################################################################################
+
+
+
+if __name__=='__main__':
+
+    # default values of parameters
+    instancedir = ""
+    pattern = "*.col"
+    grid = {"problemtype": ["matching"], "precision": [0.001], "maxiter": [1000],
+            "corrfreq": [1], "initconss": [2], "lbopt": [-1], "solver": ["gurobi"]}
+    optvalsfile = ""
+    dbfile = "results.db"
+    workdir = "."
+    njobs = os.cpu_count() or 1
+    timelimit = -1
+    memlimit = -1
+
+    converters = {"--type": ("problemtype", str), "--precision": ("precision", float),
+                  "--maxiter": ("maxiter", int), "--corrfreq": ("corrfreq", int),
+                  "--initconss": ("initconss", int), "--solver": ("solver", str)}
+
+    # read parameters; grid parameters are given as comma-separated lists
+    for i in range(1, len(sys.argv)):
+        arg = sys.argv[i]
+        key = arg.split('=')[0]
+        if key in converters:
+            name, conv = converters[key]
+            grid[name] = [conv(val) for val in arg.split('=')[1].split(',')]
+        elif key == "--lbopt":
+            grid["lbopt"] = [val if val == "opt" else float(val)
+                             for val in arg.split('=')[1].split(',')]
+        elif key == "--instancedir":
+            instancedir = arg.split('=')[1]
+        elif key == "--pattern":
+            pattern = arg.split('=')[1]
+        elif key == "--optvals":
+            optvalsfile = arg.split('=')[1]
+        elif key == "--db":
+            dbfile = arg.split('=')[1]
+        elif key == "--workdir":
+            workdir = arg.split('=')[1]
+        elif key == "--jobs":
+            njobs = int(arg.split('=')[1])
+        elif key == "--timelimit":
+            timelimit = float(arg.split('=')[1])
+        elif key == "--memlimit":
+            memlimit = float(arg.split('=')[1])
+        else:
+            sys.exit("ERROR unkown argument %s." % arg)
+
+    if instancedir == "":
+        sys.exit("ERROR no instance directory given")
+
+    instances = sorted(os.path.abspath(f) for f in glob.glob(os.path.join(instancedir, pattern)))
+    opt_vals = read_opt_values(optvalsfile) if optvalsfile != "" else {}
+    if "opt" in grid["lbopt"] and optvalsfile == "":
+        sys.exit("ERROR --lbopt=opt requires a file of optimal values (--optvals)")
+
+    store = RESULTSTORE(dbfile)
+    run_batch(expand_grid(instances, grid, opt_vals), store, njobs, workdir, timelimit, memlimit)
+    store.close()
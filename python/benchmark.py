@@ -0,0 +1,438 @@
+#!/usr/bin/env python3
+from oracles import *
+from problems import *
+from auxiliary import *
+from packing_algorithm import *
+from cutloop import *
+from instance import INSTANCE
+from generators import generate_matching_graph, generate_stableset_graph
+from tracing import *
+
+import sys
+import os
+import io
+import json
+import platform
+import contextlib
+import time
+import numpy
+
+####################################################################################################
+#
+# BENCHMARK SUITE
+#
+####################################################################################################
+#
+# Each benchmark is run on generated instances (no files or network access are needed) and
+# reports the minimum and median running time in seconds of its repetitions. Results are written
+# as JSON of the form
+#
+# {"meta": {...}, "results": {<benchmark name>: {"min": ..., "median": ..., "repeat": ...,
+#                                                "params": {...}, ...}}}
+#
+# and can be compared against a baseline created by an earlier run on the same machine. Since
+# running times depend on the machine, no baseline is shipped: running the script with
+# --baseline=<file> for a file that does not exist yet stores the results as that baseline.
+
+# sizes (number of nodes) of the generated instances per suite
+SUITES = {"quick": {"matching": [30, 60], "stableset": [20, 40], "dims": [100, 500],
+                    "maxiter": 20},
+          "full": {"matching": [60, 120, 240], "stableset": [30, 60, 90],
+                   "dims": [100, 1000, 5000], "maxiter": 100}}
+
+
+def generate_instance(problem, n, seed):
+    '''
+    returns an INSTANCE generated for a problem with n nodes (see generators.py)
+    problem - "matching" or "stableset"
+    n       - number of nodes
+    seed    - seed of random generator
+    '''
+    if problem == "matching":
+        nnodes, edges, weights = generate_matching_graph(n, n // 2, 3, seed, False)
+    else:
+        nnodes, edges, weights, optval = generate_stableset_graph(n, max(n // 5, 1), 2 * n, seed)
+
+    return INSTANCE(nnodes, edges + 1, weights, "%s_n%d_s%d" % (problem, n, seed))
+
+
+def measure(func, repeat):
+    '''
+    calls a function repeatedly and returns the minimum and median running time of a call
+    func   - function without arguments
+    repeat - number of calls
+    '''
+    times = []
+    for r in range(repeat):
+        starttime = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - starttime)
+
+    return {"min": min(times), "median": float(numpy.median(times)), "repeat": repeat}
+
+
+def random_points(rng, dim, npoints, scale):
+    '''
+    returns a list of random points in [0,scale]^dim
+    rng     - numpy random generator
+    dim     - dimension
+    npoints - number of points
+    scale   - upper bound on the entries
+    '''
+    return [(scale * rng.random(dim)).tolist() for i in range(npoints)]
+
+
+def bench_separation(problem, n, solver, repeat, seed):
+    '''
+    times separate_point of the oracle of a problem for random points (one call per repetition,
+    cycling through the points); the result also contains the number of separated points
+    '''
+    oracle = ORACLE(generate_instance(problem, n, seed), problem, solver)
+    dim = len(oracle.get_obj())
+    rng = numpy.random.default_rng(seed)
+
+    # points of norm comparable to points generated by the packing algorithm
+    points = random_points(rng, dim, repeat, 2.0 / max(numpy.sqrt(dim), 1))
+    cuts = []
+    calls = iter(points)
+    result = measure(lambda: cuts.append(len(oracle.separate_point(next(calls), 0.0001)) > 0),
+                     repeat)
+    result["params"] = {"nodes": n, "dim": dim}
+    result["nseparated"] = sum(cuts)
+
+    return result
+
+
+def bench_linesegment(dim, repeat, seed):
+    '''
+    times closest_point_linesegment for random points (100 calls per repetition)
+    '''
+    rng = numpy.random.default_rng(seed)
+    a, b, target = random_points(rng, dim, 3, 1.0)
+
+    def run():
+        for i in range(100):
+            closest_point_linesegment(a, b, target)
+
+    result = measure(run, repeat)
+    result["params"] = {"dim": dim, "calls": 100}
+
+    return result
+
+
+def bench_projection(dim, ncons, solver, repeat, seed):
+    '''
+    times CLOSESTPOINTPROJECTION of a random point onto the hull of random points
+    '''
+    rng = numpy.random.default_rng(seed)
+    target = random_points(rng, dim, 1, 1.0)[0]
+    conss = [[0.0] * dim] + random_points(rng, dim, ncons, 1.0)
+
+    result = measure(lambda: CLOSESTPOINTPROJECTION(target, conss, True, solver).solve(), repeat)
+    result["params"] = {"dim": dim, "ncons": ncons}
+
+    return result
+
+
+def bench_verification(problem, n, solver, repeat, seed):
+    '''
+    times solving the relaxation used as verif_model, where a standard cut is added before each
+    solve (as the packing algorithm does after each separated cut)
+    '''
+    instance = generate_instance(problem, n, seed)
+    oracle = ORACLE(instance, problem, solver)
+    verif_model = PROBLEM(instance, problem, solver, 1)
+    cuts = oracle.get_standard_cuts()
+    calls = iter(range(repeat))
+
+    def run():
+        i = next(calls)
+        if len(cuts) > 0:
+            verif_model.add_cut(cuts[i % len(cuts)])
+        verif_model.optimize()
+
+    result = measure(run, repeat)
+    result["params"] = {"nodes": n, "dim": len(oracle.get_obj())}
+
+    return result
+
+
+def bench_packing(problem, n, solver, maxiter, repeat, seed):
+    '''
+    times full runs of packing_algorithm (with the initialization of solve.py)
+    '''
+    instance = generate_instance(problem, n, seed)
+    values = []
+    niter = []
+
+    def run():
+        oracle = ORACLE(instance, problem, solver)
+        obj = oracle.get_obj()
+        gamma = numpy.sqrt(sum(val * val for val in obj)) * oracle.get_inner_radius()
+        verif_model = PROBLEM(instance, problem, solver, 1)
+        initconss = oracle.get_initial_conss(1)
+        stats = {}
+        with contextlib.redirect_stdout(io.StringIO()):
+            res = packing_algorithm(oracle, 0.001, maxiter, -1, gamma, initconss, solver,
+                                    verif_model, stats=stats)
+        values.append(res[0])
+        niter.append(stats["niter"])
+
+    result = measure(run, repeat)
+    result["params"] = {"nodes": n, "maxiter": maxiter}
+    result["value"] = values[-1]
+    result["niter"] = niter[-1]
+
+    return result
+
+
+def bench_continuation(problem, n, solver, maxiter, tolerance, repeat, seed):
+    '''
+    runs packing_algorithm with fixed precision and with a precision continuation starting at a
+    tolerance (repeat times each); the times are the separation times of the continuation runs,
+    and the result also contains the minimum separation time with fixed precision and the saved
+    fraction of the minima
+    '''
+    instance = generate_instance(problem, n, seed)
+    times = {None: [], tolerance: []}
+    values = {}
+
+    for r in range(repeat):
+        for initial in [None, tolerance]:
+            oracle = ORACLE(instance, problem, solver)
+            obj = oracle.get_obj()
+            gamma = numpy.sqrt(sum(val * val for val in obj)) * oracle.get_inner_radius()
+            initconss = oracle.get_initial_conss(1)
+            stats = {}
+            with contextlib.redirect_stdout(io.StringIO()):
+                res = packing_algorithm(oracle, 0.001, maxiter, -1, gamma, initconss, solver,
+                                        PROBLEM(instance, problem, solver, 1), stats=stats,
+                                        continuation=initial)
+            times[initial].append(stats["separation_time"])
+            values[initial] = res[0]
+
+    fixed = min(times[None])
+    continued = min(times[tolerance])
+    result = {"min": continued, "median": float(numpy.median(times[tolerance])),
+              "repeat": repeat}
+    result["params"] = {"nodes": n, "maxiter": maxiter, "tolerance": tolerance}
+    result["fixed_time"] = fixed
+    result["saved"] = 1 - continued / fixed if fixed > 0 else 0.0
+    result["value"] = values[tolerance]
+    result["fixed_value"] = values[None]
+
+    return result
+
+
+def bench_replay(problem, n, solver, maxiter, repeat, seed):
+    '''
+    times runs of packing_algorithm that replay the oracle and verification model responses
+    recorded in a single run (see tracing.py), i.e., only the driver logic is timed
+    '''
+    instance = generate_instance(problem, n, seed)
+    oracle = ORACLE(instance, problem, solver)
+    obj = oracle.get_obj()
+    gamma = numpy.sqrt(sum(val * val for val in obj)) * oracle.get_inner_radius()
+    initconss = oracle.get_initial_conss(1)
+
+    trace = TRACE()
+    with contextlib.redirect_stdout(io.StringIO()):
+        packing_algorithm(RECORDINGORACLE(oracle, trace), 0.001, maxiter, -1, gamma, initconss,
+                          solver, RECORDINGPROBLEM(PROBLEM(instance, problem, solver, 1), trace))
+
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            packing_algorithm(REPLAYORACLE(trace), 0.001, maxiter, -1, gamma, initconss, solver,
+                              REPLAYPROBLEM(trace))
+
+    result = measure(run, repeat)
+    result["params"] = {"nodes": n, "maxiter": maxiter}
+    result["nseparations"] = len(trace.separations)
+
+    return result
+
+
+def bench_cutloop(problem, n, solver, maxiter, repeat, seed):
+    '''
+    times full runs of cut_loop_LP
+    '''
+    instance = generate_instance(problem, n, seed)
+    values = []
+    niter = []
+
+    def run():
+        oracle = ORACLE(instance, problem, solver)
+        lp = PROBLEM(instance, problem, solver, 1)
+        stats = {}
+        with contextlib.redirect_stdout(io.StringIO()):
+            obj_vals = cut_loop_LP(lp, oracle, 0.001, maxiter, stats=stats)
+        values.append(obj_vals[-1])
+        niter.append(stats["niter"])
+
+    result = measure(run, repeat)
+    result["params"] = {"nodes": n, "maxiter": maxiter}
+    result["value"] = values[-1]
+    result["niter"] = niter[-1]
+
+    return result
+
+
+def get_benchmarks(suite, solver, repeat, seed):
+    '''
+    returns list of pairs of names and functions running the benchmarks of a suite
+    suite  - name of suite (see SUITES)
+    solver - solver to be used
+    repeat - number of repetitions of each benchmark
+    seed   - seed of random generator
+    '''
+    sizes = SUITES[suite]
+    maxiter = sizes["maxiter"]
+    benchmarks = []
+
+    for dim in sizes["dims"]:
+        benchmarks.append(("linesegment_d%d" % dim,
+                           lambda dim=dim: bench_linesegment(dim, repeat, seed)))
+        benchmarks.append(("projection_d%d" % dim,
+                           lambda dim=dim: bench_projection(dim, 20, solver, repeat, seed)))
+
+    for problem in ["matching", "stableset"]:
+        for n in sizes[problem]:
+            args = (problem, n, solver)
+            benchmarks.append(("separate_%s_n%d" % (problem, n),
+                               lambda args=args: bench_separation(*args, repeat, seed)))
+            benchmarks.append(("verif_%s_n%d" % (problem, n),
+                               lambda args=args: bench_verification(*args, repeat, seed)))
+            benchmarks.append(("packing_%s_n%d" % (problem, n),
+                               lambda args=args: bench_packing(*args, maxiter, repeat, seed)))
+            benchmarks.append(("continuation_%s_n%d" % (problem, n),
+                               lambda args=args: bench_continuation(*args, maxiter, 0.1, repeat,
+                                                                    seed)))
+            benchmarks.append(("replay_%s_n%d" % (problem, n),
+                               lambda args=args: bench_replay(*args, maxiter, repeat, seed)))
+            benchmarks.append(("cutloop_%s_n%d" % (problem, n),
+                               lambda args=args: bench_cutloop(*args, maxiter, repeat, seed)))
+
+    return benchmarks
+
+
+def run_benchmarks(suite, solver, repeat=5, seed=1, pattern=""):
+    '''
+    runs the benchmarks of a suite and returns the results as dictionary
+    suite   - name of suite (see SUITES)
+    solver  - solver to be used
+    repeat  - (optional) number of repetitions of each benchmark
+    seed    - (optional) seed of random generator
+    pattern - (optional) only benchmarks whose name contains this string are run
+    '''
+    meta = {"suite": suite, "solver": solver, "repeat": repeat, "seed": seed,
+            "python": platform.python_version(), "numpy": numpy.__version__,
+            "machine": platform.node(), "date": time.strftime("%Y-%m-%d %H:%M:%S")}
+    results = {}
+
+    for name, func in get_benchmarks(suite, solver, repeat, seed):
+        if not pattern in name:
+            continue
+        results[name] = func()
+        print("%-30s min %10.6fs  median %10.6fs" % (name, results[name]["min"],
+                                                    results[name]["median"]))
+
+    return {"meta": meta, "results": results}
+
+
+def compare_to_baseline(results, baseline, tolerance):
+    '''
+    compares the minimum running times of benchmarks against a baseline and returns the names
+    of benchmarks that became slower by more than the tolerance
+    results   - results of run_benchmarks
+    baseline  - results of an earlier run of run_benchmarks
+    tolerance - allowed relative slowdown (e.g., 0.25 for 25%)
+    '''
+    regressions = []
+
+    print("%-30s %12s %12s %8s" % ("benchmark", "baseline", "current", "ratio"))
+    for name in results["results"]:
+        if not name in baseline["results"]:
+            continue
+        old = baseline["results"][name]["min"]
+        new = results["results"][name]["min"]
+        ratio = new / old if old > 0 else float("inf")
+        flag = ""
+        if ratio > 1 + tolerance:
+            regressions.append(name)
+            flag = "REGRESSION"
+        print("%-30s %12.6f %12.6f %8.2f %s" % (name, old, new, ratio, flag))
+
+    return regressions
+
+
+
+####################################################################################################
+#
+# MAIN METHOD
+#
+####################################################################################################
+
+
+
+if __name__=='__main__':
+
+    # default values of parameters
+    suite = "quick"
+    solver = None
+    repeat = 5
+    seed = 1
+    pattern = ""
+    outfile = ""
+    baselinefile = ""
+    tolerance = 0.25
+
+    for i in range(1, len(sys.argv)):
+        arg = sys.argv[i]
+        if arg.startswith("--suite"):
+            suite = arg.split('=')[1]
+            if not suite in SUITES:
+                sys.exit("ERROR unkown suite '%s', allowed suites are %s" % (suite,
+                                                                             list(SUITES.keys())))
+        elif arg.startswith("--solver"):
+            solver = arg.split('=')[1]
+        elif arg.startswith("--repeat"):
+            repeat = int(arg.split('=')[1])
+        elif arg.startswith("--seed"):
+            seed = int(arg.split('=')[1])
+        elif arg.startswith("--filter"):
+            pattern = arg.split('=')[1]
+        elif arg.startswith("--output"):
+            outfile = arg.split('=')[1]
+        elif arg.startswith("--baseline"):
+            baselinefile = arg.split('=')[1]
+        elif arg.startswith("--tolerance"):
+            tolerance = float(arg.split('=')[1])
+        else:
+            sys.exit("ERROR unkown argument %s." % arg)
+
+    if solver is None:
+        solver = default_solver()
+        if solver is None:
+            sys.exit("ERROR cannot locate SCIP or Gurobi Python interface")
+
+    results = run_benchmarks(suite, solver, repeat, seed, pattern)
+
+    if outfile != "":
+        f = open(outfile, 'w')
+        json.dump(results, f, indent=2)
+        f.close()
+
+    if baselinefile != "" and not os.path.exists(baselinefile):
+        f = open(baselinefile, 'w')
+        json.dump(results, f, indent=2)
+        f.close()
+        print("stored results as new baseline %s" % baselinefile)
+    elif baselinefile != "":
+        f = open(baselinefile, 'r')
+        baseline = json.load(f)
+        f.close()
+
+        regressions = compare_to_baseline(results, baseline, tolerance)
+        if len(regressions) > 0:
+            sys.exit("ERROR %d benchmarks are slower than the baseline: %s"
+                     % (len(regressions), ", ".join(regressions)))
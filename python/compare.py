@@ -4,12 +4,13 @@ from problems import *
 from auxiliary import *
 from packing_algorithm import *
 from cutloop import *
+from runlog import *
+from solve import *
 
 import sys
 import os
 import math
 import numpy
-import matplotlib.pyplot as plt
 import time
 
 ####################################################################################################
@@ -19,44 +20,37 @@ import time
 ####################################################################################################
 
 
-def compare_primal_dual_LP(dual_bounds_LP, gamma_vals, cuts, cut_rounds, all_f, all_a, r,
-                           problemtype, solver, instancefile, initconss, suffix=""):
+def get_log_progress(writer, names):
+    '''
+    returns a progress function for packing_algorithm or cut_loop_LP that appends the values
+    passed to it after the number of iterations and the elapsed time as row to a log
+    writer - RUNLOGWRITER of the run
+    names  - names of the series of the passed values followed by the one of the elapsed time
+    '''
+    starttime = time.time()
+
+    def progress(niter, *values):
+        writer.add_row(dict(zip(names, list(values) + [time.time() - starttime])))
+        return False
+
+    return progress
+
+def compare_primal_dual_LP(dual_bounds_LP, gamma_vals, dual_bounds, all_f, all_a, r,
+                           instancefile, suffix=""):
     '''
     generate plots to compare the primal/dual progress of our method with the dual values
     of the classical cutting plane loop
     dual_bounds_LP - list containing dual bound of LP loop for each iteration
     gamma_vals     - list of primal bounds of our routine for each iteration
-    cuts           - list of cuts generated by our routine
-    cut_rounds     - list of indices indicating in which round a cut has been generated
+    dual_bounds    - list of dual bounds of our routine for each iteration as recorded
+                     by packing_algorithm
     all_f          - list of target vectors for each iteration
     all_a          - list of dual points for each iteration
     r              - radius of interior ball
-    problemtype    - string specifying the problem type
-    solver         - solver to compute dual bounds of our routine
     instancefile   - path to file encoding instance
-    initconss      - {0,1,2} to encode whether no/box/standard constraints shall be
-                     used to compute dual bounds for our method
     suffix         - (optional) information on instance given in plot title
     '''
-
-    # create problem instance to compute dual bounds for our method
-    problem = PROBLEM(instancefile, problemtype, solver, initconss)
-    dual_bounds = []
-
-    # compute dual bounds after a cut has been added
-    for cut in cuts:
-        problem.add_cut(cut)
-        dual_bounds.append(problem.optimize())
-
-    # generate the dual bounds for each iteration from the cut rounds
-    plot_dual_bounds = [dual_bounds[0]]
-    cut_cnt = 0
-    for i in range(1, len(gamma_vals)):
-        if cut_cnt < len(cut_rounds) and cut_rounds[cut_cnt] == i:
-            cut_cnt += 1
-            plot_dual_bounds.append(dual_bounds[cut_cnt])
-        else:
-            plot_dual_bounds.append(plot_dual_bounds[-1])
+    import matplotlib.pyplot as plt
 
     # compute differences between f and a
     f_diff_a = []
@@ -66,14 +60,14 @@ def compare_primal_dual_LP(dual_bounds_LP, gamma_vals, cuts, cut_rounds, all_f,
                                         if all_f[i][j] - all_a[i][j] > 0 ))))
 
     # compute estimation on difference of f and a
-    est_f_diff_a = [numpy.nan] + [1/(r * numpy.sqrt(t)) for t in range(1,len(plot_dual_bounds))]
+    est_f_diff_a = [numpy.nan] + [1/(r * numpy.sqrt(t)) for t in range(1,len(dual_bounds))]
 
-    x = range(max(len(plot_dual_bounds), len(dual_bounds_LP)))
+    x = range(max(len(dual_bounds), len(dual_bounds_LP)))
 
     # create plot with log-scale
     fig, ax1 = plt.subplots()
 
-    lns = ax1.plot(x[:len(plot_dual_bounds)], plot_dual_bounds, label='dual from A_t')
+    lns = ax1.plot(x[:len(dual_bounds)], dual_bounds, label='dual from A_t')
     lns += ax1.plot(x[:len(gamma_vals)], gamma_vals, label='gamma_t')
     lns += ax1.plot(x[:len(dual_bounds_LP)], dual_bounds_LP, label='dual from LP', color='red')
     try:
@@ -106,7 +100,7 @@ def compare_primal_dual_LP(dual_bounds_LP, gamma_vals, cuts, cut_rounds, all_f,
     # create plot with linear-scale
     fig, ax1 = plt.subplots()
 
-    lns = ax1.plot(x[:len(plot_dual_bounds)], plot_dual_bounds, label='dual from A_t')
+    lns = ax1.plot(x[:len(dual_bounds)], dual_bounds, label='dual from A_t')
     lns += ax1.plot(x[:len(gamma_vals)], gamma_vals, label='gamma_t')
     lns += ax1.plot(x[:len(dual_bounds_LP)], dual_bounds_LP, label='dual from LP', color='red')
 
@@ -122,21 +116,6 @@ def compare_primal_dual_LP(dual_bounds_LP, gamma_vals, cuts, cut_rounds, all_f,
     plotfilename = title.replace(" ", "_")
     plt.savefig("plots/{}.png".format(plotfilename))
 
-    # create logs
-    if not os.path.exists("logs"):
-        os.makedirs("logs")
-    f = open("logs/%s.txt" % plotfilename, 'w')
-    f.write("dualDHHW\n")
-    for val in plot_dual_bounds:
-        f.write("%f " % val)
-    f.write("\nprimalDHHW\n")
-    for val in gamma_vals:
-        f.write("%f " % val)
-    f.write("\ndualLP\n")
-    for val in dual_bounds_LP:
-        f.write("%f " % val)
-    f.close()
-
 
 
 ####################################################################################################
@@ -149,89 +128,67 @@ def compare_primal_dual_LP(dual_bounds_LP, gamma_vals, cuts, cut_rounds, all_f,
 
 if __name__=='__main__':
 
-    # default values of general parameters
-    instancefile = ""
-    problemtype = "matching"
-    precision = 0.0001
-    maxiter = 1000
+    params, unknown = parse_arguments(sys.argv[1:])
+    if len(unknown) > 0:
+        sys.exit("ERROR unkown argument %s." % unknown[0])
 
-    try:
-        import pyscipopt
-        solver = "scip"
-    except ImportError:
-        try:
-            import gurobipy
-            solver = "gurobi"
-        except ImportError:
-            sys.exit("ERROR cannot locate SCIP or Gurobi Python interface")
-
-    silent = True
-    corr_freq = -1
-    initconss = 1
-    lbopt = -1
-
-    allowedtypes = ["matching", "weightmatching", "stableset", "weightstableset"]
-
-    # read instance parameters
-    for i in range(1, len(sys.argv)):
-        arg = sys.argv[i]
-        if arg.startswith("--file"):
-            instancefile = arg.split('=')[1]
-        elif arg.startswith("--type"):
-            problemtype = arg.split('=')[1]
-
-            if not problemtype in allowedtypes:
-                msg = "ERROR unkown type of problem."
-                msg += "Allowed types are {}, but '{}' was given".format(allowedtypes, problemtype)
-                sys.exit(msg)
-
-        elif arg.startswith("--precision"):
-            precision = float(arg.split('=')[1])
-        elif arg.startswith("--maxiter"):
-            maxiter = int(arg.split('=')[1])
-        elif arg.startswith("--solver"):
-            solver = arg.split('=')[1]
-        elif arg.startswith("--nosilent"):
-            silent = False
-        elif arg.startswith("--corrfreq"):
-            corr_freq = int(arg.split('=')[1])
-        elif arg.startswith("--initconss"):
-            initconss = int(arg.split('=')[1])
-        elif arg.startswith("--lbopt"):
-            lbopt = float(arg.split('=')[1])
-        else:
-            sys.exit("ERROR unkown argument %s." % arg)
-
-    # generate instance and solve it
-    OPT = -1
-    oracle = ORACLE(instancefile, problemtype, solver)
-
-    # initialize parameters for our algorithm
-    obj = oracle.get_obj()
-    norm_obj = sum(val * val for val in obj)
-    norm_obj = numpy.sqrt(norm_obj)
-    inner_radius = oracle.get_inner_radius()
-    gamma = norm_obj * inner_radius
-    if lbopt > gamma:
-        gamma = lbopt
-
-    # list of cuts used for the fully corrective step
-    initial_conss = []
-    if initconss >= 1:
-        initial_conss.extend(get_ub_conss(len(obj)))
-    if initconss == 2:
-        initial_conss.extend(oracle.get_standard_cuts())
+    instancefile = params["instancefile"]
+    problemtype = params["problemtype"]
+    precision = params["precision"]
+    maxiter = params["maxiter"]
+    solver = params["solver"]
+    corr_freq = params["corr_freq"]
+    initconss = params["initconss"]
+    lbopt = params["lbopt"]
+    dual_freq = params["dual_freq"] if params["dual_freq"] is not None else 1
 
-    # get results for our algorithm
-    verif_model = PROBLEM(instancefile, problemtype, solver, initconss)
-    OPT, separated_cons, found_solutions, gamma_vals, sepa_rounds, all_f, all_a =\
-        packing_algorithm(oracle, precision, maxiter, corr_freq, gamma,
-                          initial_conss, solver, verif_model, silent=silent)
+    heuristic_freq = params["heuristic_freq"]
+    adaptive_corrective = params["adaptive_corrective"]
 
-    suffix = " prec_%f corrfreq_%d initconss_%d solver_%s %s" %\
-        (precision, corr_freq, initconss, solver, problemtype)
-    if lbopt >= 0:
-        suffix += " lbopt_%d" % lbopt
+    # get results for our algorithm
+    instance = load_instance(instancefile, problemtype, params["cachedir"], params["float32"])
+    oracle = ORACLE(instance, problemtype, solver)
+
+    # the value of the primal heuristics is used as lower bound by both methods
+    if params["heuristics"]:
+        heuristic_value, solution = run_heuristics(oracle)
+        print("HeuristicValue\t%f" % heuristic_value)
+        lbopt = max(lbopt, heuristic_value)
+
+    # cuts and the best primal value of earlier runs are used by both methods (solve() loads the
+    # cuts of the store itself and stores the cuts of the packing algorithm)
+    cutstore = None
+    stored_cuts = []
+    if params["cutstore"] != "":
+        cutstore = CUTSTORE(params["cutstore"])
+        stored_cuts, stored_primal, stored_solution = cutstore.load(instance, problemtype,
+                                                                    oracle.get_obj())
+        print("nStoredCuts\t%d" % len(stored_cuts))
+        lbopt = max(lbopt, stored_primal)
+
+    suffix = get_run_suffix(precision, corr_freq, initconss, solver, problemtype, lbopt,
+                            heuristic_freq, adaptive_corrective, params["continuation"],
+                            params["update"], params["cheap_dual"])
+    runname = get_run_name(instancefile, precision, corr_freq, initconss, solver, problemtype,
+                           lbopt, heuristic_freq, adaptive_corrective, params["continuation"],
+                           params["update"], params["cheap_dual"])
+
+    # the log is written while both methods run, such that the series of a killed run are kept
+    logparams = {"instance": instancefile, "problemtype": problemtype, "precision": precision,
+                 "maxiter": maxiter, "corrfreq": corr_freq, "initconss": initconss,
+                 "lbopt": lbopt, "solver": solver, "dualfreq": dual_freq,
+                 "heuristicfreq": heuristic_freq, "adaptivecorr": adaptive_corrective,
+                 "continuation": params["continuation"], "update": params["update"],
+                 "cheapdual": params["cheap_dual"]}
+    writer = RUNLOGWRITER(os.path.join("logs", runname), logparams)
+
+    # the primal heuristics have already been run, and the plots need f and q of all iterations
+    result = solve(instancefile, problemtype,
+                   dict(params, lbopt=lbopt, dual_freq=dual_freq, heuristics=False,
+                        record_points=True),
+                   oracle=oracle, cutstore=cutstore,
+                   progress=get_log_progress(writer, ["primalDHHW", "dualDHHW", "timeDHHW"]))
+    packing_stats = result["stats"]
 
     # get results for standard LP loop
     LPinitconss = initconss
@@ -239,13 +196,33 @@ if __name__=='__main__':
         # to compute a point in the LP cut loop, we need at least some constraints
         LPinitconss = 1
 
-    problem = PROBLEM(instancefile, problemtype, solver, LPinitconss)
-    lporacle = ORACLE(instancefile, problemtype, solver)
-    dual_bounds_LP = cut_loop_LP(problem, lporacle, precision, maxiter, lbopt=lbopt)
-
-    compare_primal_dual_LP(dual_bounds_LP, gamma_vals, separated_cons, sepa_rounds, all_f, all_a,
-                           oracle.get_inner_radius(), problemtype, solver, instancefile,
-                           initconss, suffix=suffix)
-
-    print("best primal value found by packing algorithm:\t", OPT)
-
+    problem = PROBLEM(instance, problemtype, solver, LPinitconss)
+    LP_stats = {}
+    dual_bounds_LP = cut_loop_LP(problem, oracle, precision, maxiter, lbopt=lbopt, stats=LP_stats,
+                                 timelimit=params["timelimit"],
+                                 cputimelimit=params["cputimelimit"], initial_cuts=stored_cuts,
+                                 continuation=params["continuation"],
+                                 progress=get_log_progress(writer, ["dualLP", "timeLP"]))
+    if cutstore is not None:
+        cutstore.save(instance, problemtype, oracle.get_obj(), LP_stats["cuts"])
+        cutstore.close()
+
+    compare_primal_dual_LP(dual_bounds_LP, result["gamma_vals"], result["dual_bounds"],
+                           result["all_f"], result["all_q"], oracle.get_inner_radius(),
+                           instancefile, suffix=suffix)
+
+    # complete the log by the full series (including the initial values)
+    series = {"dualDHHW": result["dual_bounds"], "primalDHHW": result["gamma_vals"],
+              "dualLP": dual_bounds_LP, "timeDHHW": [0.0] + packing_stats["iteration_times"],
+              "timeLP": LP_stats["iteration_times"]}
+    timing = {"DHHWtime": packing_stats["time"], "LPtime": LP_stats["time"],
+              "nDHHWiterations": packing_stats["niter"], "nLPiterations": LP_stats["niter"],
+              "DHHWseparationTime": packing_stats["separation_time"],
+              "LPseparationTime": LP_stats["separation_time"],
+              "nDHHWlpSolves": packing_stats["nlpsolves"]}
+    for name in series:
+        writer.add_series(name, series[name])
+    writer.add_timing(timing)
+    writer.close()
+
+    print("best primal value found by packing algorithm:\t", result["primal"])
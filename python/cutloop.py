@@ -4,43 +4,107 @@ from problems import *
 import numpy
 import time
 
-def cut_loop_LP(problem, oracle, precision, maxiter, lbopt=-1):
+def cut_loop_LP(problem, oracle, precision, maxiter, lbopt=-1, stats=None, gap=0.0, timelimit=-1,
+                cputimelimit=-1, initial_cuts=None, continuation=None, progress=None):
     '''
     runs standard cut loop to solve an IP
-    problem   - LP relaxation of problem instance
-    oracle    - oracle to generate cuts for problem instance
-    precision - precision used to decide whether violated cuts exist
-    maxiter   - maximum number of iterations of cut loop
-    lbopt     - (optional) lower bound on the optimal objective value
+    problem      - LP relaxation of problem instance
+    oracle       - oracle to generate cuts for problem instance
+    precision    - precision used to decide whether violated cuts exist
+    maxiter      - maximum number of iterations of cut loop
+    lbopt        - (optional) lower bound on the optimal objective value
+    stats        - (optional) dictionary that is filled with statistics of the run
+                   (iteration count, running time, elapsed time after each iteration)
+    gap          - (optional) relative gap between LP value and lbopt at which the loop stops
+    timelimit    - (optional) wall-clock time limit in seconds (nonpositive if unlimited)
+    cputimelimit - (optional) CPU time limit in seconds (nonpositive if unlimited)
+    initial_cuts - (optional) list of cuts known in advance, which are added to problem before
+                   the first iteration
+    continuation - (optional) initial separation tolerance; if it exceeds precision, cuts are
+                   separated with a coarse tolerance that is tightened geometrically as the gap
+                   between the LP value and lbopt closes (see CONTINUATION in oracles.py); None
+                   separates with precision throughout
+    progress     - (optional) function called after each LP solve with the number of iterations
+                   and the LP value; if it returns True, the loop stops with status "interrupted"
+
+    The loop stops after the current iteration if SIGINT or SIGTERM is received, and the
+    separation receives the remaining time. The reason for stopping ("converged", "maxiter",
+    "timelimit", "cputimelimit", "interrupted") is stored in stats["status"] and the separated
+    cuts in stats["cuts"].
     '''
 
     cnt = 0
     obj_vals = []
+    iteration_times = []
+    cuts = []
+    separation = CONTINUATION(precision, continuation)
+
+    for cons in initial_cuts or []:
+        problem.add_cut(cons)
 
     # the cut loop
     starttime = time.time()
-    while cnt < maxiter:
-        cnt += 1
+    deadline = DEADLINE(timelimit, cputimelimit)
+    status = "maxiter"
+    with INTERRUPTHANDLER() as handler:
+        while cnt < maxiter:
 
-        # solve the LP relaxation
-        obj_val = problem.optimize()
-        x = problem.get_opt_solution()
-        obj_vals.append(obj_val)
+            # stop if a signal has been received or a time limit is reached
+            if handler.interrupted:
+                status = "interrupted"
+                break
+            limit = deadline.get_status()
+            if limit is not None:
+                status = limit
+                break
 
-        # separate LP solution
-        cons = oracle.separate_point(x, precision)
+            cnt += 1
 
-        # if not violated cut exists or we have hit the lower bound, break
-        if len(cons) == 0 or isGE([lbopt], [obj_val], precision):
-            break
+            # solve the LP relaxation
+            obj_val = problem.optimize()
+            x = problem.get_opt_solution()
+            obj_vals.append(obj_val)
+            iteration_times.append(time.time() - starttime)
+            if progress is not None and progress(cnt, obj_val):
+                status = "interrupted"
+                break
 
-        # update LP relaxation by separated cut
-        problem.add_cut(cons)
+            # separate LP solution
+            if lbopt > 0:
+                separation.update_gap(obj_val / lbopt - 1)
+            try:
+                cons = separation.separate(oracle, x, deadline)
+            except TimeoutError:
+                status = deadline.get_status() or "timelimit"
+                break
+            except KeyboardInterrupt:
+                status = "interrupted"
+                break
+
+            # if not violated cut exists or we have hit the lower bound, break
+            if len(cons) == 0 or isGE([(1 + gap) * lbopt], [obj_val], precision):
+                status = "converged"
+                break
+
+            # update LP relaxation by separated cut
+            problem.add_cut(cons)
+            cuts.append(cons)
 
     endtime = time.time()
 
     # print statistics
     print("nLPiterations\t%d" % cnt)
     print("LPtime\t%f" % (endtime - starttime))
+    print("LPseparationTime\t%f" % separation.time)
+    print("LPstatus\t%s" % status)
+
+    if stats is not None:
+        stats["niter"] = cnt
+        stats["time"] = endtime - starttime
+        stats["iteration_times"] = iteration_times
+        stats["separation_time"] = separation.time
+        stats["nseparations"] = separation.ncalls
+        stats["status"] = status
+        stats["cuts"] = cuts
 
     return obj_vals
@@ -0,0 +1,279 @@
+from instance import *
+
+import hashlib
+import sqlite3
+import time
+import numpy
+
+
+####################################################################################################
+#
+# PERSISTENT STORE OF CUTS AND SOLUTIONS
+#
+####################################################################################################
+#
+# Cuts and feasible solutions only depend on the feasible region, so they can be reused by all
+# later runs on the same instance. The store keys them by a fingerprint of the parsed instance
+# (see get_fingerprint) and the feasible region of the problem type (see CUT_REGIONS), i.e., a
+# renamed or recompressed file shares the entries of the original file. Since the objective of a
+# run may differ, the best known primal value is stored per objective, and the lower bound of a
+# run is the maximum of this value and the values of the stored solutions.
+#
+# Vectors are stored sparsely as the indices of their nonzero entries and the nonzero values; if
+# all nonzero values are equal (e.g., for degree, odd set, and clique cuts), only one value is
+# stored. The store is an SQLite database, which can be read and written by several processes at
+# the same time. If its size exceeds a limit, the least recently used instances are removed.
+
+# problem types sharing the same feasible region
+CUT_REGIONS = {"matching": "matching", "weightmatching": "matching", "stableset": "stableset",
+               "weightstableset": "stableset", "polytope": "polytope", "maxcut": "maxcut",
+               "lpboost": "lpboost"}
+
+# default size limit of the store in bytes (sum of the sizes of the encoded vectors)
+CUTSTORE_MAXSIZE = 1 << 28
+
+
+def get_fingerprint(instance):
+    '''
+    returns the SHA-1 hash of the parsed data of an instance (the graph returned by
+    read_graph_arrays, the matrix and objective of a polytope, or the margins of a dataset);
+    the hash is computed once per instance
+    instance - INSTANCE, POLYTOPE, or DATASET
+    '''
+    if "fingerprint" in instance.cache:
+        return instance.cache["fingerprint"]
+
+    h = hashlib.sha1()
+    if isinstance(instance, INSTANCE):
+        h.update(b"graph")
+        h.update(numpy.array([instance.nnodes], dtype=numpy.int64).tobytes())
+        h.update(numpy.ascontiguousarray(instance.get_edge_array(), dtype=numpy.int64).tobytes())
+        h.update(numpy.ascontiguousarray(instance.get_weight_array(),
+                                         dtype=numpy.float64).tobytes())
+    elif isinstance(instance, POLYTOPE):
+        h.update(b"polytope")
+        for arr in [instance.indptr, instance.indices, instance.data, instance.obj]:
+            h.update(numpy.asarray(arr).tobytes())
+    else:
+        h.update(b"dataset")
+        h.update(numpy.array([instance.nu], dtype=numpy.float64).tobytes())
+        for start in range(0, instance.nsamples, LPBOOST_CHUNKSIZE):
+            h.update(numpy.ascontiguousarray(instance.margins[start:start + LPBOOST_CHUNKSIZE],
+                                             dtype=numpy.float64).tobytes())
+
+    instance.cache["fingerprint"] = h.hexdigest()
+    return instance.cache["fingerprint"]
+
+
+def get_vector_key(vector):
+    '''
+    returns the SHA-1 hash identifying a vector
+    vector - list of values
+    '''
+    return hashlib.sha1(numpy.asarray(vector, dtype=numpy.float64).tobytes()).hexdigest()
+
+
+def encode_vector(vector):
+    '''
+    returns the indices (as uint32) and values (as float64) of the nonzero entries of a vector as
+    bytes; if all nonzero values are equal, only one value is returned
+    vector - list of values
+    '''
+    arr = numpy.asarray(vector, dtype=numpy.float64)
+    indices = numpy.flatnonzero(arr)
+    values = arr[indices]
+    if len(values) > 0 and numpy.all(values == values[0]):
+        values = values[:1]
+
+    return indices.astype(numpy.uint32).tobytes(), values.tobytes()
+
+
+def decode_vector(indices, values, nvars):
+    '''
+    returns the vector encoded by encode_vector as list
+    indices - bytes encoding the indices of the nonzero entries
+    values  - bytes encoding the nonzero values
+    nvars   - length of the vector
+    '''
+    arr = numpy.zeros(nvars)
+    arr[numpy.frombuffer(indices, dtype=numpy.uint32)] = numpy.frombuffer(values,
+                                                                          dtype=numpy.float64)
+    return arr.tolist()
+
+
+class CUTSTORE:
+    '''
+    SQLite based store of cuts, solutions, and primal values of instances (see above); each
+    thread has to use its own store object
+
+    class variables:
+    filename   - path to database file
+    maxsize    - size limit of the store in bytes
+    connection - connection to database
+    '''
+
+    def __init__(self, filename, maxsize=CUTSTORE_MAXSIZE):
+        '''
+        opens (and possibly creates) the store
+        filename - path to database file
+        maxsize  - (optional) size limit of the store in bytes
+        '''
+        self.filename = filename
+        self.maxsize = maxsize
+
+        # transactions are started explicitly; writers wait for each other
+        self.connection = sqlite3.connect(filename, timeout=60, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+
+        self.connection.execute("BEGIN IMMEDIATE")
+        self.connection.execute("CREATE TABLE IF NOT EXISTS instances (fingerprint TEXT, "
+                                "region TEXT, nvars INTEGER, size INTEGER, lastused REAL, "
+                                "PRIMARY KEY (fingerprint, region))")
+        for table in ["cuts", "solutions"]:
+            self.connection.execute("CREATE TABLE IF NOT EXISTS %s (fingerprint TEXT, "
+                                    "region TEXT, vectorkey TEXT, indices BLOB, vals BLOB, "
+                                    "PRIMARY KEY (fingerprint, region, vectorkey))" % table)
+        self.connection.execute("CREATE TABLE IF NOT EXISTS primals (fingerprint TEXT, "
+                                "region TEXT, objkey TEXT, value REAL, "
+                                "PRIMARY KEY (fingerprint, region, objkey))")
+        self.connection.execute("COMMIT")
+
+    def close(self):
+        '''
+        closes the connection to the database
+        '''
+        self.connection.close()
+
+    def load(self, instance, problemtype, obj):
+        '''
+        returns the stored cuts (with right-hand side 1), the best known primal value for an
+        objective (-1 if unknown), and a stored solution attaining it (None if the value is not
+        attained by a stored solution); marks the instance as recently used
+        instance    - INSTANCE, POLYTOPE, or DATASET
+        problemtype - type of problem
+        obj         - objective vector
+        '''
+        key = (get_fingerprint(instance), CUT_REGIONS[problemtype])
+        nvars = len(obj)
+
+        cuts = [decode_vector(indices, values, nvars) for (indices, values) in
+                self.connection.execute("SELECT indices, vals FROM cuts WHERE fingerprint = ? "
+                                        "AND region = ?", key)]
+        solutions = [decode_vector(indices, values, nvars) for (indices, values) in
+                     self.connection.execute("SELECT indices, vals FROM solutions WHERE "
+                                             "fingerprint = ? AND region = ?", key)]
+        row = self.connection.execute("SELECT value FROM primals WHERE fingerprint = ? AND "
+                                      "region = ? AND objkey = ?",
+                                      key + (get_vector_key(obj),)).fetchone()
+        self.connection.execute("UPDATE instances SET lastused = ? WHERE fingerprint = ? AND "
+                                "region = ?", (time.time(),) + key)
+
+        primal = -1
+        solution = None
+        if len(solutions) > 0:
+            values = numpy.asarray(solutions) @ numpy.asarray(obj, dtype=numpy.float64)
+            best = int(numpy.argmax(values))
+            if values[best] > 0:
+                primal = values[best]
+                solution = solutions[best]
+        if row is not None and row[0] > primal:
+            primal = row[0]
+            solution = None
+
+        return cuts, primal, solution
+
+    def save(self, instance, problemtype, obj, cuts, primal=-1, solutions=()):
+        '''
+        adds cuts and solutions of a run to the store (vectors that are already stored and the
+        origin are skipped) and updates the best known primal value of the objective; afterwards,
+        the least recently used instances are removed while the store exceeds its size limit
+        instance    - INSTANCE, POLYTOPE, or DATASET
+        problemtype - type of problem
+        obj         - objective vector
+        cuts        - list of cuts (with right-hand side 1) valid for the feasible region
+        primal      - (optional) primal value of a feasible solution for obj
+        solutions   - (optional) list of feasible solutions
+        '''
+        key = (get_fingerprint(instance), CUT_REGIONS[problemtype])
+
+        self.connection.execute("BEGIN IMMEDIATE")
+        try:
+            self.add_entries(key, obj, cuts, primal, solutions)
+            self.evict()
+        except:
+            self.connection.execute("ROLLBACK")
+            raise
+        self.connection.execute("COMMIT")
+
+    def add_entries(self, key, obj, cuts, primal, solutions):
+        '''
+        adds the cuts, solutions, and primal value of save() to the store (must be called within
+        a transaction)
+        key       - pair of fingerprint and region of the instance
+        obj       - objective vector
+        cuts      - list of cuts
+        primal    - primal value for obj
+        solutions - list of feasible solutions
+        '''
+        size = 0
+        for (table, vectors) in [("cuts", cuts), ("solutions", solutions)]:
+            for vector in vectors:
+                indices, values = encode_vector(vector)
+                if len(values) == 0:
+                    continue
+                cursor = self.connection.execute("INSERT OR IGNORE INTO %s VALUES (?, ?, ?, ?, ?)"
+                                                 % table, key + (get_vector_key(vector), indices,
+                                                                 values))
+                if cursor.rowcount > 0:
+                    size += len(indices) + len(values)
+
+        if primal > 0:
+            objkey = get_vector_key(obj)
+            row = self.connection.execute("SELECT value FROM primals WHERE fingerprint = ? AND "
+                                          "region = ? AND objkey = ?", key + (objkey,)).fetchone()
+            if row is None or row[0] < primal:
+                self.connection.execute("INSERT OR REPLACE INTO primals VALUES (?, ?, ?, ?)",
+                                        key + (objkey, float(primal)))
+
+        row = self.connection.execute("SELECT size FROM instances WHERE fingerprint = ? AND "
+                                      "region = ?", key).fetchone()
+        self.connection.execute("INSERT OR REPLACE INTO instances VALUES (?, ?, ?, ?, ?)",
+                                key + (len(obj), size + (row[0] if row is not None else 0),
+                                       time.time()))
+
+    def evict(self):
+        '''
+        removes the least recently used instances while the store exceeds its size limit; the
+        most recently used instance is kept (must be called within a transaction)
+        '''
+        total = self.connection.execute("SELECT COALESCE(SUM(size), 0) FROM instances")\
+                               .fetchone()[0]
+        if total <= self.maxsize:
+            return
+
+        rows = self.connection.execute("SELECT fingerprint, region, size FROM instances "
+                                       "ORDER BY lastused").fetchall()
+        for (fingerprint, region, size) in rows[:-1]:
+            if total <= self.maxsize:
+                break
+            for table in ["instances", "cuts", "solutions", "primals"]:
+                self.connection.execute("DELETE FROM %s WHERE fingerprint = ? AND region = ?"
+                                        % table, (fingerprint, region))
+            total -= size
+
+    def get_sizes(self):
+        '''
+        returns a dictionary mapping (fingerprint, region) of each stored instance to its number
+        of cuts, number of solutions, and size in bytes
+        '''
+        sizes = {}
+        for (fingerprint, region, size) in self.connection.execute(
+                "SELECT fingerprint, region, size FROM instances"):
+            key = (fingerprint, region)
+            ncuts = self.connection.execute("SELECT COUNT(*) FROM cuts WHERE fingerprint = ? AND "
+                                            "region = ?", key).fetchone()[0]
+            nsolutions = self.connection.execute("SELECT COUNT(*) FROM solutions WHERE "
+                                                 "fingerprint = ? AND region = ?",
+                                                 key).fetchone()[0]
+            sizes[key] = (ncuts, nsolutions, size)
+        return sizes
@@ -0,0 +1,245 @@
+from oracles import ORACLE
+from instance import *
+from solve import solve, get_solve_params
+
+import io
+import os
+import time
+import contextlib
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy
+
+####################################################################################################
+#
+# DECOMPOSITION OF GRAPH INSTANCES INTO CONNECTED COMPONENTS
+#
+####################################################################################################
+#
+# The matching and stable set polytopes of a graph are the products of the polytopes of its
+# connected components. Hence, each component (or a group of small components) can be solved
+# independently: the sum of the primal values is a primal value of the whole instance, the sum
+# of the dual bounds is a dual bound, and cuts of a group are valid for the whole instance after
+# padding them with zeros.
+
+
+def connected_components(nnodes, edges):
+    '''
+    returns an array containing for each node the smallest node of its connected component
+    (computed by hooking and pointer jumping)
+    nnodes - number of nodes (labeled 0,...,nnodes-1)
+    edges  - (m,2) array of edges
+    '''
+    labels = numpy.arange(nnodes)
+    u = edges[:, 0]
+    v = edges[:, 1]
+
+    while True:
+        # hook the root of the larger label to the smaller label
+        lu = labels[u]
+        lv = labels[v]
+        smaller = numpy.minimum(lu, lv)
+        hooked = labels.copy()
+        numpy.minimum.at(hooked, lu, smaller)
+        numpy.minimum.at(hooked, lv, smaller)
+
+        # pointer jumping until each node points to a root
+        while True:
+            jumped = hooked[hooked]
+            if numpy.array_equal(jumped, hooked):
+                break
+            hooked = jumped
+
+        if numpy.array_equal(hooked, labels):
+            return labels
+        labels = hooked
+
+
+def group_components(sizes, min_group_size):
+    '''
+    returns a list of groups of components, where small components are combined such that each
+    group (except possibly the last one) has at least min_group_size variables
+    sizes          - list of numbers of variables of components
+    min_group_size - minimum number of variables of a group
+    '''
+    groups = []
+    current = []
+    cursize = 0
+
+    # largest components first, such that the expensive groups are started first
+    for comp in sorted(range(len(sizes)), key=lambda c: -sizes[c]):
+        current.append(comp)
+        cursize += sizes[comp]
+        if cursize >= min_group_size:
+            groups.append(current)
+            current = []
+            cursize = 0
+
+    if len(current) > 0:
+        groups.append(current)
+
+    return groups
+
+
+def decompose_instance(instance, problemtype, min_group_size=1):
+    '''
+    splits an instance into groups of connected components and returns a list of pairs of
+    sub-instances and the indices of the variables of the original instance that correspond to
+    the variables of the sub-instance (edges for matching, nodes for stable set problems);
+    components without variables (isolated nodes of matching problems) are dropped
+    instance       - INSTANCE to be decomposed
+    problemtype    - type of problem
+    min_group_size - (optional) minimum number of variables of a group of components
+    '''
+    matching = problemtype in ["matching", "weightmatching"]
+    n = instance.nnodes
+    edges = instance.get_edge_array() - 1
+    labels = connected_components(n, edges)
+    edgelabels = labels[edges[:, 0]]
+
+    # objective of the variables of the original instance
+    if matching:
+        obj = numpy.asarray(instance.get_weight_array(), dtype=numpy.float64)
+        varlabels = edgelabels
+    else:
+        # node objectives are taken from the edge weights, which may be fewer than the nodes (only
+        # weighted problems can be solved then, whose objective is derived from the graph)
+        nodeobj = instance.get_node_obj()
+        obj = numpy.zeros(n)
+        obj[:len(nodeobj)] = nodeobj
+        varlabels = labels
+
+    roots, varcomp = numpy.unique(varlabels, return_inverse=True)
+    if len(roots) == 0:
+        return []
+    sizes = numpy.bincount(varcomp).tolist()
+
+    # component of each node and each edge (-1 if the component has no variables)
+    compindex = numpy.full(n, -1, dtype=numpy.int64)
+    compindex[roots] = numpy.arange(len(roots))
+    nodecomp = compindex[labels]
+    edgecomp = compindex[edgelabels]
+
+    subinstances = []
+    for group in group_components(sizes, min_group_size):
+        ingroup = numpy.zeros(len(roots), dtype=bool)
+        ingroup[group] = True
+
+        # relabel the nodes of the group by 1,...,k
+        groupnodes = numpy.nonzero((nodecomp >= 0) & ingroup[nodecomp])[0]
+        newlabel = numpy.zeros(n, dtype=numpy.int64)
+        newlabel[groupnodes] = numpy.arange(1, len(groupnodes) + 1)
+        groupedges = numpy.nonzero((edgecomp >= 0) & ingroup[edgecomp])[0]
+
+        variables = groupedges if matching else groupnodes
+        name = "%s[%d]" % (instance.filename, len(subinstances))
+        subinstances.append((INSTANCE(len(groupnodes), newlabel[edges[groupedges]],
+                                      obj[variables], name), variables))
+
+    return subinstances
+
+
+def solve_group(subinstance, problemtype, params, deadline=-1):
+    '''
+    solves a group of components by the packing algorithm and returns its primal value, best
+    solution, cuts (without the zero vector), dual bound (nan if not tracked), and statistics;
+    the output of the algorithm is suppressed; groups that start after the deadline (wall-clock
+    time, nonpositive if unlimited) return the zero solution, and the time limit of params is
+    replaced by the remaining time
+    '''
+    if deadline > 0 and time.time() >= deadline:
+        matching = problemtype in ["matching", "weightmatching"]
+        dim = len(subinstance.get_edge_array()) if matching else subinstance.nnodes
+        return 0.0, [0.0] * dim, [], numpy.nan, {"niter": 0, "status": "timelimit"}
+
+    # groups with zero objective (e.g., isolated nodes of weighted stable set problems) are trivial
+    oracle = ORACLE(subinstance, problemtype, params["solver"])
+    if max(abs(val) for val in oracle.get_obj()) == 0:
+        return 0.0, [0.0] * len(oracle.get_obj()), [], 0.0, {"niter": 0, "status": "converged"}
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        timelimit = max(deadline - time.time(), 1e-6) if deadline > 0 else -1
+        result = solve(subinstance, problemtype, dict(params, timelimit=timelimit),
+                       oracle=oracle)
+
+    # the primal value is attained by the last solution found (if any)
+    solution = result["solutions"][-1] if len(result["solutions"]) > 0 else None
+    dual = result["dual_bounds"][-1] if len(result["dual_bounds"]) > 0 else numpy.nan
+
+    return result["primal"], solution, result["cuts"][1:], dual, result["stats"]
+
+
+def solve_decomposed(instancefile, problemtype, params=None, njobs=None, min_group_size=100):
+    '''
+    solves each group of connected components of a graph instance by the packing algorithm in a
+    pool of processes and returns a dictionary containing the combined results
+    instancefile   - path to file encoding instance or INSTANCE
+    problemtype    - type of problem (one of the graph problems)
+    params         - (optional) dictionary of parameters of solve() for each group (see
+                     get_solve_params); the time limit applies to the whole call, and groups that
+                     have not been started when it is reached contribute the zero solution,
+                     while the CPU time limit applies to each group; lbopt is ignored, and
+                     presolving is not supported
+    njobs          - (optional) number of processes (number of CPUs if None)
+    min_group_size - (optional) minimum number of variables of a group of components
+
+    The dictionary contains the keys
+    primal      - sum of primal values of the groups
+    dual        - sum of final dual bounds of the groups (nan if dual_freq is 0)
+    solution    - feasible solution attaining the primal value (None if a group found none)
+    cuts        - list of cuts of all groups lifted to the variables of the whole instance
+    ncomponents - number of groups of components that have been solved
+    stats       - statistics of the run (time, and niter and status of each group)
+    '''
+    if problemtype in ["polytope", "maxcut", "lpboost"]:
+        raise ValueError("decomposition is only available for matching and stable set problems")
+
+    params = get_solve_params(params, lbopt=-1)
+    if params["solver"] is None:
+        params["solver"] = default_solver()
+        if params["solver"] is None:
+            raise RuntimeError("cannot locate SCIP or Gurobi Python interface")
+
+    starttime = time.time()
+    instance = load_instance(instancefile, problemtype, params["cachedir"])
+    subinstances = decompose_instance(instance, problemtype, min_group_size)
+    if problemtype in ["matching", "weightmatching"]:
+        dim = len(instance.get_edge_array())
+    else:
+        dim = instance.nnodes
+
+    deadline = starttime + params["timelimit"] if params["timelimit"] > 0 else -1
+    args = [(sub, problemtype, params, deadline) for (sub, variables) in subinstances]
+    if njobs == 1 or len(subinstances) <= 1:
+        results = [solve_group(*arg) for arg in args]
+    else:
+        with ProcessPoolExecutor(max_workers=njobs) as pool:
+            results = list(pool.map(solve_group, *zip(*args)))
+
+    # combine the results of the groups
+    primal = 0.0
+    dual = 0.0
+    solution = numpy.zeros(dim)
+    complete = True
+    cuts = []
+    niter = []
+    status = []
+    for (sub, variables), (subprimal, subsolution, subcuts, subdual, substats) in \
+            zip(subinstances, results):
+        primal += subprimal
+        dual += subdual
+        if subsolution is None:
+            complete = False
+        else:
+            solution[variables] = subsolution
+        for cut in subcuts:
+            lifted = numpy.zeros(dim)
+            lifted[variables] = cut
+            cuts.append(lifted.tolist())
+        niter.append(substats["niter"])
+        status.append(substats["status"])
+
+    stats = {"time": time.time() - starttime, "niter": niter, "status": status}
+
+    return {"primal": primal, "dual": dual, "solution": solution.tolist() if complete else None,
+            "cuts": cuts, "ncomponents": len(subinstances), "stats": stats}
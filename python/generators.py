@@ -0,0 +1,349 @@
+import bz2
+import gzip
+
+import numpy
+
+####################################################################################################
+#
+# RANDOM INSTANCE GENERATORS
+#
+####################################################################################################
+#
+# All generators work on NumPy arrays: nodes are labeled 0,...,n-1, edges are stored as an
+# (m,2) array of pairs (i,j) with i < j, and edge weights as an array of length m. Instances are
+# written in the DIMACS format used by read_graph_from_file() (with labels 1,...,n).
+
+
+def sample_subsets(rng, n, nsets, size):
+    '''
+    returns an (nsets,size) array whose rows are sorted random subsets of {0,...,n-1}
+    rng   - numpy random generator
+    n     - size of ground set
+    nsets - number of subsets
+    size  - size of each subset
+    '''
+    if size > n:
+        raise ValueError("cannot sample subsets of size %d from %d elements" % (size, n))
+
+    # for large subsets, rejection sampling is inefficient; take the smallest random keys instead
+    if size * size > n:
+        subsets = numpy.argpartition(rng.random((nsets, n)), size - 1, axis=1)[:, :size]
+        subsets.sort(axis=1)
+        return subsets
+
+    subsets = rng.integers(0, n, size=(nsets, size))
+    subsets.sort(axis=1)
+    bad = numpy.nonzero((subsets[:, 1:] == subsets[:, :-1]).any(axis=1))[0]
+    while len(bad) > 0:
+        new = rng.integers(0, n, size=(len(bad), size))
+        new.sort(axis=1)
+        subsets[bad] = new
+        bad = bad[(new[:, 1:] == new[:, :-1]).any(axis=1)]
+
+    return subsets
+
+
+def unique_edges(edges, n):
+    '''
+    returns the edges without duplicates, keeping the first occurrence of each edge
+    edges - (m,2) array of edges (i,j) with i < j
+    n     - number of nodes
+    '''
+    # each edge is encoded by the key i*n + j, which is unique for all pairs i < j
+    keys = edges[:, 0] * n + edges[:, 1]
+    first = numpy.sort(numpy.unique(keys, return_index=True)[1])
+
+    return edges[first]
+
+
+def clique_edges(labels):
+    '''
+    returns all edges (i,j) with i < j between nodes having the same label
+    labels - array containing the label of each node
+    '''
+    order = numpy.argsort(labels, kind="stable")
+    sizes = numpy.bincount(labels)
+    starts = numpy.concatenate(([0], numpy.cumsum(sizes)[:-1]))
+
+    # the node at position p of its group is joined to all nodes at later positions of the group
+    pos = numpy.arange(len(order)) - numpy.repeat(starts, sizes)
+    counts = numpy.repeat(sizes, sizes) - pos - 1
+    first = numpy.repeat(numpy.arange(len(order)), counts)
+    offsets = numpy.arange(counts.sum()) - numpy.repeat(numpy.cumsum(counts) - counts, counts)
+    u = order[first]
+    v = order[first + 1 + offsets]
+
+    return numpy.stack((numpy.minimum(u, v), numpy.maximum(u, v)), axis=1)
+
+
+def generate_laminar_family(rng, n, radix=3):
+    '''
+    returns a random laminar family of subsets of {0,...,n-1} encoded as forest: node i < n is
+    the singleton {i}, node k >= n is the union of its children; the family is built in rounds
+    from a pool that initially contains all singletons: in each round, the pool is shuffled and
+    split into groups of radix members, which are merged, while the remaining members stay in
+    the pool (an odd radix yields only odd sets); returns the arrays of parents (-1 for roots)
+    and sizes
+    rng   - numpy random generator
+    n     - size of ground set
+    radix - number of sets merged in each step
+    '''
+    nmerges = (n - 1) // (radix - 1) if n >= radix else 0
+    parent = numpy.full(n + nmerges, -1, dtype=numpy.int64)
+    size = numpy.ones(n + nmerges, dtype=numpy.int64)
+
+    # each round merges all groups at once; the new sets get the next labels and join the pool
+    pool = numpy.arange(n)
+    first = n
+    while len(pool) >= radix:
+        pool = rng.permutation(pool)
+        ngroups = len(pool) // radix
+        nodes = numpy.arange(first, first + ngroups)
+        merged = pool[:ngroups * radix]
+        parent[merged] = numpy.repeat(nodes, radix)
+        size[nodes] = size[merged].reshape(ngroups, radix).sum(axis=1)
+        pool = numpy.concatenate((pool[ngroups * radix:], nodes))
+        first += ngroups
+
+    return parent, size
+
+
+def sum_to_root(parent, values):
+    '''
+    returns for each node of a forest the sum of values of the node and all its ancestors
+    (computed by pointer jumping)
+    parent - array of parents (-1 for roots)
+    values - array of values of nodes
+    '''
+    sums = numpy.array(values, dtype=numpy.float64)
+    jump = parent.copy()
+
+    active = numpy.nonzero(jump >= 0)[0]
+    while len(active) > 0:
+        sums[active] += sums[jump[active]]
+        jump[active] = jump[jump[active]]
+        active = active[jump[active] >= 0]
+
+    return sums
+
+
+def lowest_common_ancestors(parent, depth, u, v):
+    '''
+    returns for each pair of nodes their lowest common ancestor in a forest (-1 if they are
+    contained in different trees)
+    parent - array of parents (-1 for roots)
+    depth  - array of depths of nodes
+    u, v   - arrays of nodes
+    '''
+    a = u.copy()
+    b = v.copy()
+
+    # lift the deeper node until both nodes have the same depth
+    for (x, y) in [(a, b), (b, a)]:
+        idx = numpy.nonzero(depth[x] > depth[y])[0]
+        while len(idx) > 0:
+            x[idx] = parent[x[idx]]
+            idx = idx[depth[x[idx]] > depth[y[idx]]]
+
+    # lift both nodes until they meet (roots have parent -1)
+    idx = numpy.nonzero(a != b)[0]
+    while len(idx) > 0:
+        a[idx] = parent[a[idx]]
+        b[idx] = parent[b[idx]]
+        idx = idx[a[idx] != b[idx]]
+
+    return a
+
+
+def generate_matching_graph(num_nodes, num_odd_sets, size_odd_sets, seed, weighted):
+    '''
+    generates a graph for the matching problem as in scripts/generate_matching_instances.py:
+    the graph is the union of cliques on random node subsets; if weighted, each edge e receives
+    the weight sum 2/(|S| - 1) over all sets S of a random laminar family of odd sets with
+    e in S; returns the number of nodes, the array of edges, and the array of weights
+    num_nodes     - number of nodes
+    num_odd_sets  - number of random subsets
+    size_odd_sets - size of each random subset
+    seed          - seed of random generator
+    weighted      - whether weights are derived from a laminar family (otherwise all weights are 1)
+    '''
+    rng = numpy.random.default_rng(seed)
+
+    subsets = sample_subsets(rng, num_nodes, num_odd_sets, size_odd_sets)
+    rows, cols = numpy.triu_indices(size_odd_sets, 1)
+    edges = numpy.stack((subsets[:, rows].ravel(), subsets[:, cols].ravel()), axis=1)
+    edges = unique_edges(edges, num_nodes)
+
+    if not weighted:
+        return num_nodes, edges, numpy.ones(len(edges))
+
+    parent, size = generate_laminar_family(rng, num_nodes)
+    depth = sum_to_root(parent, numpy.ones(len(parent))).astype(numpy.int64) - 1
+
+    # the weight of an edge is the sum over all common ancestors of its end nodes, i.e., the
+    # lowest common ancestor and its ancestors
+    setweight = numpy.zeros(len(parent))
+    setweight[size > 1] = 2.0 / (size[size > 1] - 1)
+    cumweight = sum_to_root(parent, setweight)
+
+    lca = lowest_common_ancestors(parent, depth, edges[:, 0], edges[:, 1])
+    weights = numpy.where(lca >= 0, cumweight[lca], 0.0)
+
+    return num_nodes, edges, weights
+
+
+def generate_stableset_graph(num_nodes, num_cliques, num_extra_edges, seed):
+    '''
+    generates a graph whose maximum stable set has known size: the nodes are partitioned into
+    num_cliques cliques, each containing a planted representative, and random edges between
+    different cliques are added that do not join two representatives; hence, the stability
+    number is num_cliques; since the problem type "stableset" uses the first num_nodes weights
+    of the file as objective, at least num_nodes edges with unit weights are generated (a
+    ValueError is raised if the graph cannot have that many edges); returns the number of
+    nodes, the array of edges, the array of weights, and the stability number
+    num_nodes       - number of nodes
+    num_cliques     - number of cliques (between 1 and num_nodes)
+    num_extra_edges - number of random edges between different cliques
+    seed            - seed of random generator
+    '''
+    if num_cliques < 1 or num_cliques > num_nodes:
+        raise ValueError("number of cliques has to be between 1 and %d, but %d was given"
+                         % (num_nodes, num_cliques))
+
+    npossible = num_nodes * (num_nodes - 1) // 2 - num_cliques * (num_cliques - 1) // 2
+    if npossible < num_nodes:
+        raise ValueError("a graph with %d nodes and %d cliques has at most %d edges, but the "
+                         "objective of %d nodes is given by edge weights"
+                         % (num_nodes, num_cliques, npossible, num_nodes))
+
+    rng = numpy.random.default_rng(seed)
+
+    # the first num_cliques nodes of a random permutation are the representatives
+    perm = rng.permutation(num_nodes)
+    labels = numpy.empty(num_nodes, dtype=numpy.int64)
+    labels[perm[:num_cliques]] = numpy.arange(num_cliques)
+    labels[perm[num_cliques:]] = rng.integers(0, num_cliques, size=num_nodes - num_cliques)
+    representative = numpy.zeros(num_nodes, dtype=bool)
+    representative[perm[:num_cliques]] = True
+
+    edges = clique_edges(labels)
+    target = min(len(edges) + max(num_extra_edges, num_nodes - len(edges)), npossible)
+
+    while len(edges) < target:
+        pairs = rng.integers(0, num_nodes, size=(2 * (target - len(edges)), 2))
+        pairs = numpy.stack((pairs.min(axis=1), pairs.max(axis=1)), axis=1)
+        keep = (labels[pairs[:, 0]] != labels[pairs[:, 1]])
+        keep &= ~(representative[pairs[:, 0]] & representative[pairs[:, 1]])
+        edges = unique_edges(numpy.concatenate((edges, pairs[keep])), num_nodes)[:target]
+
+    return num_nodes, edges, numpy.ones(len(edges)), num_cliques
+
+
+def write_graph(filename, num_nodes, edges, weights, comments=[]):
+    '''
+    writes a graph in DIMACS format; the file is compressed if its name ends with .gz or .bz2
+    filename  - path to file
+    num_nodes - number of nodes
+    edges     - (m,2) array of edges with nodes labeled 0,...,n-1
+    weights   - array of edge weights
+    comments  - (optional) list of comment lines written to the head of the file
+    '''
+    if filename.endswith(".gz"):
+        f = gzip.open(filename, "wt", compresslevel=6)
+    elif filename.endswith(".bz2"):
+        f = bz2.open(filename, "wt")
+    else:
+        f = open(filename, "w")
+
+    for comment in comments:
+        f.write("c %s\n" % comment)
+    f.write("p edge %d %d\n" % (num_nodes, len(edges)))
+
+    # format blocks of edges by a single string operation
+    blocksize = 100000
+    for start in range(0, len(edges), blocksize):
+        block = numpy.empty((min(blocksize, len(edges) - start), 3), dtype=object)
+        block[:, :2] = edges[start:start + blocksize] + 1
+        block[:, 2] = weights[start:start + blocksize]
+        f.write(("e %d %d %f\n" * len(block)) % tuple(block.ravel().tolist()))
+
+    f.close()
+
+
+def generate_packing_polytope(nrows, ncols, nnz_per_row, seed):
+    '''
+    generates a random packing polytope {x >= 0 : Ax <= 1} with sparse nonnegative matrix A:
+    each row has nnz_per_row random entries in (0,1], and each column additionally receives an
+    entry 1 in a random row, such that the polytope is contained in the unit cube; the objective
+    has random entries in [1,2); returns A in CSR format (row pointers, column indices, values)
+    and the objective
+    nrows       - number of rows of A
+    ncols       - number of columns of A (dimension of polytope)
+    nnz_per_row - number of random entries per row
+    seed        - seed of random generator
+    '''
+    rng = numpy.random.default_rng(seed)
+
+    rows = numpy.concatenate((numpy.repeat(numpy.arange(nrows), nnz_per_row),
+                              rng.integers(0, nrows, size=ncols)))
+    cols = numpy.concatenate((sample_subsets(rng, ncols, nrows, nnz_per_row).ravel(),
+                              numpy.arange(ncols)))
+    vals = numpy.concatenate((1.0 - rng.random(nrows * nnz_per_row), numpy.ones(ncols)))
+
+    # sort entries by row and column; duplicate entries keep the largest value
+    order = numpy.lexsort((-vals, cols, rows))
+    rows, cols, vals = rows[order], cols[order], vals[order]
+    first = numpy.ones(len(rows), dtype=bool)
+    first[1:] = (rows[1:] != rows[:-1]) | (cols[1:] != cols[:-1])
+    rows, cols, vals = rows[first], cols[first], vals[first]
+
+    indptr = numpy.zeros(nrows + 1, dtype=numpy.int64)
+    indptr[1:] = numpy.cumsum(numpy.bincount(rows, minlength=nrows))
+
+    return indptr, cols, vals, 1.0 + rng.random(ncols)
+
+
+def write_polytope(filename, indptr, indices, data, obj):
+    '''
+    writes a packing polytope in CSR format and its objective to a NumPy file
+    filename - path to file (should end with .npz)
+    indptr   - row pointers of A
+    indices  - column indices of A
+    data     - values of A
+    obj      - objective vector
+    '''
+    numpy.savez_compressed(filename, indptr=indptr, indices=indices, data=data, obj=obj)
+
+
+def generate_lpboost_dataset(nsamples, nfeatures, noise, seed):
+    '''
+    generates a random labeled dataset: the features are standard normal, and the labels are the
+    signs of a random linear function of the features that are flipped with probability noise;
+    returns the array of labels in {-1,1} and the (samples,features) array of features
+    nsamples  - number of samples
+    nfeatures - number of features
+    noise     - probability of flipping a label
+    seed      - seed of random generator
+    '''
+    rng = numpy.random.default_rng(seed)
+
+    features = rng.standard_normal((nsamples, nfeatures))
+    labels = numpy.where(features @ rng.standard_normal(nfeatures) >= 0, 1, -1)
+    labels[rng.random(nsamples) < noise] *= -1
+
+    return labels, features
+
+
+def write_lpboost_dataset(filename, nu, labels, features):
+    '''
+    writes a labeled dataset in the format read by read_lpboost_arrays
+    filename - path to file
+    nu       - parameter nu of LPBoost
+    labels   - array of labels in {-1,1}
+    features - (samples,features) array of features
+    '''
+    f = open(filename, 'w')
+    f.write("%r\n" % float(nu))
+    numpy.savetxt(f, numpy.column_stack((labels, features)), delimiter=",",
+                  fmt=["%d"] + features.shape[1] * ["%.10g"])
+    f.close()
@@ -0,0 +1,358 @@
+import numpy
+
+####################################################################################################
+#
+# PRIMAL HEURISTICS
+#
+####################################################################################################
+#
+# The heuristics compute feasible 0/1 solutions, which are used to initialize the lower bound
+# gamma of the packing algorithm and, optionally, to improve gamma during the algorithm by rounding
+# separation candidates. A greedy construction processes the variables in the order of a guiding
+# point (decreasing values, ties broken by the objective) or, if no point is given, in the order of
+# decreasing objective; local search then applies improving exchanges until none exists:
+#
+# matching   - an edge is added and the (at most two) matching edges at its end nodes are removed;
+#              if both end nodes were matched, the freed partners are matched by their common edge
+#              if it exists (2-opt); afterwards, freed nodes are matched greedily
+# stable set - a node is added and its neighbors in the stable set are removed if its weight
+#              exceeds theirs; afterwards, nodes without neighbors in the stable set are added
+# polytope   - a column is added if all rows stay satisfied (no local search)
+# LPBoost    - the distribution is the projection of the guiding point onto the feasible
+#              distributions (or the uniform distribution), and gamma is chosen maximal
+# max-cut    - the cut is obtained by rounding a factorization of the guiding point with random
+#              hyperplanes (or all nodes are put on one side); a node is moved to the other side
+#              if this increases the weight of the cut
+
+
+def greedy_order(obj, point=None):
+    '''
+    returns the indices of the variables with positive objective in the order processed by the
+    greedy heuristics
+    obj   - array of objective coefficients
+    point - (optional) array of values of a guiding point
+    '''
+    if point is None:
+        order = numpy.lexsort((numpy.arange(len(obj)), -obj))
+    else:
+        order = numpy.lexsort((-obj, -point))
+    return order[obj[order] > 0]
+
+
+def greedy_matching(nnodes, edges, obj, point=None):
+    '''
+    returns the characteristic vector of a matching computed greedily
+    nnodes - number of nodes
+    edges  - (m,2) array of edges with nodes labeled 0,...,n-1
+    obj    - array of edge weights
+    point  - (optional) array of values of a guiding point
+    '''
+    x = numpy.zeros(len(edges))
+    matched = numpy.zeros(nnodes, dtype=bool)
+
+    for e in greedy_order(obj, point).tolist():
+        u, v = edges[e]
+        if u != v and not matched[u] and not matched[v]:
+            x[e] = 1
+            matched[u] = matched[v] = True
+
+    return x
+
+
+def local_search_matching(nnodes, edges, obj, x, maxpasses=10):
+    '''
+    improves a matching by edge exchanges (see above) and returns the improved characteristic
+    vector
+    nnodes    - number of nodes
+    edges     - (m,2) array of edges with nodes labeled 0,...,n-1
+    obj       - array of edge weights
+    x         - characteristic vector of a matching
+    maxpasses - (optional) maximum number of passes over all edges
+    '''
+    x = numpy.array(x, dtype=numpy.float64)
+    edgelist = edges.tolist()
+    weights = obj.tolist()
+
+    # matching edge at each node (-1 if the node is free) and heaviest edge between two nodes
+    mate = [-1] * nnodes
+    for e in numpy.nonzero(x > 0.5)[0].tolist():
+        mate[edgelist[e][0]] = e
+        mate[edgelist[e][1]] = e
+    incidence = [[] for v in range(nnodes)]
+    between = {}
+    for e in greedy_order(obj).tolist():
+        u, v = edgelist[e]
+        if u == v:
+            continue
+        incidence[u].append(e)
+        incidence[v].append(e)
+        between.setdefault((min(u, v), max(u, v)), e)
+
+    def other(e, u):
+        return edgelist[e][1] if edgelist[e][0] == u else edgelist[e][0]
+
+    def match(e):
+        u, v = edgelist[e]
+        x[e] = 1
+        mate[u] = mate[v] = e
+
+    def unmatch(e):
+        u, v = edgelist[e]
+        x[e] = 0
+        mate[u] = mate[v] = -1
+
+    def match_greedily(u):
+        # incidence lists are sorted by decreasing weight
+        if mate[u] == -1:
+            for e in incidence[u]:
+                if mate[other(e, u)] == -1:
+                    match(e)
+                    break
+
+    for npass in range(maxpasses):
+        improved = False
+        for e in greedy_order(obj).tolist():
+            u, v = edgelist[e]
+            if u == v or mate[u] == e:
+                continue
+
+            f = mate[u]
+            g = mate[v] if mate[v] != f else -1
+            gain = weights[e] - (weights[f] if f >= 0 else 0) - (weights[g] if g >= 0 else 0)
+
+            # 2-opt: match the freed partners by their common edge
+            h = -1
+            if f >= 0 and g >= 0:
+                up = other(f, u)
+                vp = other(g, v)
+                h = between.get((min(up, vp), max(up, vp)), -1)
+                if h >= 0 and weights[h] > 0:
+                    gain += weights[h]
+                else:
+                    h = -1
+
+            if gain <= 1e-9:
+                continue
+
+            freed = []
+            for k in [f, g]:
+                if k >= 0:
+                    unmatch(k)
+                    freed.extend(edgelist[k])
+            match(e)
+            if h >= 0:
+                match(h)
+            for w in freed:
+                match_greedily(w)
+            improved = True
+
+        if not improved:
+            break
+
+    return x
+
+
+def greedy_stableset(nnodes, edges, obj, point=None):
+    '''
+    returns the characteristic vector of a stable set computed greedily; without guiding point,
+    nodes are processed by decreasing ratio of weight and degree plus one
+    nnodes - number of nodes
+    edges  - (m,2) array of edges with nodes labeled 0,...,n-1
+    obj    - array of node weights
+    point  - (optional) array of values of a guiding point
+    '''
+    neighbors = [[] for v in range(nnodes)]
+    for (u, v) in edges.tolist():
+        neighbors[u].append(v)
+        neighbors[v].append(u)
+
+    x = numpy.zeros(nnodes)
+    blocked = numpy.zeros(nnodes, dtype=bool)
+    if point is None:
+        degrees = numpy.bincount(edges.ravel(), minlength=nnodes)
+        order = greedy_order(obj, obj / (degrees + 1))
+    else:
+        order = greedy_order(obj, point)
+
+    for v in order.tolist():
+        if not blocked[v]:
+            x[v] = 1
+            blocked[v] = True
+            for w in neighbors[v]:
+                blocked[w] = True
+
+    return x
+
+
+def local_search_stableset(nnodes, edges, obj, x, maxpasses=10):
+    '''
+    improves a stable set by node exchanges (see above) and returns the improved characteristic
+    vector
+    nnodes    - number of nodes
+    edges     - (m,2) array of edges with nodes labeled 0,...,n-1
+    obj       - array of node weights
+    x         - characteristic vector of a stable set
+    maxpasses - (optional) maximum number of passes over all nodes
+    '''
+    x = numpy.array(x, dtype=numpy.float64)
+    weights = obj.tolist()
+    neighbors = [set() for v in range(nnodes)]
+    for (u, v) in edges.tolist():
+        if u != v:
+            neighbors[u].add(v)
+            neighbors[v].add(u)
+
+    # number of neighbors in the stable set (tightness) of each node
+    chosen = [bool(val > 0.5) for val in x.tolist()]
+    tightness = [sum(1 for w in neighbors[v] if chosen[w]) for v in range(nnodes)]
+
+    def insert(v):
+        chosen[v] = True
+        x[v] = 1
+        for w in neighbors[v]:
+            tightness[w] += 1
+
+    def remove(v):
+        chosen[v] = False
+        x[v] = 0
+        for w in neighbors[v]:
+            tightness[w] -= 1
+
+    order = greedy_order(obj).tolist()
+    for npass in range(maxpasses):
+        improved = False
+        for v in order:
+            if chosen[v]:
+                continue
+
+            conflicts = [w for w in neighbors[v] if chosen[w]]
+            if weights[v] - sum(weights[w] for w in conflicts) <= 1e-9:
+                continue
+
+            for w in conflicts:
+                remove(w)
+            insert(v)
+
+            # add free nodes around the removed nodes
+            for w in conflicts:
+                for z in sorted(neighbors[w], key=lambda z: -weights[z]):
+                    if not chosen[z] and tightness[z] == 0 and weights[z] > 0:
+                        insert(z)
+            improved = True
+
+        if not improved:
+            break
+
+    return x
+
+
+def greedy_polytope(polytope, obj, point=None):
+    '''
+    returns a 0/1 point of a packing polytope computed greedily
+    polytope - POLYTOPE
+    obj      - array of objective coefficients
+    point    - (optional) array of values of a guiding point
+    '''
+    # columns of A (CSC format)
+    order = numpy.argsort(polytope.indices, kind="stable")
+    rows = polytope.get_row_ids()[order]
+    values = polytope.data[order]
+    colptr = numpy.concatenate(([0], numpy.cumsum(numpy.bincount(polytope.indices,
+                                                                 minlength=polytope.ncols))))
+
+    x = numpy.zeros(polytope.ncols)
+    activity = numpy.zeros(polytope.nrows)
+    for j in greedy_order(obj, point).tolist():
+        colrows = rows[colptr[j]:colptr[j + 1]]
+        colvals = values[colptr[j]:colptr[j + 1]]
+        if numpy.all(activity[colrows] + colvals <= 1 + 1e-9):
+            x[j] = 1
+            activity[colrows] += colvals
+
+    return x
+
+
+def project_capped_simplex(values, bound, maxrounds=100):
+    '''
+    returns the Euclidean projection of a vector onto the capped simplex
+    {x : 0 <= x_i <= bound, sum_i x_i = 1}, i.e., min(max(values - tau, 0), bound) for the shift
+    tau computed by bisection
+    values    - array to project
+    bound     - upper bound on the entries (at least 1 / len(values))
+    maxrounds - (optional) number of bisection rounds
+    '''
+    values = numpy.asarray(values, dtype=numpy.float64)
+    lower = values.min() - bound
+    upper = values.max()
+
+    for nround in range(maxrounds):
+        tau = (lower + upper) / 2
+        if numpy.clip(values - tau, 0, bound).sum() > 1:
+            lower = tau
+        else:
+            upper = tau
+
+    return numpy.clip(values - (lower + upper) / 2, 0, bound)
+
+
+def hyperplane_maxcut(weights, point=None, nhyperplanes=10, seed=0):
+    '''
+    returns the sides (+1 or -1) of the nodes of a cut obtained by hyperplane rounding; the
+    best cut of several random hyperplanes is returned
+    weights      - symmetric (n,n) array of edge weights
+    point        - (optional) symmetric (n,n) array X with unit diagonal, which is projected onto
+                   the positive semidefinite matrices and factorized as X = V V^T; the sides are
+                   the signs of V r for random vectors r (without point, all sides are +1)
+    nhyperplanes - (optional) number of random hyperplanes
+    seed         - (optional) seed of the random hyperplanes
+    '''
+    nnodes = len(weights)
+    if point is None:
+        return numpy.ones(nnodes)
+
+    vals, vecs = numpy.linalg.eigh(point)
+    factor = vecs * numpy.sqrt(numpy.maximum(vals, 0))
+
+    rng = numpy.random.default_rng(seed)
+    best = numpy.ones(nnodes)
+    bestval = -numpy.inf
+    for k in range(nhyperplanes):
+        sides = numpy.where(factor @ rng.standard_normal(nnodes) >= 0, 1.0, -1.0)
+        val = -sides @ weights @ sides
+        if val > bestval:
+            best = sides
+            bestval = val
+
+    return best
+
+
+def local_search_maxcut(weights, sides, maxmoves=1000):
+    '''
+    improves a cut by moving single nodes to the other side (see above) and returns the improved
+    sides
+    weights  - symmetric (n,n) array of edge weights
+    sides    - array of sides (+1 or -1) of the nodes
+    maxmoves - (optional) maximum number of moves
+    '''
+    sides = numpy.array(sides, dtype=numpy.float64)
+
+    # moving node i changes the weight of the cut by sides[i] * (weights @ sides)[i]
+    field = weights @ sides
+    for nmove in range(maxmoves):
+        gains = sides * field
+        i = int(numpy.argmax(gains))
+        if gains[i] <= 1e-9:
+            break
+
+        sides[i] = -sides[i]
+        field += 2 * sides[i] * weights[:, i]
+
+    return sides
+
+
+def graph_arrays(instance):
+    '''
+    returns the number of nodes and the (m,2) array of edges with nodes labeled 0,...,n-1
+    instance - INSTANCE
+    '''
+    return instance.nnodes, instance.get_edge_array() - 1
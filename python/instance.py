@@ -0,0 +1,798 @@
+import os
+
+import numpy
+
+from MIP import *
+from auxiliary import *
+
+
+####################################################################################################
+#
+# CLASS FOR PARSED INSTANCES
+#
+####################################################################################################
+
+
+class INSTANCE:
+    '''
+    graph instance that is parsed once and shared by all oracles and problems; derived graph
+    structures and optimization models are computed on first use
+
+    The graph is given either by lists or by arrays (e.g., memory-mapped arrays of the binary
+    cache of read_graph_arrays); the list of the other representation is only built when it is
+    accessed, such that large graphs can be processed by array operations without lists.
+
+    class variables:
+    filename  - path to file encoding instance (empty if not read from a file)
+    nnodes    - number of nodes
+    nodes     - list of nodes of the graph (labeled 1,...,n)
+    edge_list - list of edges (i,j) with i < j of the graph
+    obj       - list of edge weights given in the file
+    arrays    - dictionary of the arrays "edges" ((m,2) array of edges) and "weights"
+    lists     - dictionary of the lists "nodes", "edge_list", and "obj"
+    cache     - dictionary of derived graph structures
+    models    - dictionary of prototypes of optimization models, which are copied for each user
+    '''
+
+    def __init__(self, nodes, edge_list, obj, filename=""):
+        '''
+        initializes the instance
+        nodes     - list of nodes of the graph (labeled 1,...,n) or their number
+        edge_list - list of edges (i,j) with i < j of the graph or (m,2) array of them
+        obj       - list or array of edge weights
+        filename  - (optional) path to file encoding instance
+        '''
+        self.filename = filename
+        self.arrays = {}
+        self.lists = {}
+        self.cache = {}
+        self.models = {}
+
+        if isinstance(nodes, int):
+            self.nnodes = nodes
+        else:
+            self.nnodes = len(nodes)
+            self.lists["nodes"] = nodes
+        if isinstance(edge_list, numpy.ndarray):
+            self.arrays["edges"] = edge_list.reshape(-1, 2)
+        else:
+            self.lists["edge_list"] = edge_list
+        if isinstance(obj, numpy.ndarray):
+            self.arrays["weights"] = obj
+        else:
+            self.lists["obj"] = obj
+
+    def __getstate__(self):
+        '''
+        returns the state of the instance used for pickling (models cannot be pickled, and lists
+        built from arrays are rebuilt on demand)
+        '''
+        state = dict(self.__dict__)
+        state["models"] = {}
+        state["lists"] = dict(self.lists)
+        if "edges" in self.arrays:
+            state["lists"].pop("edge_list", None)
+        if "weights" in self.arrays:
+            state["lists"].pop("obj", None)
+        return state
+
+    @property
+    def nodes(self):
+        '''
+        returns list of nodes (built on first access)
+        '''
+        if not "nodes" in self.lists:
+            self.lists["nodes"] = list(range(1, self.nnodes + 1))
+        return self.lists["nodes"]
+
+    @property
+    def edge_list(self):
+        '''
+        returns list of edges (built on first access if the edges are given by an array)
+        '''
+        if not "edge_list" in self.lists:
+            edges = self.arrays["edges"]
+            self.lists["edge_list"] = list(zip(edges[:, 0].tolist(), edges[:, 1].tolist()))
+        return self.lists["edge_list"]
+
+    @property
+    def obj(self):
+        '''
+        returns list of edge weights (built on first access if they are given by an array)
+        '''
+        if not "obj" in self.lists:
+            self.lists["obj"] = self.arrays["weights"].tolist()
+        return self.lists["obj"]
+
+    def get_edge_array(self):
+        '''
+        returns the (m,2) array of edges (i,j) with i < j (labeled 1,...,n)
+        '''
+        if not "edges" in self.arrays:
+            self.arrays["edges"] = numpy.array(self.edge_list, dtype=numpy.int64).reshape(-1, 2)
+        return self.arrays["edges"]
+
+    def get_weight_array(self):
+        '''
+        returns the array of edge weights given in the file
+        '''
+        if not "weights" in self.arrays:
+            self.arrays["weights"] = numpy.array(self.obj, dtype=numpy.float64)
+        return self.arrays["weights"]
+
+    def get_degrees(self):
+        '''
+        returns list of degrees of nodes
+        '''
+        if not "degrees" in self.cache:
+            self.cache["degrees"] = numpy.bincount(self.get_edge_array().ravel() - 1,
+                                                   minlength=self.nnodes).tolist()
+        return self.cache["degrees"]
+
+    def get_incidence(self):
+        '''
+        returns list containing for each node the list of indices of its incident edges
+        '''
+        if not "incidence" in self.cache:
+            incidence = [[] for v in self.nodes]
+            for e in range(len(self.edge_list)):
+                incidence[self.edge_list[e][0] - 1].append(e)
+                incidence[self.edge_list[e][1] - 1].append(e)
+            self.cache["incidence"] = incidence
+        return self.cache["incidence"]
+
+    def get_complement_edges(self):
+        '''
+        returns list of edges [u,v] with u < v of the complement graph
+        '''
+        if not "complement" in self.cache:
+            self.cache["complement"] = compute_complement_edges(self.nodes, self.edge_list)
+        return self.cache["complement"]
+
+    def get_edge_weights(self):
+        '''
+        returns edge weights degree(u) + degree(v) (see compute_edge_weights)
+        '''
+        if not "edge_weights" in self.cache:
+            degrees = self.get_degrees()
+            self.cache["edge_weights"] = [degrees[u - 1] + degrees[v - 1]
+                                          for (u,v) in self.edge_list]
+        return self.cache["edge_weights"]
+
+    def get_node_weights(self):
+        '''
+        returns node weights degree(v) (see compute_node_weights)
+        '''
+        return self.get_degrees()
+
+    def get_node_obj(self):
+        '''
+        returns the objective used for unweighted stable set problems, i.e., the first n weights
+        given in the file
+        '''
+        if "obj" in self.lists:
+            return self.obj[:self.nnodes]
+        return self.arrays["weights"][:self.nnodes].tolist()
+
+    def get_pairs(self):
+        '''
+        returns the arrays (rows, cols) of all node pairs (i,j) with i < j, labeled 0,...,n-1 and
+        in row-major order, which index the variables of the max-cut problem
+        '''
+        if not "pairs" in self.cache:
+            self.cache["pairs"] = numpy.triu_indices(len(self.nodes), 1)
+        return self.cache["pairs"]
+
+    def get_weight_matrix(self):
+        '''
+        returns the symmetric (n,n) array of edge weights (0 for non-adjacent nodes and on the
+        diagonal, i.e., loops are ignored)
+        '''
+        if not "weight_matrix" in self.cache:
+            edges = self.get_edge_array() - 1
+            w = self.get_weight_array()
+            loops = edges[:, 0] == edges[:, 1]
+            weights = numpy.zeros((self.nnodes, self.nnodes))
+            numpy.add.at(weights, (edges[~loops, 0], edges[~loops, 1]), w[~loops])
+            numpy.add.at(weights, (edges[~loops, 1], edges[~loops, 0]), w[~loops])
+            self.cache["weight_matrix"] = weights
+        return self.cache["weight_matrix"]
+
+    def get_maxcut_obj(self):
+        '''
+        returns the objective of the max-cut problem over all node pairs, i.e., -w_ij for edges
+        and 0 for all other pairs (maximizing it is equivalent to maximizing
+        sum w_ij (1 - X_ij) / 2)
+        '''
+        if not "maxcut_obj" in self.cache:
+            self.cache["maxcut_obj"] = (-self.get_weight_matrix()[self.get_pairs()]).tolist()
+        return self.cache["maxcut_obj"]
+
+    def get_objective(self, problemtype):
+        '''
+        returns the objective vector used by a problem type (see MATCHINGORACLE,
+        STABLESETORACLE, and MAXCUTORACLE)
+        problemtype - type of graph problem
+        '''
+        if problemtype == "maxcut":
+            return self.get_maxcut_obj()
+        if problemtype == "matching":
+            return self.obj
+        if problemtype == "weightmatching":
+            return self.get_edge_weights()
+        if problemtype == "stableset":
+            return self.get_node_obj()
+        return self.get_node_weights()
+
+    def get_degree_conss(self):
+        '''
+        returns list of left-hand sides of degree constraints (see compute_degree_conss)
+        '''
+        if not "degree_conss" in self.cache:
+            conss = []
+            for inc in self.get_incidence():
+                cons = len(self.edge_list) * [0]
+                for e in inc:
+                    cons[e] = 1
+                conss.append(cons)
+            self.cache["degree_conss"] = conss
+        return self.cache["degree_conss"]
+
+    def get_edge_conss(self):
+        '''
+        returns list of left-hand sides of edge constraints (see compute_edge_conss)
+        '''
+        if not "edge_conss" in self.cache:
+            self.cache["edge_conss"] = compute_edge_conss(self.nodes, self.edge_list)
+        return self.cache["edge_conss"]
+
+    def get_model(self, key, solver, builder):
+        '''
+        returns a copy of a model and its variables; the model is built on first use
+        key     - identifier of the model
+        solver  - solver to be used
+        builder - function returning the model if it has not been built yet
+        '''
+        if not (key, solver) in self.models:
+            self.models[(key, solver)] = builder()
+
+        return copy_model(self.models[(key, solver)], solver)
+
+    def get_sepamodel(self, problem, solver):
+        '''
+        returns a copy of the separation model of a problem together with its variables
+        (see matching_create_sepamodel and stableset_create_sepamodel)
+        problem - "matching" or "stableset"
+        solver  - solver used by the separation oracle
+        '''
+        if problem == "matching":
+            model, vars = self.get_model("sepa_matching", solver,
+                                         lambda: matching_create_sepamodel(self.nodes,
+                                                                           self.edge_list,
+                                                                           solver)[0])
+            n = len(self.nodes)
+            return model, vars[:n], vars[n:-1], vars[-1]
+
+        return self.get_model("sepa_stableset", solver,
+                              lambda: stableset_create_sepamodel(self.nodes, self.edge_list, solver,
+                                                                 self.get_complement_edges())[0])
+
+    def get_relaxation(self, problem, objcoefs, solver, initconss, weighted):
+        '''
+        returns a copy of the LP relaxation of a problem together with its variables
+        (see matching_create_model, stableset_create_model, and maxcut_create_model)
+        problem   - "matching", "stableset", or "maxcut"
+        objcoefs  - objective coefficients
+        solver    - solver used to solve relaxation
+        initconss - {0,1,2} to encode whether no/box/standard constraints shall be used
+        weighted  - whether objcoefs have been generated from the graph
+        '''
+        if problem == "maxcut":
+            builder = lambda: maxcut_create_model(objcoefs, solver, initconss)[0]
+        elif problem == "matching":
+            builder = lambda: matching_create_model(self.nodes, self.edge_list, objcoefs, solver,
+                                                    initconss)[0]
+        else:
+            builder = lambda: stableset_create_model(self.nodes, self.edge_list, objcoefs, solver,
+                                                     initconss)[0]
+
+        return self.get_model(("relaxation", problem, initconss, weighted), solver, builder)
+
+    def apply_edit(self, edit):
+        '''
+        returns a new instance whose graph is obtained by applying an edit to the graph of this
+        instance, which is not changed (see GRAPHEDIT)
+        edit - GRAPHEDIT that has not been applied to another instance
+        '''
+        return edit.apply(self)
+
+
+####################################################################################################
+#
+# CLASS FOR EDITS OF GRAPHS
+#
+####################################################################################################
+
+
+class GRAPHEDIT:
+    '''
+    nodes and edges added to or removed from the graph of an instance; nodes are given by their
+    labels before the edit, where added nodes are labeled n+1,...,n+k. Applying the edit relabels
+    the remaining nodes consecutively (keeping their order), keeps the order of the remaining
+    edges, and appends the added edges. Afterwards, the edit maps vectors and cuts indexed by the
+    nodes or edges of the old graph to the new graph:
+
+    matching   - a cut with nonnegative coefficients stays valid if the coefficients of removed
+                 edges are dropped and added edges get coefficient 0, since the matchings of the
+                 new graph restricted to the old edges are matchings of the old graph
+    stable set - the same holds for nodes unless both end nodes of a removed edge have positive
+                 coefficients, since removing an edge allows stable sets containing both nodes
+
+    class variables:
+    add_nodes     - number of added nodes
+    remove_nodes  - list of labels of removed nodes (their incident edges are removed as well)
+    add_edges     - list of added edges (i,j)
+    remove_edges  - list of removed edges (i,j) (all parallel edges are removed)
+    edge_weights  - list of weights of added edges
+    node_weights  - list of weights of added nodes (objective of stable set problems)
+    old           - INSTANCE to which the edit has been applied
+    instance      - edited INSTANCE (None if the edit has not been applied)
+    node_map      - list mapping the index of each node of the old graph to its new index (-1 if
+                    removed)
+    edge_map      - list mapping the index of each edge of the old graph to its new index (-1 if
+                    removed)
+    joined_pairs  - list of pairs (u,v) of new indices of old nodes joined by an added edge
+    removed_pairs - list of pairs (u,v) of new indices of remaining nodes that are no longer
+                    adjacent
+    '''
+
+    def __init__(self, add_nodes=0, remove_nodes=(), add_edges=(), remove_edges=(),
+                 edge_weights=None, node_weights=None):
+        '''
+        initializes the edit
+        add_nodes    - (optional) number of added nodes
+        remove_nodes - (optional) list of labels of removed nodes
+        add_edges    - (optional) list of added edges (i,j)
+        remove_edges - (optional) list of removed edges (i,j)
+        edge_weights - (optional) list of weights of added edges (default 1)
+        node_weights - (optional) list of weights of added nodes (default 1)
+        '''
+        self.add_nodes = add_nodes
+        self.remove_nodes = list(remove_nodes)
+        self.add_edges = [(min(i, j), max(i, j)) for (i, j) in add_edges]
+        self.remove_edges = [(min(i, j), max(i, j)) for (i, j) in remove_edges]
+        self.edge_weights = [1.0 for e in self.add_edges] if edge_weights is None \
+            else [float(val) for val in edge_weights]
+        self.node_weights = [1.0 for v in range(add_nodes)] if node_weights is None \
+            else [float(val) for val in node_weights]
+        self.instance = None
+
+        if len(self.edge_weights) != len(self.add_edges):
+            raise ValueError("%d edges are added, but %d weights are given" %
+                             (len(self.add_edges), len(self.edge_weights)))
+        if len(self.node_weights) != add_nodes:
+            raise ValueError("%d nodes are added, but %d weights are given" %
+                             (add_nodes, len(self.node_weights)))
+
+    def apply(self, instance):
+        '''
+        returns the edited instance and computes the maps of the edit; applying the edit again to
+        the same instance returns the same edited instance
+        instance - INSTANCE to be edited
+        '''
+        if self.instance is not None:
+            if instance is not self.old:
+                raise ValueError("the edit has already been applied to another instance")
+            return self.instance
+
+        nnodes = instance.nnodes + self.add_nodes
+        for v in self.remove_nodes + [v for e in self.add_edges + self.remove_edges for v in e]:
+            if v < 1 or v > nnodes:
+                raise ValueError("node %d does not exist" % v)
+
+        removed = set(self.remove_nodes)
+        self.node_map = []
+        for v in range(1, nnodes + 1):
+            self.node_map.append(-1 if v in removed else v - 1 - sum(1 for w in removed if w < v))
+
+        oldpairs = set(tuple(e) for e in instance.edge_list)
+        removedpairs = set(self.remove_edges)
+        for e in self.remove_edges:
+            if not e in oldpairs:
+                raise ValueError("edge (%d,%d) does not exist" % e)
+
+        edge_list = []
+        obj = []
+        self.edge_map = []
+        for (u,v), w in zip(instance.edge_list, instance.obj):
+            u, v = min(u, v), max(u, v)
+            if u in removed or v in removed or (u,v) in removedpairs:
+                self.edge_map.append(-1)
+            else:
+                self.edge_map.append(len(edge_list))
+                edge_list.append((self.node_map[u - 1] + 1, self.node_map[v - 1] + 1))
+                obj.append(w)
+        remaining = set(edge_list)
+
+        addedpairs = set()
+        for (u,v), w in zip(self.add_edges, self.edge_weights):
+            if u == v or u in removed or v in removed:
+                raise ValueError("edge (%d,%d) cannot be added" % (u, v))
+            e = (self.node_map[u - 1] + 1, self.node_map[v - 1] + 1)
+            if e in remaining:
+                raise ValueError("edge (%d,%d) already exists" % (u, v))
+            remaining.add(e)
+            edge_list.append(e)
+            obj.append(w)
+            addedpairs.add((u,v))
+
+        # adjacencies between remaining old nodes that are changed by the edit
+        nold = instance.nnodes
+        self.joined_pairs = [(self.node_map[u - 1], self.node_map[v - 1])
+                             for (u,v) in sorted(addedpairs - oldpairs)
+                             if u <= nold and v <= nold]
+        self.removed_pairs = [(self.node_map[u - 1], self.node_map[v - 1])
+                              for (u,v) in sorted(removedpairs - addedpairs)
+                              if not u in removed and not v in removed]
+
+        self.old = instance
+        self.instance = INSTANCE(list(range(1, nnodes - len(removed) + 1)), edge_list, obj)
+        return self.instance
+
+    def map_values(self, values, problem, added=None):
+        '''
+        returns a vector indexed by the edges (matching) or nodes (stable set) of the old graph
+        mapped to the new graph
+        values  - vector indexed by the old graph
+        problem - "matching" or "stableset"
+        added   - (optional) values of the added edges or nodes (default 0)
+        '''
+        indexmap = self.edge_map if problem == "matching" else self.node_map[:len(values)]
+        nnew = len(self.instance.edge_list) if problem == "matching" else len(self.instance.nodes)
+        nadded = len(self.add_edges) if problem == "matching" else self.add_nodes
+
+        mapped = [0 for i in range(nnew)]
+        for i in range(len(values)):
+            if indexmap[i] >= 0:
+                mapped[indexmap[i]] = values[i]
+        if added is not None:
+            mapped[nnew - nadded:] = list(added)
+
+        return mapped
+
+    def map_cut(self, cut, problem):
+        '''
+        returns a cut of the old graph mapped to the new graph, or None if it is not known to be
+        valid for the new graph (see above)
+        cut     - list of coefficients of the cut (with right-hand side 1)
+        problem - "matching" or "stableset"
+        '''
+        if min(cut) < 0:
+            return None
+
+        mapped = self.map_values(cut, problem)
+        if problem != "matching":
+            for (u,v) in self.removed_pairs:
+                if mapped[u] > 0 and mapped[v] > 0:
+                    return None
+
+        return mapped
+
+    def keeps_feasibility(self, problem):
+        '''
+        returns whether the feasible points of the old graph, mapped to the new graph, are
+        feasible, i.e., whether no edge has been added between old nodes of a stable set problem
+        problem - "matching" or "stableset"
+        '''
+        return problem == "matching" or len(self.joined_pairs) == 0
+
+
+# instances that have already been read, indexed by absolute path of file
+instance_cache = {}
+
+
+def get_instance(instancefile, cachedir=None):
+    '''
+    returns the instance encoded in a file; each file is only parsed once (unless it has changed)
+    instancefile - path to file encoding instance or an INSTANCE, which is returned
+    cachedir     - (optional) directory of binary cache of parsed files (see read_graph_arrays)
+    '''
+    if isinstance(instancefile, INSTANCE):
+        return instancefile
+
+    path = os.path.abspath(instancefile)
+    mtime = os.path.getmtime(path)
+    if not path in instance_cache or instance_cache[path][0] != mtime:
+        nnodes, edges, weights = read_graph_arrays(instancefile, cachedir)
+        instance_cache[path] = (mtime, INSTANCE(nnodes, edges, weights, instancefile))
+
+    return instance_cache[path][1]
+
+
+def clear_instance_cache():
+    '''
+    removes all instances from the cache
+    '''
+    instance_cache.clear()
+
+
+####################################################################################################
+#
+# CLASS FOR EXPLICIT PACKING POLYTOPES
+#
+####################################################################################################
+
+
+class POLYTOPE:
+    '''
+    packing polytope {x >= 0 : Ax <= 1} given by a sparse nonnegative matrix A in CSR format
+
+    class variables:
+    filename - path to file encoding polytope
+    indptr   - row pointers of A
+    indices  - column indices of A
+    data     - values of A
+    obj      - objective vector
+    nrows    - number of rows of A
+    ncols    - number of columns of A
+    cache    - dictionary of derived data
+    models   - dictionary of prototypes of optimization models, which are copied for each user
+    '''
+
+    def __init__(self, indptr, indices, data, obj, filename=""):
+        '''
+        initializes the polytope
+        indptr   - row pointers of A
+        indices  - column indices of A
+        data     - values of A
+        obj      - objective vector
+        filename - (optional) path to file encoding polytope
+        '''
+        self.filename = filename
+        self.indptr = numpy.asarray(indptr, dtype=numpy.int64)
+        self.indices = numpy.asarray(indices, dtype=numpy.int64)
+        self.data = numpy.asarray(data, dtype=numpy.float64)
+        self.obj = numpy.asarray(obj, dtype=numpy.float64).tolist()
+        self.nrows = len(self.indptr) - 1
+        self.ncols = len(self.obj)
+        self.cache = {}
+        self.models = {}
+
+    def __getstate__(self):
+        '''
+        returns the state of the polytope used for pickling (models cannot be pickled)
+        '''
+        state = dict(self.__dict__)
+        state["models"] = {}
+        return state
+
+    def get_row_ids(self):
+        '''
+        returns array containing the row index of each entry of A
+        '''
+        if not "row_ids" in self.cache:
+            self.cache["row_ids"] = numpy.repeat(numpy.arange(self.nrows), numpy.diff(self.indptr))
+        return self.cache["row_ids"]
+
+    def get_row_norms(self):
+        '''
+        returns array of Euclidean norms of the rows of A
+        '''
+        if not "row_norms" in self.cache:
+            self.cache["row_norms"] = numpy.sqrt(numpy.bincount(self.get_row_ids(),
+                                                                weights=self.data * self.data,
+                                                                minlength=self.nrows))
+        return self.cache["row_norms"]
+
+    def get_upper_bounds(self):
+        '''
+        returns array of the upper bounds 1 / max_i A_ij on the variables that are implied by A
+        (infinite if column j has no positive entry)
+        '''
+        if not "upper_bounds" in self.cache:
+            colmax = numpy.zeros(self.ncols)
+            numpy.maximum.at(colmax, self.indices, self.data)
+            with numpy.errstate(divide="ignore"):
+                self.cache["upper_bounds"] = numpy.where(colmax > 0, 1 / colmax, numpy.inf)
+        return self.cache["upper_bounds"]
+
+    def multiply(self, x):
+        '''
+        returns the product Ax
+        x - array of length ncols
+        '''
+        return numpy.bincount(self.get_row_ids(), weights=self.data * x[self.indices],
+                              minlength=self.nrows)
+
+    def get_row(self, i):
+        '''
+        returns row i of A as dense numpy array
+        i - index of row
+        '''
+        row = numpy.zeros(self.ncols)
+        row[self.indices[self.indptr[i]:self.indptr[i + 1]]] = \
+            self.data[self.indptr[i]:self.indptr[i + 1]]
+        return row
+
+    def get_model(self, key, solver, builder):
+        '''
+        returns a copy of a model and its variables; the model is built on first use
+        key     - identifier of the model
+        solver  - solver to be used
+        builder - function returning the model if it has not been built yet
+        '''
+        if not (key, solver) in self.models:
+            self.models[(key, solver)] = builder()
+
+        return copy_model(self.models[(key, solver)], solver)
+
+    def get_relaxation(self, solver, initconss):
+        '''
+        returns a copy of the LP relaxation (see polytope_create_model) with its variables
+        solver    - solver used to solve relaxation
+        initconss - {0,1,2} to encode whether no/box/box constraints shall be used
+        '''
+        return self.get_model(("relaxation", min(initconss, 1)), solver,
+                              lambda: polytope_create_model(self.obj, solver, initconss,
+                                                            self.get_upper_bounds())[0])
+
+
+def get_polytope(polytopefile):
+    '''
+    returns the polytope encoded in a file (see write_polytope in generators.py); each file is only
+    read once (unless it has changed)
+    polytopefile - path to file encoding polytope or a POLYTOPE, which is returned
+    '''
+    if isinstance(polytopefile, POLYTOPE):
+        return polytopefile
+
+    path = os.path.abspath(polytopefile)
+    mtime = os.path.getmtime(path)
+    if not path in instance_cache or instance_cache[path][0] != mtime:
+        data = numpy.load(path)
+        polytope = POLYTOPE(data["indptr"], data["indices"], data["data"], data["obj"],
+                            polytopefile)
+        data.close()
+        instance_cache[path] = (mtime, polytope)
+
+    return instance_cache[path][1]
+
+
+####################################################################################################
+#
+# CLASS FOR LPBOOST DATASETS
+#
+####################################################################################################
+
+
+class DATASET:
+    '''
+    labeled dataset of an LPBoost problem (see read_lpboost_arrays); the hypotheses are the
+    normalized features h_j and their negations, so the edges sum_i lambda_i y_i h_j(x_i) of all
+    hypotheses are given by a single product of lambda with the matrix of margins
+
+    class variables:
+    filename  - path to file encoding dataset
+    nu        - parameter nu of LPBoost
+    labels    - array of labels in {-1,1}
+    margins   - (samples,features) array of margins y_i h_j(x_i) (possibly memory-mapped and in
+                single precision)
+    nsamples  - number of samples
+    nfeatures - number of features
+    cache     - dictionary of derived data
+    models    - dictionary of prototypes of optimization models, which are copied for each user
+    '''
+
+    def __init__(self, nu, labels, margins, filename=""):
+        '''
+        initializes the dataset
+        nu       - parameter nu of LPBoost
+        labels   - array of labels in {-1,1}
+        margins  - (samples,features) array of margins
+        filename - (optional) path to file encoding dataset
+        '''
+        self.filename = filename
+        self.nu = nu
+        self.labels = labels
+        self.margins = margins
+        self.nsamples, self.nfeatures = margins.shape
+        self.cache = {}
+        self.models = {}
+
+    def __getstate__(self):
+        '''
+        returns the state of the dataset used for pickling (models cannot be pickled)
+        '''
+        state = dict(self.__dict__)
+        state["models"] = {}
+        return state
+
+    def compute_edges(self, weights):
+        '''
+        returns the array of edges sum_i weights_i y_i h_j(x_i) of the hypotheses h_j; the
+        product is computed in chunks of LPBOOST_CHUNKSIZE samples (in the precision of the
+        margins), so memory-mapped margins are streamed once
+        weights - array of weights of the samples
+        '''
+        weights = numpy.asarray(weights, dtype=self.margins.dtype)
+        edges = numpy.zeros(self.nfeatures)
+        for start in range(0, self.nsamples, LPBOOST_CHUNKSIZE):
+            stop = start + LPBOOST_CHUNKSIZE
+            edges += weights[start:stop] @ self.margins[start:stop]
+        return edges
+
+    def get_uniform_edges(self):
+        '''
+        returns the edges of the hypotheses w.r.t. the uniform distribution
+        '''
+        if not "uniform_edges" in self.cache:
+            self.cache["uniform_edges"] = self.compute_edges(numpy.full(self.nsamples,
+                                                                        1 / self.nsamples))
+        return self.cache["uniform_edges"]
+
+    def get_column(self, j):
+        '''
+        returns the margins y_i h_j(x_i) of a hypothesis
+        j - index of hypothesis
+        '''
+        return numpy.asarray(self.margins[:, j], dtype=numpy.float64)
+
+    def get_model(self, key, solver, builder):
+        '''
+        returns a copy of a model and its variables; the model is built on first use
+        key     - identifier of the model
+        solver  - solver to be used
+        builder - function returning the model if it has not been built yet
+        '''
+        if not (key, solver) in self.models:
+            self.models[(key, solver)] = builder()
+
+        return copy_model(self.models[(key, solver)], solver)
+
+    def get_relaxation(self, solver, initconss):
+        '''
+        returns a copy of the initial relaxation (see lpboost_create_model) with its variables
+        solver    - solver used to solve relaxation
+        initconss - {0,1,2} to encode whether no/box/box constraints shall be used
+        '''
+        return self.get_model("relaxation", solver,
+                              lambda: lpboost_create_model(self.nsamples, self.nu, solver,
+                                                           initconss)[0])
+
+
+def get_dataset(datasetfile, cachedir=None, float32=False):
+    '''
+    returns the dataset encoded in a file (see read_lpboost_arrays); each file is only read once
+    (unless it has changed)
+    datasetfile - path to file encoding dataset or a DATASET, which is returned
+    cachedir    - (optional) directory of binary cache of parsed files
+    float32     - (optional) whether the margins are stored in single precision
+    '''
+    if isinstance(datasetfile, DATASET):
+        return datasetfile
+
+    path = os.path.abspath(datasetfile)
+    mtime = os.path.getmtime(path)
+    key = (path, float32)
+    if not key in instance_cache or instance_cache[key][0] != mtime:
+        nu, labels, margins = read_lpboost_arrays(datasetfile, cachedir, float32)
+        instance_cache[key] = (mtime, DATASET(nu, labels, margins, datasetfile))
+
+    return instance_cache[key][1]
+
+
+def load_instance(instancefile, problemtype, cachedir=None, float32=False):
+    '''
+    returns the INSTANCE, POLYTOPE, or DATASET encoded in a file, depending on the type of problem
+    instancefile - path to file encoding instance (or an INSTANCE, POLYTOPE, or DATASET, which is
+                   returned)
+    problemtype  - type of problem
+    cachedir     - (optional) directory of binary cache of parsed graph files and datasets
+    float32      - (optional) whether LPBoost datasets are stored in single precision
+    '''
+    if problemtype == "polytope":
+        return get_polytope(instancefile)
+    if problemtype == "lpboost":
+        return get_dataset(instancefile, cachedir, float32)
+
+    return get_instance(instancefile, cachedir)
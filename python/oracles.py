@@ -1,7 +1,50 @@
 import numpy
+import time
 
 from MIP import *
 from auxiliary import *
+from instance import *
+from heuristics import *
+
+
+def raise_separation_limit(status):
+    '''
+    raises the exception corresponding to a separation solve that has been stopped before a
+    violated cut has been found, i.e., before the point has been proven to be feasible (solves
+    interrupted by SIGINT are handled by check_interrupt)
+    status - status of the separation model (see get_status)
+    '''
+    if status == "timelimit":
+        raise TimeoutError("separation stopped at time limit")
+
+
+def check_interrupt(status):
+    '''
+    raises KeyboardInterrupt if a separation solve has been interrupted; since the solver catches
+    SIGINT itself during the solve, the signal would otherwise be lost
+    status - status of the separation model (see get_status)
+    '''
+    if status == "interrupted":
+        raise KeyboardInterrupt
+
+
+def get_initial_conss(oracle, initconss, box_conss=True):
+    '''
+    returns the constraints used in all fully corrective steps of an oracle: the upper bound
+    constraints (see get_ub_conss, with the upper bounds of the oracle if it has any) if initconss
+    is at least 1 and box_conss is set, followed by the standard cuts if initconss is 2
+    oracle    - oracle providing get_obj, get_upper_bounds, and get_standard_cuts
+    initconss - {0,1,2} to encode whether no/box/standard constraints shall be used
+    box_conss - (optional) whether upper bound constraints are valid in the coordinates of the
+                oracle
+    '''
+    conss = []
+    if initconss >= 1 and box_conss:
+        conss.extend(get_ub_conss(len(oracle.get_obj()), oracle.get_upper_bounds()))
+    if initconss == 2:
+        conss.extend(oracle.get_standard_cuts())
+
+    return conss
 
 
 ####################################################################################################
@@ -23,7 +66,7 @@ class ORACLE:
     def __init__(self, instancefile, problemtype, solver):
         '''
         initializes interface class
-        instancefile - path to file encoding instance
+        instancefile - path to file encoding instance or INSTANCE
         problemtype  - type of problem for which an oracle is defined
         solver       - solver used by oracles
         '''
@@ -36,6 +79,12 @@ class ORACLE:
             self.instantiation = STABLESETORACLE(instancefile, solver, False)
         elif problemtype == "weightstableset":
             self.instantiation = STABLESETORACLE(instancefile, solver, True)
+        elif problemtype == "polytope":
+            self.instantiation = POLYTOPEORACLE(instancefile, solver)
+        elif problemtype == "maxcut":
+            self.instantiation = MAXCUTORACLE(instancefile, solver)
+        elif problemtype == "lpboost":
+            self.instantiation = LPBOOSTORACLE(instancefile, solver)
 
         self.obj = self.instantiation.get_obj()
         self.inner_radius = self.instantiation.get_inner_radius()
@@ -52,19 +101,69 @@ class ORACLE:
         '''
         return self.inner_radius
 
+    def set_obj(self, obj):
+        '''
+        replaces the objective vector (only supported by oracles of packing problems, whose
+        separation does not depend on the objective)
+        obj - new objective vector
+        '''
+        self.instantiation.set_obj(obj)
+        self.obj = self.instantiation.get_obj()
+
+    def apply_edit(self, edit):
+        '''
+        applies an edit of the graph to the oracle, whose separation models are updated in place
+        (only supported by oracles of matching and stable set problems); the objective
+        coefficients of remaining variables are kept unless the objective is derived from the
+        graph, and added variables get the weights given in the edit
+        edit - GRAPHEDIT (see instance.py)
+        '''
+        self.instantiation.apply_edit(edit)
+        self.obj = self.instantiation.get_obj()
+        self.inner_radius = self.instantiation.get_inner_radius()
+
     def get_standard_cuts(self):
         '''
         return standard cuts of problem
         '''
         return self.instantiation.get_standard_cuts()
 
-    def separate_point(self, point, precision):
+    def get_upper_bounds(self):
         '''
-        separates a given point up to a certain precision
+        returns upper bounds on the variables of all feasible points as list (entries may be
+        infinite), or None if the feasible region is not contained in the nonnegative orthant;
+        together with a point below a convex combination of valid cuts, they yield a dual bound
+        without solving an LP (see get_cheap_dual_bound in packing_algorithm.py)
+        '''
+        return self.instantiation.get_upper_bounds()
+
+    def get_initial_conss(self, initconss):
+        '''
+        returns the constraints used in all fully corrective steps (see get_initial_conss)
+        initconss - {0,1,2} to encode whether no/box/standard constraints shall be used
+        '''
+        return self.instantiation.get_initial_conss(initconss)
+
+    def separate_point(self, point, precision, timelimit=None, mipgap=None):
+        '''
+        separates a given point up to a certain precision; raises TimeoutError (KeyboardInterrupt)
+        if the time limit is reached (the solver is interrupted) before the point is separated or
+        proven to be feasible
         point     - point to separate
         precision - precision to decide whether a violated cut exists
+        timelimit - (optional) time limit of the separation in seconds (None if unlimited)
+        mipgap    - (optional) relative gap at which separation MIPs stop (None for the default
+                    gap of the solver); with a positive gap, MIPs also stop at the first cut whose
+                    violation exceeds precision by the gap, and a violated cut may be missed
+        '''
+        return self.instantiation.separate_point(point, precision, timelimit, mipgap)
+
+    def get_primal_solution(self, point=None):
+        '''
+        returns a feasible solution computed by primal heuristics
+        point - (optional) point guiding the heuristics, e.g., a separation candidate
         '''
-        return self.instantiation.separate_point(point, precision)
+        return self.instantiation.get_primal_solution(point)
 
 
 
@@ -80,8 +179,10 @@ class MATCHINGORACLE:
     separation oracle class for the matching problem
 
     class variables:
+    instance         - INSTANCE of underlying graph
     nodes            - list of nodes of underlying graph
     edge_list        - edge list of underlying graph
+    incidence        - list of indices of incident edges for each node
     obj              - objective of problem instance
     solver           - solver used by the oracle
     inner_radius     - radius of inner ball of concrete problem
@@ -90,28 +191,34 @@ class MATCHINGORACLE:
     edgevars         - edge variables of separation model
     parvar           - parity variable of separation model
     degree_conss     - degree constraints
+    weighted         - whether the objective is derived from the graph
     '''
 
     def __init__(self, instancefile, solver, weighted):
         '''
         initializes matching oracle class
-        instancefile - path to file encoding instance
+        instancefile - path to file encoding instance or INSTANCE
         solver       - solver used by oracles
         weighted     - whether we shall generate our own objective function
         '''
 
-        # read instance
-        self.nodes, self.edge_list, self.obj = read_graph_from_file(instancefile)
+        # get (possibly already parsed) instance
+        self.instance = get_instance(instancefile)
+        self.nodes = self.instance.nodes
+        self.edge_list = self.instance.edge_list
+        self.incidence = self.instance.get_incidence()
+        self.obj = self.instance.obj
         self.solver = solver
         self.inner_radius = inner_radius_simplex(len(self.edge_list))
+        self.weighted = weighted
 
         if weighted:
-            self.obj = compute_edge_weights(self.nodes, self.edge_list)
+            self.obj = self.instance.get_edge_weights()
 
-        self.degree_conss = compute_degree_conss(self.nodes, self.edge_list)
+        self.degree_conss = self.instance.get_degree_conss()
 
         self.separation_model, self.nodevars, self.edgevars, self.parvar\
-            = matching_create_sepamodel(self.nodes, self.edge_list, solver)
+            = self.instance.get_sepamodel("matching", solver)
 
     def get_obj(self):
         '''
@@ -119,6 +226,13 @@ class MATCHINGORACLE:
         '''
         return self.obj
 
+    def set_obj(self, obj):
+        '''
+        replaces the objective vector
+        obj - new objective vector
+        '''
+        self.obj = list(obj)
+
     def get_inner_radius(self):
         '''
         returns radius of inner ball
@@ -131,11 +245,72 @@ class MATCHINGORACLE:
         '''
         return self.degree_conss
 
-    def separate_point(self, point, precision):
+    def get_upper_bounds(self):
+        '''
+        returns upper bounds on the variables (each edge is matched at most once)
+        '''
+        return [1.0 for i in self.obj]
+
+    def get_initial_conss(self, initconss):
+        '''
+        returns the constraints used in all fully corrective steps (see get_initial_conss)
+        initconss - {0,1,2} to encode whether no/box/standard constraints shall be used
+        '''
+        return get_initial_conss(self, initconss)
+
+    def apply_edit(self, edit):
+        '''
+        applies an edit of the graph (see GRAPHEDIT) to the oracle; in the separation model,
+        variables of removed edges are dropped from the objective, variables of removed nodes are
+        fixed to 0, and variables and constraints of added nodes and edges are created
+        edit - GRAPHEDIT
+        '''
+        model = self.separation_model
+        solver = self.solver
+        nodes = len(self.nodes)
+        instance = self.instance.apply_edit(edit)
+
+        for v in range(nodes):
+            if edit.node_map[v] < 0:
+                fix_var(model, solver, self.nodevars[v], 0)
+        nodevars = [self.nodevars[v] for v in range(nodes) if edit.node_map[v] >= 0]
+        for k in range(edit.add_nodes):
+            var = create_var(model, solver, vtype="B", obj=0.0, name="v%d" % len(nodevars))
+            add_cons_coeff(model, solver, "select_odd_set", var, 1)
+            nodevars.append(var)
+
+        edgevars = [self.edgevars[e] for e in range(len(self.edgevars)) if edit.edge_map[e] >= 0]
+        for (i,j) in instance.edge_list[len(edgevars):]:
+            var = create_var(model, solver, vtype="B", obj=0.0, name="e%d" % len(edgevars))
+            add_cons(model, solver, var <= nodevars[i-1], name="edge_{}_{}_1".format(i, j))
+            add_cons(model, solver, var <= nodevars[j-1], name="edge_{}_{}_2".format(i, j))
+            add_cons(model, solver, nodevars[i-1] + nodevars[j-1] <= var + 1,
+                     name="edge_{}_{}_3".format(i, j))
+            edgevars.append(var)
+        update_model(model, solver)
+
+        self.instance = instance
+        self.nodes = instance.nodes
+        self.edge_list = instance.edge_list
+        self.incidence = instance.get_incidence()
+        self.degree_conss = instance.get_degree_conss()
+        self.inner_radius = inner_radius_simplex(len(self.edge_list))
+        self.nodevars = nodevars
+        self.edgevars = edgevars
+        if self.weighted:
+            self.obj = instance.get_edge_weights()
+        else:
+            self.obj = edit.map_values(self.obj, "matching", edit.edge_weights)
+
+    def separate_point(self, point, precision, timelimit=None, mipgap=None):
         '''
         separates a given point up to a certain precision
         point     - point to separate
         precision - precision to decide whether a violated cut exists
+        timelimit - (optional) time limit of the separation in seconds (None if unlimited)
+        mipgap    - (optional) relative gap at which the separation MIP stops (None for the
+                    default gap of the solver); if given, the MIP also stops as soon as a cut
+                    whose violation exceeds precision by this relative gap is found
         '''
 
         model = self.separation_model
@@ -150,10 +325,21 @@ class MATCHINGORACLE:
         vars = edgevars + [parvar]
         coefs = point + [-1]
         change_objective(model, solver, vars, coefs, 1)
+        set_time_limit(model, solver, timelimit)
+        set_mip_gap(model, solver, mipgap)
+        set_objective_stop(model, solver, precision * (1 + mipgap) if mipgap is not None else None)
         update_model(model, solver)
         model.optimize()
 
-        max_violation = get_obj_val(model, solver)
+        # if the solve has been stopped by the time limit, the best odd set found so far is used
+        status = get_status(model, solver)
+        check_interrupt(status)
+        if status == "timelimit":
+            max_violation = get_incumbent_val(model, solver)
+            if numpy.isnan(max_violation):
+                max_violation = -numpy.inf
+        else:
+            max_violation = get_obj_val(model, solver)
         res = []
         if max_violation > precision:
             # there is a violated odd set inequality
@@ -174,10 +360,7 @@ class MATCHINGORACLE:
         # check whether degree constraints are violated
         max_degree = -1
         for v in nodes:
-            val = 0
-            for e in range(len(edge_list)):
-                if v in edge_list[e]:
-                    val += point[e]
+            val = sum(point[e] for e in self.incidence[v - 1])
 
             violation = val - 1
 
@@ -187,20 +370,32 @@ class MATCHINGORACLE:
 
         # if a degree constraint is more violated than an odd set constraint, update cut
         if max_degree != -1:
-            res = []
-            for e in range(len(edge_list)):
-                if max_degree in edge_list[e]:
-                    res.append(1)
-                else:
-                    res.append(0)
+            res = list(self.degree_conss[max_degree - 1])
+
+        if len(res) == 0:
+            raise_separation_limit(status)
         return res
 
+    def get_primal_solution(self, point=None):
+        '''
+        returns the characteristic vector of a matching computed by the greedy heuristic and
+        local search (see heuristics.py)
+        point - (optional) point guiding the greedy heuristic
+        '''
+        nnodes, edges = graph_arrays(self.instance)
+        obj = numpy.asarray(self.obj, dtype=numpy.float64)
+        guide = numpy.asarray(point, dtype=numpy.float64) if point is not None else None
+
+        x = greedy_matching(nnodes, edges, obj, guide)
+        return local_search_matching(nnodes, edges, obj, x).tolist()
+
 
 class STABLESETORACLE:
     '''
     separation oracle class for the stable set problem
 
     class variables:
+    instance           - INSTANCE of underlying graph
     nodes              - list of nodes of underlying graph
     counter_edge_list  - edge list of complement of underlying graph
     obj                - objective of problem instance
@@ -208,30 +403,38 @@ class STABLESETORACLE:
     inner_radius       - radius of inner ball of concrete problem
     separation_model   - optimization model to generate cuts
     nodevars           - node variables of separation model
+    labels             - list of the indices of the nodes used in the names of their variables and
+                         constraints in the separation model (the nodes are relabeled by edits)
+    nextlabel          - label of the next added node
     counter_edge_conss - list of edge constraints in complement graph
+    weighted           - whether the objective is derived from the graph
     '''
 
     def __init__(self, instancefile, solver, weighted):
         '''
         initializes stable set oracle class
-        instancefile - path to file encoding instance
+        instancefile - path to file encoding instance or INSTANCE
         solver       - solver used by oracles
         weighted     - whether we shall generate our own objective function
         '''
 
-        # read instance
-        self.nodes, self.edge_list, self.obj = read_graph_from_file(instancefile)
-        self.obj = self.obj[:len(self.nodes)]
+        # get (possibly already parsed) instance
+        self.instance = get_instance(instancefile)
+        self.nodes = self.instance.nodes
+        self.edge_list = self.instance.edge_list
+        self.obj = self.instance.get_node_obj()
         self.solver = solver
         self.inner_radius = inner_radius_simplex(len(self.nodes))
+        self.weighted = weighted
 
         if weighted:
-            self.obj = compute_node_weights(self.nodes, self.edge_list)
+            self.obj = self.instance.get_node_weights()
 
-        self.edge_conss = compute_edge_conss(self.nodes, self.edge_list)
+        self.edge_conss = self.instance.get_edge_conss()
 
-        self.separation_model, self.nodevars\
-            = stableset_create_sepamodel(self.nodes, self.edge_list, solver)
+        self.separation_model, self.nodevars = self.instance.get_sepamodel("stableset", solver)
+        self.labels = list(range(len(self.nodes)))
+        self.nextlabel = len(self.nodes)
 
     def get_obj(self):
         '''
@@ -239,6 +442,13 @@ class STABLESETORACLE:
         '''
         return self.obj
 
+    def set_obj(self, obj):
+        '''
+        replaces the objective vector
+        obj - new objective vector
+        '''
+        self.obj = list(obj)
+
     def get_inner_radius(self):
         '''
         returns radius of inner ball
@@ -251,11 +461,82 @@ class STABLESETORACLE:
         '''
         return self.edge_conss
 
-    def separate_point(self, point, precision):
+    def get_upper_bounds(self):
+        '''
+        returns upper bounds on the variables (each node is chosen at most once)
+        '''
+        return [1.0 for i in self.obj]
+
+    def get_initial_conss(self, initconss):
+        '''
+        returns the constraints used in all fully corrective steps (see get_initial_conss)
+        initconss - {0,1,2} to encode whether no/box/standard constraints shall be used
+        '''
+        return get_initial_conss(self, initconss)
+
+    def apply_edit(self, edit):
+        '''
+        applies an edit of the graph (see GRAPHEDIT) to the oracle; in the separation model,
+        variables of removed nodes are fixed to 0, the constraints of pairs of nodes joined by an
+        added edge are removed, and variables and constraints of nodes that are no longer adjacent
+        and of added nodes are created
+        edit - GRAPHEDIT
+        '''
+        model = self.separation_model
+        solver = self.solver
+        nodes = len(self.nodes)
+        instance = self.instance.apply_edit(edit)
+
+        def name(u, v):
+            return "nonedge_{}_{}".format(min(labels[u], labels[v]), max(labels[u], labels[v]))
+
+        for v in range(nodes):
+            if edit.node_map[v] < 0:
+                fix_var(model, solver, self.nodevars[v], 0)
+        nodevars = [self.nodevars[v] for v in range(nodes) if edit.node_map[v] >= 0]
+        labels = [self.labels[v] for v in range(nodes) if edit.node_map[v] >= 0]
+
+        if len(edit.joined_pairs) > 0:
+            remove_conss(model, solver, set(name(u, v) for (u,v) in edit.joined_pairs))
+        for (u,v) in edit.removed_pairs:
+            add_cons(model, solver, nodevars[u] + nodevars[v] <= 1, name=name(u, v))
+
+        # added nodes are joined to all nodes that are not adjacent in the complement graph
+        neighbors = [set() for k in range(edit.add_nodes)]
+        for (u,v) in instance.edge_list:
+            if v > len(nodevars):
+                neighbors[v - len(nodevars) - 1].add(u - 1)
+        for k in range(edit.add_nodes):
+            w = len(nodevars)
+            labels.append(self.nextlabel)
+            self.nextlabel += 1
+            nodevars.append(create_var(model, solver, vtype="B", obj=0.0, name="v%d" % labels[w]))
+            for u in range(w):
+                if not u in neighbors[k]:
+                    add_cons(model, solver, nodevars[u] + nodevars[w] <= 1, name=name(u, w))
+        update_model(model, solver)
+
+        self.instance = instance
+        self.nodes = instance.nodes
+        self.edge_list = instance.edge_list
+        self.edge_conss = instance.get_edge_conss()
+        self.inner_radius = inner_radius_simplex(len(self.nodes))
+        self.nodevars = nodevars
+        self.labels = labels
+        if self.weighted:
+            self.obj = instance.get_node_weights()
+        else:
+            self.obj = edit.map_values(self.obj, "stableset", edit.node_weights)
+
+    def separate_point(self, point, precision, timelimit=None, mipgap=None):
         '''
         separates a given point up to a certain precision
         point     - point to separate
         precision - precision to decide whether a violated cut exists
+        timelimit - (optional) time limit of the separation in seconds (None if unlimited)
+        mipgap    - (optional) relative gap at which the separation MIP stops (None for the
+                    default gap of the solver); if given, the MIP also stops as soon as a cut
+                    whose violation exceeds precision by this relative gap is found
         '''
 
         model = self.separation_model
@@ -265,17 +546,507 @@ class STABLESETORACLE:
 
         # separate clique inequalities
         change_objective(model, solver, nodevars, point, 1)
+        set_time_limit(model, solver, timelimit)
+        set_mip_gap(model, solver, mipgap)
+        set_objective_stop(model, solver,
+                           (1 + precision) * (1 + mipgap) if mipgap is not None else None)
         update_model(model, solver)
         model.optimize()
 
+        # if the solve has been stopped by the time limit, the best clique found so far is used
+        status = get_status(model, solver)
+        check_interrupt(status)
+        if status == "timelimit":
+            max_val = get_incumbent_val(model, solver)
+        else:
+            max_val = get_obj_val(model, solver)
+
         # there is a violated clique inequality
         res = []
-        if get_obj_val(model, solver) - 1 > precision:
+        if max_val - 1 > precision:
             sol = get_solution(model, solver)
             for i in range(len(nodevars)):
                 if get_sol_val(model, solver, sol, nodevars[i]) > 0.5:
                     res.append(1)
                 else:
                     res.append(0)
+        else:
+            raise_separation_limit(status)
 
         return res
+
+    def get_primal_solution(self, point=None):
+        '''
+        returns the characteristic vector of a stable set computed by the greedy heuristic and
+        local search (see heuristics.py)
+        point - (optional) point guiding the greedy heuristic
+        '''
+        nnodes, edges = graph_arrays(self.instance)
+        obj = numpy.asarray(self.obj, dtype=numpy.float64)
+        guide = numpy.asarray(point, dtype=numpy.float64) if point is not None else None
+
+        x = greedy_stableset(nnodes, edges, obj, guide)
+        return local_search_stableset(nnodes, edges, obj, x).tolist()
+
+
+class POLYTOPEORACLE:
+    '''
+    separation oracle class for an explicit packing polytope {x >= 0 : Ax <= 1}; no solver is
+    needed since all rows of A are checked by a single sparse matrix-vector product
+
+    class variables:
+    polytope     - POLYTOPE defining the problem
+    obj          - objective of problem instance
+    solver       - solver used by the oracle (not used)
+    inner_radius - radius of inner ball of concrete problem
+    '''
+
+    def __init__(self, polytopefile, solver):
+        '''
+        initializes polytope oracle class
+        polytopefile - path to file encoding polytope or POLYTOPE
+        solver       - solver used by oracles
+        '''
+
+        # get (possibly already read) polytope
+        self.polytope = get_polytope(polytopefile)
+        self.obj = self.polytope.obj
+        self.solver = solver
+
+        # the ball of radius 1/max ||a_i|| around the origin satisfies all rows
+        norms = self.polytope.get_row_norms()
+        self.inner_radius = 1 / norms.max() if len(norms) > 0 else 1.0
+
+    def get_obj(self):
+        '''
+        returns objective vector
+        '''
+        return self.obj
+
+    def set_obj(self, obj):
+        '''
+        replaces the objective vector
+        obj - new objective vector
+        '''
+        self.obj = list(obj)
+
+    def get_inner_radius(self):
+        '''
+        returns radius of inner ball
+        '''
+        return self.inner_radius
+
+    def get_standard_cuts(self):
+        '''
+        return standard cuts (none, the upper bounds are already part of the initial constraints)
+        '''
+        return []
+
+    def get_upper_bounds(self):
+        '''
+        returns upper bounds on the variables, i.e., 1 / max_i A_ij for column j (infinite if the
+        column has no positive entry)
+        '''
+        return self.polytope.get_upper_bounds().tolist()
+
+    def get_initial_conss(self, initconss):
+        '''
+        returns the constraints used in all fully corrective steps (see get_initial_conss)
+        initconss - {0,1,2} to encode whether no/box/standard constraints shall be used
+        '''
+        return get_initial_conss(self, initconss)
+
+    def separate_point(self, point, precision, timelimit=None, mipgap=None):
+        '''
+        separates a given point up to a certain precision by returning a most violated row
+        point     - point to separate
+        precision - precision to decide whether a violated cut exists
+        timelimit - (optional) time limit of the separation in seconds (not used, the separation
+                    is a single matrix-vector product)
+        mipgap    - (optional) relative gap of separation MIPs (not used)
+        '''
+        activity = self.polytope.multiply(numpy.asarray(point, dtype=numpy.float64))
+        if len(activity) == 0:
+            return []
+
+        row = int(numpy.argmax(activity))
+        if activity[row] - 1 > precision:
+            return self.polytope.get_row(row)
+
+        return []
+
+    def get_primal_solution(self, point=None):
+        '''
+        returns a 0/1 point of the polytope computed by the greedy heuristic (see heuristics.py)
+        point - (optional) point guiding the greedy heuristic
+        '''
+        obj = numpy.asarray(self.obj, dtype=numpy.float64)
+        guide = numpy.asarray(point, dtype=numpy.float64) if point is not None else None
+
+        return greedy_polytope(self.polytope, obj, guide).tolist()
+
+
+class MAXCUTORACLE:
+    '''
+    separation oracle class for the semidefinite relaxation of the max-cut problem, i.e.,
+    maximizing sum w_ij (1 - X_ij) / 2 over the elliptope {X psd : X_ii = 1}; the variables are
+    the entries X_ij with i < j (see INSTANCE.get_pairs), so the diagonal is fixed implicitly and
+    no equations are needed. A point violates X psd iff the smallest eigenvalue lambda of X is
+    negative; for a unit eigenvector v, v^T X v >= 0 then gives the cut
+    sum_{i<j} -2 v_i v_j X_ij <= 1 with violation -lambda. The eigenvector of the previous call
+    is used as starting vector of the next eigensolve (see smallest_eigenpair), since the
+    separation candidates of consecutive iterations are close.
+
+    class variables:
+    instance     - INSTANCE of underlying graph
+    nodes        - list of nodes of underlying graph
+    pairs        - arrays (rows, cols) of the node pairs indexing the variables
+    weights      - symmetric (n,n) array of edge weights
+    obj          - objective of problem instance
+    solver       - solver used by the oracle (not used)
+    inner_radius - radius of inner ball of concrete problem
+    eigvec       - eigenvector computed by the previous separation (None before the first one)
+    '''
+
+    def __init__(self, instancefile, solver):
+        '''
+        initializes max-cut oracle class
+        instancefile - path to file encoding instance or INSTANCE
+        solver       - solver used by oracles
+        '''
+
+        # get (possibly already parsed) instance
+        self.instance = get_instance(instancefile)
+        self.nodes = self.instance.nodes
+        self.pairs = self.instance.get_pairs()
+        self.weights = self.instance.get_weight_matrix()
+        self.obj = self.instance.get_maxcut_obj()
+        self.solver = solver
+        self.eigvec = None
+
+        # I + E is psd if the spectral norm of E is at most 1, which holds if
+        # ||E||_F^2 = 2 sum_{i<j} E_ij^2 <= 1
+        self.inner_radius = 1 / numpy.sqrt(2)
+
+    def get_obj(self):
+        '''
+        returns objective vector
+        '''
+        return self.obj
+
+    def get_inner_radius(self):
+        '''
+        returns radius of inner ball
+        '''
+        return self.inner_radius
+
+    def get_standard_cuts(self):
+        '''
+        return lower bound constraints -X_ij <= 1 (the upper bounds are part of the initial
+        constraints)
+        '''
+        npairs = len(self.obj)
+        cuts = []
+        for i in range(npairs):
+            cut = npairs * [0]
+            cut[i] = -1
+            cuts.append(cut)
+        return cuts
+
+    def get_upper_bounds(self):
+        '''
+        returns None, since the entries X_ij may be negative
+        '''
+        return None
+
+    def get_initial_conss(self, initconss):
+        '''
+        returns the constraints used in all fully corrective steps (see get_initial_conss)
+        initconss - {0,1,2} to encode whether no/box/standard constraints shall be used
+        '''
+        return get_initial_conss(self, initconss)
+
+    def get_matrix(self, point):
+        '''
+        returns the symmetric matrix X with unit diagonal encoded by a point
+        point - values of the entries X_ij with i < j
+        '''
+        matrix = numpy.eye(len(self.nodes))
+        matrix[self.pairs] = point
+        matrix.T[self.pairs] = point
+        return matrix
+
+    def separate_point(self, point, precision, timelimit=None, mipgap=None):
+        '''
+        separates a given point up to a certain precision by an eigenvector of the smallest
+        eigenvalue
+        point     - point to separate
+        precision - precision to decide whether a violated cut exists
+        timelimit - (optional) time limit of the separation in seconds (not used, the eigensolve
+                    is not interrupted)
+        mipgap    - (optional) relative gap of separation MIPs (not used)
+        '''
+        if len(self.nodes) == 0:
+            return []
+
+        eigval, eigvec = smallest_eigenpair(self.get_matrix(point), self.eigvec)
+        self.eigvec = eigvec
+
+        if -eigval > precision:
+            return (-2 * numpy.outer(eigvec, eigvec)[self.pairs]).tolist()
+
+        return []
+
+    def get_primal_solution(self, point=None):
+        '''
+        returns the point X = s s^T of a cut computed by hyperplane rounding and local search
+        (see heuristics.py)
+        point - (optional) point guiding the hyperplane rounding
+        '''
+        matrix = self.get_matrix(point) if point is not None else None
+
+        sides = hyperplane_maxcut(self.weights, matrix)
+        sides = local_search_maxcut(self.weights, sides)
+        return numpy.outer(sides, sides)[self.pairs].tolist()
+
+
+class LPBOOSTORACLE:
+    '''
+    separation oracle class for the LPBoost problem max { gamma : gamma + sum_i lambda_i y_i h(x_i)
+    <= 0 for all hypotheses h, 0 <= lambda_i <= D, sum_i lambda_i = 1 } with D = 1 / (n nu), where
+    the hypotheses are the normalized features and their negations (see DATASET). Since the
+    packing algorithm needs the origin in the interior of a well-conditioned region, the
+    variables are z = (gamma + 2, n lambda - 1), i.e., the objective value is gamma + 2, and all
+    cuts are scaled to right-hand side 1 and projected onto the subspace sum_i z_i = 0 of the
+    distributions (so every point computed by the packing algorithm is a distribution). At the
+    origin, all hypotheses have slack at least 1, and the bounds -1 <= z_i <= 1/nu - 1 have slack
+    1 and 1/nu - 1, respectively.
+
+    class variables:
+    dataset      - DATASET defining the problem
+    nsamples     - number of samples n
+    ub           - upper bound 1/nu - 1 on the variables of lambda
+    obj          - objective of problem instance
+    solver       - solver used by the oracle (not used)
+    inner_radius - radius of inner ball of concrete problem (within the subspace)
+    '''
+
+    def __init__(self, datasetfile, solver):
+        '''
+        initializes LPBoost oracle class
+        datasetfile - path to file encoding dataset or DATASET
+        solver      - solver used by oracles
+        '''
+
+        # get (possibly already read) dataset
+        self.dataset = get_dataset(datasetfile)
+        self.nsamples = self.dataset.nsamples
+        self.ub = 1 / self.dataset.nu - 1
+        self.obj = [1.0] + self.nsamples * [0.0]
+        self.solver = solver
+
+        if self.nsamples < 2 or self.dataset.nfeatures == 0 or self.ub <= 0:
+            raise ValueError("LPBoost needs at least two samples, a feature, and nu < 1")
+
+        # the projected cuts of the hypotheses have norm at most sqrt(1 + 1/n)
+        self.inner_radius = min(self.ub, 1 / numpy.sqrt(1 + 1 / self.nsamples))
+
+    def get_obj(self):
+        '''
+        returns objective vector
+        '''
+        return self.obj
+
+    def get_inner_radius(self):
+        '''
+        returns radius of inner ball
+        '''
+        return self.inner_radius
+
+    def get_bound_cut(self, i, upper):
+        '''
+        returns the bound lambda_i <= D (or lambda_i >= 0) as cut
+        i     - index of sample
+        upper - whether the upper bound is returned
+        '''
+        n = self.nsamples
+        scale = 1 / self.ub if upper else -1.0
+
+        cut = numpy.full(n + 1, -scale / n)
+        cut[0] = 0
+        cut[i + 1] += scale
+        return cut.tolist()
+
+    def get_standard_cuts(self):
+        '''
+        return bounds on lambda
+        '''
+        return [self.get_bound_cut(i, upper) for upper in [True, False]
+                for i in range(self.nsamples)]
+
+    def get_upper_bounds(self):
+        '''
+        returns None, since the feasible region is not down-closed
+        '''
+        return None
+
+    def get_initial_conss(self, initconss):
+        '''
+        returns the constraints used in all fully corrective steps (see get_initial_conss); the
+        bounds on lambda are no unit vectors in the coordinates of the oracle and are only
+        contained in the standard cuts
+        initconss - {0,1,2} to encode whether no/box/standard constraints shall be used
+        '''
+        return get_initial_conss(self, initconss, False)
+
+    def get_distribution(self, point):
+        '''
+        returns the distribution lambda encoded by a point
+        point - point in the coordinates of the oracle
+        '''
+        return (1 + numpy.asarray(point[1:], dtype=numpy.float64)) / self.nsamples
+
+    def separate_point(self, point, precision, timelimit=None, mipgap=None):
+        '''
+        separates a given point up to a certain precision by the most violated bound or
+        hypothesis; the edges of all hypotheses are computed by a single product with the margins
+        point     - point to separate
+        precision - precision to decide whether a violated cut exists
+        timelimit - (optional) time limit of the separation in seconds (not used)
+        mipgap    - (optional) relative gap of separation MIPs (not used)
+        '''
+        n = self.nsamples
+        point = numpy.asarray(point, dtype=numpy.float64)
+
+        # violations of the bounds (scaled to right-hand side 1)
+        upper = point[1:] / self.ub - 1
+        lower = -point[1:] - 1
+        iupper = int(numpy.argmax(upper))
+        ilower = int(numpy.argmax(lower))
+
+        # violations of the hypotheses s h_j, s in {-1,1}, whose cuts z_0 + s sum_i z_i y_i h_j(x_i)
+        # / n <= 2 - s edge_j(1/n, ..., 1/n) are equivalent to gamma + s edge_j(lambda) <= 0
+        edges = self.dataset.compute_edges(self.get_distribution(point))
+        uniform = self.dataset.get_uniform_edges()
+        violations = numpy.stack([(point[0] - 2 + edges) / (2 - uniform),
+                                  (point[0] - 2 - edges) / (2 + uniform)])
+        k, j = numpy.unravel_index(numpy.argmax(violations), violations.shape)
+        sign = 1.0 if k == 0 else -1.0
+        violation = violations[k, j]
+
+        if max(upper[iupper], lower[ilower]) > max(violation, precision):
+            if upper[iupper] >= lower[ilower]:
+                return self.get_bound_cut(iupper, True)
+            return self.get_bound_cut(ilower, False)
+
+        if violation > precision:
+            column = sign * self.dataset.get_column(j)
+            cut = numpy.empty(n + 1)
+            cut[0] = 1
+            cut[1:] = (column - column.mean()) / n
+            return (cut / (2 - sign * uniform[j])).tolist()
+
+        return []
+
+    def get_primal_solution(self, point=None):
+        '''
+        returns the feasible point of the distribution closest to the one of a point (or of the
+        uniform distribution) with maximum gamma (see heuristics.py)
+        point - (optional) point guiding the heuristic
+        '''
+        n = self.nsamples
+        if point is None:
+            distribution = numpy.full(n, 1 / n)
+        else:
+            distribution = project_capped_simplex(self.get_distribution(point),
+                                                  1 / (n * self.dataset.nu))
+
+        gamma = -numpy.abs(self.dataset.compute_edges(distribution)).max()
+        return [gamma + 2] + (n * distribution - 1).tolist()
+
+
+
+####################################################################################################
+#
+# SEPARATION WITH PRECISION CONTINUATION
+#
+####################################################################################################
+
+# factor by which the separation tolerance is tightened
+CONTINUATION_FACTOR = 0.1
+
+
+class CONTINUATION:
+    '''
+    separation tolerance of a run that starts coarse and is tightened geometrically until it
+    reaches the precision of the run; with a coarse tolerance, only cuts violated by more than the
+    tolerance are separated, and separation MIPs stop at a relative gap equal to the tolerance or
+    as soon as a sufficiently violated cut is found, which makes early separation rounds cheaper.
+    Points are only declared feasible by the precision of the run: if no cut is found with a
+    coarse tolerance, the point is separated again with the precision. If the initial tolerance
+    does not exceed the precision, the separation is the same as without continuation.
+
+    class variables:
+    precision - precision of the run, i.e., final tolerance
+    tolerance - current tolerance
+    factor    - factor by which the tolerance is tightened
+    time      - total time spent in separation in seconds
+    ncalls    - number of calls of the oracle
+    '''
+
+    def __init__(self, precision, initial=None, factor=CONTINUATION_FACTOR):
+        '''
+        initializes the tolerance
+        precision - precision of the run
+        initial   - (optional) initial tolerance (None for no continuation)
+        factor    - (optional) factor by which the tolerance is tightened
+        '''
+        self.precision = precision
+        self.tolerance = max(initial, precision) if initial is not None else precision
+        self.factor = factor
+        self.time = 0.0
+        self.ncalls = 0
+
+    def is_final(self):
+        '''
+        returns whether the tolerance has reached the precision of the run
+        '''
+        return self.tolerance <= self.precision
+
+    def tighten(self):
+        '''
+        tightens the tolerance by one step
+        '''
+        self.tolerance = max(self.tolerance * self.factor, self.precision)
+
+    def update_gap(self, relgap):
+        '''
+        tightens the tolerance while it exceeds the relative gap between a verified dual bound and
+        the primal value, i.e., while cuts of the current tolerance cannot close the gap
+        relgap - relative gap (dual bound / primal value - 1)
+        '''
+        while not self.is_final() and self.tolerance > relgap:
+            self.tighten()
+
+    def separate(self, oracle, point, deadline):
+        '''
+        separates a point with the current tolerance and returns the cut; if no cut is found, the
+        point is separated again with the precision of the run
+        oracle   - ORACLE
+        point    - point to separate
+        deadline - DEADLINE whose remaining time is passed to each separation
+        '''
+        starttime = time.time()
+        try:
+            self.ncalls += 1
+            if self.is_final():
+                return oracle.separate_point(point, self.precision, deadline.get_remaining())
+
+            cut = oracle.separate_point(point, self.tolerance, deadline.get_remaining(),
+                                        self.tolerance)
+            if len(cut) == 0:
+                self.ncalls += 1
+                cut = oracle.separate_point(point, self.precision, deadline.get_remaining())
+            return cut
+        finally:
+            self.time += time.time() - starttime
@@ -1,13 +1,81 @@
 from oracles import *
 from problems import *
 from auxiliary import *
+from scheduler import *
+from activeset import *
 
 import numpy
 import time
 
 
+def update_q(activeset, cur_q, atom, cur_f, toward=False):
+    '''
+    returns q after a cheap step towards an atom, i.e., the point closest to f on the line segment
+    between q and the atom or the result of a step of the active set (see activeset.py)
+    activeset - ACTIVESET (None for line segment steps)
+    cur_q     - current q
+    atom      - new cut or the origin
+    cur_f     - current f
+    toward    - (optional) whether the active set has to perform a toward step
+    '''
+    if activeset is None:
+        return closest_point_linesegment(cur_q, atom, cur_f)
+    return activeset.step(atom, cur_f, toward)
+
+
+def get_cheap_dual_bound(cur_q, cur_f, cur_gamma, upper_bounds):
+    '''
+    returns an upper bound on the optimal objective value that is derived from q without solving
+    an LP: since q lies below a convex combination of valid cuts (and the origin), q x <= 1 holds
+    for all feasible x >= 0, and thus obj x = gamma f x <= gamma (lambda + sum_j ub_j (f_j -
+    lambda q_j)_+) for all lambda >= 0; the bound is evaluated for lambda = 1 and for the lambda
+    minimizing the terms of the entries q_j > 0, i.e., the breakpoint f_j / q_j at which the
+    weights ub_j q_j, accumulated in decreasing order of the breakpoints, first exceed 1 (0 if
+    they do not)
+    cur_q        - current q
+    cur_f        - current f
+    cur_gamma    - current gamma
+    upper_bounds - numpy array of upper bounds on the variables (may be infinite)
+    '''
+    q = numpy.asarray(cur_q, dtype=numpy.float64)
+    f = numpy.asarray(cur_f, dtype=numpy.float64)
+
+    candidates = [1.0]
+    positive = q > 0
+    breakpoints = f[positive] / q[positive]
+    order = numpy.argsort(-breakpoints)
+    exceeding = numpy.flatnonzero(numpy.cumsum((upper_bounds[positive] * q[positive])[order]) > 1)
+    candidates.append(max(breakpoints[order[exceeding[0]]], 0.0) if len(exceeding) > 0 else 0.0)
+
+    bound = numpy.inf
+    for factor in candidates:
+        slack = f - factor * q
+        excess = slack > 0
+        bound = min(bound, factor + numpy.dot(upper_bounds[excess], slack[excess]))
+    return cur_gamma * bound
+
+
+def update_cheap_dual_bound(cheap_bound, cur_q, cur_f, cur_gamma, upper_bounds):
+    '''
+    returns the minimum of the best dual bound derived from q so far (nan if there is none) and
+    the bound of the current q if the latter is finite
+    cheap_bound  - best dual bound derived from q so far
+    cur_q        - current q
+    cur_f        - current f
+    cur_gamma    - current gamma
+    upper_bounds - numpy array of upper bounds on the variables
+    '''
+    bound = get_cheap_dual_bound(cur_q, cur_f, cur_gamma, upper_bounds)
+    if numpy.isfinite(bound):
+        return numpy.fmin(cheap_bound, bound)
+    return cheap_bound
+
+
 def packing_algorithm(oracle, precision, maxiter, corrective_freq, lbopt, initconss, solver,
-                      verif_model, silent=True):
+                      verif_model, silent=True, dual_freq=0, stats=None, heuristic_freq=0,
+                      gap=0.01, timelimit=-1, cputimelimit=-1, scheduler=None, down_closed=True,
+                      initial_cuts=None, progress=None, initial_q=None, continuation=None,
+                      update="linesegment", cheap_dual=False, record_points=False):
     '''
     runs our algorithm for packing problems
     oracle          - oracle to generate cuts for problem instance
@@ -19,107 +87,332 @@ def packing_algorithm(oracle, precision, maxiter, corrective_freq, lbopt, initco
     solver          - solver used by oracle
     verif_model     - model to verify termination criterion
     silent          - (optional) whether no output to the terminal shall be produced
+    dual_freq       - (optional) frequency (in separated cuts) of recording the dual bound of
+                      verif_model; 0 disables tracking, 1 records the bound after each cut
+    stats           - (optional) dictionary that is filled with statistics of the run
+                      (iteration counts, running time, elapsed time after each iteration)
+    heuristic_freq  - (optional) frequency (in separated cuts) of rounding the separation candidate
+                      by the primal heuristics of the oracle (see get_primal_solution); 0 disables
+                      rounding
+    gap             - (optional) relative gap between dual bound and gamma at which the algorithm
+                      stops
+    timelimit       - (optional) wall-clock time limit in seconds (nonpositive if unlimited)
+    cputimelimit    - (optional) CPU time limit in seconds (nonpositive if unlimited)
+    scheduler       - (optional) scheduler deciding when fully corrective steps are performed (see
+                      scheduler.py); if None, they are performed with frequency corrective_freq
+    down_closed     - (optional) whether the feasible region is down-closed within the nonnegative
+                      orthant (as for packing problems); otherwise, f is only approximated well
+                      enough if ||f - q|| <= precision, and q is not reduced to min(f, q)
+    initial_cuts    - (optional) list of cuts known in advance, e.g., separated in runs for other
+                      objectives; q is initialized as closest point to f in their convex hull
+                      (by line segment steps if no fully corrective steps are performed), they are
+                      used in all fully corrective steps and returned with the separated cuts;
+                      they have to be added to verif_model by the caller
+    progress        - (optional) function called after each iteration with the number of
+                      iterations, gamma, and the last computed dual bound (nan if none has been
+                      computed yet); if it returns True, the algorithm stops with status
+                      "interrupted"
+    initial_q       - (optional) point in the convex hull of the origin and initial_cuts, e.g., q
+                      of an earlier run, at which the line segment steps of the warm start begin
+    continuation    - (optional) initial separation tolerance; if it exceeds precision, cuts are
+                      separated with a coarse tolerance that is tightened geometrically as the
+                      gap between gamma and the verified dual bound closes (see CONTINUATION in
+                      oracles.py); None separates with precision throughout
+    update          - (optional) how q is updated between fully corrective steps: "linesegment"
+                      projects f onto the line segment between q and the new cut (or 0), "away"
+                      and "pairwise" track q as convex combination of the cuts and perform
+                      away or pairwise steps (see activeset.py)
+    cheap_dual      - (optional) whether the dual bound derived from q (see get_cheap_dual_bound)
+                      is computed in each iteration for regions whose oracle provides upper bounds
+                      on the variables; it replaces the LP solves of verif_model for recording
+                      dual bounds and adapting the separation tolerance, and verif_model is only
+                      solved once q approximates f; the algorithm also stops as soon as this bound
+                      closes the gap
+    record_points   - (optional) whether f and q are recorded after each iteration (e.g., for
+                      the plots of compare.py); otherwise, only the final f and q are returned
+
+    The algorithm stops after the current iteration if SIGINT or SIGTERM is received, and the
+    separation receives the remaining time. In both cases, the results found so far are returned;
+    the reason for stopping ("converged", "maxiter", "timelimit", "cputimelimit", "interrupted")
+    is stored in stats["status"] and the last computed dual bound in stats["dual_bound"].
     '''
 
     # get the objective coefficients and the radius of the inner ball
     obj = oracle.get_obj()
 
-    # initialize parameters
+    # initialize parameters (the vectors are numpy arrays)
+    obj_arr = numpy.asarray(obj, dtype=numpy.float64)
     cur_gamma = lbopt
-    cur_q = [0 for i in obj]
-    cur_f = [val/cur_gamma for val in obj]
+    cur_q = numpy.zeros(len(obj_arr))
+    cur_f = obj_arr / cur_gamma
 
     # initialize null vector necessary for projection on line segment
-    null_vector = [0 for i in obj]
+    null_vector = numpy.zeros(len(obj_arr))
 
     # initialize lists for generating statistics
-    separated_cons = [cur_q]
+    separated_cons = [null_vector]
     sepa_rounds = []
     found_solutions = []
     gamma_vals = [cur_gamma]
     all_f = [cur_f]
     all_q = [cur_q]
+    dual_bounds = []
+
+    # upper bounds on the variables and best dual bound derived from q (nan if not computed)
+    upper_bounds = None
+    cheap_bound = numpy.nan
+    if cheap_dual and down_closed and oracle.get_upper_bounds() is not None:
+        upper_bounds = numpy.asarray(oracle.get_upper_bounds(), dtype=numpy.float64)
+        cheap_bound = update_cheap_dual_bound(cheap_bound, cur_q, cur_f, cur_gamma, upper_bounds)
+
+    # dual bound of verif_model and whether it reflects all cuts added so far; the recorded
+    # bounds are the minimum of this bound and the one derived from q
+    cur_dual = numpy.nan
+    dual_uptodate = False
+    lpcnt = 0
+    if dual_freq > 0:
+        if upper_bounds is None:
+            cur_dual = verif_model.optimize()
+            dual_uptodate = True
+            lpcnt += 1
+        dual_bounds.append(numpy.fmin(cur_dual, cheap_bound))
 
     iterationcnt = 0
     primalcnt = 0
     dualcnt = 0
+    heuristiccnt = 0
+    correctivecnt = 0
+    iteration_times = []
+    if scheduler is None:
+        scheduler = FIXEDSCHEDULER(corrective_freq)
+    separation = CONTINUATION(precision, continuation)
+    activeset = None
+    if update != "linesegment":
+        activeset = ACTIVESET(update, down_closed, null_vector)
 
-    # the main loop
     starttime = time.time()
-    while True:
-        silentprint(["iteration", iterationcnt], silent)
-        silentprint(["f", cur_f], silent)
 
-        # stop if we have approximated f well enough
-        if isGE(cur_q, cur_f, precision):
-            dual_val = verif_model.optimize()
+    # warm start q by the cuts known in advance (q is reduced after each step as in the loop);
+    # since they are contained in verif_model, they are not added again if they are separated
+    initial_keys = set()
+    if initial_cuts:
+        separated_cons.extend(initial_cuts)
+        initial_keys = set(tuple(cons) for cons in initial_cuts)
+        if scheduler.is_active():
+            projection = AUXPROBLEM([cur_f, separated_cons + initconss, down_closed],
+                                    "closestpoint", solver)
+            cur_q = projection.solve()
+            if activeset is not None:
+                activeset.reset(separated_cons + initconss, projection.get_multipliers())
+            if down_closed:
+                cur_q = numpy.minimum(cur_q, cur_f)
+            else:
+                cur_q = update_q(activeset, cur_q, null_vector, cur_f, True)
+        else:
+            if initial_q is not None:
+                cur_q = numpy.array(initial_q, dtype=numpy.float64)
+                if activeset is not None:
+                    activeset.reset([cur_q], [1.0])
+            for cons in initial_cuts:
+                cur_q = update_q(activeset, cur_q, cons, cur_f)
+                if down_closed:
+                    cur_q = numpy.minimum(cur_q, cur_f)
+                else:
+                    cur_q = update_q(activeset, cur_q, null_vector, cur_f, True)
+        all_q[0] = cur_q
+        if upper_bounds is not None:
+            cheap_bound = update_cheap_dual_bound(cheap_bound, cur_q, cur_f, cur_gamma,
+                                                  upper_bounds)
+
+    # the main loop
+    deadline = DEADLINE(timelimit, cputimelimit)
+    status = "maxiter"
+    with INTERRUPTHANDLER() as handler:
+        while True:
+            silentprint(["iteration", iterationcnt], silent)
+            silentprint(["f", cur_f], silent)
+
+            # stop if a signal has been received or a time limit is reached
+            if handler.interrupted:
+                status = "interrupted"
+                break
+            limit = deadline.get_status()
+            if limit is not None:
+                status = limit
+                break
 
-            # we are close enough to the primal value
-            if dual_val / cur_gamma < 1.01:
+            # stop if the dual bound derived from q closes the gap (it is valid on its own, so no
+            # LP is solved)
+            if cheap_bound / cur_gamma < 1 + gap:
+                status = "converged"
                 break
 
-        # check whether we want to perform a fully corrective step
-        fully_corrective = corrective_freq > 0 and iterationcnt % corrective_freq == 0
+            # stop if we have approximated f well enough (up to the separation tolerance)
+            if down_closed:
+                approximated = numpy.min(cur_q - cur_f) >= -separation.tolerance
+            else:
+                approximated = numpy.linalg.norm(cur_f - cur_q) <= separation.tolerance
+            if approximated:
+                if upper_bounds is None or not dual_uptodate:
+                    cur_dual = verif_model.optimize()
+                    dual_uptodate = True
+                    lpcnt += 1
+                dual_val = numpy.fmin(cur_dual, cheap_bound)
 
-        # compute separation candidate x and try to separate it
-        tau = sum ( (cur_f[i] - cur_q[i]) * (cur_f[i] + cur_q[i])
-            for i in range(len(cur_f)) )
-        assert( tau > 0 )
-        x = [2 * (cur_f[i] - cur_q[i]) / tau for i in range(len(cur_f))]
-        cons = oracle.separate_point(x, precision)
+                # we are close enough to the primal value
+                if dual_val / cur_gamma < 1 + gap:
+                    status = "converged"
+                    break
 
-        if len(cons) == 0:
-            # x is feasible
-            found_solutions.append(x)
-            silentprint("found solution", silent)
+                # otherwise, the cuts of the current tolerance do not suffice to close the gap
+                separation.update_gap(dual_val / cur_gamma - 1)
+                if not separation.is_final():
+                    separation.tighten()
 
-            # update gamma and f
-            cur_gamma = sum(obj[i] * x[i] for i in range(len(obj)))
-            cur_f = [val/cur_gamma for val in obj]
+            # check whether we want to perform a fully corrective step
+            fully_corrective = scheduler.decide(iterationcnt)
+            iteration_start = time.time()
+            dist_before = numpy.linalg.norm(cur_f - cur_q)
+
+            # compute separation candidate x and try to separate it (oracles receive lists)
+            tau = numpy.dot(cur_f - cur_q, cur_f + cur_q)
+            assert( tau > 0 )
+            x = 2 * (cur_f - cur_q) / tau
+            try:
+                cons = separation.separate(oracle, x.tolist(), deadline)
+            except TimeoutError:
+                status = deadline.get_status() or "timelimit"
+                break
+            except KeyboardInterrupt:
+                status = "interrupted"
+                break
+
+            if len(cons) == 0:
+                # x is feasible
+                found_solutions.append(x.tolist())
+                silentprint("found solution", silent)
+
+                # update gamma and f
+                cur_gamma = obj_arr @ x
+                cur_f = obj_arr / cur_gamma
+
+                # the tolerance follows the gap between the new gamma and the verified dual bound
+                if not separation.is_final():
+                    if upper_bounds is None:
+                        cur_dual = verif_model.optimize()
+                        dual_uptodate = True
+                        lpcnt += 1
+                    separation.update_gap(numpy.fmin(cur_dual, cheap_bound) / cur_gamma - 1)
+
+                if fully_corrective:
+                    projection = AUXPROBLEM([cur_f, separated_cons + initconss, down_closed],
+                                            "closestpoint", solver)
+                    cur_q = projection.solve()
+                    if activeset is not None:
+                        activeset.reset(separated_cons + initconss,
+                                        projection.get_multipliers())
+                else:
+                    # project f onto line segment between q and 0 (or step of the active set)
+                    cur_q = update_q(activeset, cur_q, null_vector, cur_f)
+
+                primalcnt += 1
 
-            if fully_corrective:
-                projection = AUXPROBLEM([cur_f, separated_cons + initconss, True],
-                                        "closestpoint", solver)
-                cur_q = projection.solve()
             else:
-                # project f onto line segment between q and 0
-                cur_q = closest_point_linesegment(cur_q, null_vector, cur_f)
 
-            primalcnt += 1
+                # we have found a separating inequality
+                separated_cons.append(cons)
+                sepa_rounds.append(iterationcnt + 1)
+                if len(initial_keys) == 0 or not tuple(cons) in initial_keys:
+                    verif_model.add_cut(cons)
+                    dual_uptodate = False
+                silentprint("separated_cons", silent)
+                silentprint(["cons", cons], silent)
 
-        else:
+                if fully_corrective:
+                    projection = AUXPROBLEM([cur_f, separated_cons + initconss, down_closed],
+                                            "closestpoint", solver)
+                    cur_q = projection.solve()
+                    if activeset is not None:
+                        activeset.reset(separated_cons + initconss,
+                                        projection.get_multipliers())
+                else:
+                    # project f onto line segment between q and cons (or step of the active set)
+                    cur_q = update_q(activeset, cur_q, cons, cur_f)
+                dualcnt += 1
 
-            # we have found a separating inequality
-            separated_cons.append(cons)
-            sepa_rounds.append(iterationcnt + 1)
-            verif_model.add_cut(cons)
-            silentprint("separated_cons", silent)
-            silentprint(["cons", cons], silent)
+                # sample dual bound after every dual_freq-th cut
+                if dual_freq > 0 and dualcnt % dual_freq == 0:
+                    if upper_bounds is None:
+                        cur_dual = verif_model.optimize()
+                        dual_uptodate = True
+                        lpcnt += 1
+                    separation.update_gap(numpy.fmin(cur_dual, cheap_bound) / cur_gamma - 1)
 
-            if fully_corrective:
-                projection = AUXPROBLEM([cur_f, separated_cons + initconss, True],
-                                        "closestpoint", solver)
-                cur_q = projection.solve()
+                # round the infeasible candidate after every heuristic_freq-th cut
+                if heuristic_freq > 0 and dualcnt % heuristic_freq == 0:
+                    solution = oracle.get_primal_solution(x.tolist())
+                    heuristic_gamma = obj_arr @ numpy.asarray(solution, dtype=numpy.float64)
+
+                    # update gamma and f as if the rounded solution had been found
+                    if heuristic_gamma > cur_gamma:
+                        found_solutions.append(solution)
+                        silentprint("found heuristic solution", silent)
+                        cur_gamma = heuristic_gamma
+                        cur_f = obj_arr / cur_gamma
+                        cur_q = update_q(activeset, cur_q, null_vector, cur_f)
+                        heuristiccnt += 1
+
+            silentprint(["x", x], silent)
+            silentprint(["cut", cons], silent)
+
+            # compute componentwise minimum of f and q (theoretically not necessary in fully
+            # corrective step, but avoids numerical difficulties due to solving a quadratic program)
+            # for regions that are not down-closed, q is instead shrunk towards 0 if this reduces
+            # the distance to f, which ensures q (f - q) >= 0 and thus tau > 0 (the line segment
+            # steps do not maintain this on their own)
+            if down_closed:
+                cur_q = numpy.minimum(cur_q, cur_f)
             else:
-                # project f onto line segment between q and cons
-                cur_q = closest_point_linesegment(cur_q, cons, cur_f)
-            dualcnt += 1
+                cur_q = update_q(activeset, cur_q, null_vector, cur_f, True)
+            if upper_bounds is not None:
+                cheap_bound = update_cheap_dual_bound(cheap_bound, cur_q, cur_f, cur_gamma,
+                                                      upper_bounds)
 
-        silentprint(["x", x], silent)
-        silentprint(["cut", cons], silent)
+            # inform the scheduler about the progress of the step
+            scheduler.update(fully_corrective, dist_before,
+                             numpy.linalg.norm(cur_f - cur_q),
+                             time.time() - iteration_start)
+            if fully_corrective:
+                correctivecnt += 1
 
-        # compute componentwise minimum of f and q (theoretically not necessary in fully corrective
-        # step, but avoids numerical difficulties due to solving a quadratic program)
-        cur_q = [min(cur_q[i], cur_f[i]) for i in range(len(cur_q))]
+            iterationcnt += 1
+            gamma_vals.append(cur_gamma)
+            if record_points:
+                all_f.append(cur_f)
+                all_q.append(cur_q)
+            else:
+                all_f[0] = cur_f
+                all_q[0] = cur_q
+            iteration_times.append(time.time() - starttime)
+            if dual_freq > 0:
+                dual_bounds.append(numpy.fmin(cur_dual, cheap_bound))
 
-        iterationcnt += 1
-        gamma_vals.append(cur_gamma)
-        all_f.append(cur_f)
-        all_q.append(cur_q)
+            if progress is not None and progress(iterationcnt, cur_gamma,
+                                                 numpy.fmin(cur_dual, cheap_bound)):
+                status = "interrupted"
+                break
 
-        if iterationcnt >= maxiter:
-            silentprint("terminate early", silent)
-            break
+            if iterationcnt >= maxiter:
+                silentprint("terminate early", silent)
+                break
+
+    # make sure that the last recorded dual bound takes all cuts into account; if the bound
+    # derived from q has closed the gap, the recorded bound is the one that has stopped the run
+    if dual_freq > 0 and not dual_uptodate and not cheap_bound / cur_gamma < 1 + gap:
+        cur_dual = verif_model.optimize()
+        dual_uptodate = True
+        lpcnt += 1
+        dual_bounds[-1] = numpy.fmin(cur_dual, cheap_bound)
 
     endtime = time.time()
 
@@ -127,7 +420,36 @@ def packing_algorithm(oracle, precision, maxiter, corrective_freq, lbopt, initco
     print("nPrimalDHHWiterations\t%d" % primalcnt)
     print("nDualDHHWiterations\t%d" % dualcnt)
     print("nDHHWiterations\t%d" % iterationcnt)
+    print("nCorrectiveDHHWiterations\t%d" % correctivecnt)
     print("DHHWtime\t%f" % (endtime - starttime))
+    print("DHHWseparationTime\t%f" % separation.time)
+    print("nDHHWlpSolves\t%d" % lpcnt)
+    if upper_bounds is not None:
+        print("DHHWcheapDualBound\t%f" % cheap_bound)
+    print("DHHWstatus\t%s" % status)
+
+    if stats is not None:
+        stats["nprimal"] = primalcnt
+        stats["ndual"] = dualcnt
+        stats["niter"] = iterationcnt
+        stats["nheuristic"] = heuristiccnt
+        stats["ncorrective"] = correctivecnt
+        stats["time"] = endtime - starttime
+        stats["iteration_times"] = iteration_times
+        stats["separation_time"] = separation.time
+        stats["nseparations"] = separation.ncalls
+        stats["tolerance"] = separation.tolerance
+        stats["nlpsolves"] = lpcnt
+        stats["cheap_dual_bound"] = cheap_bound
+        if activeset is not None:
+            stats["naway"] = activeset.naway
+            stats["npairwise"] = activeset.npairwise
+            stats["ndrop"] = activeset.ndrop
+            stats["nactive"] = activeset.size
+        stats["status"] = status
+        stats["dual_bound"] = dual_bounds[-1] if dual_freq > 0 else \
+            numpy.fmin(cur_dual, cheap_bound)
 
-    return cur_gamma, separated_cons, found_solutions, gamma_vals, sepa_rounds, all_f, all_q
+    return cur_gamma, separated_cons, found_solutions, gamma_vals, sepa_rounds, all_f, all_q,\
+        dual_bounds
 
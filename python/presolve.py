@@ -0,0 +1,221 @@
+from instance import *
+
+import time
+
+import numpy
+
+####################################################################################################
+#
+# PRESOLVE OF GRAPH INSTANCES
+#
+####################################################################################################
+#
+# The reductions fix variables to values that are attained by some optimal solution, i.e., they
+# preserve the optimal value of max c^T x over the matching or stable set polytope (but not the
+# polytope itself):
+#
+# matching   - edges of nonpositive weight are fixed to 0; if v is a pendant node with edge
+#              e = {u,v} and c_e >= c_f for all edges f at u, then e is fixed to 1 and all other
+#              edges at u to 0; nodes without edges are removed
+# stable set - nodes of nonpositive weight are fixed to 0; isolated nodes are fixed to 1; if v
+#              is a pendant node with neighbor u and c_v >= c_u, then v is fixed to 1 and u to 0;
+#              if N[u] is contained in N[v] for adjacent u, v and c_u >= c_v, then v is fixed to 0
+#
+# Since the objective of the weighted problem types is derived from the graph, which changes by
+# the reductions, the reduced instance is solved with the explicit objective of the original
+# instance (problem types "matching" and "stableset").
+
+
+class PRESOLVE:
+    '''
+    result of presolving a graph instance
+
+    class variables:
+    problemtype - problem type of the original instance
+    instance    - reduced INSTANCE
+    reducedtype - problem type of the reduced instance
+    variables   - array of indices of the original variables that correspond to the variables of
+                  the reduced instance
+    fixed       - array of values of the original variables (entries of reduced variables are 0)
+    offset      - objective value of the fixed variables
+    stats       - dictionary of reduction statistics
+    '''
+
+    def __init__(self, problemtype, instance, reducedtype, variables, fixed, offset, stats):
+        '''
+        initializes the presolve result; use presolve() to presolve an instance
+        '''
+        self.problemtype = problemtype
+        self.instance = instance
+        self.reducedtype = reducedtype
+        self.variables = variables
+        self.fixed = fixed
+        self.offset = offset
+        self.stats = stats
+
+    def postsolve(self, x):
+        '''
+        returns the solution of the original instance corresponding to a solution of the
+        reduced instance
+        x - solution of the reduced instance
+        '''
+        full = self.fixed.copy()
+        full[self.variables] = x
+        return full.tolist()
+
+
+def reduce_matching(nnodes, edges, obj, stats):
+    '''
+    applies the matching reductions and returns the array of values of fixed edges (nan if not
+    fixed)
+    nnodes - number of nodes
+    edges  - (m,2) array of edges with nodes labeled 0,...,n-1
+    obj    - array of edge weights
+    stats  - dictionary of statistics, which is updated
+    '''
+    fixed = numpy.full(len(edges), numpy.nan)
+    fixed[obj <= 0] = 0
+    stats["zero_weight"] = int((obj <= 0).sum())
+
+    incident = [set() for v in range(nnodes)]
+    for e in numpy.nonzero(obj > 0)[0].tolist():
+        incident[edges[e, 0]].add(e)
+        incident[edges[e, 1]].add(e)
+
+    def remove_edge(e, value):
+        fixed[e] = value
+        incident[edges[e, 0]].discard(e)
+        incident[edges[e, 1]].discard(e)
+
+    stats["pendant"] = 0
+    queue = [v for v in range(nnodes) if len(incident[v]) == 1]
+    while len(queue) > 0:
+        v = queue.pop()
+        if len(incident[v]) != 1:
+            continue
+
+        e = next(iter(incident[v]))
+        u = edges[e, 0] if edges[e, 1] == v else edges[e, 1]
+        if all(obj[e] >= obj[f] for f in incident[u]):
+            stats["pendant"] += 1
+            for f in list(incident[u]):
+                remove_edge(f, 1 if f == e else 0)
+                w = edges[f, 0] if edges[f, 1] == u else edges[f, 1]
+                if len(incident[w]) == 1:
+                    queue.append(w)
+
+    return fixed
+
+
+def reduce_stableset(nnodes, edges, obj, stats):
+    '''
+    applies the stable set reductions and returns the array of values of fixed nodes (nan if not
+    fixed)
+    nnodes - number of nodes
+    edges  - (m,2) array of edges with nodes labeled 0,...,n-1
+    obj    - array of node weights
+    stats  - dictionary of statistics, which is updated
+    '''
+    fixed = numpy.full(nnodes, numpy.nan)
+    neighbors = [set() for v in range(nnodes)]
+    for (u, v) in edges.tolist():
+        neighbors[u].add(v)
+        neighbors[v].add(u)
+
+    def remove_node(v, value):
+        fixed[v] = value
+        for w in neighbors[v]:
+            neighbors[w].discard(v)
+        neighbors[v] = set()
+
+    for key in ["zero_weight", "isolated", "pendant", "dominated"]:
+        stats[key] = 0
+
+    changed = True
+    while changed:
+        changed = False
+        for v in range(nnodes):
+            if not numpy.isnan(fixed[v]):
+                continue
+
+            if obj[v] <= 0:
+                remove_node(v, 0)
+                stats["zero_weight"] += 1
+                changed = True
+            elif len(neighbors[v]) == 0:
+                remove_node(v, 1)
+                stats["isolated"] += 1
+                changed = True
+            elif len(neighbors[v]) == 1:
+                u = next(iter(neighbors[v]))
+                if obj[v] >= obj[u]:
+                    remove_node(u, 0)
+                    remove_node(v, 1)
+                    stats["pendant"] += 1
+                    changed = True
+
+        # neighborhood dominance: v can be replaced by its neighbor u in each stable set
+        for v in range(nnodes):
+            if not numpy.isnan(fixed[v]):
+                continue
+            for u in neighbors[v]:
+                if obj[u] >= obj[v] and len(neighbors[u]) <= len(neighbors[v]) and \
+                        all(w == v or w in neighbors[v] for w in neighbors[u]):
+                    remove_node(v, 0)
+                    stats["dominated"] += 1
+                    changed = True
+                    break
+
+    return fixed
+
+
+def presolve(instancefile, problemtype, cachedir=None):
+    '''
+    presolves a graph instance and returns a PRESOLVE containing the reduced instance
+    instancefile - path to file encoding instance or INSTANCE
+    problemtype  - type of problem (one of the matching and stable set problems)
+    cachedir     - (optional) directory of binary cache of parsed instance files
+    '''
+    if problemtype in ["polytope", "maxcut", "lpboost"]:
+        raise ValueError("presolve is only available for matching and stable set problems")
+
+    starttime = time.time()
+    instance = load_instance(instancefile, problemtype, cachedir)
+    matching = problemtype in ["matching", "weightmatching"]
+    obj = numpy.asarray(instance.get_objective(problemtype), dtype=numpy.float64)
+    nnodes = instance.nnodes
+    edges = instance.get_edge_array() - 1
+
+    stats = {}
+    if matching:
+        fixed = reduce_matching(nnodes, edges, obj, stats)
+        keptedges = numpy.nonzero(numpy.isnan(fixed))[0]
+        keptnodes = numpy.unique(edges[keptedges])
+        variables = keptedges
+    else:
+        fixed = reduce_stableset(nnodes, edges, obj, stats)
+        keptnodes = numpy.nonzero(numpy.isnan(fixed))[0]
+        iskept = numpy.zeros(nnodes, dtype=bool)
+        iskept[keptnodes] = True
+        keptedges = numpy.nonzero(iskept[edges[:, 0]] & iskept[edges[:, 1]])[0]
+        variables = keptnodes
+
+    # relabel remaining nodes by 1,...,k
+    newlabel = numpy.zeros(nnodes, dtype=numpy.int64)
+    newlabel[keptnodes] = numpy.arange(1, len(keptnodes) + 1)
+    reduced = INSTANCE(len(keptnodes), newlabel[edges[keptedges]], obj[variables],
+                       instance.filename)
+
+    values = numpy.nan_to_num(fixed, nan=0.0)
+    offset = float(obj @ values)
+
+    stats["nodes"] = [nnodes, len(keptnodes)]
+    stats["edges"] = [len(edges), len(keptedges)]
+    stats["variables"] = [len(obj), len(variables)]
+    stats["fixed_zero"] = int((fixed == 0).sum())
+    stats["fixed_one"] = int((fixed == 1).sum())
+    stats["offset"] = offset
+    stats["time"] = time.time() - starttime
+
+    return PRESOLVE(problemtype, reduced, "matching" if matching else "stableset", variables,
+                    values, offset, stats)
@@ -2,6 +2,7 @@ import numpy
 
 from MIP import *
 from auxiliary import *
+from instance import *
 
 
 ####################################################################################################
@@ -22,7 +23,7 @@ class PROBLEM:
     def __init__(self, instancefile, problemtype, solver, initconss):
         '''
         initializes interface class
-        instancefile - path to file encoding instance
+        instancefile - path to file encoding instance or INSTANCE
         problemtype  - type of problem for which the class is defined
         solver       - solver used to solve the problem
         initconss    - {0,1,2} to encode whether no/box/standard constraints shall be
@@ -37,6 +38,12 @@ class PROBLEM:
             self.instantiation = STABLESETPROBLEM(instancefile, solver, initconss, False)
         elif problemtype == "weightstableset":
             self.instantiation = STABLESETPROBLEM(instancefile, solver, initconss, True)
+        elif problemtype == "polytope":
+            self.instantiation = POLYTOPEPROBLEM(instancefile, solver, initconss)
+        elif problemtype == "maxcut":
+            self.instantiation = MAXCUTPROBLEM(instancefile, solver, initconss)
+        elif problemtype == "lpboost":
+            self.instantiation = LPBOOSTPROBLEM(instancefile, solver, initconss)
 
     def add_cut(self, cut):
         '''
@@ -51,12 +58,32 @@ class PROBLEM:
         '''
         return self.instantiation.optimize()
 
+    def set_obj(self, obj):
+        '''
+        replaces the objective vector (only supported by packing problems)
+        obj - new objective vector
+        '''
+        self.instantiation.set_obj(obj)
+
     def get_opt_solution(self):
         '''
         returns an optimal solution of the problem
         '''
         return self.instantiation.get_opt_solution()
 
+    def apply_edit(self, edit, cuts=()):
+        '''
+        applies an edit of the graph to the problem (only supported by matching and stable set
+        problems); the LP relaxation is rebuilt for the edited graph since the standard
+        constraints change, and the objective is mapped as for the oracle (see ORACLE.apply_edit)
+        edit - GRAPHEDIT (see instance.py)
+        cuts - (optional) list of cuts valid for the edited graph added to the new relaxation,
+               e.g., the cuts of the old relaxation mapped by edit.map_cut
+        '''
+        self.instantiation.apply_edit(edit)
+        for cut in cuts:
+            self.instantiation.add_cut(cut)
+
 class AUXPROBLEM:
     '''
     interface class to classes of concrete problems
@@ -84,6 +111,13 @@ class AUXPROBLEM:
         '''
         return self.instantiation.solve()
 
+    def get_multipliers(self):
+        '''
+        returns the multipliers of the points spanning the convex set in the solution of a
+        closest point problem
+        '''
+        return self.instantiation.multipliers
+
 
 
 
@@ -103,6 +137,9 @@ class MATCHINGPROBLEM:
     edge_list - list of edges of underlying graph
     obj       - objective vector
     solver    - solver used to solve the problem
+    instance  - INSTANCE of underlying graph
+    initconss - {0,1,2} to encode whether no/box/standard constraints are included in model
+    weighted  - whether the objective is derived from the graph
     model     - LP relaxation model of matching problem
     edgevars  - edge variables in model
     '''
@@ -110,22 +147,28 @@ class MATCHINGPROBLEM:
     def __init__(self, instancefile, solver, initconss, weighted):
         '''
         initializes matching problem class
-        instancefile - path to file encoding instance
+        instancefile - path to file encoding instance or INSTANCE
         solver       - solver used by oracles
         initconss    - {0,1,2} to encode whether no/box/standard constraints shall be
                        included in model
         weighted     - whether we shall generate our own objective function
         '''
 
-        # read instance
-        self.nodes, self.edge_list, self.obj = read_graph_from_file(instancefile)
+        # get (possibly already parsed) instance
+        instance = get_instance(instancefile)
+        self.nodes = instance.nodes
+        self.edge_list = instance.edge_list
+        self.obj = instance.obj
         self.solver = solver
+        self.instance = instance
+        self.initconss = initconss
+        self.weighted = weighted
 
         if weighted:
-            self.obj = compute_edge_weights(self.nodes, self.edge_list)
+            self.obj = instance.get_edge_weights()
 
-        self.model, self.edgevars = matching_create_model(self.nodes, self.edge_list,
-                                                          self.obj, solver, initconss)
+        self.model, self.edgevars = instance.get_relaxation("matching", self.obj, solver,
+                                                            initconss, weighted)
 
     def optimize(self):
         '''
@@ -137,6 +180,33 @@ class MATCHINGPROBLEM:
 
         return get_obj_val(model, self.solver)
 
+    def set_obj(self, obj):
+        '''
+        replaces the objective vector of the LP relaxation
+        obj - new objective vector
+        '''
+        self.obj = list(obj)
+        change_objective(self.model, self.solver, self.edgevars, self.obj, 1)
+
+    def apply_edit(self, edit):
+        '''
+        replaces the LP relaxation by the relaxation of the edited graph (see GRAPHEDIT), whose
+        objective is mapped from the current objective unless it is derived from the graph
+        edit - GRAPHEDIT
+        '''
+        instance = self.instance.apply_edit(edit)
+        if self.weighted:
+            obj = instance.get_edge_weights()
+        else:
+            obj = edit.map_values(self.obj, "matching", edit.edge_weights)
+
+        self.instance = instance
+        self.nodes = instance.nodes
+        self.edge_list = instance.edge_list
+        self.model, self.edgevars = instance.get_relaxation("matching", obj, self.solver,
+                                                           self.initconss, self.weighted)
+        self.set_obj(obj)
+
     def get_opt_solution(self):
         '''
         returns an optimal solution of the problem
@@ -166,6 +236,9 @@ class STABLESETPROBLEM:
     edge_list - list of edges of underlying graph
     obj       - objective vector
     solver    - solver used to solve the problem
+    instance  - INSTANCE of underlying graph
+    initconss - {0,1,2} to encode whether no/box/standard constraints are included in model
+    weighted  - whether the objective is derived from the graph
     model     - LP relaxation model of stable set problem
     nodevars  - node variables in model
     '''
@@ -173,23 +246,28 @@ class STABLESETPROBLEM:
     def __init__(self, instancefile, solver, initconss, weighted):
         '''
         initializes stable set problem class
-        instancefile - path to file encoding instance
+        instancefile - path to file encoding instance or INSTANCE
         solver       - solver used by oracles
         initconss    - {0,1,2} to encode whether no/box/standard constraints shall be
                        included in model
         weighted     - whether we shall generate our own objective function
         '''
 
-        # read instance
-        self.nodes, self.edge_list, self.obj = read_graph_from_file(instancefile)
-        self.obj = self.obj[:len(self.nodes)]
+        # get (possibly already parsed) instance
+        instance = get_instance(instancefile)
+        self.nodes = instance.nodes
+        self.edge_list = instance.edge_list
+        self.obj = instance.get_node_obj()
         self.solver = solver
+        self.instance = instance
+        self.initconss = initconss
+        self.weighted = weighted
 
         if weighted:
-            self.obj = compute_node_weights(self.nodes, self.edge_list)
+            self.obj = instance.get_node_weights()
 
-        self.model, self.nodevars = stableset_create_model(self.nodes, self.edge_list,
-                                                           self.obj, solver, initconss)
+        self.model, self.nodevars = instance.get_relaxation("stableset", self.obj, solver,
+                                                            initconss, weighted)
 
 
     def optimize(self):
@@ -202,6 +280,33 @@ class STABLESETPROBLEM:
 
         return get_obj_val(model, self.solver)
 
+    def set_obj(self, obj):
+        '''
+        replaces the objective vector of the LP relaxation
+        obj - new objective vector
+        '''
+        self.obj = list(obj)
+        change_objective(self.model, self.solver, self.nodevars, self.obj, 1)
+
+    def apply_edit(self, edit):
+        '''
+        replaces the LP relaxation by the relaxation of the edited graph (see GRAPHEDIT), whose
+        objective is mapped from the current objective unless it is derived from the graph
+        edit - GRAPHEDIT
+        '''
+        instance = self.instance.apply_edit(edit)
+        if self.weighted:
+            obj = instance.get_node_weights()
+        else:
+            obj = edit.map_values(self.obj, "stableset", edit.node_weights)
+
+        self.instance = instance
+        self.nodes = instance.nodes
+        self.edge_list = instance.edge_list
+        self.model, self.nodevars = instance.get_relaxation("stableset", obj, self.solver,
+                                                           self.initconss, self.weighted)
+        self.set_obj(obj)
+
     def get_opt_solution(self):
         '''
         returns an optimal solution of the problem
@@ -222,6 +327,184 @@ class STABLESETPROBLEM:
                                              for i in range(len(coefs))) <= 1 , "")
 
 
+class POLYTOPEPROBLEM:
+    '''
+    class of explicit packing polytope problem
+
+    class variables:
+    obj    - objective vector
+    solver - solver used to solve the problem
+    model  - LP relaxation model of the problem
+    vars   - variables in model
+    '''
+
+    def __init__(self, polytopefile, solver, initconss):
+        '''
+        initializes polytope problem class
+        polytopefile - path to file encoding polytope or POLYTOPE
+        solver       - solver used by oracles
+        initconss    - {0,1,2} to encode whether no/box/box constraints shall be
+                       included in model
+        '''
+
+        # get (possibly already read) polytope
+        polytope = get_polytope(polytopefile)
+        self.obj = polytope.obj
+        self.solver = solver
+
+        self.model, self.vars = polytope.get_relaxation(solver, initconss)
+
+    def optimize(self):
+        '''
+        returns the optimal solution value of the problem
+        '''
+
+        model = self.model
+        model.optimize()
+
+        return get_obj_val(model, self.solver)
+
+    def set_obj(self, obj):
+        '''
+        replaces the objective vector of the LP relaxation
+        obj - new objective vector
+        '''
+        self.obj = list(obj)
+        change_objective(self.model, self.solver, self.vars, self.obj, 1)
+
+    def get_opt_solution(self):
+        '''
+        returns an optimal solution of the problem
+        '''
+
+        model = self.model
+        model.optimize()
+
+        return get_solution_array(model, self.solver, self.vars)
+
+
+    def add_cut(self, coefs):
+        '''
+        adds cut to problem
+        coefs - coefficients of the cut to be added (only nonzeros are passed to the solver)
+        '''
+        add_cut(self.model, self.solver, sum(float(coefs[i]) * self.vars[i]
+                                             for i in numpy.flatnonzero(coefs)) <= 1, "")
+
+
+class MAXCUTPROBLEM:
+    '''
+    class of the semidefinite relaxation of the max-cut problem (see MAXCUTORACLE)
+
+    class variables:
+    obj    - objective vector
+    solver - solver used to solve the problem
+    model  - LP relaxation model of the problem
+    vars   - variables in model
+    '''
+
+    def __init__(self, instancefile, solver, initconss):
+        '''
+        initializes max-cut problem class
+        instancefile - path to file encoding instance or INSTANCE
+        solver       - solver used by oracles
+        initconss    - {0,1,2} to encode whether no/box/box constraints shall be
+                       included in model
+        '''
+
+        # get (possibly already parsed) instance
+        instance = get_instance(instancefile)
+        self.obj = instance.get_maxcut_obj()
+        self.solver = solver
+
+        self.model, self.vars = instance.get_relaxation("maxcut", self.obj, solver, initconss,
+                                                        True)
+
+    def optimize(self):
+        '''
+        returns the optimal solution value of the problem
+        '''
+
+        model = self.model
+        model.optimize()
+
+        return get_obj_val(model, self.solver)
+
+    def get_opt_solution(self):
+        '''
+        returns an optimal solution of the problem
+        '''
+
+        model = self.model
+        model.optimize()
+
+        return get_solution_array(model, self.solver, self.vars)
+
+
+    def add_cut(self, coefs):
+        '''
+        adds cut to problem
+        coefs - coefficients of the cut to be added (only nonzeros are passed to the solver)
+        '''
+        add_cut(self.model, self.solver, sum(float(coefs[i]) * self.vars[i]
+                                             for i in numpy.flatnonzero(coefs)) <= 1, "")
+
+
+class LPBOOSTPROBLEM:
+    '''
+    class of LPBoost problem in the coordinates of LPBOOSTORACLE
+
+    class variables:
+    solver - solver used to solve the problem
+    model  - LP relaxation model of the problem
+    vars   - variables in model
+    '''
+
+    def __init__(self, datasetfile, solver, initconss):
+        '''
+        initializes LPBoost problem class
+        datasetfile - path to file encoding dataset or DATASET
+        solver      - solver used by oracles
+        initconss   - {0,1,2} to encode whether no/box/box constraints shall be
+                      included in model
+        '''
+
+        # get (possibly already read) dataset
+        dataset = get_dataset(datasetfile)
+        self.solver = solver
+
+        self.model, self.vars = dataset.get_relaxation(solver, initconss)
+
+    def optimize(self):
+        '''
+        returns the optimal solution value of the problem
+        '''
+
+        model = self.model
+        model.optimize()
+
+        return get_obj_val(model, self.solver)
+
+    def get_opt_solution(self):
+        '''
+        returns an optimal solution of the problem
+        '''
+
+        model = self.model
+        model.optimize()
+
+        return get_solution_array(model, self.solver, self.vars)
+
+
+    def add_cut(self, coefs):
+        '''
+        adds cut to problem
+        coefs - coefficients of the cut to be added
+        '''
+        add_cut(self.model, self.solver, sum(float(coefs[i]) * self.vars[i]
+                                             for i in numpy.flatnonzero(coefs)) <= 1, "")
+
+
 ####################################################################################################
 #
 # INSTANTIATIONS OF AUXILIARY PROBLEM CLASSES
@@ -241,6 +524,7 @@ class CLOSESTPOINTPROJECTION:
     conss             - points spanning the convex set A
     use_nonnegativity - True is we are in case (1), False otherwise
     solver            - solver used to solve the problem
+    multipliers       - multipliers of the points in the convex combination of q (after solve())
     '''
 
     def __init__(self, target, conss, use_nonnegativity, solver):
@@ -281,12 +565,12 @@ class CLOSESTPOINTPROJECTION:
         # q_i <= sum multipliers * coefficients (or == )
         if use_nonnegativity:
             for i in range(len(target)):
-                add_cons(model, solver, qvars[i] <= sum(conss[c][i] * conv_mults[c]
+                add_cons(model, solver, qvars[i] <= sum(float(conss[c][i]) * conv_mults[c]
                                                         for c in range(len(conss)) ),
                          "linkpmult%d" % i)
         else:
             for i in range(len(target)):
-                add_cons(model, solver, qvars[i] == sum(conss[c][i] * conv_mults[c]
+                add_cons(model, solver, qvars[i] == sum(float(conss[c][i]) * conv_mults[c]
                                                         for c in range(len(conss)) ),
                          "linkpmult%d" % i)
 
@@ -305,11 +589,11 @@ class CLOSESTPOINTPROJECTION:
         model.optimize()
 
         # extract solution
-        solution = len(target) * [0]
+        self.multipliers = [get_sol_val(model, solver, get_solution(model, solver), var)
+                            for var in conv_mults]
+        solution = numpy.zeros(len(target))
         for c in range(len(conss)):
-            for i in range(len(target)):
-                solution[i] += conss[c][i] * get_sol_val(model, solver, get_solution(model, solver),
-                                                         conv_mults[c])
+            solution += self.multipliers[c] * numpy.asarray(conss[c], dtype=numpy.float64)
 
         return solution
 
@@ -0,0 +1,124 @@
+import json
+import sqlite3
+import time
+
+
+####################################################################################################
+#
+# STORE FOR RESULTS OF EXPERIMENTS
+#
+####################################################################################################
+
+# parameters identifying a run of compare.py
+JOB_PARAMETERS = ["instance", "problemtype", "precision", "maxiter", "corrfreq", "initconss",
+                  "lbopt", "solver"]
+
+# types of the parameters, to which their values are converted before building the job key
+JOB_PARAMETER_TYPES = {"instance": str, "problemtype": str, "precision": float, "maxiter": int,
+                       "corrfreq": int, "initconss": int, "lbopt": float, "solver": str}
+
+# statistics extracted from the output of a run
+RESULT_FIELDS = ["status", "returncode", "walltime", "primal", "niter", "nprimaliter",
+                 "ndualiter", "dhhwtime", "nlpiter", "lptime", "logfile", "output", "finished"]
+
+# states of jobs that do not need to be run again
+FINISHED_STATES = ["done", "timeout", "memout"]
+
+
+def normalize_job(job):
+    '''
+    returns a copy of a job whose values of JOB_PARAMETERS are converted to the types of
+    JOB_PARAMETER_TYPES, e.g., such that the lower bounds -1 and -1.0 define the same job
+    job - dictionary containing (at least) the values of JOB_PARAMETERS
+    '''
+    job = dict(job)
+    for p in JOB_PARAMETERS:
+        job[p] = JOB_PARAMETER_TYPES[p](job[p])
+    return job
+
+
+def get_job_key(job):
+    '''
+    returns a string uniquely identifying a job
+    job - dictionary containing (at least) the values of JOB_PARAMETERS
+    '''
+    job = normalize_job(job)
+    return json.dumps([job[p] for p in JOB_PARAMETERS])
+
+
+class RESULTSTORE:
+    '''
+    SQLite based store of the results of experiments
+
+    class variables:
+    filename   - path to database file
+    connection - connection to database
+    '''
+
+    def __init__(self, filename):
+        '''
+        opens (and possibly creates) the store
+        filename - path to database file
+        '''
+        self.filename = filename
+        self.connection = sqlite3.connect(filename)
+
+        columns = ["jobkey TEXT PRIMARY KEY", "instance TEXT", "problemtype TEXT",
+                   "precision REAL", "maxiter INTEGER", "corrfreq INTEGER", "initconss INTEGER",
+                   "lbopt REAL", "solver TEXT", "status TEXT", "returncode INTEGER",
+                   "walltime REAL", "primal REAL", "niter INTEGER", "nprimaliter INTEGER",
+                   "ndualiter INTEGER", "dhhwtime REAL", "nlpiter INTEGER", "lptime REAL",
+                   "logfile TEXT", "output TEXT", "finished REAL"]
+        self.connection.execute("CREATE TABLE IF NOT EXISTS runs (%s)" % ", ".join(columns))
+        self.connection.commit()
+
+    def close(self):
+        '''
+        closes the connection to the database
+        '''
+        self.connection.close()
+
+    def is_finished(self, job):
+        '''
+        returns whether a job has already been run to completion
+        job - dictionary containing the values of JOB_PARAMETERS
+        '''
+        row = self.connection.execute("SELECT status FROM runs WHERE jobkey = ?",
+                                      (get_job_key(job),)).fetchone()
+
+        return row is not None and row[0] in FINISHED_STATES
+
+    def save_result(self, job, result):
+        '''
+        stores the result of a job (an existing result of the same job is replaced)
+        job    - dictionary containing the values of JOB_PARAMETERS
+        result - dictionary containing (a subset of) the values of RESULT_FIELDS
+        '''
+        job = normalize_job(job)
+        result = dict(result)
+        result["finished"] = time.time()
+
+        fields = ["jobkey"] + JOB_PARAMETERS + RESULT_FIELDS
+        values = [get_job_key(job)] + [job[p] for p in JOB_PARAMETERS]\
+            + [result.get(f) for f in RESULT_FIELDS]
+
+        self.connection.execute("INSERT OR REPLACE INTO runs (%s) VALUES (%s)" %
+                                (", ".join(fields), ", ".join("?" for f in fields)), values)
+        self.connection.commit()
+
+    def get_results(self, **filters):
+        '''
+        returns list of dictionaries containing the stored runs matching the filters
+        filters - (optional) values of JOB_PARAMETERS or RESULT_FIELDS runs have to match
+        '''
+        query = "SELECT * FROM runs"
+        if len(filters) > 0:
+            for key in filters:
+                if not key in JOB_PARAMETERS + RESULT_FIELDS:
+                    raise ValueError("unknown field %s" % key)
+            query += " WHERE " + " AND ".join("%s = ?" % key for key in filters)
+
+        cursor = self.connection.execute(query, list(filters.values()))
+        names = [d[0] for d in cursor.description]
+
+        return [dict(zip(names, row)) for row in cursor.fetchall()]
@@ -0,0 +1,258 @@
+import json
+import os
+
+import numpy
+
+####################################################################################################
+#
+# STRUCTURED LOGS OF RUNS
+#
+####################################################################################################
+#
+# A log with base name <name> consists of two files:
+#
+# <name>.jsonl - one JSON object per line, each having a field "record" that is one of
+#                "params" (parameters of the run), "row" (values of some series in one
+#                iteration), "series" (name and length of a series stored in the array file),
+#                "timing" (running times), or "end" (log is complete)
+# <name>.npz   - compressed NumPy arrays containing the series in full precision
+#
+# Records are appended and flushed while the run proceeds. The array file is only written when
+# the log is closed, so the series of an unfinished (e.g., killed) run are read from its rows,
+# whose values are exact since JSON stores the shortest representation of each float.
+# The series of the plain-text logs of previous versions are called "dualDHHW", "primalDHHW",
+# and "dualLP"; we use the same names.
+
+
+class RUNLOGWRITER:
+    '''
+    writes a structured log of a run
+
+    class variables:
+    basename - path of log without file extension
+    metafile - file handle of metadata file
+    series   - dictionary of series to be stored in the array file
+    rows     - dictionary mapping names of series to the lists of values written as rows
+    '''
+
+    def __init__(self, basename, params):
+        '''
+        opens the log and writes the parameters of the run
+        basename - path of log without file extension
+        params   - dictionary of parameters of the run
+        '''
+        dirname = os.path.dirname(basename)
+        if dirname != "" and not os.path.exists(dirname):
+            os.makedirs(dirname)
+
+        self.basename = basename
+        self.metafile = open(basename + ".jsonl", 'w')
+        self.series = {}
+        self.rows = {}
+
+        self.write_record("params", params)
+
+    def write_record(self, record, data):
+        '''
+        appends a record to the metadata file
+        record - type of the record
+        data   - dictionary containing the content of the record
+        '''
+        entry = {"record": record}
+        entry.update(data)
+        self.metafile.write(json.dumps(entry) + "\n")
+        self.metafile.flush()
+
+    def add_row(self, values):
+        '''
+        appends the values of some series in one iteration to the log
+        values - dictionary mapping names of series to numbers
+        '''
+        values = {name: float(values[name]) for name in values}
+        for name in values:
+            self.rows.setdefault(name, []).append(values[name])
+        self.write_record("row", values)
+
+    def add_series(self, name, values):
+        '''
+        adds a series of numbers to the log
+        name   - name of the series
+        values - list of numbers
+        '''
+        self.series[name] = numpy.asarray(values, dtype=numpy.float64)
+        self.write_record("series", {"name": name, "length": len(self.series[name])})
+
+    def add_timing(self, timing):
+        '''
+        adds running times to the log
+        timing - dictionary mapping names to running times in seconds
+        '''
+        self.write_record("timing", timing)
+
+    def close(self):
+        '''
+        writes the array file and closes the log; series that have only been written as rows are
+        stored as well
+        '''
+        for name in self.rows:
+            if not name in self.series:
+                self.add_series(name, self.rows[name])
+        numpy.savez_compressed(self.basename + ".npz", **self.series)
+        self.write_record("end", {})
+        self.metafile.close()
+
+
+def write_run_log(basename, params, series, timing):
+    '''
+    writes a complete structured log of a run at once (use RUNLOGWRITER to write the log while
+    the run proceeds)
+    basename - path of log without file extension
+    params   - dictionary of parameters of the run
+    series   - dictionary mapping names to lists of numbers
+    timing   - dictionary mapping names to running times in seconds
+    '''
+    writer = RUNLOGWRITER(basename, params)
+    for name in series:
+        writer.add_series(name, series[name])
+    writer.add_timing(timing)
+    writer.close()
+
+
+class RUNLOG:
+    '''
+    read access to a log of a run
+
+    class variables:
+    params    - dictionary of parameters of the run
+    timing    - dictionary of running times
+    lengths   - dictionary mapping names of series to their lengths
+    complete  - whether the log has been closed by the writer
+    arrays    - dictionary of series (loaded on first access)
+    arrayfile - path to array file (None if series are already loaded)
+    '''
+
+    def __init__(self, params, timing, lengths, complete, arrays, arrayfile):
+        '''
+        initializes the log; use read_run_log() to read a log from a file
+        '''
+        self.params = params
+        self.timing = timing
+        self.lengths = lengths
+        self.complete = complete
+        self.arrays = arrays
+        self.arrayfile = arrayfile
+
+    def get_series_names(self):
+        '''
+        returns names of series contained in the log
+        '''
+        return list(self.lengths.keys())
+
+    def has_series(self, name):
+        '''
+        returns whether the log contains a series
+        name - name of series
+        '''
+        return name in self.lengths
+
+    def get_series(self, name, default=None):
+        '''
+        returns a series as NumPy array
+        name    - name of series
+        default - (optional) value returned if the log does not contain the series
+        '''
+        if not name in self.lengths:
+            return default
+
+        if self.arrays is None:
+            if self.arrayfile is None or not os.path.exists(self.arrayfile):
+                return default
+            with numpy.load(self.arrayfile) as data:
+                self.arrays = {key: data[key] for key in data.files}
+
+        return self.arrays.get(name, default)
+
+
+def read_legacy_log(filename):
+    '''
+    reads a plain-text log that contains for each series a line with its name followed by a line
+    of values
+    filename - path to log
+    '''
+    f = open(filename, 'r')
+    lines = [line.strip() for line in f]
+    f.close()
+
+    arrays = {}
+    i = 0
+    while i < len(lines):
+        name = lines[i]
+        values = lines[i + 1].split() if i + 1 < len(lines) else []
+        arrays[name] = numpy.array([float(val) for val in values], dtype=numpy.float64)
+        i += 2
+
+    lengths = {name: len(arrays[name]) for name in arrays}
+
+    return RUNLOG({}, {}, lengths, True, arrays, None)
+
+
+def read_run_log(filename):
+    '''
+    reads a log of a run; filename may be a structured log (with or without file extension)
+    or a plain-text log of previous versions
+    filename - path to log
+    '''
+    if filename.endswith(".txt"):
+        return read_legacy_log(filename)
+
+    basename = filename
+    for ext in [".jsonl", ".npz"]:
+        if filename.endswith(ext):
+            basename = filename[:-len(ext)]
+
+    params = {}
+    timing = {}
+    lengths = {}
+    rows = {}
+    complete = False
+
+    f = open(basename + ".jsonl", 'r')
+    for line in f:
+        line = line.strip()
+        if line == "":
+            continue
+        entry = json.loads(line)
+        record = entry.pop("record")
+        if record == "params":
+            params.update(entry)
+        elif record == "timing":
+            timing.update(entry)
+        elif record == "row":
+            for name in entry:
+                rows.setdefault(name, []).append(entry[name])
+        elif record == "series":
+            lengths[entry["name"]] = entry["length"]
+        elif record == "end":
+            complete = True
+    f.close()
+
+    # the array file of an unfinished run does not exist yet (or belongs to an earlier run)
+    if not complete:
+        arrays = {name: numpy.array(rows[name], dtype=numpy.float64) for name in rows}
+        lengths = {name: len(arrays[name]) for name in arrays}
+        return RUNLOG(params, timing, lengths, complete, arrays, None)
+
+    return RUNLOG(params, timing, lengths, complete, None, basename + ".npz")
+
+
+def find_run_log(logdir, name):
+    '''
+    returns path of the log of a run stored in a directory, preferring structured logs
+    logdir - directory containing logs
+    name   - name of the run (see get_run_name())
+    '''
+    path = os.path.join(logdir, name)
+    if os.path.exists(path + ".jsonl"):
+        return path + ".jsonl"
+
+    return path + ".txt"
@@ -0,0 +1,129 @@
+import numpy
+
+####################################################################################################
+#
+# SCHEDULERS OF FULLY CORRECTIVE STEPS
+#
+####################################################################################################
+#
+# A scheduler decides in each iteration of the packing algorithm whether the point q is computed
+# by the fully corrective step (projection of f onto the convex hull of all separated cuts, see
+# CLOSESTPOINTPROJECTION) or by the cheap projection onto a line segment. After each iteration,
+# the scheduler is informed about the kind of step, the distance ||f - q|| before and after the
+# iteration, and its running time.
+#
+# The adaptive scheduler measures progress as the relative decrease log(d_before / d_after) of
+# the distance per second. Relative decreases are used since the absolute distances shrink during
+# the run, which would make old measurements look better than recent ones. The rates of both
+# kinds of steps are smoothed exponentially, and a fully corrective step is performed if its rate
+# exceeds the rate of the cheap steps. Since the rate of a kind of step is only updated when such
+# a step is performed, a fully corrective step is enforced after a number of cheap steps to
+# refresh its estimate.
+
+
+class FIXEDSCHEDULER:
+    '''
+    scheduler performing a fully corrective step in every freq-th iteration
+
+    class variables:
+    freq - frequency of fully corrective steps (nonpositive if no such step shall be performed)
+    '''
+
+    def __init__(self, freq):
+        '''
+        initializes the scheduler
+        freq - frequency of fully corrective steps (nonpositive if no such step shall be performed)
+        '''
+        self.freq = freq
+
+    def is_active(self):
+        '''
+        returns whether fully corrective steps may be performed
+        '''
+        return self.freq > 0
+
+    def decide(self, iterationcnt):
+        '''
+        returns whether a fully corrective step shall be performed in an iteration
+        iterationcnt - number of the iteration (starting at 0)
+        '''
+        return self.freq > 0 and iterationcnt % self.freq == 0
+
+    def update(self, corrective, dist_before, dist_after, elapsed):
+        '''
+        informs the scheduler about the progress of an iteration (not used)
+        '''
+        pass
+
+
+class ADAPTIVESCHEDULER:
+    '''
+    scheduler performing a fully corrective step if the recent progress per second of such steps
+    exceeds the one of the cheap line segment steps (see above)
+
+    class variables:
+    warmup       - number of cheap steps before the first fully corrective step
+    max_interval - maximum number of cheap steps between two fully corrective steps
+    smoothing    - weight of the latest measurement in the smoothed rates
+    rate_cheap   - smoothed progress per second of cheap steps (nan if not measured yet)
+    rate_corr    - smoothed progress per second of fully corrective steps (nan if not measured yet)
+    ncheap       - number of cheap steps since the last fully corrective step
+    '''
+
+    def __init__(self, warmup=10, max_interval=100, smoothing=0.3):
+        '''
+        initializes the scheduler
+        warmup       - (optional) number of cheap steps before the first fully corrective step
+        max_interval - (optional) maximum number of cheap steps between two fully corrective steps
+        smoothing    - (optional) weight of the latest measurement in the smoothed rates
+        '''
+        self.warmup = warmup
+        self.max_interval = max_interval
+        self.smoothing = smoothing
+        self.rate_cheap = numpy.nan
+        self.rate_corr = numpy.nan
+        self.ncheap = 0
+
+    def is_active(self):
+        '''
+        returns whether fully corrective steps may be performed
+        '''
+        return True
+
+    def decide(self, iterationcnt):
+        '''
+        returns whether a fully corrective step shall be performed in an iteration
+        iterationcnt - number of the iteration (starting at 0)
+        '''
+        if numpy.isnan(self.rate_corr):
+            return self.ncheap >= self.warmup
+        if self.ncheap >= self.max_interval:
+            return True
+
+        return self.rate_corr > self.rate_cheap
+
+    def update(self, corrective, dist_before, dist_after, elapsed):
+        '''
+        informs the scheduler about the progress of an iteration
+        corrective  - whether a fully corrective step has been performed
+        dist_before - distance ||f - q|| at the beginning of the iteration
+        dist_after  - distance ||f - q|| at the end of the iteration
+        elapsed     - running time of the iteration in seconds
+        '''
+        if dist_before > 0 and dist_after > 0:
+            rate = max(numpy.log(dist_before / dist_after), 0.0) / max(elapsed, 1e-9)
+        else:
+            rate = 0.0
+
+        if corrective:
+            self.ncheap = 0
+            if numpy.isnan(self.rate_corr):
+                self.rate_corr = rate
+            else:
+                self.rate_corr += self.smoothing * (rate - self.rate_corr)
+        else:
+            self.ncheap += 1
+            if numpy.isnan(self.rate_cheap):
+                self.rate_cheap = rate
+            else:
+                self.rate_cheap += self.smoothing * (rate - self.rate_cheap)
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+import json
+import os
+import subprocess
+import sys
+import time
+
+#######################
+#
+# LOCAL FUNCTIONS
+#
+#######################
+
+# directory containing solve.py and compare.py
+code_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+
+def time_command(args, nruns):
+    '''
+    returns the minimum and mean wall-clock time of running a command in a fresh process
+    args  - command and its arguments
+    nruns - number of repetitions
+    '''
+    times = []
+    for r in range(nruns):
+        starttime = time.time()
+        subprocess.run(args, cwd=code_dir, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                       check=True)
+        times.append(time.time() - starttime)
+
+    return min(times), sum(times) / len(times)
+
+
+def import_times(module):
+    '''
+    returns the cumulative import time in seconds of the heaviest modules loaded by a module
+    (as reported by python -X importtime)
+    module - name of module to import
+    '''
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", "import %s" % module],
+                          cwd=code_dir, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                          universal_newlines=True, check=True)
+
+    # only report modules imported at the two outermost levels that take at least 1ms
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        data = line.split("|")
+        name = data[2][1:]
+        depth = (len(name) - len(name.lstrip())) // 2
+        if depth <= 1 and int(data[1]) >= 1000:
+            times[name.strip()] = int(data[1]) / 1e6
+
+    return times
+
+
+def loaded_modules(module, candidates):
+    '''
+    returns which of the candidate modules are loaded when importing a module
+    module     - name of module to import
+    candidates - list of module names to check
+    '''
+    code = "import sys, %s; print(' '.join(m for m in %r if m in sys.modules))" % (module,
+                                                                                  candidates)
+    proc = subprocess.run([sys.executable, "-c", code], cwd=code_dir, stdout=subprocess.PIPE,
+                          stderr=subprocess.DEVNULL, universal_newlines=True, check=True)
+
+    return proc.stdout.split()
+
+
+#######################
+#
+# MAIN PART
+#
+#######################
+
+# usage: benchmark_startup.py [<instance> <type> [<maxiter> [<nruns>]]]
+instancefile = sys.argv[1] if len(sys.argv) > 1 else ""
+problemtype = sys.argv[2] if len(sys.argv) > 2 else "matching"
+maxiter = int(sys.argv[3]) if len(sys.argv) > 3 else 1
+nruns = int(sys.argv[4]) if len(sys.argv) > 4 else 5
+
+heavy = ["matplotlib", "pyscipopt", "gurobipy", "scipy"]
+results = {}
+
+results["python"] = time_command([sys.executable, "-c", "pass"], nruns)
+for module in ["solve", "compare"]:
+    results["import_%s" % module] = time_command([sys.executable, "-c", "import %s" % module],
+                                                 nruns)
+    results["modules_%s" % module] = import_times(module)
+    results["heavy_%s" % module] = loaded_modules(module, heavy)
+
+if instancefile != "":
+    args = [sys.executable, "solve.py", "--file=%s" % os.path.abspath(instancefile),
+            "--type=%s" % problemtype, "--maxiter=%d" % maxiter]
+    results["coldstart_solve"] = time_command(args, nruns)
+
+print(json.dumps(results, indent=2))
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from generators import *
+
+#########################
+#
+# MAIN PART
+#
+#########################
+
+# default values of parameters
+problemtype = "matching"
+num_nodes = 500
+num_odd_sets = 30
+size_odd_sets = 3
+weighted = False
+num_cliques = 50
+num_extra_edges = 1000
+num_rows = 1000
+num_cols = 10000
+nnz_per_row = 10
+num_samples = 1000
+num_features = 50
+nu = 0.1
+noise = 0.1
+seed = 1
+filename = ""
+optvalsfile = ""
+
+for i in range(1, len(sys.argv)):
+    arg = sys.argv[i]
+    if arg.startswith("--type"):
+        problemtype = arg.split('=')[1]
+        if not problemtype in ["matching", "stableset", "polytope", "lpboost"]:
+            sys.exit("ERROR unkown type of problem '%s'" % problemtype)
+    elif arg.startswith("--nodes"):
+        num_nodes = int(arg.split('=')[1])
+    elif arg.startswith("--oddsets"):
+        num_odd_sets = int(arg.split('=')[1])
+    elif arg.startswith("--sizeoddsets"):
+        size_odd_sets = int(arg.split('=')[1])
+    elif arg.startswith("--weighted"):
+        weighted = True
+    elif arg.startswith("--cliques"):
+        num_cliques = int(arg.split('=')[1])
+    elif arg.startswith("--extraedges"):
+        num_extra_edges = int(arg.split('=')[1])
+    elif arg.startswith("--rows"):
+        num_rows = int(arg.split('=')[1])
+    elif arg.startswith("--cols"):
+        num_cols = int(arg.split('=')[1])
+    elif arg.startswith("--rownnz"):
+        nnz_per_row = int(arg.split('=')[1])
+    elif arg.startswith("--samples"):
+        num_samples = int(arg.split('=')[1])
+    elif arg.startswith("--features"):
+        num_features = int(arg.split('=')[1])
+    elif arg.startswith("--nu"):
+        nu = float(arg.split('=')[1])
+    elif arg.startswith("--noise"):
+        noise = float(arg.split('=')[1])
+    elif arg.startswith("--seed"):
+        seed = int(arg.split('=')[1])
+    elif arg.startswith("--output"):
+        filename = arg.split('=')[1]
+    elif arg.startswith("--optvals"):
+        optvalsfile = arg.split('=')[1]
+    else:
+        sys.exit("ERROR unkown argument %s." % arg)
+
+if filename == "":
+    sys.exit("ERROR no output file given")
+
+starttime = time.time()
+
+# packing polytopes are stored as NumPy arrays
+if problemtype == "polytope":
+    indptr, indices, data, obj = generate_packing_polytope(num_rows, num_cols, nnz_per_row, seed)
+    gentime = time.time() - starttime
+    write_polytope(filename, indptr, indices, data, obj)
+    print("generated %s with %d rows, %d columns, and %d nonzeros (generation %.2fs, writing %.2fs)"
+          % (filename, num_rows, num_cols, len(data), gentime, time.time() - starttime - gentime))
+    sys.exit(0)
+
+# LPBoost datasets are stored in the format of the Julia code
+if problemtype == "lpboost":
+    labels, features = generate_lpboost_dataset(num_samples, num_features, noise, seed)
+    gentime = time.time() - starttime
+    write_lpboost_dataset(filename, nu, labels, features)
+    print("generated %s with %d samples and %d features (generation %.2fs, writing %.2fs)"
+          % (filename, num_samples, num_features, gentime, time.time() - starttime - gentime))
+    sys.exit(0)
+
+comments = ["generated by generate_instances.py %s" % " ".join(sys.argv[1:])]
+optval = None
+
+if problemtype == "matching":
+    num_nodes, edges, weights = generate_matching_graph(num_nodes, num_odd_sets, size_odd_sets,
+                                                        seed, weighted)
+else:
+    try:
+        num_nodes, edges, weights, optval = generate_stableset_graph(num_nodes, num_cliques,
+                                                                     num_extra_edges, seed)
+    except ValueError as e:
+        sys.exit("ERROR %s" % e)
+    comments.append("optimal value of problem type stableset: %d" % optval)
+gentime = time.time() - starttime
+
+write_graph(filename, num_nodes, edges, weights, comments)
+print("generated %s with %d nodes and %d edges (generation %.2fs, writing %.2fs)"
+      % (filename, num_nodes, len(edges), gentime, time.time() - starttime - gentime))
+
+# store optimal value in the format read by batch.py (--optvals)
+if optval is not None and optvalsfile != "":
+    f = open(optvalsfile, 'a')
+    f.write("%s %d\n" % (os.path.basename(filename), optval))
+    f.close()
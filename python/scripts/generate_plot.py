@@ -1,35 +1,19 @@
+import os
 import sys
 import matplotlib.pyplot as plt
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from runlog import read_run_log
+
 logfile = sys.argv[1]
 title = sys.argv[2]
 
-f = open(logfile, 'r')
-
-# get dual values polar
-line = f.readline()
-line = f.readline()
-dual = line.split()
-
-# get primal values polar
-line = f.readline()
-line = f.readline()
-primal = line.split()
-
-# get LP values
-line = f.readline()
-line = f.readline()
-LP = line.split()
-
-f.close()
+log = read_run_log(logfile)
 
-# transform string values to float values
-for i in range(len(dual)):
-    dual[i] = float(dual[i])
-for i in range(len(primal)):
-    primal[i] = float(primal[i])
-for i in range(len(LP)):
-    LP[i] = float(LP[i])
+# get dual values polar, primal values polar, and LP values
+dual = log.get_series("dualDHHW", [])
+primal = log.get_series("primalDHHW", [])
+LP = log.get_series("dualLP", [])
 
 x = range(max(len(dual), len(primal), len(LP)))
 
@@ -1,5 +1,10 @@
+import os
 import sys
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from auxiliary import get_run_name
+from runlog import read_run_log, find_run_log
+
 #######################
 #
 # LOCAL FUNCTIONS
@@ -49,21 +54,12 @@ def print_experiment_line(problem_type, log_path, freq):
 
         optval = opt_vals[inst]
         
-        f = open(log_path + "/%s_prec_0.001000_corrfreq_%d_initconss_2_solver_gurobi_%s_lbopt_%d.txt" % (inst, freq, problem_type, optval))
+        log = read_run_log(find_run_log(log_path, get_run_name(inst, 0.001, freq, 2, "gurobi",
+                                                               problem_type, optval)))
 
-        # get dual values polar algorithm
-        line = f.readline()
-        line = f.readline()
-        dual_vals_polar_opt = list(line.split())
-
-        # get dual values LP
-        line = f.readline()
-        line = f.readline()
-        line = f.readline()
-        line = f.readline()
-        dual_vals_LP = line.split()
-    
-        f.close()
+        # get dual values polar algorithm and dual values LP
+        dual_vals_polar_opt = log.get_series("dualDHHW", [])
+        dual_vals_LP = log.get_series("dualLP", [])
 
         # update statistics
         niter_polar_opt += 1000     # in case we don't solve the instance
@@ -82,14 +78,11 @@ def print_experiment_line(problem_type, log_path, freq):
                 
 
         # get also values for not optimally initialized instances
-        f = open(log_path + "/%s_prec_0.001000_corrfreq_%d_initconss_2_solver_gurobi_%s.txt" % (inst, freq, problem_type))
+        log = read_run_log(find_run_log(log_path, get_run_name(inst, 0.001, freq, 2, "gurobi",
+                                                               problem_type)))
 
         # get dual values polar algorithm
-        line = f.readline()
-        line = f.readline()
-        dual_vals_polar = line.split()
-
-        f.close()
+        dual_vals_polar = log.get_series("dualDHHW", [])
 
         niter_polar += 1000     # in case we don't solve the instance
         for i in range(len(dual_vals_polar)):
@@ -0,0 +1,637 @@
+#!/usr/bin/env python3
+from oracles import *
+from problems import *
+from auxiliary import *
+from instance import load_instance
+from solve import ALLOWED_TYPES, NONPACKING_TYPES, solve, get_solve_params
+
+import sys
+import os
+import json
+import queue
+import signal
+import socketserver
+import threading
+import multiprocessing
+import time
+import numpy
+from concurrent.futures import Future
+
+####################################################################################################
+#
+# SOLVE SERVER
+#
+####################################################################################################
+#
+# The server keeps instances, oracles (with their separation models), and the prototypes of the
+# LP relaxations resident, so a solve request does not pay for starting Python, importing the
+# solver, parsing the instance, and building the models. Requests are JSON objects, one per line,
+# read from stdin (responses are written to stdout, the output of the algorithm to stderr) or
+# from the connections to a Unix socket (responses are written to the connection of the request):
+#
+# {"command": "solve", "id": <id>, "instance": <path>, "type": <problem type>,
+#  "objective": [...], "precision": ..., "maxiter": ..., "gap": ..., "corrfreq": ...,
+#  "initconss": ..., "dualfreq": ..., "timelimit": <seconds> or "deadline": <UNIX time>,
+#  "progress": <k>}
+# {"command": "load", "id": <id>, "instance": <path>, "type": <problem type>}
+# {"command": "cancel", "id": <id of a solve request>}
+# {"command": "shutdown"}
+#
+# Only "instance" and "type" are mandatory for solve requests; "command" defaults to "solve". The
+# objective replaces the objective of the instance (packing problems only). The time limit is
+# measured from the arrival of the request, i.e., it includes the time waiting for a worker.
+# Solve requests are processed in parallel by a pool of worker processes, each of which processes
+# one request at a time; requests wait in a queue until a worker is idle. Each worker keeps its own
+# instances and oracles (with their separation models), so the separation MIPs of different
+# requests are solved in parallel. A load request loads the instance in all workers. The
+# verification model of each request is copied from the prototype kept in the instance. A cancel
+# request stops the queued or running solve requests with the given id; ids of other requests are
+# ignored.
+#
+# Responses are JSON objects with the id of the request and a field "event":
+#
+# "accepted" - the request has been queued
+# "progress" - after every k-th iteration (if "progress" is positive): iteration count, primal
+#              value, and last computed dual bound (null if none has been computed)
+# "result"   - primal value, dual bound, status, iteration count, running time, number of cuts,
+#              and the best solution found (null if no solution has been found)
+# "loaded"   - the instance of a load request has been loaded
+# "error"    - the request failed; the message describes the reason
+
+# fields of solve requests that set parameters of solve() (see get_solve_params), mapped to the
+# parameter and its type
+REQUEST_PARAMS = {"precision": ("precision", float), "maxiter": ("maxiter", int),
+                  "gap": ("gap", float), "corrfreq": ("corr_freq", int),
+                  "initconss": ("initconss", int), "dualfreq": ("dual_freq", int)}
+
+
+class SOLVEWORKER:
+    '''
+    state of a worker process, which processes one request at a time with its own oracles
+
+    class variables:
+    index     - index of the worker
+    solver    - solver used by all oracles and models
+    cachedir  - directory of binary cache of parsed instance files (None if not used)
+    conn      - connection receiving tasks and cancellations from the server
+    responses - queue to which (index, token, response, final) is put
+    oracles   - dictionary mapping (path, problem type) to (instance, oracle, objective)
+    cancelled - set of tokens of cancelled requests
+    '''
+
+    def __init__(self, index, solver, cachedir, conn, responses):
+        '''
+        initializes the worker
+        index     - index of the worker
+        solver    - solver used by all oracles and models
+        cachedir  - directory of binary cache of parsed instance files (None if not used)
+        conn      - connection receiving tasks and cancellations from the server
+        responses - queue to which responses are put
+        '''
+        self.index = index
+        self.solver = solver
+        self.cachedir = cachedir
+        self.conn = conn
+        self.responses = responses
+        self.oracles = {}
+        self.cancelled = set()
+
+    def serve(self):
+        '''
+        processes tasks until None is received
+        '''
+        while True:
+            message = self.conn.recv()
+            if message is None:
+                break
+            if message[0] == "cancel":
+                self.cancelled.add(message[1])
+                continue
+
+            kind, token, command, request, deadline, cancelled = message
+            self.cancelled = set([token]) if cancelled else set()
+            self.process(token, command, request, deadline)
+
+    def send(self, token, response, final=False):
+        '''
+        sends a response of a request to the server
+        token    - token of the request
+        response - response (a dictionary)
+        final    - (optional) whether it is the last response of the request
+        '''
+        self.responses.put((self.index, token, response, final))
+
+    def is_cancelled(self, token):
+        '''
+        returns whether a request has been cancelled; cancellations sent by the server while the
+        request is running are read first
+        token - token of the request
+        '''
+        while self.conn.poll():
+            message = self.conn.recv()
+            if message is not None and message[0] == "cancel":
+                self.cancelled.add(message[1])
+        return token in self.cancelled
+
+    def get_oracle(self, instancefile, problemtype):
+        '''
+        returns the instance, the oracle, and the objective of an instance and problem type, which
+        are created on first use
+        instancefile - path to file encoding instance
+        problemtype  - type of problem
+        '''
+        if not problemtype in ALLOWED_TYPES:
+            raise ValueError("unknown type of problem %s, allowed types are %s" %
+                             (problemtype, ALLOWED_TYPES))
+
+        key = (os.path.abspath(instancefile), problemtype)
+        if not key in self.oracles:
+            instance = load_instance(instancefile, problemtype, self.cachedir)
+            oracle = ORACLE(instance, problemtype, self.solver)
+            self.oracles[key] = (instance, oracle, list(oracle.get_obj()))
+        return self.oracles[key]
+
+    def process(self, token, command, request, deadline):
+        '''
+        processes a solve or load request
+        token    - token of the request
+        command  - "solve" or "load"
+        request  - dictionary of the request
+        deadline - DEADLINE of the request
+        '''
+        reqid = request.get("id")
+        try:
+            instance, oracle, objective = self.get_oracle(request["instance"], request["type"])
+            if command == "load":
+                response = {"id": reqid, "event": "loaded"}
+            else:
+                response = self.run(token, request, instance, oracle, objective, deadline)
+        except Exception as e:
+            response = {"id": reqid, "event": "error", "message": "%s: %s" %
+                        (type(e).__name__, e)}
+        self.send(token, response, True)
+
+    def run(self, token, request, instance, oracle, default_objective, deadline):
+        '''
+        solves the problem of a request and returns the response containing the result
+        token             - token of the request
+        request           - dictionary of the request
+        instance          - instance (see load_instance)
+        oracle            - oracle of the instance and problem type
+        default_objective - objective of the problem type on the instance
+        deadline          - DEADLINE of the request
+        '''
+        reqid = request.get("id")
+        problemtype = request["type"]
+        objective = request.get("objective")
+        if objective is not None and problemtype in NONPACKING_TYPES:
+            raise ValueError("objectives can only be replaced for packing problems")
+        if objective is None:
+            objective = default_objective
+        if len(objective) != len(default_objective):
+            raise ValueError("objective has %d entries, but the instance has %d variables" %
+                             (len(objective), len(default_objective)))
+
+        params = get_solve_params(solver=self.solver)
+        for field in REQUEST_PARAMS:
+            if field in request:
+                name, convert = REQUEST_PARAMS[field]
+                params[name] = convert(request[field])
+
+        verif_model = PROBLEM(instance, problemtype, self.solver, params["initconss"])
+        if not problemtype in NONPACKING_TYPES:
+            oracle.set_obj(objective)
+            verif_model.set_obj(objective)
+
+        interval = int(request.get("progress", 0))
+
+        def progress(iteration, gamma, dual):
+            if interval > 0 and iteration % interval == 0:
+                self.send(token, {"id": reqid, "event": "progress", "iteration": iteration,
+                                  "primal": float(gamma), "dual": json_number(dual)})
+            return self.is_cancelled(token)
+
+        params["timelimit"], cputimelimit = deadline.get_remaining_limits()
+        result = solve(request["instance"], problemtype, params, oracle=oracle,
+                       verif_model=verif_model, progress=progress)
+
+        stats = result["stats"]
+        solution = result["solutions"][-1] if len(result["solutions"]) > 0 else None
+        return {"id": reqid, "event": "result", "primal": float(result["primal"]),
+                "dual": json_number(stats["dual_bound"]), "status": stats["status"],
+                "niter": stats["niter"], "time": stats["time"],
+                "ncuts": len(result["sepa_rounds"]),
+                "solution": [float(val) for val in solution] if solution is not None else None}
+
+
+def run_worker(index, solver, cachedir, conn, responses):
+    '''
+    main function of a worker process; the output of the algorithm (also the output written by
+    the solver to the file descriptor of stdout) is redirected to stderr
+    index     - index of the worker
+    solver    - solver used by all oracles and models
+    cachedir  - directory of binary cache of parsed instance files (None if not used)
+    conn      - connection receiving tasks and cancellations from the server
+    responses - queue to which responses are put
+    '''
+    os.dup2(2, 1)
+    sys.stdout = sys.stderr
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    load_solver(solver)
+    SOLVEWORKER(index, solver, cachedir, conn, responses).serve()
+
+
+class TASK:
+    '''
+    request that is queued or processed by a worker
+
+    class variables:
+    token     - unique number of the task
+    command   - "solve" or "load"
+    request   - dictionary of the request
+    deadline  - DEADLINE of the request
+    send      - function sending a response (a dictionary)
+    future    - future that is done when the last response has been sent
+    pinned    - index of the worker that has to process the task (None if any worker)
+    worker    - index of the worker processing the task (None if queued)
+    cancelled - whether the request has been cancelled
+    '''
+
+    def __init__(self, token, command, request, deadline, send, pinned=None):
+        '''
+        initializes a queued task
+        token    - unique number of the task
+        command  - "solve" or "load"
+        request  - dictionary of the request
+        deadline - DEADLINE of the request
+        send     - function sending a response (a dictionary)
+        pinned   - (optional) index of the worker that has to process the task
+        '''
+        self.token = token
+        self.command = command
+        self.request = request
+        self.deadline = deadline
+        self.send = send
+        self.future = Future()
+        self.pinned = pinned
+        self.worker = None
+        self.cancelled = False
+
+
+class SOLVESERVER:
+    '''
+    server processing requests of the protocol described above by a pool of worker processes;
+    requests are queued by the server and assigned to idle workers, such that cancellations of
+    queued and running requests can be forwarded
+
+    class variables:
+    solver     - solver used by all oracles and models
+    cachedir   - directory of binary cache of parsed instance files (None if not used)
+    context    - multiprocessing context used to start the workers
+    responses  - queue of responses of the workers
+    workers    - list of pairs of worker processes and connections to them
+    idle       - list of indices of idle workers
+    queue      - list of queued tasks
+    tasks      - dictionary mapping tokens to queued and running tasks
+    lock       - lock guarding the workers, idle, queue, and tasks
+    ntokens    - number of created tasks
+    dispatcher - thread forwarding the responses of the workers
+    '''
+
+    def __init__(self, solver, nworkers, cachedir=None):
+        '''
+        initializes the server and starts the workers
+        solver   - solver used by all oracles and models
+        nworkers - number of worker processes
+        cachedir - (optional) directory of binary cache of parsed instance files
+        '''
+        self.solver = solver
+        self.cachedir = cachedir
+        self.context = multiprocessing.get_context("spawn")
+        self.responses = self.context.Queue()
+        self.workers = [self.start_worker(i) for i in range(nworkers)]
+        self.idle = list(range(nworkers))
+        self.queue = []
+        self.tasks = {}
+        self.lock = threading.Lock()
+        self.ntokens = 0
+        self.dispatcher = threading.Thread(target=self.dispatch, daemon=True)
+        self.dispatcher.start()
+
+    def start_worker(self, index):
+        '''
+        starts a worker process and returns it together with the connection to it
+        index - index of the worker
+        '''
+        conn, workerconn = self.context.Pipe()
+        process = self.context.Process(target=run_worker, daemon=True,
+                                       args=(index, self.solver, self.cachedir, workerconn,
+                                             self.responses))
+        process.start()
+        workerconn.close()
+        return process, conn
+
+    def assign(self):
+        '''
+        assigns queued tasks to idle workers (the lock has to be held)
+        '''
+        for index in list(self.idle):
+            for (position, task) in enumerate(self.queue):
+                if task.pinned is None or task.pinned == index:
+                    del self.queue[position]
+                    self.idle.remove(index)
+                    task.worker = index
+                    self.workers[index][1].send(("task", task.token, task.command, task.request,
+                                                 task.deadline, task.cancelled))
+                    break
+
+    def finish(self, task, response):
+        '''
+        sends the last response of a task and marks it as done
+        task     - TASK
+        response - last response of the task
+        '''
+        task.send(response)
+        task.future.set_result(response)
+
+    def dispatch(self):
+        '''
+        forwards the responses of the workers to the senders of the requests until None is
+        received; workers that died are restarted and their tasks fail
+        '''
+        while True:
+            try:
+                message = self.responses.get(timeout=1)
+            except queue.Empty:
+                message = ()
+            if message is None:
+                break
+
+            finished = []
+            with self.lock:
+                if len(message) > 0:
+                    index, token, response, final = message
+                    task = self.tasks.get(token)
+                    if task is None:
+                        # the task of a worker that died has already failed
+                        pass
+                    elif final:
+                        del self.tasks[token]
+                        self.idle.append(index)
+                        finished.append((task, response))
+                    else:
+                        task.send(response)
+
+                for index, (process, conn) in enumerate(self.workers):
+                    if process.is_alive():
+                        continue
+                    for task in [t for t in self.tasks.values() if t.worker == index]:
+                        del self.tasks[task.token]
+                        finished.append((task, {"id": task.request.get("id"), "event": "error",
+                                                "message": "worker process died with exit "
+                                                "code %s" % process.exitcode}))
+                    conn.close()
+                    self.workers[index] = self.start_worker(index)
+                    if not index in self.idle:
+                        self.idle.append(index)
+                self.assign()
+
+            for (task, response) in finished:
+                self.finish(task, response)
+
+    def handle(self, line, send, futures=None):
+        '''
+        processes a request; returns False if the server shall shut down, otherwise True
+        line    - line containing the request as JSON object
+        send    - function sending a response (a dictionary)
+        futures - (optional) list to which the futures of the submitted requests are appended,
+                  which are done after the last response of the request has been sent
+        '''
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            send({"id": None, "event": "error", "message": "invalid JSON: %s" % e})
+            return True
+
+        if not isinstance(request, dict):
+            send({"id": None, "event": "error", "message": "request is not a JSON object"})
+            return True
+
+        command = request.get("command", "solve")
+        reqid = request.get("id")
+        if command == "shutdown":
+            return False
+        if command == "cancel":
+            self.cancel(reqid)
+            return True
+        if not command in ["solve", "load"]:
+            send({"id": reqid, "event": "error", "message": "unknown command %s" % command})
+            return True
+
+        # the time limit is measured from the arrival of the request
+        deadline = DEADLINE(request_timelimit(request))
+        with self.lock:
+            if command == "solve":
+                send({"id": reqid, "event": "accepted"})
+                tasks = [TASK(self.ntokens, command, request, deadline, send)]
+            else:
+                sendgroup = get_group_sender(send, len(self.workers))
+                tasks = [TASK(self.ntokens + i, command, request, deadline, sendgroup, i)
+                         for i in range(len(self.workers))]
+            self.ntokens += len(tasks)
+            for task in tasks:
+                self.tasks[task.token] = task
+                self.queue.append(task)
+            self.assign()
+
+        if futures is not None:
+            futures.extend(task.future for task in tasks)
+        return True
+
+    def cancel(self, reqid):
+        '''
+        cancels the queued and running solve requests with an id; ids of other requests are
+        ignored
+        reqid - id of the request
+        '''
+        with self.lock:
+            for task in self.tasks.values():
+                if task.request.get("id") != reqid or task.command != "solve" or task.cancelled:
+                    continue
+                task.cancelled = True
+                if task.worker is not None:
+                    self.workers[task.worker][1].send(("cancel", task.token))
+
+    def close(self):
+        '''
+        waits for all requests and stops the workers
+        '''
+        with self.lock:
+            futures = [task.future for task in self.tasks.values()]
+        for future in futures:
+            future.result()
+
+        self.responses.put(None)
+        self.dispatcher.join()
+        for (process, conn) in self.workers:
+            conn.send(None)
+            process.join()
+            conn.close()
+
+
+def get_group_sender(send, ntasks):
+    '''
+    returns a function that sends only the last of the responses of a group of tasks, or the
+    first error if a task fails
+    send   - function sending a response (a dictionary)
+    ntasks - number of tasks
+    '''
+    state = {"remaining": ntasks, "error": None}
+    lock = threading.Lock()
+
+    def sendgroup(response):
+        with lock:
+            state["remaining"] -= 1
+            if response.get("event") == "error" and state["error"] is None:
+                state["error"] = response
+            if state["remaining"] > 0:
+                return
+        send(state["error"] if state["error"] is not None else response)
+
+    return sendgroup
+
+
+def request_timelimit(request):
+    '''
+    returns the wall-clock time limit of a request in seconds (nonpositive if unlimited)
+    request - dictionary of the request
+    '''
+    if "deadline" in request:
+        return max(float(request["deadline"]) - time.time(), 1e-6)
+    return float(request.get("timelimit", -1))
+
+
+def json_number(value):
+    '''
+    returns a float as JSON number, or None if it is nan
+    value - float
+    '''
+    value = float(value)
+    return None if numpy.isnan(value) else value
+
+
+def serve_stdin(server):
+    '''
+    reads requests from stdin until the end of the input or a shutdown request and writes the
+    responses to stdout; the output of the algorithm is redirected to stderr
+    server - SOLVESERVER
+    '''
+    out = sys.stdout
+    sys.stdout = sys.stderr
+    lock = threading.Lock()
+
+    def send(response):
+        with lock:
+            out.write(json.dumps(response) + "\n")
+            out.flush()
+
+    for line in sys.stdin:
+        if line.strip() == "":
+            continue
+        if not server.handle(line, send):
+            break
+
+    server.close()
+
+
+def serve_socket(server, path):
+    '''
+    accepts connections to a Unix socket until a shutdown request is received; the responses to
+    the requests of a connection are written to this connection
+    server - SOLVESERVER
+    path   - path of the socket
+    '''
+    if os.path.exists(path):
+        os.remove(path)
+
+    class HANDLER(socketserver.StreamRequestHandler):
+        def handle(self):
+            lock = threading.Lock()
+            wfile = self.wfile
+            futures = []
+
+            def send(response):
+                with lock:
+                    try:
+                        wfile.write((json.dumps(response) + "\n").encode())
+                        wfile.flush()
+                    except (OSError, ValueError):
+                        pass
+
+            for line in self.rfile:
+                line = line.decode()
+                if line.strip() == "":
+                    continue
+                if not server.handle(line, send, futures):
+                    threading.Thread(target=socketserver_instance.shutdown).start()
+                    break
+
+            # keep the connection open until the requests of the connection are done
+            for future in futures:
+                future.result()
+
+    class UNIXSERVER(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        daemon_threads = True
+
+    socketserver_instance = UNIXSERVER(path, HANDLER)
+    sys.stdout = sys.stderr
+    try:
+        socketserver_instance.serve_forever()
+    finally:
+        socketserver_instance.server_close()
+        server.close()
+        if os.path.exists(path):
+            os.remove(path)
+
+
+
+####################################################################################################
+#
+# MAIN METHOD
+#
+####################################################################################################
+
+
+
+if __name__=='__main__':
+
+    solver = None
+    socketpath = ""
+    nworkers = os.cpu_count() or 1
+    cachedir = None
+    for arg in sys.argv[1:]:
+        if arg.startswith("--socket"):
+            socketpath = arg.split('=')[1]
+        elif arg.startswith("--workers"):
+            nworkers = int(arg.split('=')[1])
+        elif arg.startswith("--solver"):
+            solver = arg.split('=')[1]
+        elif arg.startswith("--cachedir"):
+            cachedir = arg.split('=')[1]
+        else:
+            sys.exit("ERROR unkown argument %s." % arg)
+
+    if nworkers <= 0:
+        sys.exit("ERROR number of workers has to be positive, but %d was given" % nworkers)
+
+    if solver is None:
+        solver = default_solver()
+        if solver is None:
+            sys.exit("ERROR cannot locate SCIP or Gurobi Python interface")
+    load_solver(solver)
+
+    server = SOLVESERVER(solver, nworkers, cachedir)
+    if socketpath != "":
+        serve_socket(server, socketpath)
+    else:
+        serve_stdin(server)
@@ -0,0 +1,763 @@
+#!/usr/bin/env python3
+from oracles import *
+from problems import *
+from auxiliary import *
+from packing_algorithm import *
+from instance import load_instance
+from tracing import *
+from presolve import presolve
+from cutstore import CUTSTORE
+
+import sys
+import time
+
+####################################################################################################
+#
+# LIBRARY INTERFACE TO THE PACKING ALGORITHM
+#
+####################################################################################################
+
+ALLOWED_TYPES = ["matching", "weightmatching", "stableset", "weightstableset", "polytope",
+                 "maxcut", "lpboost"]
+
+# problem types whose feasible region is not down-closed (see packing_algorithm)
+NONPACKING_TYPES = ["maxcut", "lpboost"]
+
+# problem types whose oracle and verification model support edits of the graph (see GRAPHEDIT)
+EDITABLE_TYPES = ["matching", "weightmatching", "stableset", "weightstableset"]
+
+
+def run_heuristics(oracle):
+    '''
+    returns the objective value of a feasible solution computed by the primal heuristics of an
+    oracle (see get_primal_solution) and the solution
+    oracle - ORACLE of the instance
+    '''
+    obj = oracle.get_obj()
+    solution = oracle.get_primal_solution()
+
+    return sum(obj[i] * solution[i] for i in range(len(obj))), solution
+
+
+# parameters of solve() and their default values (see solve() for their meaning); the dictionary
+# returned by parse_arguments contains them together with the parameters of the scripts
+SOLVE_PARAMS = {"solver": None, "precision": 0.0001, "maxiter": 1000, "corr_freq": -1,
+                "initconss": 1, "lbopt": -1, "silent": True, "dual_freq": 0, "cachedir": None,
+                "presolving": False, "heuristics": False, "heuristic_freq": 0, "gap": 0.01,
+                "timelimit": -1, "cputimelimit": -1, "adaptive_corrective": False,
+                "float32": False, "continuation": None, "update": "linesegment",
+                "cheap_dual": False, "record_points": False}
+
+
+def get_solve_params(params=None, **changes):
+    '''
+    returns a new dictionary of the parameters of solve(), whose default values (see SOLVE_PARAMS)
+    are replaced by the entries of params and then by the keyword arguments; entries of params
+    that are no parameters of solve() are ignored (e.g., the instance file in the dictionary of
+    parse_arguments), unknown keyword arguments raise a ValueError, and a frequency of recording
+    dual bounds of None (see parse_arguments) is replaced by 0
+    params  - (optional) dictionary of parameters
+    changes - parameters replacing the ones of params
+    '''
+    unknown = [key for key in changes if not key in SOLVE_PARAMS]
+    if len(unknown) > 0:
+        raise ValueError("unknown parameters of solve(): %s" % unknown)
+
+    result = dict(SOLVE_PARAMS)
+    if params is not None:
+        result.update((key, val) for (key, val) in params.items() if key in SOLVE_PARAMS)
+    result.update(changes)
+    if result["dual_freq"] is None:
+        result["dual_freq"] = 0
+
+    return result
+
+
+def solve(instancefile, problemtype, params=None, oracle=None, verif_model=None,
+          initial_cuts=None, progress=None, initial_q=None, cutstore=None):
+    '''
+    runs the packing algorithm on an instance and returns a dictionary containing the results
+    (no LP cut loop is run and no plots or logs are generated)
+    instancefile - path to file encoding instance
+    problemtype  - type of problem
+    params       - (optional) dictionary of parameters (see get_solve_params and below)
+    oracle       - (optional) ORACLE of the instance to be used instead of creating a new one
+    verif_model  - (optional) PROBLEM used to verify termination instead of creating a new one
+    initial_cuts - (optional) list of cuts known in advance to warm start the packing algorithm
+                   (see packing_algorithm); they have to be contained in verif_model
+    progress     - (optional) function informed about the progress after each iteration, which
+                   may stop the algorithm (see packing_algorithm)
+    initial_q    - (optional) point at which the warm start by initial_cuts begins (see
+                   packing_algorithm)
+    cutstore     - (optional) CUTSTORE (see cutstore.py) whose cuts of the instance warm start
+                   the algorithm (see initial_cuts) and whose best solution initializes the lower
+                   bound; afterwards, the separated cuts and the best solution found are stored
+
+    The parameters are
+    solver       - solver to be used; an installed solver is used if None
+    precision    - precision used to decide whether violated cuts exist
+    maxiter      - maximum number of iterations
+    corr_freq    - frequency of fully corrective steps
+    initconss    - {0,1,2} to encode whether no/box/standard constraints shall be used (see
+                   ORACLE.get_initial_conss)
+    lbopt        - lower bound on the optimal objective value (negative if unknown)
+    silent       - whether no output of the algorithm shall be printed
+    dual_freq    - frequency of recording dual bounds (see packing_algorithm)
+    cachedir     - directory of binary cache of parsed instance files
+    presolving   - whether the instance is reduced by presolve() before it is solved; primal
+                   values, dual bounds, and solutions refer to the original instance, while cuts,
+                   target vectors, and dual points refer to the reduced instance
+    heuristics   - whether the lower bound is initialized by the primal heuristics of the oracle
+                   (see run_heuristics)
+    heuristic_freq - frequency of rounding separation candidates (see packing_algorithm)
+    gap          - relative gap between dual bound and primal value at which the algorithm stops
+    timelimit    - wall-clock time limit of the call in seconds, including reading the instance
+                   and building the models (nonpositive if unlimited)
+    cputimelimit - CPU time limit of the call in seconds (nonpositive if unlimited)
+    adaptive_corrective - whether fully corrective steps are scheduled adaptively (see
+                          ADAPTIVESCHEDULER) instead of with frequency corr_freq
+    float32      - whether LPBoost datasets are stored in single precision
+    continuation - initial separation tolerance of a precision continuation (see
+                   packing_algorithm); None separates with precision throughout
+    update       - how q is updated between fully corrective steps ("linesegment", "away", or
+                   "pairwise", see packing_algorithm)
+    cheap_dual   - whether dual bounds derived from q replace most LP solves (see
+                   packing_algorithm)
+    record_points - whether the target vectors and dual points of all iterations are returned
+                    instead of only the final ones
+
+    The dictionary contains the keys
+    primal      - best primal value found
+    cuts        - list of separated cuts
+    solutions   - list of feasible solutions found
+    gamma_vals  - list of primal bounds for each iteration
+    sepa_rounds - list of iterations in which cuts have been separated
+    all_f       - list of target vectors (numpy arrays) for each iteration (only the final one
+                  unless record_points)
+    all_q       - list of dual points (numpy arrays) for each iteration (only the final one
+                  unless record_points)
+    dual_bounds - list of dual bounds for each iteration (empty if dual_freq is 0)
+    stats       - statistics of the run (see packing_algorithm, e.g., the reason for stopping is
+                  stored in the key "status"; the reduction statistics of
+                  presolve are stored in the key "presolve", the value and running time of the
+                  primal heuristics in "heuristic_value" and "heuristic_time", and the number
+                  of cuts loaded from cutstore in "nstored_cuts")
+    '''
+    params = get_solve_params(params)
+    solver = params["solver"]
+    lbopt = params["lbopt"]
+    dual_freq = params["dual_freq"]
+    cachedir = params["cachedir"]
+    float32 = params["float32"]
+    heuristics = params["heuristics"]
+
+    if solver is None:
+        solver = default_solver()
+        if solver is None and (oracle is None or verif_model is None):
+            raise RuntimeError("cannot locate SCIP or Gurobi Python interface")
+    deadline = DEADLINE(params["timelimit"], params["cputimelimit"])
+
+    presolved = None
+    if params["presolving"]:
+        if oracle is not None or verif_model is not None:
+            raise ValueError("presolving requires that the oracle and verification model are "
+                             "created by solve()")
+
+        presolved = presolve(instancefile, problemtype, cachedir)
+        instancefile = presolved.instance
+        problemtype = presolved.reducedtype
+        if lbopt >= 0:
+            lbopt -= presolved.offset
+
+        # all variables have been fixed
+        if presolved.stats["variables"][1] == 0:
+            dual_bounds = [presolved.offset] if dual_freq > 0 else []
+            stats = {"niter": 0, "nprimal": 0, "ndual": 0, "nheuristic": 0, "time": 0.0,
+                     "iteration_times": [], "status": "converged",
+                     "dual_bound": presolved.offset, "presolve": presolved.stats}
+            if heuristics:
+                stats["heuristic_value"] = presolved.offset
+                stats["heuristic_time"] = 0.0
+            return {"primal": presolved.offset, "cuts": [], "solutions": [presolved.postsolve([])],
+                    "gamma_vals": [presolved.offset], "sepa_rounds": [], "all_f": [],
+                    "all_q": [], "dual_bounds": dual_bounds, "stats": stats}
+
+    # the instance is only needed if the oracle or the verification model is created here
+    if oracle is None or verif_model is None:
+        instance = load_instance(instancefile, problemtype, cachedir, float32)
+    if oracle is None:
+        oracle = ORACLE(instance, problemtype, solver)
+
+    # initialize parameters for our algorithm
+    obj = oracle.get_obj()
+    norm_obj = numpy.sqrt(sum(val * val for val in obj))
+    gamma = norm_obj * oracle.get_inner_radius()
+    if lbopt > gamma:
+        gamma = lbopt
+
+    # the solution of the heuristics is the first solution if it improves the lower bound
+    stats = {}
+    warmstart = []
+
+    # cuts and best solution of earlier runs
+    stored_cuts = []
+    if cutstore is not None:
+        stored_cuts, stored_primal, stored_solution = \
+            cutstore.load(load_instance(instancefile, problemtype, cachedir, float32),
+                          problemtype, obj)
+        if stored_primal > gamma and stored_solution is not None:
+            gamma = stored_primal
+            warmstart = [stored_solution]
+        if initial_cuts:
+            keys = set(tuple(cut) for cut in initial_cuts)
+            stored_cuts = [cut for cut in stored_cuts if not tuple(cut) in keys]
+        initial_cuts = list(initial_cuts or []) + stored_cuts
+        stats["nstored_cuts"] = len(stored_cuts)
+    if heuristics:
+        heuristic_start = time.time()
+        heuristic_value, solution = run_heuristics(oracle)
+        stats["heuristic_value"] = heuristic_value
+        stats["heuristic_time"] = time.time() - heuristic_start
+        if heuristic_value > gamma:
+            gamma = heuristic_value
+            warmstart = [solution]
+
+    # list of cuts used for the fully corrective step (only built if such steps are performed,
+    # the upper bound constraints are dense)
+    if params["adaptive_corrective"]:
+        scheduler = ADAPTIVESCHEDULER()
+    else:
+        scheduler = FIXEDSCHEDULER(params["corr_freq"])
+    initial_conss = []
+    if scheduler.is_active():
+        initial_conss = oracle.get_initial_conss(params["initconss"])
+
+    if verif_model is None:
+        verif_model = PROBLEM(instance, problemtype, solver, params["initconss"])
+    for cut in stored_cuts:
+        verif_model.add_cut(cut)
+
+    remaining_time, remaining_cputime = deadline.get_remaining_limits()
+    primal, cuts, solutions, gamma_vals, sepa_rounds, all_f, all_q, dual_bounds =\
+        packing_algorithm(oracle, params["precision"], params["maxiter"], params["corr_freq"],
+                          gamma, initial_conss, solver, verif_model, silent=params["silent"],
+                          dual_freq=dual_freq, stats=stats,
+                          heuristic_freq=params["heuristic_freq"], gap=params["gap"],
+                          timelimit=remaining_time, cputimelimit=remaining_cputime,
+                          scheduler=scheduler, down_closed=not problemtype in NONPACKING_TYPES,
+                          initial_cuts=initial_cuts, progress=progress, initial_q=initial_q,
+                          continuation=params["continuation"], update=params["update"],
+                          cheap_dual=params["cheap_dual"],
+                          record_points=params["record_points"])
+    solutions = warmstart + solutions
+
+    # the cuts start with the origin (see packing_algorithm)
+    if cutstore is not None:
+        best_value = -1
+        best = []
+        if len(solutions) > 0:
+            values = numpy.asarray(solutions) @ numpy.asarray(obj, dtype=numpy.float64)
+            best_value = values.max()
+            best = [solutions[int(numpy.argmax(values))]]
+        cutstore.save(load_instance(instancefile, problemtype, cachedir, float32), problemtype,
+                      obj, cuts[1:], best_value, best)
+
+    # map values and solutions back to the original instance
+    if presolved is not None:
+        primal += presolved.offset
+        solutions = [presolved.postsolve(x) for x in solutions]
+        gamma_vals = [val + presolved.offset for val in gamma_vals]
+        dual_bounds = [val + presolved.offset for val in dual_bounds]
+        stats["dual_bound"] += presolved.offset
+        if heuristics:
+            stats["heuristic_value"] += presolved.offset
+        stats["presolve"] = presolved.stats
+
+    return {"primal": primal, "cuts": cuts, "solutions": solutions, "gamma_vals": gamma_vals,
+            "sepa_rounds": sepa_rounds, "all_f": all_f, "all_q": all_q,
+            "dual_bounds": dual_bounds, "stats": stats}
+
+
+def solve_batch(instancefile, problemtype, objectives, params=None):
+    '''
+    runs the packing algorithm for several objective vectors over the feasible region of the same
+    instance and returns a dictionary containing the list of results of solve() for each objective
+    ("results") and statistics of the batch ("stats"). The instance is read once, and one oracle
+    (with its separation models) is shared by all objectives. Since cuts do not depend on the
+    objective, all distinct cuts separated so far form a pool, which warm starts each later run
+    (see packing_algorithm) and is added to its verification model; likewise, the best feasible
+    solution found so far initializes the lower bound. Each objective uses a new verification
+    model since the model of a run receives every separated cut, also repeated ones, and adding
+    cuts to a large model is expensive.
+    instancefile - path to file encoding instance
+    problemtype  - type of problem (a packing problem, i.e., not in NONPACKING_TYPES)
+    objectives   - list of objective vectors
+    params       - (optional) dictionary of parameters of solve() (see get_solve_params); the
+                   time limits apply to each objective, lbopt is ignored, and presolving is not
+                   supported
+
+    The statistics contain the keys
+    time               - total running time in seconds (including reading the instance)
+    setup_time         - running time of reading the instance and creating the oracle
+    time_per_objective - amortized running time per objective, i.e., time / #objectives
+    objective_times    - list of running times of each objective (without setup)
+    pool_sizes         - list of sizes of the cut pool at the start of each objective
+    ncuts              - final size of the cut pool
+    '''
+    if problemtype in NONPACKING_TYPES:
+        raise ValueError("batched solving is only available for packing problems, not for %s"
+                         % problemtype)
+    params = get_solve_params(params)
+    solver = params["solver"]
+    if solver is None:
+        solver = default_solver()
+        if solver is None:
+            raise RuntimeError("cannot locate SCIP or Gurobi Python interface")
+
+    starttime = time.time()
+    instance = load_instance(instancefile, problemtype, params["cachedir"])
+    oracle = ORACLE(instance, problemtype, solver)
+    nvars = len(oracle.get_obj())
+    setup_time = time.time() - starttime
+
+    pool = []
+    poolkeys = set()
+    solutions = []
+    results = []
+    objective_times = []
+    pool_sizes = []
+    for obj in objectives:
+        objective_start = time.time()
+        obj = [float(val) for val in obj]
+        if len(obj) != nvars:
+            raise ValueError("objective has %d entries, but the instance has %d variables"
+                             % (len(obj), nvars))
+        oracle.set_obj(obj)
+        verif_model = PROBLEM(instance, problemtype, solver, params["initconss"])
+        verif_model.set_obj(obj)
+        for cut in pool:
+            verif_model.add_cut(cut)
+
+        # best solution of the previous objectives
+        lbopt = -1
+        warmstart = []
+        if len(solutions) > 0:
+            values = numpy.asarray(solutions) @ numpy.asarray(obj)
+            best = int(numpy.argmax(values))
+            if values[best] > 0:
+                lbopt = values[best]
+                warmstart = [solutions[best]]
+
+        result = solve(instancefile, problemtype, dict(params, solver=solver, lbopt=lbopt),
+                       oracle=oracle, verif_model=verif_model, initial_cuts=list(pool))
+        result["solutions"] = warmstart + result["solutions"]
+
+        # the cuts start with the origin and the pool, see packing_algorithm; a cut may be
+        # separated several times but enters the pool only once
+        pool_sizes.append(len(pool))
+        for cut in result["cuts"][1 + len(pool):]:
+            key = tuple(cut)
+            if not key in poolkeys:
+                poolkeys.add(key)
+                pool.append(cut)
+        solutions.extend(result["solutions"][len(warmstart):])
+
+        results.append(result)
+        objective_times.append(time.time() - objective_start)
+
+    endtime = time.time()
+    stats = {"time": endtime - starttime, "setup_time": setup_time,
+             "time_per_objective": (endtime - starttime) / max(len(objectives), 1),
+             "objective_times": objective_times, "pool_sizes": pool_sizes, "ncuts": len(pool)}
+
+    return {"results": results, "stats": stats}
+
+
+def solve_after_edit(result, edit, oracle, verif_model, problemtype, params=None):
+    '''
+    reoptimizes a matching or stable set problem after an edit of its graph and returns the result
+    of solve() for the edited graph. The edit is applied in place to the oracle and the
+    verification model of the previous run (see ORACLE.apply_edit and PROBLEM.apply_edit). The
+    distinct cuts of the previous run that stay valid (see GRAPHEDIT.map_cut) warm start the run
+    and are added to the new verification model. If no cut has been dropped, the last point q of
+    the previous run is still a convex combination of the cuts and starts the warm start (see
+    packing_algorithm). The best solution of the previous run initializes the lower bound if it
+    stays feasible, which is checked by the oracle if edges have been added between old nodes.
+    result       - result of solve() for the graph before the edit (without presolving)
+    edit         - GRAPHEDIT (see instance.py)
+    oracle       - ORACLE used by the previous run
+    verif_model  - PROBLEM used by the previous run
+    problemtype  - type of problem (in EDITABLE_TYPES)
+    params       - (optional) dictionary of parameters of solve() (see get_solve_params); lbopt
+                   is ignored, and presolving is not supported
+
+    In addition to the statistics of solve(), the statistics contain the number of cuts carried
+    forward ("ncarried") and dropped ("ndropped") and the running time of the edit ("edit_time").
+    '''
+    if not problemtype in EDITABLE_TYPES:
+        raise ValueError("edits are only available for %s, not for %s" %
+                         (EDITABLE_TYPES, problemtype))
+    if "presolve" in result["stats"]:
+        raise ValueError("edits cannot be applied to presolved runs")
+
+    params = get_solve_params(params)
+    starttime = time.time()
+    problem = "matching" if problemtype in ["matching", "weightmatching"] else "stableset"
+    oracle.apply_edit(edit)
+    obj = oracle.get_obj()
+
+    # the cuts start with the origin (see packing_algorithm)
+    cuts = []
+    keys = set()
+    ndropped = 0
+    for cut in result["cuts"][1:]:
+        key = tuple(cut)
+        if key in keys:
+            continue
+        keys.add(key)
+
+        mapped = edit.map_cut(cut, problem)
+        if mapped is None:
+            ndropped += 1
+        elif max(mapped) > 0:
+            cuts.append(mapped)
+    verif_model.apply_edit(edit, cuts)
+
+    initial_q = None
+    if ndropped == 0 and len(result["all_q"]) > 0:
+        initial_q = edit.map_values(result["all_q"][-1], problem)
+
+    # best solution of the previous run
+    lbopt = -1
+    warmstart = []
+    if len(result["solutions"]) > 0:
+        solutions = [edit.map_values(x, problem) for x in result["solutions"]]
+        values = numpy.asarray(solutions) @ numpy.asarray(obj)
+        best = int(numpy.argmax(values))
+        if values[best] > 0 and (edit.keeps_feasibility(problem) or
+                                 len(oracle.separate_point(solutions[best],
+                                                           params["precision"])) == 0):
+            lbopt = values[best]
+            warmstart = [solutions[best]]
+    edit_time = time.time() - starttime
+
+    result = solve(edit.instance, problemtype, dict(params, lbopt=lbopt), oracle=oracle,
+                   verif_model=verif_model, initial_cuts=cuts, initial_q=initial_q)
+    result["solutions"] = warmstart + result["solutions"]
+    result["stats"]["ncarried"] = len(cuts)
+    result["stats"]["ndropped"] = ndropped
+    result["stats"]["edit_time"] = edit_time
+
+    return result
+
+
+def read_graph_edit(filename):
+    '''
+    reads an edit of a graph (see GRAPHEDIT) from a file whose lines have the form
+
+    a <i> <j> [<weight>]   add edge {i,j}
+    d <i> <j>              remove edge {i,j}
+    n [<weight>]           add a node (labeled n+1, n+2, ... in the order of these lines)
+    r <v>                  remove node v and its incident edges
+
+    (empty lines and lines starting with 'c' are ignored)
+    filename - path to file
+    '''
+    add_nodes = 0
+    remove_nodes = []
+    add_edges = []
+    remove_edges = []
+    edge_weights = []
+    node_weights = []
+    f = open(filename, 'r')
+    for line in f:
+        entries = line.split()
+        if len(entries) == 0 or entries[0] == "c":
+            continue
+        if entries[0] == "a":
+            add_edges.append((int(entries[1]), int(entries[2])))
+            edge_weights.append(float(entries[3]) if len(entries) > 3 else 1.0)
+        elif entries[0] == "d":
+            remove_edges.append((int(entries[1]), int(entries[2])))
+        elif entries[0] == "n":
+            add_nodes += 1
+            node_weights.append(float(entries[1]) if len(entries) > 1 else 1.0)
+        elif entries[0] == "r":
+            remove_nodes.append(int(entries[1]))
+        else:
+            raise ValueError("unknown line in edit file: %s" % line.strip())
+    f.close()
+
+    return GRAPHEDIT(add_nodes, remove_nodes, add_edges, remove_edges, edge_weights, node_weights)
+
+
+def read_objectives(filename):
+    '''
+    reads objective vectors from a file containing one vector per line, whose entries are
+    separated by whitespace or commas (empty lines and lines starting with '#' are ignored)
+    filename - path to file
+    '''
+    objectives = []
+    f = open(filename, 'r')
+    for line in f:
+        if line.strip() == "" or line.startswith("#"):
+            continue
+        objectives.append([float(val) for val in line.replace(',', ' ').split()])
+    f.close()
+
+    return objectives
+
+
+# options that cannot be combined: each option excludes the listed options, e.g., traces do not
+# contain the responses of the primal heuristics, stored cuts change the responses of the oracle,
+# and presolving as well as edits need oracles created by solve()
+CONFLICTING_OPTIONS = {"--record": ["--heuristics", "--heuristicfreq", "--cutstore"],
+                       "--replay": ["--heuristics", "--heuristicfreq", "--cutstore"],
+                       "--presolve": ["--decompose", "--record", "--replay", "--objectives",
+                                      "--edit"],
+                       "--objectives": ["--decompose", "--record", "--replay", "--cutstore",
+                                        "--edit"],
+                       "--decompose": ["--record", "--replay", "--cutstore", "--edit"],
+                       "--edit": ["--record", "--replay", "--cutstore"]}
+
+
+def check_conflicts(argv):
+    '''
+    exits with an error if the command line contains options that cannot be combined (see
+    CONFLICTING_OPTIONS)
+    argv - list of command line arguments (without program name)
+    '''
+    options = [arg.split('=')[0] for arg in argv]
+    for option in options:
+        conflicts = [other for other in CONFLICTING_OPTIONS.get(option, []) if other in options]
+        if len(conflicts) > 0:
+            sys.exit("ERROR %s cannot be combined with %s" % (option, ", ".join(conflicts)))
+
+
+def parse_arguments(argv, allowedtypes=ALLOWED_TYPES):
+    '''
+    parses the command line arguments shared by solve.py and compare.py and returns a dictionary
+    of parameters, which contains the parameters of solve() (see get_solve_params); unknown
+    arguments are returned as a list (the frequency of recording dual bounds is None if --dualfreq
+    is not given, i.e., compare.py records them after each cut and solve.py does not record them),
+    and options that cannot be combined end the program (see check_conflicts)
+    argv         - list of command line arguments (without program name)
+    allowedtypes - (optional) list of allowed problem types
+    '''
+    params = dict(SOLVE_PARAMS, instancefile="", problemtype="matching", dual_freq=None,
+                  record="", replay="", cutstore="")
+    unknown = []
+
+    for arg in argv:
+        if arg.startswith("--file"):
+            params["instancefile"] = arg.split('=')[1]
+        elif arg.startswith("--type"):
+            params["problemtype"] = arg.split('=')[1]
+
+            if not params["problemtype"] in allowedtypes:
+                msg = "ERROR unkown type of problem."
+                msg += "Allowed types are {}, but '{}' was given".format(allowedtypes,
+                                                                         params["problemtype"])
+                sys.exit(msg)
+
+        elif arg.startswith("--precision"):
+            params["precision"] = float(arg.split('=')[1])
+        elif arg.startswith("--maxiter"):
+            params["maxiter"] = int(arg.split('=')[1])
+        elif arg.startswith("--solver"):
+            params["solver"] = arg.split('=')[1]
+        elif arg.startswith("--nosilent"):
+            params["silent"] = False
+        elif arg.startswith("--corrfreq"):
+            params["corr_freq"] = int(arg.split('=')[1])
+        elif arg.startswith("--adaptivecorr"):
+            params["adaptive_corrective"] = True
+        elif arg.startswith("--initconss"):
+            params["initconss"] = int(arg.split('=')[1])
+        elif arg.startswith("--lbopt"):
+            params["lbopt"] = float(arg.split('=')[1])
+        elif arg.startswith("--dualfreq"):
+            params["dual_freq"] = int(arg.split('=')[1])
+            if params["dual_freq"] <= 0:
+                sys.exit("ERROR dual bound frequency has to be positive, but %d was given"
+                         % params["dual_freq"])
+        elif arg.startswith("--cachedir"):
+            params["cachedir"] = arg.split('=')[1]
+        elif arg.startswith("--record"):
+            params["record"] = arg.split('=')[1]
+        elif arg.startswith("--replay"):
+            params["replay"] = arg.split('=')[1]
+        elif arg.startswith("--gap"):
+            params["gap"] = float(arg.split('=')[1])
+        elif arg.startswith("--timelimit"):
+            params["timelimit"] = float(arg.split('=')[1])
+        elif arg.startswith("--cputimelimit"):
+            params["cputimelimit"] = float(arg.split('=')[1])
+        elif arg.startswith("--heuristicfreq"):
+            params["heuristic_freq"] = int(arg.split('=')[1])
+        elif arg.startswith("--heuristics"):
+            params["heuristics"] = True
+        elif arg.startswith("--float32"):
+            params["float32"] = True
+        elif arg.startswith("--cutstore"):
+            params["cutstore"] = arg.split('=')[1]
+        elif arg.startswith("--update"):
+            params["update"] = arg.split('=')[1]
+            if not params["update"] in UPDATE_MODES:
+                sys.exit("ERROR unkown update of q '%s', allowed updates are %s"
+                         % (params["update"], UPDATE_MODES))
+        elif arg.startswith("--cheapdual"):
+            params["cheap_dual"] = True
+        elif arg.startswith("--continuation"):
+            params["continuation"] = float(arg.split('=')[1])
+            if params["continuation"] <= 0:
+                sys.exit("ERROR initial separation tolerance has to be positive, but %f was given"
+                         % params["continuation"])
+        else:
+            unknown.append(arg)
+
+    check_conflicts(argv)
+
+    if params["solver"] is None:
+        params["solver"] = default_solver()
+
+        # replayed runs only need a solver for fully corrective steps
+        if params["solver"] is None and (params["replay"] == "" or params["corr_freq"] > 0 or
+                                         params["adaptive_corrective"]):
+            sys.exit("ERROR cannot locate SCIP or Gurobi Python interface")
+
+    return params, unknown
+
+
+
+####################################################################################################
+#
+# MAIN METHOD
+#
+####################################################################################################
+
+
+
+if __name__=='__main__':
+
+    params, unknown = parse_arguments(sys.argv[1:])
+
+    # parameters of presolve and of the decomposition into connected components (only used by
+    # solve.py)
+    decompose = False
+    njobs = None
+    min_group_size = 100
+    objectivefile = ""
+    editfile = ""
+    for arg in unknown:
+        if arg.startswith("--decompose"):
+            decompose = True
+        elif arg.startswith("--jobs"):
+            njobs = int(arg.split('=')[1])
+        elif arg.startswith("--groupsize"):
+            min_group_size = int(arg.split('=')[1])
+        elif arg.startswith("--presolve"):
+            params["presolving"] = True
+        elif arg.startswith("--objectives"):
+            objectivefile = arg.split('=')[1]
+        elif arg.startswith("--edit"):
+            editfile = arg.split('=')[1]
+        else:
+            sys.exit("ERROR unkown argument %s." % arg)
+
+    # dual bounds are only recorded if --dualfreq is given, since they need LP solves
+    if params["dual_freq"] is None:
+        params["dual_freq"] = 0
+    cutstore = CUTSTORE(params["cutstore"]) if params["cutstore"] != "" else None
+
+    if editfile != "":
+        if not params["problemtype"] in EDITABLE_TYPES:
+            sys.exit("ERROR --edit is only available for problem types %s" % EDITABLE_TYPES)
+
+        instance = load_instance(params["instancefile"], params["problemtype"],
+                                 params["cachedir"])
+        oracle = ORACLE(instance, params["problemtype"], params["solver"])
+        verif_model = PROBLEM(instance, params["problemtype"], params["solver"],
+                              params["initconss"])
+        result = solve(instance, params["problemtype"], params, oracle=oracle,
+                       verif_model=verif_model)
+        print("best primal value found before edit:\t", result["primal"])
+        print("DHHWtimeBeforeEdit\t%f" % result["stats"]["time"])
+
+        result = solve_after_edit(result, read_graph_edit(editfile), oracle, verif_model,
+                                  params["problemtype"], params)
+        print("best primal value found after edit:\t", result["primal"])
+        print("nCarriedCuts\t%d" % result["stats"]["ncarried"])
+        print("nDroppedCuts\t%d" % result["stats"]["ndropped"])
+        print("EditTime\t%f" % result["stats"]["edit_time"])
+        print("DHHWtimeAfterEdit\t%f" % result["stats"]["time"])
+        print("DHHWstatusAfterEdit\t%s" % result["stats"]["status"])
+        sys.exit(0)
+
+    if objectivefile != "":
+        if params["problemtype"] in NONPACKING_TYPES:
+            sys.exit("ERROR --objectives is only available for packing problems")
+
+        batch = solve_batch(params["instancefile"], params["problemtype"],
+                            read_objectives(objectivefile), params)
+        batch_stats = batch["stats"]
+        for k, result in enumerate(batch["results"]):
+            print("best primal value found for objective %d:\t" % k, result["primal"])
+        print("nBatchObjectives\t%d" % len(batch["results"]))
+        print("nBatchCuts\t%d" % batch_stats["ncuts"])
+        print("BatchSetupTime\t%f" % batch_stats["setup_time"])
+        print("BatchTime\t%f" % batch_stats["time"])
+        print("BatchTimePerObjective\t%f" % batch_stats["time_per_objective"])
+        sys.exit(0)
+
+    if decompose:
+        from decomposition import solve_decomposed
+
+        result = solve_decomposed(params["instancefile"], params["problemtype"], params,
+                                  njobs=njobs, min_group_size=min_group_size)
+        print("nComponentGroups\t%d" % result["ncomponents"])
+        print("DecompositionTime\t%f" % result["stats"]["time"])
+        if params["dual_freq"] > 0:
+            print("DHHWdualBound\t%f" % result["dual"])
+        print("best primal value found by packing algorithm:\t", result["primal"])
+        sys.exit(0)
+
+    # record the responses of the oracle and verification model or replay recorded responses
+    oracle = None
+    verif_model = None
+    if params["replay"] != "":
+        trace = load_trace(params["replay"])
+        oracle = REPLAYORACLE(trace)
+        verif_model = REPLAYPROBLEM(trace)
+    elif params["record"] != "":
+        trace = TRACE()
+        instance = load_instance(params["instancefile"], params["problemtype"],
+                                 params["cachedir"], params["float32"])
+        oracle = RECORDINGORACLE(ORACLE(instance, params["problemtype"], params["solver"]), trace)
+        verif_model = RECORDINGPROBLEM(PROBLEM(instance, params["problemtype"], params["solver"],
+                                               params["initconss"]), trace)
+
+    result = solve(params["instancefile"], params["problemtype"], params, oracle=oracle,
+                   verif_model=verif_model, cutstore=cutstore)
+
+    if params["record"] != "" and params["replay"] == "":
+        trace.save(params["record"])
+
+    if params["presolving"]:
+        presolve_stats = result["stats"]["presolve"]
+        print("PresolveVariables\t%d %d" % tuple(presolve_stats["variables"]))
+        print("PresolveFixed\t%d %d" % (presolve_stats["fixed_zero"], presolve_stats["fixed_one"]))
+        print("PresolveTime\t%f" % presolve_stats["time"])
+
+    if params["heuristics"]:
+        print("HeuristicValue\t%f" % result["stats"]["heuristic_value"])
+        print("HeuristicTime\t%f" % result["stats"]["heuristic_time"])
+    if params["heuristic_freq"] > 0:
+        print("nHeuristicSolutions\t%d" % result["stats"]["nheuristic"])
+    if cutstore is not None and "nstored_cuts" in result["stats"]:
+        print("nStoredCuts\t%d" % result["stats"]["nstored_cuts"])
+        cutstore.close()
+
+    if params["dual_freq"] > 0:
+        print("DHHWdualBound\t%f" % result["stats"]["dual_bound"])
+    print("best primal value found by packing algorithm:\t", result["primal"])
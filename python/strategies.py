@@ -0,0 +1,866 @@
+#!/usr/bin/env python3
+from oracles import *
+from problems import *
+from auxiliary import *
+from instance import load_instance
+from runlog import write_run_log
+from solve import get_solve_params, parse_arguments
+
+import sys
+import time
+import numpy
+
+####################################################################################################
+#
+# NEXT-POINT STRATEGIES
+#
+####################################################################################################
+#
+# The port of loop.jl of the Julia code separates the loop driver (strategy_loop) from the rule
+# that selects the next point queried from the oracle. All strategies share the driver, the
+# oracle, and an LP relaxation (PROBLEM) that receives every separated cut and provides the upper
+# bound in each iteration, so the methods can be compared on the same instance in one process:
+#
+# cutloop   - an optimal solution of the LP relaxation (the standard cutting plane loop)
+# ellipsoid - the center of an ellipsoid containing all optimal solutions; the ellipsoid is
+#             replaced by the smallest ellipsoid containing its intersection with a (deep) cut
+# analytic  - the analytic center of the known inequalities, the cutoff obj x >= lb, and a ball
+#             containing the domain, computed by an infeasible start Newton method
+# dhhw      - the separation candidate of the packing algorithm (line segment steps only)
+#
+# Each strategy is initialized with the objective, the lower bound, the DOMAIN, and the LP
+# relaxation. In each iteration, a point violating a bound of the domain is cut off by this bound,
+# a point of objective value smaller than the lower bound lb by the cutoff obj x >= lb, and all
+# other points are separated by the oracle. If the oracle does not separate the point, the lower
+# bound is raised to its objective value. Strategies receive inequalities as coefficients and
+# right-hand side (cuts of the oracle have right-hand side 1).
+#
+# The ellipsoid and analytic center strategies store dense matrices whose size is quadratic in the
+# number of variables and are meant for small instances. They work in the coordinates z of the
+# affine hull of the domain, in which the domain is contained in a ball of given radius around 0
+# (see DOMAIN.lift).
+
+STRATEGY_TYPES = ["cutloop", "ellipsoid", "analytic", "dhhw"]
+
+# problem types whose domain is the 0/1 cube (the other types are handled by get_domain)
+PACKING_TYPES = ["matching", "weightmatching", "stableset", "weightstableset", "polytope"]
+
+
+class DOMAIN:
+    '''
+    box {x : lower <= x <= upper} intersected with an affine subspace {x : E x = e} that contains
+    all optimal solutions; the affine subspace is parametrized as x = T z + u for an orthonormal
+    basis T of the kernel of E and the projection u of the center of the box onto the subspace, so
+    the domain is contained in the ball of the given radius around z = 0
+
+    class variables:
+    lower       - array of lower bounds
+    upper       - array of upper bounds
+    down_closed - whether the feasible region is down-closed (see packing_algorithm)
+    basis       - matrix T (None if there are no equations, i.e., T is the identity)
+    offset      - point u
+    dim         - dimension of the coordinates z
+    radius      - radius of the ball containing the domain
+    '''
+
+    def __init__(self, lower, upper, down_closed, eqmatrix=None, eqrhs=None):
+        '''
+        initializes the domain
+        lower       - array of lower bounds
+        upper       - array of upper bounds
+        down_closed - whether the feasible region is down-closed
+        eqmatrix    - (optional) (k,n) array E of equations
+        eqrhs       - (optional) array e of right-hand sides of equations
+        '''
+        self.lower = numpy.asarray(lower, dtype=numpy.float64)
+        self.upper = numpy.asarray(upper, dtype=numpy.float64)
+        self.down_closed = down_closed
+
+        center = (self.lower + self.upper) / 2
+        radius = numpy.linalg.norm(self.upper - self.lower) / 2
+        if eqmatrix is None:
+            self.basis = None
+            self.offset = center
+            self.dim = len(center)
+            self.radius = radius
+        else:
+            # the rows of vt beyond the rank of E span its kernel
+            eqmatrix = numpy.atleast_2d(numpy.asarray(eqmatrix, dtype=numpy.float64))
+            u, sing, vt = numpy.linalg.svd(eqmatrix)
+            rank = int(numpy.sum(sing > 1e-10 * sing.max())) if len(sing) > 0 else 0
+            self.basis = vt[rank:].T
+            self.offset = center - numpy.linalg.lstsq(eqmatrix, eqmatrix @ center - eqrhs,
+                                                      rcond=None)[0]
+            self.dim = self.basis.shape[1]
+
+            # the ball around the center intersects the subspace in a ball around the offset
+            dist = numpy.linalg.norm(center - self.offset)
+            self.radius = numpy.sqrt(max(radius ** 2 - dist ** 2, 0.0))
+
+    def lift(self, z):
+        '''
+        returns the point x = T z + u
+        z - array of coordinates in the affine subspace
+        '''
+        if self.basis is None:
+            return z + self.offset
+        return self.basis @ z + self.offset
+
+    def project_inequality(self, coefs, rhs):
+        '''
+        returns coefficients and right-hand side of the inequality in the coordinates z that is
+        equivalent to coefs x <= rhs on the affine subspace
+        coefs - array of coefficients
+        rhs   - right-hand side
+        '''
+        coefs = numpy.asarray(coefs, dtype=numpy.float64)
+        rhs = rhs - coefs @ self.offset
+        if self.basis is None:
+            return coefs, rhs
+        return self.basis.T @ coefs, rhs
+
+    def get_bounds(self):
+        '''
+        returns the bounds of the box as list of pairs (coefficients, right-hand side)
+        '''
+        n = len(self.lower)
+        bounds = []
+        for i in range(n):
+            coefs = numpy.zeros(n)
+            coefs[i] = 1.0
+            bounds.append((coefs, self.upper[i]))
+            bounds.append((-coefs, -self.lower[i]))
+        return bounds
+
+    def get_violated_bound(self, point, precision):
+        '''
+        returns a most violated bound of the box as pair (coefficients, right-hand side) or None
+        if all bounds are satisfied up to a certain precision
+        point     - array of values of a point
+        precision - precision to decide whether a bound is violated
+        '''
+        upper = point - self.upper
+        lower = self.lower - point
+        i = int(numpy.argmax(upper))
+        j = int(numpy.argmax(lower))
+        if max(upper[i], lower[j]) <= precision:
+            return None
+
+        coefs = numpy.zeros(len(point))
+        if upper[i] >= lower[j]:
+            coefs[i] = 1.0
+            return coefs, self.upper[i]
+        coefs[j] = -1.0
+        return coefs, -self.lower[j]
+
+
+def get_domain(problemtype, oracle):
+    '''
+    returns the DOMAIN of the variables of an oracle: the box between 0 and the upper bounds of
+    the oracle for packing problems (raises ValueError if a bound is infinite), the cube
+    [-1,1]^n for max-cut, and the distributions with gamma + 2 in [0,3] for LPBoost (gamma lies
+    in [-1,0] since the hypotheses contain all negations and all edges lie in [-1,1])
+    problemtype - type of problem
+    oracle      - ORACLE of the instance
+    '''
+    n = len(oracle.get_obj())
+    if problemtype in PACKING_TYPES:
+        upper = numpy.asarray(oracle.get_upper_bounds(), dtype=numpy.float64)
+        if not numpy.all(numpy.isfinite(upper)):
+            raise ValueError("feasible region is unbounded since a variable has no upper bound")
+        return DOMAIN(numpy.zeros(n), upper, True)
+    if problemtype == "maxcut":
+        return DOMAIN(-numpy.ones(n), numpy.ones(n), False)
+    if problemtype == "lpboost":
+        ub = oracle.instantiation.ub
+        lower = numpy.concatenate(([0.0], -numpy.ones(n - 1)))
+        upper = numpy.concatenate(([3.0], numpy.full(n - 1, ub)))
+        eqmatrix = numpy.concatenate(([0.0], numpy.ones(n - 1)))
+        return DOMAIN(lower, upper, False, eqmatrix, numpy.zeros(1))
+
+    raise ValueError("no domain known for problem type %s" % problemtype)
+
+
+####################################################################################################
+#
+# INTERFACE CLASS FOR STRATEGIES
+#
+####################################################################################################
+
+class STRATEGY:
+    '''
+    interface class to next-point strategies
+
+    class variables:
+    instantiation - class of concrete strategy
+    '''
+
+    def __init__(self, method, obj, lb, domain, problem):
+        '''
+        initializes interface class
+        method  - name of strategy (see STRATEGY_TYPES)
+        obj     - array of objective coefficients
+        lb      - lower bound on the optimal objective value
+        domain  - DOMAIN of the variables
+        problem - PROBLEM of the LP relaxation shared with the loop
+        '''
+
+        if method == "cutloop":
+            self.instantiation = CUTLOOPSTRATEGY(obj, lb, domain, problem)
+        elif method == "ellipsoid":
+            self.instantiation = ELLIPSOIDSTRATEGY(obj, lb, domain, problem)
+        elif method == "analytic":
+            self.instantiation = ANALYTICSTRATEGY(obj, lb, domain, problem)
+        elif method == "dhhw":
+            self.instantiation = PACKINGSTRATEGY(obj, lb, domain, problem)
+        else:
+            raise ValueError("unknown strategy %s, allowed strategies are %s" %
+                             (method, STRATEGY_TYPES))
+
+    def next_point(self):
+        '''
+        returns the next point to query
+        '''
+        return self.instantiation.next_point()
+
+    def add_inequality(self, coefs, rhs):
+        '''
+        informs the strategy about a valid inequality coefs x <= rhs violated by the last point
+        coefs - array of coefficients
+        rhs   - right-hand side
+        '''
+        self.instantiation.add_inequality(coefs, rhs)
+
+    def update_lower_bound(self, lb):
+        '''
+        informs the strategy about the current lower bound on the optimal objective value
+        lb - lower bound
+        '''
+        self.instantiation.update_lower_bound(lb)
+
+
+####################################################################################################
+#
+# INSTANTIATIONS OF STRATEGIES
+#
+####################################################################################################
+
+
+class CUTLOOPSTRATEGY:
+    '''
+    strategy querying an optimal solution of the LP relaxation
+
+    class variables:
+    problem - PROBLEM of the LP relaxation
+    '''
+
+    def __init__(self, obj, lb, domain, problem):
+        '''
+        initializes the strategy
+        obj     - array of objective coefficients (not used)
+        lb      - lower bound on the optimal objective value (not used)
+        domain  - DOMAIN of the variables (not used)
+        problem - PROBLEM of the LP relaxation
+        '''
+        self.problem = problem
+
+    def next_point(self):
+        '''
+        returns an optimal solution of the LP relaxation, which is solved by the loop
+        '''
+        return numpy.asarray(self.problem.get_opt_solution(), dtype=numpy.float64)
+
+    def add_inequality(self, coefs, rhs):
+        '''
+        does nothing, the loop adds separated cuts to the LP relaxation
+        '''
+        pass
+
+    def update_lower_bound(self, lb):
+        '''
+        does nothing, the LP relaxation does not use the lower bound
+        '''
+        pass
+
+
+class ELLIPSOIDSTRATEGY:
+    '''
+    strategy querying the center of an ellipsoid {z : (z - center)^T matrix^-1 (z - center) <= 1}
+    in the coordinates of the domain; a cut a z <= b is applied as deep cut with depth
+    alpha = (a center - b) / sqrt(a^T matrix a), and the ellipsoid is updated by a rank-one
+    correction of its matrix
+
+    class variables:
+    obj    - array of objective coefficients
+    domain - DOMAIN of the variables
+    dim    - dimension n of the coordinates
+    center - center of the ellipsoid
+    matrix - positive definite (n,n) matrix of the ellipsoid
+    '''
+
+    def __init__(self, obj, lb, domain, problem):
+        '''
+        initializes the strategy with the ball containing the domain
+        obj     - array of objective coefficients
+        lb      - lower bound on the optimal objective value
+        domain  - DOMAIN of the variables
+        problem - PROBLEM of the LP relaxation (not used)
+        '''
+        self.obj = numpy.asarray(obj, dtype=numpy.float64)
+        self.domain = domain
+        self.dim = domain.dim
+        self.center = numpy.zeros(self.dim)
+        self.matrix = domain.radius ** 2 * numpy.eye(self.dim)
+
+    def next_point(self):
+        '''
+        returns the center of the ellipsoid
+        '''
+        return self.domain.lift(self.center)
+
+    def add_inequality(self, coefs, rhs):
+        '''
+        cuts the ellipsoid by an inequality if it is violated by the center
+        coefs - array of coefficients
+        rhs   - right-hand side
+        '''
+        coefs, rhs = self.domain.project_inequality(coefs, rhs)
+        if coefs @ self.center >= rhs:
+            self.cut(coefs, rhs)
+
+    def update_lower_bound(self, lb):
+        '''
+        cuts the ellipsoid by obj x >= lb if it is violated by the center (or tight)
+        lb - lower bound
+        '''
+        self.add_inequality(-self.obj, -lb)
+
+    def cut(self, coefs, rhs):
+        '''
+        replaces the ellipsoid by the smallest ellipsoid containing its intersection with the
+        half space coefs z <= rhs (whose boundary must not lie beyond the center)
+        coefs - array of coefficients
+        rhs   - right-hand side
+        '''
+        n = self.dim
+        direction = self.matrix @ coefs
+        scale = coefs @ direction
+        if scale <= 0:
+            return
+        scale = numpy.sqrt(scale)
+
+        # an empty intersection is only possible due to round-off errors; we use a central cut
+        alpha = (coefs @ self.center - rhs) / scale
+        if alpha >= 1:
+            alpha = 0.0
+
+        if n == 1:
+            # the ellipsoid is an interval
+            self.center -= (1 + alpha) / 2 * direction / scale
+            self.matrix *= (1 - alpha) ** 2 / 4
+            return
+
+        self.center -= (1 + n * alpha) / (n + 1) * direction / scale
+        self.matrix -= 2 * (1 + n * alpha) / ((n + 1) * (1 + alpha)) / scale ** 2 *\
+            numpy.outer(direction, direction)
+        self.matrix *= n ** 2 * (1 - alpha ** 2) / (n ** 2 - 1)
+
+
+class ANALYTICSTRATEGY:
+    '''
+    strategy querying the analytic center of the inequalities rows z <= rhs (the first one is the
+    cutoff obj x >= lb, followed by the bounds of the domain and all added inequalities) and of
+    the ball ||z|| <= radius in the coordinates of the domain; if the computation of the analytic
+    center fails, the previous center is queried again (as in the Julia code)
+
+    class variables:
+    obj     - array of objective coefficients
+    domain  - DOMAIN of the variables
+    rows    - (capacity,n) array whose first nrows rows are the coefficients of the inequalities
+    rhs     - array of right-hand sides (of the same capacity)
+    nrows   - number of inequalities
+    center  - current analytic center
+    nfailed - number of failed computations of the analytic center
+    '''
+
+    def __init__(self, obj, lb, domain, problem):
+        '''
+        initializes the strategy with the bounds of the domain
+        obj     - array of objective coefficients
+        lb      - lower bound on the optimal objective value
+        domain  - DOMAIN of the variables
+        problem - PROBLEM of the LP relaxation (not used)
+        '''
+        self.obj = numpy.asarray(obj, dtype=numpy.float64)
+        self.domain = domain
+        self.center = numpy.zeros(domain.dim)
+        self.nfailed = 0
+
+        # the arrays grow by doubling their capacity, so adding a row is amortized O(n)
+        bounds = domain.get_bounds()
+        self.rows = numpy.zeros((2 * (len(bounds) + 1), domain.dim))
+        self.rhs = numpy.zeros(2 * (len(bounds) + 1))
+        self.nrows = 0
+
+        self.add_inequality(-self.obj, -lb)
+        for coefs, rhs in bounds:
+            self.add_inequality(coefs, rhs)
+
+    def next_point(self):
+        '''
+        returns the analytic center
+        '''
+        center = self.center.copy()
+        if analytic_center(self.rows[:self.nrows], self.rhs[:self.nrows], self.domain.radius,
+                           center):
+            self.center = center
+        else:
+            self.nfailed += 1
+
+        return self.domain.lift(self.center)
+
+    def add_inequality(self, coefs, rhs):
+        '''
+        adds an inequality
+        coefs - array of coefficients
+        rhs   - right-hand side
+        '''
+        coefs, rhs = self.domain.project_inequality(coefs, rhs)
+
+        if self.nrows == len(self.rhs):
+            self.rows = numpy.concatenate((self.rows, numpy.zeros_like(self.rows)))
+            self.rhs = numpy.concatenate((self.rhs, numpy.zeros_like(self.rhs)))
+        self.rows[self.nrows] = coefs
+        self.rhs[self.nrows] = rhs
+        self.nrows += 1
+
+    def update_lower_bound(self, lb):
+        '''
+        updates the right-hand side of the cutoff obj x >= lb
+        lb - lower bound
+        '''
+        coefs, rhs = self.domain.project_inequality(-self.obj, -lb)
+        self.rhs[0] = rhs
+
+
+class PACKINGSTRATEGY:
+    '''
+    strategy querying the separation candidate 2 (f - q) / ((f - q)(f + q)) of the packing
+    algorithm with target f = obj / lb (see packing_algorithm), where q is updated by the line
+    segment steps of the packing algorithm; fully corrective steps are not performed
+
+    class variables:
+    obj         - array of objective coefficients
+    down_closed - whether the feasible region is down-closed
+    target      - target vector f
+    dualpoint   - dual point q
+    '''
+
+    def __init__(self, obj, lb, domain, problem):
+        '''
+        initializes the strategy
+        obj     - array of objective coefficients
+        lb      - positive lower bound on the optimal objective value
+        domain  - DOMAIN of the variables
+        problem - PROBLEM of the LP relaxation (not used)
+        '''
+        self.obj = numpy.asarray(obj, dtype=numpy.float64)
+        self.down_closed = domain.down_closed
+        self.target = self.obj / lb
+        self.dualpoint = numpy.zeros(len(self.obj))
+
+    def next_point(self):
+        '''
+        returns the separation candidate
+        '''
+        diff = self.target - self.dualpoint
+        tau = diff @ (self.target + self.dualpoint)
+        return 2 * diff / tau
+
+    def add_inequality(self, coefs, rhs):
+        '''
+        projects f onto the line segment between q and the inequality scaled to right-hand side 1;
+        inequalities with nonpositive right-hand side are ignored, they are not violated by the
+        candidates since these are nonnegative for down-closed regions and otherwise all bounds of
+        the domain have positive right-hand side
+        coefs - array of coefficients
+        rhs   - right-hand side
+        '''
+        if rhs <= 0:
+            return
+
+        cut = numpy.asarray(coefs, dtype=numpy.float64) / rhs
+        self.dualpoint = numpy.asarray(closest_point_linesegment(self.dualpoint, cut,
+                                                                 self.target))
+        self.finish_step()
+
+    def update_lower_bound(self, lb):
+        '''
+        updates f = obj / lb and projects it onto the line segment between q and 0
+        lb - lower bound
+        '''
+        self.target = self.obj / lb
+        self.dualpoint = numpy.asarray(closest_point_linesegment(self.dualpoint,
+                                                                 numpy.zeros(len(self.obj)),
+                                                                 self.target))
+        self.finish_step()
+
+    def finish_step(self):
+        '''
+        reduces q to min(f, q) for down-closed regions and shrinks it towards 0 otherwise (see
+        packing_algorithm)
+        '''
+        if self.down_closed:
+            self.dualpoint = numpy.minimum(self.dualpoint, self.target)
+        else:
+            self.dualpoint = numpy.asarray(closest_point_linesegment(self.dualpoint,
+                                                                     numpy.zeros(len(self.obj)),
+                                                                     self.target))
+
+
+####################################################################################################
+#
+# ANALYTIC CENTER
+#
+####################################################################################################
+
+# a factorization of the Newton matrix is reused as long as the residual decreases at least by
+# this factor per step
+NEWTON_REUSE_DECREASE = 0.5
+
+
+def analytic_center(rows, rhs, radius, x, grad_atol=1e-8, maxiter=50, alpha=0.9):
+    '''
+    computes the analytic center of {x : rows x <= rhs, ||x|| <= radius} by Riley Badenbroek's
+    infeasible start Newton method (port of analytic.jl, source:
+    https://github.com/rileybadenbroek/CopositiveAnalyticCenter.jl, MIT License, Copyright (c)
+    2020 Riley Badenbroek); returns whether the computation has succeeded. The inverse of the
+    Cholesky factor of the Newton matrix is cached, and the next steps reuse it as long as the
+    residual decreases at least by the factor NEWTON_REUSE_DECREASE, which saves forming and
+    factorizing the matrix in each step.
+    rows      - (m,n) array of coefficients
+    rhs       - array of right-hand sides
+    radius    - radius of the ball
+    x         - array of the starting point, which is overwritten by the analytic center
+    grad_atol - (optional) tolerance on the norm of the gradient of the Lagrangian
+    maxiter   - (optional) maximum number of Newton steps
+    alpha     - (optional) fraction of the maximal step keeping the slacks positive
+    '''
+    m, n = rows.shape
+    if m == 0:
+        return True
+
+    tol = numpy.sqrt(numpy.finfo(numpy.float64).eps)
+    d = radius ** 2 - x @ x if radius - numpy.linalg.norm(x) > tol else 1.0
+    s = rhs - rows @ x
+    s[s <= tol] = 1.0
+    kappa = 1.0
+    lam = numpy.zeros(m)
+
+    def residual(x, d, s, kappa, lam):
+        v1 = 2 * kappa * x + rows.T @ lam
+        v2 = -1 / s + lam
+        v3 = s - rhs + rows @ x
+        return numpy.sqrt(v1 @ v1 + (-1 / d + kappa) ** 2 + v2 @ v2 +
+                          (d - radius ** 2 + x @ x) ** 2 + v3 @ v3)
+
+    factor = None
+    res0 = residual(x, d, s, kappa, lam)
+    iteration = 1
+    while iteration <= maxiter:
+        infeas = -s + rhs - rows @ x
+        grad = ((radius ** 2 - x @ x - d) / d ** 2 - 1 / d) * 2 * x +\
+            rows.T @ (-1 / s + infeas / s ** 2)
+
+        fresh = factor is None
+        if fresh:
+            lhs = 4 / d ** 2 * numpy.outer(x, x) + rows.T @ (rows / s[:, None] ** 2)
+            lhs[numpy.diag_indices(n)] += 2 * kappa
+            try:
+                factor = numpy.linalg.inv(numpy.linalg.cholesky(lhs))
+            except numpy.linalg.LinAlgError:
+                break
+
+        dx = factor.T @ (factor @ grad)
+        dd = -d + radius ** 2 - x @ x - 2 * x @ dx
+        ds = infeas - rows @ dx
+        dkappa = -kappa + 1 / d - dd / d ** 2
+        dlam = -lam + 1 / s - ds / s ** 2
+
+        t = 1.0
+        if numpy.any(ds < 0):
+            t = min(t, alpha * numpy.min(-s[ds < 0] / ds[ds < 0]))
+        if dd < 0:
+            t = min(t, -alpha * d / dd)
+        if dkappa < 0:
+            t = min(t, -alpha * kappa / dkappa)
+
+        rest = residual(x + t * dx, d + t * dd, s + t * ds, kappa + t * dkappa, lam + t * dlam)
+
+        # a step with a reused factorization that does not decrease the residual enough is
+        # repeated with a new factorization
+        slow = rest > NEWTON_REUSE_DECREASE * res0
+        if slow and not fresh:
+            factor = None
+            continue
+
+        if res0 <= min(grad_atol, rest) and numpy.all(lam >= 0):
+            # we have approximated the analytic center as well as we can
+            return True
+
+        x += t * dx
+        d += t * dd
+        s += t * ds
+        kappa += t * dkappa
+        lam += t * dlam
+        res0 = rest
+        if slow:
+            factor = None
+
+        if iteration == maxiter and rest <= grad_atol and numpy.all(lam >= 0):
+            return True
+        iteration += 1
+
+    # the center is only usable if it is feasible for the current inequalities
+    return not numpy.any(rows @ x >= rhs)
+
+
+####################################################################################################
+#
+# LOOP DRIVER
+#
+####################################################################################################
+
+
+def strategy_loop(method, oracle, problem, domain, precision, maxiter, lbopt, gap=0.0,
+                  heuristic_freq=0, stats=None, timelimit=-1, cputimelimit=-1):
+    '''
+    runs the loop of a next-point strategy and returns the lists of lower and upper bounds at the
+    beginning of each iteration (see above)
+    method         - name of strategy (see STRATEGY_TYPES)
+    oracle         - oracle to generate cuts for problem instance
+    problem        - LP relaxation of problem instance, which provides the upper bounds
+    domain         - DOMAIN of the variables
+    precision      - precision used to decide whether violated cuts exist
+    maxiter        - maximum number of iterations
+    lbopt          - positive lower bound on the optimal objective value
+    gap            - (optional) relative gap between upper and lower bound at which the loop stops
+    heuristic_freq - (optional) frequency (in separated cuts) of rounding the queried point by the
+                     primal heuristics of the oracle; 0 disables rounding
+    stats          - (optional) dictionary that is filled with statistics of the run
+    timelimit      - (optional) wall-clock time limit in seconds (nonpositive if unlimited)
+    cputimelimit   - (optional) CPU time limit in seconds (nonpositive if unlimited)
+
+    As cut_loop_LP, the loop stops after the current iteration if SIGINT or SIGTERM is received,
+    and the reason for stopping is stored in stats["status"]. Moreover, stats contains the
+    numbers of points cut off by bounds of the domain ("nbound"), by the objective cutoff
+    ("ncutoff"), by the oracle ("ndual"), and of feasible points ("nprimal"), the separated cuts,
+    and the feasible solutions found.
+    '''
+    obj = numpy.asarray(oracle.get_obj(), dtype=numpy.float64)
+    cur_lb = lbopt
+
+    starttime = time.time()
+    strategy = STRATEGY(method, obj, cur_lb, domain, problem)
+
+    cnt = 0
+    boundcnt = 0
+    cutoffcnt = 0
+    primalcnt = 0
+    lower_bounds = []
+    upper_bounds = []
+    iteration_times = []
+    cuts = []
+    solutions = []
+
+    deadline = DEADLINE(timelimit, cputimelimit)
+    status = "maxiter"
+    with INTERRUPTHANDLER() as handler:
+        while cnt < maxiter:
+
+            # stop if a signal has been received or a time limit is reached
+            if handler.interrupted:
+                status = "interrupted"
+                break
+            limit = deadline.get_status()
+            if limit is not None:
+                status = limit
+                break
+
+            cnt += 1
+
+            # compute the upper bound and stop if the gap is small
+            ub = problem.optimize()
+            lower_bounds.append(cur_lb)
+            upper_bounds.append(ub)
+            iteration_times.append(time.time() - starttime)
+            if isGE([(1 + gap) * cur_lb], [ub], precision):
+                status = "converged"
+                break
+
+            x = strategy.next_point()
+
+            # cut off points outside the domain or below the lower bound before querying the oracle
+            bound = domain.get_violated_bound(x, precision)
+            if bound is not None:
+                strategy.add_inequality(bound[0], bound[1])
+                boundcnt += 1
+                continue
+            if obj @ x < cur_lb:
+                strategy.update_lower_bound(cur_lb)
+                cutoffcnt += 1
+                continue
+
+            try:
+                cons = oracle.separate_point(x.tolist(), precision, deadline.get_remaining())
+            except TimeoutError:
+                status = deadline.get_status() or "timelimit"
+                break
+            except KeyboardInterrupt:
+                status = "interrupted"
+                break
+
+            if len(cons) == 0:
+                # x is feasible
+                primalcnt += 1
+                solutions.append(x.tolist())
+                cur_lb = max(cur_lb, obj @ x)
+                strategy.update_lower_bound(cur_lb)
+                continue
+
+            strategy.add_inequality(numpy.asarray(cons, dtype=numpy.float64), 1.0)
+            problem.add_cut(cons)
+            cuts.append(cons)
+
+            # round the infeasible point after every heuristic_freq-th cut
+            if heuristic_freq > 0 and len(cuts) % heuristic_freq == 0:
+                solution = oracle.get_primal_solution(x.tolist())
+                heuristic_lb = obj @ numpy.asarray(solution, dtype=numpy.float64)
+                if heuristic_lb > cur_lb:
+                    solutions.append(solution)
+                    cur_lb = heuristic_lb
+                    strategy.update_lower_bound(cur_lb)
+
+    endtime = time.time()
+
+    if stats is not None:
+        stats["niter"] = cnt
+        stats["nbound"] = boundcnt
+        stats["ncutoff"] = cutoffcnt
+        stats["ndual"] = len(cuts)
+        stats["nprimal"] = primalcnt
+        stats["time"] = endtime - starttime
+        stats["iteration_times"] = iteration_times
+        stats["status"] = status
+        stats["cuts"] = cuts
+        stats["solutions"] = solutions
+
+    return lower_bounds, upper_bounds
+
+
+def run_strategies(instancefile, problemtype, methods, params=None):
+    '''
+    runs the loops of several strategies on the same instance and oracle (the instance is read
+    once) and returns a dictionary mapping each strategy to a dictionary with the keys
+    "lower_bounds", "upper_bounds", and "stats" (see strategy_loop); each strategy uses a new LP
+    relaxation, and all strategies start with the same lower bound
+    instancefile   - path to file encoding instance
+    problemtype    - type of problem
+    methods        - list of names of strategies (see STRATEGY_TYPES)
+    params         - (optional) dictionary of parameters of solve() (see get_solve_params); the
+                     solver has to be given, initconss 0 uses box constraints in the LP
+                     relaxation, the heuristic frequency rounds queried points (see
+                     strategy_loop), and the time limits apply to each strategy; the parameters
+                     of fully corrective steps, dual bounds, and presolving are not used
+    '''
+    for method in methods:
+        if not method in STRATEGY_TYPES:
+            raise ValueError("unknown strategy %s, allowed strategies are %s" %
+                             (method, STRATEGY_TYPES))
+
+    params = get_solve_params(params)
+    solver = params["solver"]
+    instance = load_instance(instancefile, problemtype, params["cachedir"], params["float32"])
+    oracle = ORACLE(instance, problemtype, solver)
+    domain = get_domain(problemtype, oracle)
+
+    # the same initial lower bound as in solve()
+    obj = oracle.get_obj()
+    lb = numpy.linalg.norm(obj) * oracle.get_inner_radius()
+    if params["lbopt"] > lb:
+        lb = params["lbopt"]
+    if params["heuristics"]:
+        solution = oracle.get_primal_solution()
+        lb = max(lb, sum(obj[i] * solution[i] for i in range(len(obj))))
+
+    results = {}
+    for method in methods:
+        problem = PROBLEM(instance, problemtype, solver, max(params["initconss"], 1))
+        stats = {}
+        lower_bounds, upper_bounds = strategy_loop(method, oracle, problem, domain,
+                                                   params["precision"], params["maxiter"], lb,
+                                                   gap=params["gap"],
+                                                   heuristic_freq=params["heuristic_freq"],
+                                                   stats=stats, timelimit=params["timelimit"],
+                                                   cputimelimit=params["cputimelimit"])
+        results[method] = {"lower_bounds": lower_bounds, "upper_bounds": upper_bounds,
+                           "stats": stats}
+
+    return results
+
+
+
+####################################################################################################
+#
+# MAIN METHOD
+#
+####################################################################################################
+
+
+
+if __name__=='__main__':
+
+    params, unknown = parse_arguments(sys.argv[1:])
+
+    methods = STRATEGY_TYPES
+    logname = ""
+    for arg in unknown:
+        if arg.startswith("--methods"):
+            methods = arg.split('=')[1].split(',')
+            for method in methods:
+                if not method in STRATEGY_TYPES:
+                    sys.exit("ERROR unknown strategy %s, allowed strategies are %s" %
+                             (method, STRATEGY_TYPES))
+        elif arg.startswith("--log"):
+            logname = arg.split('=')[1]
+        else:
+            sys.exit("ERROR unkown argument %s." % arg)
+
+    if params["solver"] is None:
+        sys.exit("ERROR cannot locate SCIP or Gurobi Python interface")
+
+    results = run_strategies(params["instancefile"], params["problemtype"], methods, params)
+
+    print("method\tniter\ttime\tstatus\tlower\tupper")
+    for method in methods:
+        result = results[method]
+        stats = result["stats"]
+        upper = result["upper_bounds"][-1] if len(result["upper_bounds"]) > 0 else numpy.nan
+        lower = result["lower_bounds"][-1] if len(result["lower_bounds"]) > 0 else numpy.nan
+        print("%s\t%d\t%f\t%s\t%f\t%f" % (method, stats["niter"], stats["time"],
+                                          stats["status"], lower, upper))
+
+    if logname != "":
+        series = {}
+        timing = {}
+        for method in methods:
+            series["lower" + method] = results[method]["lower_bounds"]
+            series["upper" + method] = results[method]["upper_bounds"]
+            series["time" + method] = results[method]["stats"]["iteration_times"]
+            timing[method + "time"] = results[method]["stats"]["time"]
+            timing["n" + method + "iterations"] = results[method]["stats"]["niter"]
+        runparams = {"instance": params["instancefile"], "problemtype": params["problemtype"],
+                     "precision": params["precision"], "maxiter": params["maxiter"],
+                     "initconss": params["initconss"], "lbopt": params["lbopt"],
+                     "solver": params["solver"], "methods": ",".join(methods)}
+        write_run_log(logname, runparams, series, timing)
@@ -0,0 +1,107 @@
+import numpy
+import pytest
+
+from activeset import *
+
+
+def squared_distance(residual, direction, t):
+    return numpy.sum(numpy.maximum(residual - t * direction, 0.0) ** 2)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_linesearch_positive_part_minimizes(seed):
+    rng = numpy.random.default_rng(seed)
+    n = 12
+    residual = rng.normal(size=n)
+    direction = rng.normal(size=n)
+    direction[rng.random(n) < 0.2] = 0.0
+    tmax = rng.choice([0.5, 2.0, numpy.inf])
+
+    t = linesearch_positive_part(residual, direction, tmax)
+    assert 0 <= t <= tmax
+
+    # the function is convex, so comparing with a fine grid certifies the minimum
+    grid = numpy.linspace(0, min(tmax, 20.0), 20001)
+    best = min(squared_distance(residual, direction, s) for s in grid)
+    assert squared_distance(residual, direction, t) <= best + 1e-9
+
+
+def test_linesearch_positive_part_degenerate():
+    residual = numpy.array([-1.0, -2.0])
+    direction = numpy.array([1.0, 0.0])
+    assert linesearch_positive_part(residual, direction, 1.0) == 0.0
+    assert linesearch_positive_part(residual, numpy.zeros(2), 1.0) == 0.0
+
+    # the positive part vanishes from t = 1 on, any such t is optimal
+    residual = numpy.array([1.0, -1.0])
+    t = linesearch_positive_part(residual, direction, numpy.inf)
+    assert squared_distance(residual, direction, t) == 0.0
+
+
+def check_invariants(activeset):
+    weights = activeset.weights[:activeset.size]
+    assert numpy.all(weights >= ACTIVESET_MINWEIGHT)
+    assert weights.sum() == pytest.approx(1.0)
+    assert len(activeset.keys) == activeset.size == len(activeset.indices)
+    for (key, i) in activeset.indices.items():
+        assert activeset.keys[i] == key
+        assert tuple(activeset.matrix[i]) == key
+    numpy.testing.assert_allclose(activeset.point, weights @ activeset.matrix[:activeset.size],
+                                  atol=1e-9)
+
+
+def get_distance(activeset, target):
+    return numpy.linalg.norm(numpy.asarray(activeset.get_q(target)) - target)
+
+
+@pytest.mark.parametrize("mode", ["away", "pairwise"])
+@pytest.mark.parametrize("down_closed", [True, False])
+def test_activeset_invariants(mode, down_closed):
+    rng = numpy.random.default_rng(1)
+    n = 6
+    target = rng.random(n)
+    atoms = [rng.integers(0, 3, size=n).astype(float).tolist() for i in range(8)]
+
+    activeset = ACTIVESET(mode, down_closed, [0.0] * n)
+    check_invariants(activeset)
+    distance = get_distance(activeset, target)
+    for k in range(200):
+        atom = atoms[rng.integers(len(atoms))]
+        q = activeset.step(atom, target, toward=rng.random() < 0.1)
+        check_invariants(activeset)
+
+        # the step length is optimal on the step direction, so the distance cannot increase
+        assert get_distance(activeset, target) <= distance + 1e-9
+        distance = get_distance(activeset, target)
+        expected = numpy.minimum(activeset.point, target) if down_closed else activeset.point
+        numpy.testing.assert_allclose(q, expected)
+
+    assert activeset.ntoward + activeset.naway + activeset.npairwise == 200
+
+
+def test_activeset_reset():
+    activeset = ACTIVESET("away", True, [0.0, 0.0])
+    activeset.reset([[1.0, 0.0], [0.0, 1.0], [1.0, 0.0], [1.0, 1.0]], [0.25, 0.5, 0.25, 0.0])
+    check_invariants(activeset)
+    assert activeset.size == 2
+    numpy.testing.assert_allclose(activeset.point, [0.5, 0.5])
+
+
+@pytest.mark.parametrize("update", ["away", "pairwise"])
+def test_solve_with_update(tmp_path, update):
+    pytest.importorskip("pyscipopt")
+    from generators import generate_matching_graph, write_graph
+    from solve import solve
+
+    instancefile = str(tmp_path / "matching.col")
+    write_graph(instancefile, *generate_matching_graph(16, 3, 3, 1, True))
+    params = {"solver": "scip", "maxiter": 100, "dual_freq": 1, "gap": 1e-3}
+    expected = solve(instancefile, "weightmatching", params)
+    result = solve(instancefile, "weightmatching", dict(params, update=update))
+
+    assert result["stats"]["naway"] + result["stats"]["npairwise"] > 0
+    assert result["stats"]["nactive"] >= 1
+    assert result["primal"] == pytest.approx(result["dual_bounds"][-1], rel=1e-3)
+
+    # the updates of q converge faster than the steps on line segments
+    assert result["primal"] >= expected["primal"] - 1e-6
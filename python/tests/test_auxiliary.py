@@ -0,0 +1,152 @@
+import bz2
+import gzip
+import os
+import pickle
+import signal
+import time
+import warnings
+
+import numpy
+import pytest
+
+from auxiliary import *
+from instance import INSTANCE, get_instance, clear_instance_cache
+
+
+GRAPH = b"c comment\np edge 4 3\ne 1 2 2.5\ne 3 2 1\ne 1 4 0.5\n"
+
+
+def check_graph(nnodes, edges, weights):
+    assert nnodes == 4
+    assert edges.tolist() == [[1, 2], [2, 3], [1, 4]]
+    assert weights.tolist() == [2.5, 1.0, 0.5]
+
+
+@pytest.mark.parametrize("data", [GRAPH, GRAPH.rstrip(b"\n"),
+                                  GRAPH.replace(b"e 3 2 1\n", b"c inner comment\ne 3 2 1\n")])
+def test_parse_graph(data):
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        check_graph(*parse_graph(data))
+
+
+def test_parse_graph_unweighted_and_mixed():
+    nnodes, edges, weights = parse_graph(b"p edge 3 2\ne 1 2\ne 3 2\n")
+    assert edges.tolist() == [[1, 2], [2, 3]] and weights.tolist() == [1.0, 1.0]
+
+    # lines with and without weights are parsed line by line
+    nnodes, edges, weights = parse_graph(b"p edge 3 2\ne 1 2 4\ne 3 2\n")
+    assert edges.tolist() == [[1, 2], [2, 3]] and weights.tolist() == [4.0, 1.0]
+
+    nnodes, edges, weights = parse_graph(b"p edge 3 0\n")
+    assert nnodes == 3 and edges.shape == (0, 2) and len(weights) == 0
+
+
+def test_parse_edge_csv():
+    nnodes, edges, weights = parse_edge_csv(b"1,2,3.0\n3,1,1.0\n2,1,5.0\n")
+    assert nnodes == 3
+    assert edges.tolist() == [[1, 2], [1, 3]] and weights.tolist() == [3.0, 1.0]
+
+
+@pytest.mark.parametrize("opener", [open, gzip.open, bz2.open])
+def test_read_compressed(tmp_path, opener):
+    filename = str(tmp_path / "graph.col")
+    f = opener(filename, "wb")
+    f.write(GRAPH)
+    f.close()
+    check_graph(*read_graph_arrays(filename))
+
+
+def test_binary_cache(tmp_path):
+    filename = str(tmp_path / "graph.col")
+    f = open(filename, "wb")
+    f.write(GRAPH)
+    f.close()
+    cachedir = str(tmp_path / "cache")
+
+    check_graph(*read_graph_arrays(filename, cachedir))
+    nnodes, edges, weights = read_graph_arrays(filename, cachedir)
+    check_graph(nnodes, edges, weights)
+    assert isinstance(edges, numpy.memmap) and isinstance(weights, numpy.memmap)
+
+    # the instance keeps the memory-mapped arrays and builds lists only on access
+    clear_instance_cache()
+    instance = get_instance(filename, cachedir)
+    assert isinstance(instance.get_edge_array(), numpy.memmap)
+    assert instance.lists == {}
+    assert instance.get_degrees() == [2, 2, 1, 1]
+    assert instance.get_node_obj() == [2.5, 1.0, 0.5]
+    assert instance.lists == {}
+    assert instance.edge_list == [(1, 2), (2, 3), (1, 4)]
+    assert instance.obj == [2.5, 1.0, 0.5]
+    assert instance.nodes == [1, 2, 3, 4]
+    clear_instance_cache()
+
+
+def test_instance_representations():
+    fromlists = INSTANCE([1, 2, 3, 4], [(1, 2), (2, 3), (1, 4)], [2.5, 1.0, 0.5])
+    fromarrays = INSTANCE(4, numpy.array([[1, 2], [2, 3], [1, 4]]), numpy.array([2.5, 1.0, 0.5]))
+
+    for instance in [fromlists, fromarrays]:
+        assert instance.get_edge_array().tolist() == [[1, 2], [2, 3], [1, 4]]
+        assert instance.get_weight_array().tolist() == [2.5, 1.0, 0.5]
+        assert instance.get_degrees() == [2, 2, 1, 1]
+        assert instance.get_weight_matrix()[0].tolist() == [0.0, 2.5, 0.0, 0.5]
+        numpy.testing.assert_array_equal(instance.get_weight_matrix(),
+                                         instance.get_weight_matrix().T)
+
+    # lists built from arrays are not pickled
+    fromarrays.edge_list
+    state = pickle.loads(pickle.dumps(fromarrays))
+    assert not "edge_list" in state.lists
+    assert state.edge_list == fromlists.edge_list
+
+
+@pytest.mark.parametrize("target, expected", [([1.0, 1.0], [0.5, 0.5]), ([3.0, -1.0], [1.0, 0.0]),
+                                              ([-1.0, 3.0], [0.0, 1.0])])
+def test_closest_point_linesegment(target, expected):
+    point = closest_point_linesegment([1.0, 0.0], numpy.array([0.0, 1.0]), target)
+    assert isinstance(point, numpy.ndarray)
+    numpy.testing.assert_allclose(point, expected)
+
+    # both end points are equal
+    assert closest_point_linesegment([1.0, 2.0], [1.0, 2.0], target).tolist() == [1.0, 2.0]
+
+
+def test_isGE():
+    assert isGE([1.0, 2.0], numpy.array([1.0, 2.5]), 0.5)
+    assert not isGE([1.0, 2.0], [1.0, 2.5], 0.4)
+
+
+def test_deadline(monkeypatch):
+    clock = [100.0, 10.0]
+    monkeypatch.setattr(time, "time", lambda: clock[0])
+    monkeypatch.setattr(time, "process_time", lambda: clock[1])
+
+    assert DEADLINE().get_remaining() is None
+    assert DEADLINE().get_remaining_limits() == (-1, -1)
+    deadline = DEADLINE(5, 3)
+    clock[0] += 1
+    clock[1] += 2
+    assert deadline.get_remaining() == 1
+    assert deadline.get_remaining_limits() == (4, 1)
+    assert deadline.get_status() is None
+
+    clock[1] += 1
+    assert deadline.get_status() == "cputimelimit"
+    assert deadline.get_remaining_limits() == (4, 1e-6)
+    clock[0] += 4
+    assert deadline.get_status() == "timelimit"
+
+
+def test_interrupthandler():
+    previous = signal.getsignal(signal.SIGINT)
+    with INTERRUPTHANDLER() as handler:
+        assert not handler.interrupted
+        os.kill(os.getpid(), signal.SIGINT)
+        assert handler.interrupted
+
+        # a second signal ends the program
+        with pytest.raises(KeyboardInterrupt):
+            os.kill(os.getpid(), signal.SIGINT)
+    assert signal.getsignal(signal.SIGINT) is previous
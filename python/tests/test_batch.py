@@ -0,0 +1,62 @@
+import subprocess
+
+import pytest
+
+import batch
+from resultstore import *
+
+
+def get_job(**values):
+    job = {"instance": "/data/a.col", "problemtype": "matching", "precision": 0.001,
+           "maxiter": 1000, "corrfreq": 1, "initconss": 2, "lbopt": -1, "solver": "scip"}
+    job.update(values)
+    return job
+
+
+def test_job_key_normalizes_types():
+    assert get_job_key(get_job()) == get_job_key(get_job(lbopt=-1.0))
+    assert get_job_key(get_job(maxiter=1000.0)) == get_job_key(get_job())
+    assert get_job_key(get_job(precision=0.01)) != get_job_key(get_job())
+
+
+def test_resultstore_round_trip(tmp_path):
+    store = RESULTSTORE(str(tmp_path / "results.db"))
+    store.save_result(get_job(), {"status": "error", "primal": 3.5})
+    assert not store.is_finished(get_job())
+
+    # a rerun replaces the result, and the job given by --lbopt=-1 is the same job
+    store.save_result(get_job(lbopt=-1.0), {"status": "done", "primal": 4.0, "niter": 7})
+    assert store.is_finished(get_job())
+    results = store.get_results(problemtype="matching")
+    assert len(results) == 1
+    assert results[0]["primal"] == 4.0 and results[0]["niter"] == 7
+    assert store.get_results(status="timeout") == []
+    with pytest.raises(ValueError):
+        store.get_results(unknown=1)
+    store.close()
+
+
+def test_expand_grid():
+    grid = {"problemtype": ["matching", "stableset"], "precision": [0.001], "maxiter": [10],
+            "corrfreq": [1, 2], "initconss": [2], "lbopt": ["opt"], "solver": ["scip"]}
+    jobs = batch.expand_grid(["/data/a.col", "/data/b.col"], grid, {"a.col": 5})
+    assert len(jobs) == 4
+    assert all(job["instance"] == "/data/a.col" and job["lbopt"] == 5.0 for job in jobs)
+
+
+def test_parse_output():
+    output = "nDHHWiterations 12\nDHHWtime 0.5\nnLPiterations 3\n" \
+             "best primal value found by packing algorithm: 7.25\nsomething else\n"
+    assert batch.parse_output(output) == {"niter": 12, "dhhwtime": 0.5, "nlpiter": 3,
+                                          "primal": 7.25}
+
+
+def test_run_job_timeout_keeps_output(tmp_path, monkeypatch):
+    def run(args, **kwargs):
+        raise subprocess.TimeoutExpired(args, kwargs["timeout"], output=b"nDHHWiterations 4\n")
+    monkeypatch.setattr(subprocess, "run", run)
+
+    result = batch.run_job(get_job(), str(tmp_path), 1, -1)
+    assert result["status"] == "timeout"
+    assert result["output"] == "nDHHWiterations 4\n"
+    assert result["niter"] == 4
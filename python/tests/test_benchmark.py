@@ -0,0 +1,32 @@
+import benchmark
+
+
+def get_results(times):
+    return {"meta": {}, "results": {name: {"min": t, "median": t, "repeat": 1}
+                                    for (name, t) in times.items()}}
+
+
+def test_measure_repeats():
+    calls = []
+    result = benchmark.measure(lambda: calls.append(1), 4)
+    assert len(calls) == 4 and result["repeat"] == 4
+    assert 0 <= result["min"] <= result["median"]
+
+
+def test_compare_to_baseline():
+    baseline = get_results({"a": 1.0, "b": 1.0, "c": 0.0})
+    results = get_results({"a": 1.2, "b": 1.3, "c": 0.1, "d": 5.0})
+    assert benchmark.compare_to_baseline(results, baseline, 0.25) == ["b", "c"]
+
+
+def test_every_benchmark_is_repeated(monkeypatch):
+    # all benchmark functions take the number of repetitions and the seed as last arguments
+    def fake(*args):
+        return {"min": 0.0, "median": 0.0, "repeat": args[-2]}
+    for name in dir(benchmark):
+        if name.startswith("bench_"):
+            monkeypatch.setattr(benchmark, name, fake)
+
+    results = benchmark.run_benchmarks("quick", None, repeat=3)
+    assert len(results["results"]) == 2 * 2 + 2 * 2 * 6
+    assert all(result["repeat"] == 3 for result in results["results"].values())
@@ -0,0 +1,104 @@
+import pytest
+
+from auxiliary import DEADLINE
+from generators import generate_matching_graph, write_graph
+from oracles import CONTINUATION
+
+
+class FAKEORACLE:
+    '''
+    oracle that records its calls and finds a cut only with the given tolerances
+    '''
+
+    def __init__(self, tolerances):
+        self.tolerances = tolerances
+        self.calls = []
+
+    def separate_point(self, point, precision, timelimit=None, mipgap=None):
+        self.calls.append((precision, mipgap))
+        return [1.0, 1.0] if precision in self.tolerances else []
+
+
+def test_tolerance():
+    continuation = CONTINUATION(1e-6, 0.1)
+    assert continuation.tolerance == 0.1
+    assert not continuation.is_final()
+    continuation.tighten()
+    assert continuation.tolerance == pytest.approx(0.01)
+
+    # the tolerance is tightened below the gap, but not below the precision
+    continuation.update_gap(0.05)
+    assert continuation.tolerance == pytest.approx(0.01)
+    continuation.update_gap(2e-4)
+    assert continuation.tolerance == pytest.approx(1e-4)
+    continuation.update_gap(0.0)
+    assert continuation.tolerance == 1e-6
+    assert continuation.is_final()
+    continuation.tighten()
+    assert continuation.tolerance == 1e-6
+
+    # without an initial tolerance above the precision, there is no continuation
+    assert CONTINUATION(1e-6).is_final()
+    assert CONTINUATION(1e-6, 1e-7).tolerance == 1e-6
+
+
+def test_separate():
+    deadline = DEADLINE()
+    continuation = CONTINUATION(1e-6, 0.1)
+    oracle = FAKEORACLE([0.1, 1e-6])
+    assert continuation.separate(oracle, [0.5, 0.5], deadline) == [1.0, 1.0]
+    assert oracle.calls == [(0.1, 0.1)]
+
+    # points without cuts of the coarse tolerance are separated again with the precision
+    oracle = FAKEORACLE([1e-6])
+    assert continuation.separate(oracle, [0.5, 0.5], deadline) == [1.0, 1.0]
+    assert oracle.calls == [(0.1, 0.1), (1e-6, None)]
+    oracle = FAKEORACLE([])
+    assert continuation.separate(oracle, [0.5, 0.5], deadline) == []
+    assert continuation.ncalls == 5
+
+    continuation.update_gap(0.0)
+    oracle = FAKEORACLE([1e-6])
+    assert continuation.separate(oracle, [0.5, 0.5], deadline) == [1.0, 1.0]
+    assert oracle.calls == [(1e-6, None)]
+    assert continuation.time >= 0
+
+
+@pytest.fixture
+def matchingfile(tmp_path):
+    instancefile = str(tmp_path / "matching.col")
+    write_graph(instancefile, *generate_matching_graph(16, 3, 3, 1, True))
+    return instancefile
+
+
+def test_cut_loop_with_continuation(matchingfile):
+    pytest.importorskip("pyscipopt")
+    from cutloop import cut_loop_LP
+    from oracles import ORACLE
+    from problems import PROBLEM
+
+    results = []
+    for continuation in [None, 0.1]:
+        stats = {}
+        obj_vals = cut_loop_LP(PROBLEM(matchingfile, "weightmatching", "scip", 2),
+                               ORACLE(matchingfile, "weightmatching", "scip"), 1e-6, 100,
+                               stats=stats, continuation=continuation)
+        assert stats["status"] == "converged"
+        results.append(obj_vals[-1])
+    assert results[1] == pytest.approx(results[0], rel=1e-6)
+
+
+def test_solve_with_continuation(matchingfile):
+    pytest.importorskip("pyscipopt")
+    from solve import solve
+
+    params = {"solver": "scip", "maxiter": 100, "corr_freq": 5, "dual_freq": 1, "gap": 1e-3}
+    expected = solve(matchingfile, "weightmatching", params)
+    result = solve(matchingfile, "weightmatching", dict(params, continuation=0.1))
+
+    # the run converges with the same gap and ends with the (default) precision of the run
+    assert result["stats"]["status"] == expected["stats"]["status"] == "converged"
+    assert result["stats"]["tolerance"] == pytest.approx(1e-4)
+    assert result["primal"] <= result["dual_bounds"][-1] * (1 + 1e-6)
+    assert result["dual_bounds"][-1] <= result["primal"] * (1 + 1e-3)
+    assert result["primal"] == pytest.approx(expected["primal"], rel=1e-3)
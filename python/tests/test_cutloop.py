@@ -0,0 +1,54 @@
+import numpy
+import pytest
+
+from generators import generate_matching_graph, write_graph
+
+
+@pytest.fixture
+def matching(tmp_path):
+    '''
+    returns a function creating the LP relaxation and the oracle of a small matching instance
+    '''
+    pytest.importorskip("pyscipopt")
+    from oracles import ORACLE
+    from problems import PROBLEM
+
+    instancefile = str(tmp_path / "matching.col")
+    write_graph(instancefile, *generate_matching_graph(16, 3, 3, 1, True))
+    return lambda: (PROBLEM(instancefile, "weightmatching", "scip", 2),
+                    ORACLE(instancefile, "weightmatching", "scip"))
+
+
+def run_cut_loop(matching, **kwargs):
+    from cutloop import cut_loop_LP
+
+    stats = {}
+    problem, oracle = matching()
+    obj_vals = cut_loop_LP(problem, oracle, 1e-6, kwargs.pop("maxiter", 100), stats=stats,
+                           **kwargs)
+    return obj_vals, stats
+
+
+def test_cut_loop(matching):
+    obj_vals, stats = run_cut_loop(matching)
+    assert stats["status"] == "converged"
+    assert stats["niter"] == len(obj_vals) == len(stats["cuts"]) + 1
+    assert numpy.all(numpy.diff(obj_vals) <= 1e-9)
+
+
+def test_cut_loop_limits(matching):
+    obj_vals, stats = run_cut_loop(matching)
+    optimum = obj_vals[-1]
+
+    # the loop stops as soon as the LP value is within the gap of the lower bound
+    gap_vals, gap_stats = run_cut_loop(matching, lbopt=optimum, gap=0.2)
+    assert gap_stats["status"] == "converged"
+    assert gap_vals[-1] <= 1.2 * optimum + 1e-6
+    assert len(gap_vals) < len(obj_vals)
+
+    vals, stats = run_cut_loop(matching, maxiter=1)
+    assert (len(vals), stats["status"]) == (1, "maxiter")
+    vals, stats = run_cut_loop(matching, progress=lambda cnt, val: cnt == 2)
+    assert (len(vals), stats["status"]) == (2, "interrupted")
+    vals, stats = run_cut_loop(matching, timelimit=1e-9)
+    assert (len(vals), stats["status"]) == (0, "timelimit")
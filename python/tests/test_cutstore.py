@@ -0,0 +1,124 @@
+import itertools
+
+import numpy
+import pytest
+
+import cutstore
+from cutstore import *
+from generators import generate_matching_graph, write_graph
+
+
+def get_instance(weights=(1.0, 2.0, 3.0, 4.0)):
+    return INSTANCE(4, numpy.array([[1, 2], [2, 3], [3, 4], [1, 4]]), numpy.array(weights))
+
+
+@pytest.mark.parametrize("vector", [[0.0, 1.0, 0.0, 1.0], [0.5, 0.0, -2.0, 1.0 / 3.0],
+                                    [0.0, 0.0, 0.0, 0.0], [2.0]])
+def test_encode_vector(vector):
+    indices, values = encode_vector(vector)
+    assert decode_vector(indices, values, len(vector)) == vector
+
+    # equal nonzero values are stored once
+    nonzeros = [val for val in vector if val != 0]
+    nvalues = 1 if len(set(nonzeros)) == 1 else len(nonzeros)
+    assert len(indices) == 4 * len(nonzeros)
+    assert len(values) == 8 * nvalues
+
+
+def test_fingerprint(tmp_path):
+    graph = generate_matching_graph(16, 3, 3, 1, True)
+    files = [str(tmp_path / "a.col"), str(tmp_path / "b.col")]
+    for filename in files:
+        write_graph(filename, *graph)
+
+    # renamed files share their fingerprint, other weights do not
+    fingerprints = [get_fingerprint(load_instance(filename, "matching")) for filename in files]
+    assert fingerprints[0] == fingerprints[1]
+    assert get_fingerprint(get_instance()) == get_fingerprint(get_instance())
+    assert get_fingerprint(get_instance()) != get_fingerprint(get_instance([1.0, 2.0, 3.0, 5.0]))
+    assert get_fingerprint(get_instance()) != fingerprints[0]
+
+
+def test_save_and_load(tmp_path):
+    filename = str(tmp_path / "cuts.db")
+    store = CUTSTORE(filename)
+    instance = get_instance()
+    obj = [1.0, 2.0, 3.0, 4.0]
+    cuts = [[1.0, 1.0, 0.0, 0.0], [0.0, 0.5, 0.5, 0.0]]
+    assert store.load(instance, "matching", obj) == ([], -1, None)
+
+    # the origin and repeated cuts are skipped
+    store.save(instance, "matching", obj, [[0.0] * 4] + cuts + cuts[:1], 6.0,
+               [[0.0, 1.0, 0.0, 1.0]])
+    loaded, primal, solution = store.load(instance, "weightmatching", obj)
+    assert sorted(loaded) == sorted(cuts)
+    assert primal == 6.0
+    assert solution == [0.0, 1.0, 0.0, 1.0]
+    (ncuts, nsolutions, size), = store.get_sizes().values()
+    assert (ncuts, nsolutions) == (2, 1)
+
+    # the stored solutions give lower bounds for other objectives, a primal value without a
+    # solution only for its own objective
+    assert store.load(instance, "matching", [0.0, 1.0, 1.0, 0.0]) == (loaded, 1.0,
+                                                                      [0.0, 1.0, 0.0, 1.0])
+    store.save(instance, "matching", obj, [], 7.0)
+    assert store.load(instance, "matching", obj)[1:] == (7.0, None)
+    store.save(instance, "matching", obj, [], 5.0)
+    assert store.load(instance, "matching", obj)[1] == 7.0
+    assert store.load(instance, "stableset", obj) == ([], -1, None)
+
+    # a second connection sees the entries of the first one
+    other = CUTSTORE(filename)
+    other.save(instance, "stableset", obj, [[1.0, 1.0, 1.0, 0.0]])
+    assert store.load(instance, "stableset", obj)[0] == [[1.0, 1.0, 1.0, 0.0]]
+    assert len(store.get_sizes()) == 2
+    other.close()
+    store.close()
+
+
+def test_evict(tmp_path, monkeypatch):
+    clock = itertools.count()
+    monkeypatch.setattr(cutstore.time, "time", lambda: float(next(clock)))
+
+    # each instance stores one cut of 2 indices and a single value, i.e., 16 bytes
+    store = CUTSTORE(str(tmp_path / "cuts.db"), maxsize=40)
+    instances = [get_instance([1.0, 2.0, 3.0, val]) for val in [4.0, 5.0, 6.0]]
+    keys = [(get_fingerprint(instance), "matching") for instance in instances]
+    obj = [1.0] * 4
+    store.save(instances[0], "matching", obj, [[1.0, 1.0, 0.0, 0.0]])
+    store.save(instances[1], "matching", obj, [[0.0, 1.0, 1.0, 0.0]])
+    assert sorted(store.get_sizes()) == sorted(keys[:2])
+    assert store.get_sizes()[keys[0]] == (1, 0, 16)
+
+    # the least recently used instance is removed
+    store.load(instances[0], "matching", obj)
+    store.save(instances[2], "matching", obj, [[0.0, 0.0, 1.0, 1.0]])
+    assert sorted(store.get_sizes()) == sorted([keys[0], keys[2]])
+    assert store.load(instances[1], "matching", obj) == ([], -1, None)
+
+    # the most recently used instance is kept even if it exceeds the limit
+    store.save(instances[2], "matching", obj, [[1.0, 0.0, 0.0, 1.0], [1.0, 0.0, 1.0, 0.0]])
+    assert list(store.get_sizes()) == [keys[2]]
+    assert len(store.load(instances[2], "matching", obj)[0]) == 3
+    store.close()
+
+
+def test_solve_with_cutstore(tmp_path):
+    pytest.importorskip("pyscipopt")
+    from solve import solve
+
+    instancefile = str(tmp_path / "matching.col")
+    write_graph(instancefile, *generate_matching_graph(16, 3, 3, 1, True))
+    params = {"solver": "scip", "maxiter": 100, "corr_freq": 5, "dual_freq": 1, "gap": 1e-3}
+    store = CUTSTORE(str(tmp_path / "cuts.db"))
+    first = solve(instancefile, "weightmatching", params, cutstore=store)
+    assert first["stats"]["nstored_cuts"] == 0
+
+    # the second run starts with the cuts and the best solution of the first run
+    second = solve(instancefile, "weightmatching", params, cutstore=store)
+    assert second["stats"]["nstored_cuts"] == len(set(tuple(cut) for cut in first["cuts"][1:]))
+    assert second["stats"]["status"] == "converged"
+    assert second["gamma_vals"][0] >= first["primal"] - 1e-6
+    assert second["primal"] == pytest.approx(first["primal"], rel=1e-3)
+    assert len(second["gamma_vals"]) < len(first["gamma_vals"])
+    store.close()
@@ -0,0 +1,95 @@
+import numpy
+import pytest
+
+from decomposition import connected_components, decompose_instance, group_components
+from instance import INSTANCE
+
+
+def get_components(nnodes, edges):
+    '''
+    returns the smallest node of the connected component of each node by depth-first search
+    '''
+    neighbors = [[] for i in range(nnodes)]
+    for (u,v) in edges:
+        neighbors[u].append(v)
+        neighbors[v].append(u)
+    labels = [-1] * nnodes
+    for root in range(nnodes):
+        if labels[root] >= 0:
+            continue
+        labels[root] = root
+        stack = [root]
+        while stack:
+            for v in neighbors[stack.pop()]:
+                if labels[v] < 0:
+                    labels[v] = root
+                    stack.append(v)
+    return labels
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_connected_components(seed):
+    rng = numpy.random.default_rng(seed)
+    nnodes = 200
+    edges = rng.integers(0, nnodes, size=(rng.integers(50, 250), 2))
+    labels = connected_components(nnodes, edges)
+    assert labels.tolist() == get_components(nnodes, edges.tolist())
+
+
+def test_connected_components_path():
+    # a path labeled in decreasing order needs several rounds of hooking
+    nnodes = 100
+    edges = numpy.array([(i, i - 1) for i in range(nnodes - 1, 0, -1)])
+    assert connected_components(nnodes, edges).tolist() == [0] * nnodes
+
+
+def test_connected_components_no_edges():
+    labels = connected_components(5, numpy.zeros((0, 2), dtype=int))
+    assert labels.tolist() == [0, 1, 2, 3, 4]
+
+
+def test_group_components():
+    assert group_components([1, 5, 2, 2], 3) == [[1], [2, 3], [0]]
+    assert group_components([1, 5, 2, 2], 1) == [[1], [2], [3], [0]]
+    assert group_components([1, 1], 10) == [[0, 1]]
+
+
+def get_two_triangles():
+    # two triangles and the isolated node 7
+    edges = [(1,2), (2,3), (1,3), (4,5), (5,6), (4,6)]
+    return INSTANCE(7, numpy.array(edges), numpy.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0]))
+
+
+@pytest.mark.parametrize("problem", ["weightmatching", "weightstableset"])
+def test_decompose_instance(problem):
+    instance = get_two_triangles()
+    subinstances = decompose_instance(instance, problem)
+
+    # the isolated node is a component of its own only for stable set problems
+    assert len(subinstances) == (2 if problem == "weightmatching" else 3)
+    variables = numpy.concatenate([variables for (sub, variables) in subinstances])
+    assert sorted(variables.tolist()) == list(range(6 if problem == "weightmatching" else 7))
+    for (sub, variables) in subinstances:
+        if problem == "weightstableset":
+            assert sub.nnodes == len(variables)
+        assert numpy.all(sub.get_edge_array() >= 1)
+        assert numpy.all(sub.get_edge_array() <= sub.nnodes)
+
+    assert len(decompose_instance(instance, problem, min_group_size=100)) == 1
+
+
+def test_solve_decomposed():
+    pytest.importorskip("pyscipopt")
+    from decomposition import solve_decomposed
+
+    result = solve_decomposed(get_two_triangles(), "weightmatching",
+                              {"solver": "scip", "maxiter": 50, "dual_freq": 1}, njobs=1,
+                              min_group_size=1)
+    assert result["ncomponents"] == 2
+
+    # one edge of each triangle is matched, and each edge has weight 4 (the sum of the degrees)
+    assert result["primal"] == pytest.approx(8.0)
+    assert result["dual"] == pytest.approx(8.0)
+    assert result["stats"]["status"] == ["converged", "converged"]
+    for cut in result["cuts"]:
+        assert len(cut) == 6
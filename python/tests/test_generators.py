@@ -0,0 +1,86 @@
+import itertools
+
+import numpy
+import pytest
+
+from generators import *
+
+
+def check_edges(nnodes, edges):
+    assert edges.dtype.kind == "i"
+    assert numpy.all(edges[:, 0] < edges[:, 1])
+    assert edges.min() >= 0 and edges.max() < nnodes
+    assert len(numpy.unique(edges[:, 0] * nnodes + edges[:, 1])) == len(edges)
+
+
+@pytest.mark.parametrize("radix", [3, 5])
+def test_laminar_family(radix):
+    n = 1000
+    parent, size = generate_laminar_family(numpy.random.default_rng(0), n, radix)
+
+    # parents are created after their children, and sizes add up
+    children = numpy.flatnonzero(parent >= 0)
+    assert numpy.all(parent[children] > children)
+    assert numpy.all(size % 2 == 1)
+    sums = numpy.zeros(len(size), dtype=numpy.int64)
+    numpy.add.at(sums, parent[children], size[children])
+    assert numpy.array_equal(sums[n:], size[n:])
+    assert size[parent < 0].sum() == n
+
+
+def test_sum_to_root_and_lowest_common_ancestors():
+    # the tree 0,1 -> 3, 3,2 -> 4
+    parent = numpy.array([3, 3, 4, 4, -1])
+    depth = numpy.array([2, 2, 1, 1, 0])
+    assert sum_to_root(parent, numpy.arange(5)).tolist() == [7, 8, 6, 7, 4]
+    lca = lowest_common_ancestors(parent, depth, numpy.array([0, 0, 2, 4]),
+                                  numpy.array([1, 2, 2, 1]))
+    assert lca.tolist() == [3, 4, 2, 4]
+
+
+@pytest.mark.parametrize("weighted", [False, True])
+def test_matching_graph(weighted):
+    nnodes, edges, weights = generate_matching_graph(200, 30, 7, 1, weighted)
+    check_edges(nnodes, edges)
+    assert len(weights) == len(edges)
+    assert numpy.all(weights >= 0)
+
+
+def get_stability_number(nnodes, edges):
+    best = 0
+    for chosen in itertools.product([0, 1], repeat=nnodes):
+        if all(chosen[u] + chosen[v] <= 1 for (u,v) in edges):
+            best = max(best, sum(chosen))
+    return best
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_stableset_graph(seed):
+    nnodes, edges, weights, optval = generate_stableset_graph(12, 4, 20, seed)
+    check_edges(nnodes, edges)
+
+    # the first weights of the file are the objective of the problem type stableset
+    assert len(edges) >= nnodes and numpy.all(weights == 1)
+    assert get_stability_number(nnodes, edges.tolist()) == optval == 4
+
+
+def test_stableset_graph_too_few_edges():
+    with pytest.raises(ValueError):
+        generate_stableset_graph(3, 2, 0, 1)
+    with pytest.raises(ValueError):
+        generate_stableset_graph(5, 6, 0, 1)
+    assert len(generate_stableset_graph(4, 2, 0, 1)[1]) == 4
+
+
+def test_packing_polytope():
+    indptr, indices, data, obj = generate_packing_polytope(50, 80, 4, 2)
+    assert len(indptr) == 51 and indptr[-1] == len(indices) == len(data)
+    assert len(obj) == 80 and numpy.all((obj >= 1) & (obj < 2))
+
+    # each column has an entry 1, so the polytope lies in the unit cube
+    colmax = numpy.zeros(80)
+    numpy.maximum.at(colmax, indices, data)
+    assert numpy.all(colmax == 1)
+    assert numpy.all((data > 0) & (data <= 1))
+    for i in range(50):
+        assert numpy.all(numpy.diff(indices[indptr[i]:indptr[i + 1]]) > 0)
@@ -0,0 +1,130 @@
+import numpy
+import pytest
+
+from generators import generate_packing_polytope
+from heuristics import *
+from instance import POLYTOPE
+
+
+def get_random_graph(seed, nnodes=30, nedges=60):
+    rng = numpy.random.default_rng(seed)
+    edges = numpy.sort(rng.choice(nnodes, size=(nedges, 2)), axis=1)
+    edges = numpy.unique(edges[edges[:, 0] < edges[:, 1]], axis=0)
+    return rng, nnodes, edges
+
+
+def is_matching(nnodes, edges, x):
+    return numpy.bincount(edges[x > 0.5].ravel(), minlength=nnodes).max(initial=0) <= 1
+
+
+def is_stableset(edges, x):
+    return bool(numpy.all(x[edges[:, 0]] + x[edges[:, 1]] <= 1))
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_matching(seed):
+    rng, nnodes, edges = get_random_graph(seed)
+    obj = rng.integers(-2, 10, size=len(edges)).astype(float)
+    for point in [None, rng.random(len(edges))]:
+        x = greedy_matching(nnodes, edges, obj, point)
+        assert is_matching(nnodes, edges, x)
+        assert numpy.all(x[obj <= 0] == 0)
+
+        improved = local_search_matching(nnodes, edges, obj, x)
+        assert is_matching(nnodes, edges, improved)
+        assert improved @ obj >= x @ obj
+
+
+def test_matching_two_opt():
+    # the greedy matching of the 4-cycle takes the heaviest edge, 2-opt exchanges both edges
+    edges = numpy.array([[0, 1], [1, 2], [2, 3], [0, 3]])
+    obj = numpy.array([3.0, 2.5, 1.0, 2.5])
+    x = greedy_matching(4, edges, obj)
+    assert x.tolist() == [1, 0, 1, 0]
+    assert local_search_matching(4, edges, obj, x).tolist() == [0, 1, 0, 1]
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_stableset(seed):
+    rng, nnodes, edges = get_random_graph(seed)
+    obj = rng.integers(-2, 10, size=nnodes).astype(float)
+    for point in [None, rng.random(nnodes)]:
+        x = greedy_stableset(nnodes, edges, obj, point)
+        assert is_stableset(edges, x)
+
+        improved = local_search_stableset(nnodes, edges, obj, x)
+        assert is_stableset(edges, improved)
+        assert improved @ obj >= x @ obj
+
+        # nodes of positive weight without neighbors in the stable set have been added
+        blocked = numpy.zeros(nnodes, dtype=bool)
+        for (u, v) in edges:
+            blocked[u] |= improved[v] > 0
+            blocked[v] |= improved[u] > 0
+        assert numpy.all((improved > 0) | blocked | (obj <= 0))
+
+
+def test_polytope():
+    indptr, indices, data, obj = generate_packing_polytope(40, 60, 5, 1)
+    polytope = POLYTOPE(indptr, indices, data, obj)
+    rng = numpy.random.default_rng(0)
+    for point in [None, rng.random(60)]:
+        x = greedy_polytope(polytope, numpy.asarray(obj, dtype=float), point)
+        assert numpy.all(polytope.multiply(x) <= 1 + 1e-9)
+        assert x.sum() > 0
+
+
+@pytest.mark.parametrize("bound", [0.1, 0.3, 1.0])
+def test_project_capped_simplex(bound):
+    rng = numpy.random.default_rng(1)
+    values = rng.normal(size=10)
+    y = project_capped_simplex(values, bound)
+    assert y.sum() == pytest.approx(1.0)
+    assert numpy.all(y >= 0)
+    assert numpy.all(y <= bound + 1e-12)
+
+    # y is the projection iff (values - y) (z - y) <= 0 for all feasible z
+    for k in range(50):
+        z = project_capped_simplex(rng.normal(size=10) * 3, bound)
+        assert (values - y) @ (z - y) <= 1e-8
+
+
+def test_maxcut():
+    rng = numpy.random.default_rng(2)
+    nnodes = 12
+    weights = numpy.triu(rng.random((nnodes, nnodes)) * (rng.random((nnodes, nnodes)) < 0.5), 1)
+    weights = weights + weights.T
+    assert hyperplane_maxcut(weights).tolist() == [1.0] * nnodes
+
+    # a rank one point is rounded to its cut
+    sides = numpy.where(rng.random(nnodes) < 0.5, 1.0, -1.0)
+    rounded = hyperplane_maxcut(weights, numpy.outer(sides, sides))
+    assert abs(rounded @ sides) == nnodes
+
+    # no single node can be moved with positive gain
+    improved = local_search_maxcut(weights, rounded)
+    value = -improved @ weights @ improved
+    assert value >= -rounded @ weights @ rounded
+    for i in range(nnodes):
+        moved = improved.copy()
+        moved[i] = -moved[i]
+        assert -moved @ weights @ moved <= value + 1e-9
+
+
+def test_solve_with_heuristics(tmp_path):
+    pytest.importorskip("pyscipopt")
+    from generators import generate_matching_graph, write_graph
+    from solve import solve
+
+    instancefile = str(tmp_path / "matching.col")
+    write_graph(instancefile, *generate_matching_graph(16, 3, 3, 1, True))
+    params = {"solver": "scip", "maxiter": 30, "dual_freq": 1}
+    expected = solve(instancefile, "weightmatching", dict(params, heuristics=False))
+    result = solve(instancefile, "weightmatching",
+                   dict(params, heuristics=True, heuristic_freq=1))
+
+    # the heuristic solution is feasible and initializes the lower bound
+    assert 0 < result["stats"]["heuristic_value"] <= result["dual_bounds"][-1] + 1e-6
+    assert result["gamma_vals"][0] >= result["stats"]["heuristic_value"] - 1e-6
+    assert result["gamma_vals"][0] > expected["gamma_vals"][0]
+    assert result["primal"] >= expected["primal"] - 1e-6
@@ -0,0 +1,183 @@
+import itertools
+import os
+import pickle
+
+import numpy
+import pytest
+
+from instance import INSTANCE, GRAPHEDIT, clear_instance_cache, load_instance
+
+
+def get_instance():
+    # a 5-cycle with the chord (1,3)
+    edge_list = [(1,2), (2,3), (3,4), (4,5), (1,5), (1,3)]
+    return INSTANCE([1, 2, 3, 4, 5], edge_list, [1] * len(edge_list))
+
+
+def test_derived_structures():
+    instance = get_instance()
+    assert instance.get_degrees() == [3, 2, 3, 2, 2]
+    assert instance.get_incidence() == [[0, 4, 5], [0, 1], [1, 2, 5], [2, 3], [3, 4]]
+    assert instance.get_degree_conss()[1] == [1, 1, 0, 0, 0, 0]
+    assert instance.get_complement_edges() == [[1, 4], [2, 4], [2, 5], [3, 5]]
+    assert instance.get_edge_weights() == [5, 5, 5, 4, 5, 6]
+
+    # the structures are computed once
+    assert instance.get_incidence() is instance.get_incidence()
+
+
+def test_instance_cache(tmp_path):
+    filename = str(tmp_path / "graph.csv")
+    with open(filename, "w") as f:
+        f.write("1,2,1\n2,3,1\n")
+    first = load_instance(filename, "matching")
+    assert load_instance(filename, "stableset") is first
+    assert first.edge_list == [(1,2), (2,3)]
+
+    # a changed file is parsed again
+    with open(filename, "w") as f:
+        f.write("1,2,1\n2,3,1\n3,4,1\n")
+    os.utime(filename, (0, os.path.getmtime(filename) + 10))
+    second = load_instance(filename, "matching")
+    assert not second is first
+    assert second.nnodes == 4
+
+    clear_instance_cache()
+    assert not load_instance(filename, "matching") is second
+
+
+def test_model_prototypes():
+    pytest.importorskip("pyscipopt")
+    instance = get_instance()
+    nbuilt = []
+
+    def builder():
+        nbuilt.append(1)
+        return instance.get_sepamodel("stableset", "scip")[0]
+
+    first, firstvars = instance.get_model("test", "scip", builder)
+    second, secondvars = instance.get_model("test", "scip", builder)
+    assert len(nbuilt) == 1
+    assert len(firstvars) == len(secondvars) == 5
+
+    # the copies are independent
+    first.addVar(name="extra")
+    assert len(first.getVars()) == 6
+    assert len(second.getVars()) == 5
+
+    # models are not pickled
+    copy = pickle.loads(pickle.dumps(instance))
+    assert copy.models == {}
+    assert copy.edge_list == instance.edge_list
+
+
+def get_points(instance, problem):
+    '''
+    returns the incidence vectors of all matchings or stable sets of a small graph
+    '''
+    nnodes = len(instance.nodes)
+    points = []
+    if problem == "matching":
+        for chosen in itertools.product([0, 1], repeat=len(instance.edge_list)):
+            degrees = [0] * (nnodes + 1)
+            for (e, (u,v)) in zip(chosen, instance.edge_list):
+                degrees[u] += e
+                degrees[v] += e
+            if max(degrees) <= 1:
+                points.append(chosen)
+    else:
+        for chosen in itertools.product([0, 1], repeat=nnodes):
+            if all(chosen[u - 1] + chosen[v - 1] <= 1 for (u,v) in instance.edge_list):
+                points.append(chosen)
+    return numpy.array(points, dtype=float)
+
+
+def get_edits():
+    return [GRAPHEDIT(remove_edges=[(1,3)]),
+            GRAPHEDIT(remove_nodes=[2]),
+            GRAPHEDIT(add_nodes=1, add_edges=[(5,6), (2,6)]),
+            GRAPHEDIT(add_edges=[(2,4)], remove_edges=[(3,4)]),
+            GRAPHEDIT(add_nodes=1, remove_nodes=[4], add_edges=[(3,6)], remove_edges=[(1,2)])]
+
+
+@pytest.mark.parametrize("problem", ["matching", "stableset"])
+@pytest.mark.parametrize("index", range(5))
+def test_map_cut_is_valid(problem, index):
+    rng = numpy.random.default_rng(index)
+    old = get_instance()
+    edit = get_edits()[index]
+    new = edit.apply(old)
+    oldpoints = get_points(old, problem)
+    newpoints = get_points(new, problem)
+
+    nmapped = 0
+    for k in range(200):
+        # random valid cuts of the old graph, scaled to be tight
+        cut = rng.random(oldpoints.shape[1]) * (rng.random(oldpoints.shape[1]) < 0.6)
+        if cut.max() == 0:
+            continue
+        cut = (cut / (oldpoints @ cut).max()).tolist()
+
+        mapped = edit.map_cut(cut, problem)
+        if mapped is None:
+            continue
+        nmapped += 1
+        assert len(mapped) == newpoints.shape[1]
+        assert (newpoints @ numpy.array(mapped)).max() <= 1 + 1e-9
+
+    assert nmapped > 0
+
+
+def test_map_cut_rejects():
+    old = get_instance()
+
+    # negative coefficients
+    edit = GRAPHEDIT(add_nodes=1)
+    edit.apply(old)
+    assert edit.map_cut([1, -1, 0, 0, 0], "stableset") is None
+    assert edit.map_cut([1, 0, 0, 0, 0, 0], "matching") == [1, 0, 0, 0, 0, 0]
+
+    # the edge (1,3) of the stable set cut x_1 + x_3 <= 1 is removed
+    edit = GRAPHEDIT(remove_edges=[(1,3)])
+    edit.apply(old)
+    assert edit.map_cut([1, 0, 1, 0, 0], "stableset") is None
+    assert edit.map_cut([1, 1, 0, 0, 0], "stableset") == [1, 1, 0, 0, 0]
+
+
+def test_map_cut_drops_and_pads():
+    old = get_instance()
+    edit = GRAPHEDIT(add_nodes=1, remove_nodes=[2], add_edges=[(3,6)])
+    new = edit.apply(old)
+    assert len(new.nodes) == 5
+
+    # node 2 is dropped and the added node 6 gets coefficient 0
+    assert edit.map_cut([0.5, 0.25, 0.5, 0, 0], "stableset") == [0.5, 0.5, 0, 0, 0]
+
+    # the edges (1,2) and (2,3) are dropped and the added edge gets coefficient 0
+    assert edit.map_cut([1, 2, 3, 4, 5, 6], "matching") == [3, 4, 5, 6, 0]
+
+
+@pytest.mark.parametrize("problem", ["matching", "stableset"])
+@pytest.mark.parametrize("index", range(5))
+def test_solve_after_edit(problem, index):
+    pytest.importorskip("pyscipopt")
+    from oracles import ORACLE
+    from problems import PROBLEM
+    from solve import solve, solve_after_edit
+
+    params = {"solver": "scip", "maxiter": 200, "corr_freq": 5, "dual_freq": 1, "gap": 1e-6}
+    instance = get_instance()
+    oracle = ORACLE(instance, problem, "scip")
+    verif_model = PROBLEM(instance, problem, "scip", 1)
+    result = solve(instance, problem, params, oracle=oracle, verif_model=verif_model)
+    result = solve_after_edit(result, get_edits()[index], oracle, verif_model, problem, params)
+    assert result["stats"]["ncarried"] + result["stats"]["ndropped"] > 0
+
+    # the primal and dual bounds meet, at the optimum of the matching polytope of the edited graph
+    # and at an upper bound on the stability number
+    optimum = get_points(get_edits()[index].apply(get_instance()), problem).sum(axis=1).max()
+    assert result["primal"] == pytest.approx(result["dual_bounds"][-1], rel=1e-3)
+    if problem == "matching":
+        assert result["primal"] == pytest.approx(optimum, rel=1e-3)
+    else:
+        assert result["dual_bounds"][-1] >= optimum - 1e-6
@@ -0,0 +1,97 @@
+import numpy
+import pytest
+
+import auxiliary
+import instance
+from generators import generate_lpboost_dataset, write_lpboost_dataset
+from instance import clear_instance_cache, get_dataset
+
+
+@pytest.fixture
+def datasetfile(tmp_path):
+    labels, features = generate_lpboost_dataset(40, 6, 0.1, 1)
+    filename = str(tmp_path / "dataset.csv")
+    write_lpboost_dataset(filename, 0.2, labels, features)
+    return filename
+
+
+def get_margins(filename):
+    data = numpy.loadtxt(filename, delimiter=",", skiprows=1)
+    features = data[:, 1:]
+    return data[:, 0][:, None] * features / numpy.abs(features).max(axis=0)
+
+
+@pytest.mark.parametrize("float32", [False, True])
+def test_read_dataset(datasetfile, tmp_path, monkeypatch, float32):
+    monkeypatch.setattr(auxiliary, "LPBOOST_CHUNKSIZE", 7)
+    monkeypatch.setattr(instance, "LPBOOST_CHUNKSIZE", 7)
+    expected = get_margins(datasetfile)
+    rtol = 1e-6 if float32 else 1e-9
+
+    # the second read maps the cached margins
+    for k in range(2):
+        clear_instance_cache()
+        dataset = get_dataset(datasetfile, str(tmp_path), float32)
+        assert dataset.nu == 0.2
+        assert dataset.margins.dtype == (numpy.float32 if float32 else numpy.float64)
+        numpy.testing.assert_allclose(dataset.margins, expected, rtol=rtol)
+    assert isinstance(dataset.margins, numpy.memmap)
+
+    weights = numpy.random.default_rng(0).random(40)
+    numpy.testing.assert_allclose(dataset.compute_edges(weights), weights @ expected, rtol=rtol)
+
+
+def get_lp_optimum(dataset):
+    '''
+    returns the optimal value of max { gamma : gamma + s edge_j(lambda) <= 0 for s in {-1,1},
+    0 <= lambda_i <= 1 / (n nu), sum_i lambda_i = 1 } by a direct LP over all hypotheses
+    '''
+    optimize = pytest.importorskip("scipy.optimize")
+    n = dataset.nsamples
+    margins = numpy.asarray(dataset.margins)
+    rows = numpy.vstack((margins.T, -margins.T))
+    A_ub = numpy.column_stack((numpy.ones(len(rows)), rows))
+    result = optimize.linprog(numpy.eye(n + 1)[0] * -1, A_ub=A_ub, b_ub=numpy.zeros(len(rows)),
+                              A_eq=[[0] + n * [1]], b_eq=[1],
+                              bounds=[(None, None)] + n * [(0, 1 / (n * dataset.nu))])
+    assert result.status == 0
+    return -result.fun
+
+
+def test_lpboost_oracle(datasetfile):
+    from oracles import LPBOOSTORACLE
+
+    clear_instance_cache()
+    oracle = LPBOOSTORACLE(datasetfile, None)
+    dataset = oracle.dataset
+    optimum = get_lp_optimum(dataset)
+
+    # the primal solutions are feasible, and the separated cuts are valid for them
+    x = oracle.get_primal_solution()
+    assert oracle.separate_point(x, 1e-9) == []
+    assert x[0] - 2 <= optimum + 1e-9
+    ncuts = 0
+    for k in range(20):
+        point = numpy.random.default_rng(k).normal(size=41) * 2
+        cut = oracle.separate_point(point.tolist(), 1e-9)
+        y = oracle.get_primal_solution(point.tolist())
+        assert oracle.separate_point(y, 1e-9) == []
+        if len(cut) > 0:
+            ncuts += 1
+            assert numpy.dot(cut, point) > 1
+            assert numpy.dot(cut, x) <= 1 + 1e-9
+            assert numpy.dot(cut, y) <= 1 + 1e-9
+            assert sum(cut[1:]) == pytest.approx(0.0, abs=1e-12)
+    assert ncuts > 0
+
+
+def test_solve_lpboost(datasetfile):
+    pytest.importorskip("pyscipopt")
+    from solve import solve
+
+    clear_instance_cache()
+    optimum = get_lp_optimum(get_dataset(datasetfile))
+    result = solve(datasetfile, "lpboost", {"solver": "scip", "maxiter": 300, "corr_freq": 5,
+                                            "dual_freq": 1, "gap": 1e-3})
+    assert result["dual_bounds"][-1] >= optimum + 2 - 1e-6
+    assert result["primal"] == pytest.approx(optimum + 2, rel=2e-3)
@@ -0,0 +1,81 @@
+import numpy
+import pytest
+
+from auxiliary import LANCZOS_MINSIZE, smallest_eigenpair
+from instance import INSTANCE
+
+
+def get_random_symmetric(rng, n):
+    matrix = rng.normal(size=(n, n))
+    return matrix + matrix.T
+
+
+@pytest.mark.parametrize("n", [10, LANCZOS_MINSIZE + 40])
+def test_smallest_eigenpair(n):
+    rng = numpy.random.default_rng(n)
+    matrix = get_random_symmetric(rng, n)
+    expected = numpy.linalg.eigvalsh(matrix)[0]
+
+    start = None
+    for k in range(3):
+        val, vec = smallest_eigenpair(matrix, start)
+        assert val == pytest.approx(expected)
+        assert numpy.linalg.norm(vec) == pytest.approx(1.0)
+        numpy.testing.assert_allclose(matrix @ vec, val * vec, atol=1e-6)
+
+        # warm start from the previous eigenvector of a perturbed matrix
+        matrix += 1e-3 * get_random_symmetric(rng, n)
+        expected = numpy.linalg.eigvalsh(matrix)[0]
+        start = vec
+
+
+def get_oracle(nnodes, seed):
+    from oracles import MAXCUTORACLE
+
+    rng = numpy.random.default_rng(seed)
+    rows, cols = numpy.triu_indices(nnodes, 1)
+    chosen = rng.random(len(rows)) < 0.5
+    edges = numpy.stack((rows[chosen], cols[chosen]), axis=1) + 1
+    return MAXCUTORACLE(INSTANCE(nnodes, edges, rng.random(len(edges))), None), rng
+
+
+def test_maxcut_separation():
+    oracle, rng = get_oracle(8, 0)
+    pairs = oracle.pairs
+
+    # points of the elliptope are not separated
+    for k in range(5):
+        factor = rng.normal(size=(8, 3))
+        factor /= numpy.linalg.norm(factor, axis=1)[:, None]
+        point = (factor @ factor.T)[pairs]
+        numpy.testing.assert_allclose(oracle.get_matrix(point)[pairs], point)
+        assert oracle.separate_point(point.tolist(), 1e-9) == []
+
+    # the cut of a point outside is violated by the smallest eigenvalue and valid for all cuts
+    point = rng.uniform(-1, 1, size=len(pairs[0]))
+    eigval = numpy.linalg.eigvalsh(oracle.get_matrix(point))[0]
+    assert eigval < 0
+    cut = numpy.array(oracle.separate_point(point.tolist(), 1e-9))
+    assert cut @ point == pytest.approx(1 - eigval)
+    for k in range(20):
+        sides = numpy.where(rng.random(8) < 0.5, 1.0, -1.0)
+        assert cut @ numpy.outer(sides, sides)[pairs] <= 1 + 1e-9
+
+
+def test_maxcut_primal_solution():
+    oracle, rng = get_oracle(8, 1)
+    x = numpy.array(oracle.get_primal_solution())
+    assert numpy.all(numpy.abs(x) == 1)
+    assert numpy.linalg.eigvalsh(oracle.get_matrix(x))[0] >= -1e-9
+
+
+def test_solve_maxcut():
+    pytest.importorskip("pyscipopt")
+    from solve import solve
+
+    # the optimum over the elliptope of the triangle is X_ij = -1/2
+    triangle = INSTANCE(3, numpy.array([[1, 2], [2, 3], [1, 3]]), numpy.ones(3))
+    result = solve(triangle, "maxcut", {"solver": "scip", "maxiter": 100, "dual_freq": 1})
+    assert result["stats"]["status"] == "converged"
+    assert result["primal"] == pytest.approx(1.5, rel=0.01)
+    assert result["dual_bounds"][-1] == pytest.approx(1.5, rel=0.01)
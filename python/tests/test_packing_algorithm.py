@@ -0,0 +1,110 @@
+import numpy
+import pytest
+
+from generators import generate_matching_graph, write_graph
+from packing_algorithm import get_cheap_dual_bound, update_cheap_dual_bound
+
+
+def replay_dual_bounds(instancefile, problemtype, cuts, cut_rounds, niterations, initconss):
+    '''
+    returns the dual bound of each iteration by adding the separated cuts one after another to a
+    new verification model, as compare.py did before the bounds were recorded during the run
+    '''
+    from problems import PROBLEM
+
+    problem = PROBLEM(instancefile, problemtype, "scip", initconss)
+    dual_bounds = []
+    for cut in cuts:
+        problem.add_cut(cut)
+        dual_bounds.append(problem.optimize())
+
+    plot_dual_bounds = [dual_bounds[0]]
+    cut_cnt = 0
+    for i in range(1, niterations):
+        if cut_cnt < len(cut_rounds) and cut_rounds[cut_cnt] == i:
+            cut_cnt += 1
+            plot_dual_bounds.append(dual_bounds[cut_cnt])
+        else:
+            plot_dual_bounds.append(plot_dual_bounds[-1])
+    return plot_dual_bounds
+
+
+@pytest.mark.parametrize("corr_freq", [-1, 5])
+def test_dual_bounds_match_replay(tmp_path, corr_freq):
+    pytest.importorskip("pyscipopt")
+    from solve import solve
+
+    instancefile = str(tmp_path / "matching.col")
+    write_graph(instancefile, *generate_matching_graph(16, 3, 3, 1, True))
+    params = {"solver": "scip", "maxiter": 30, "corr_freq": corr_freq, "dual_freq": 1,
+              "heuristics": False}
+    result = solve(instancefile, "weightmatching", params)
+
+    replayed = replay_dual_bounds(instancefile, "weightmatching", result["cuts"],
+                                  result["sepa_rounds"], len(result["gamma_vals"]), 1)
+    assert len(result["dual_bounds"]) == len(result["gamma_vals"])
+    assert result["dual_bounds"] == pytest.approx(replayed, rel=1e-6)
+
+
+def get_lp_optimum(matrix, obj):
+    optimize = pytest.importorskip("scipy.optimize")
+    result = optimize.linprog(-obj, A_ub=matrix, b_ub=numpy.ones(len(matrix)), bounds=(0, None))
+    assert result.status == 0
+    return -result.fun
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_cheap_dual_bound_is_valid(seed):
+    rng = numpy.random.default_rng(seed)
+    m, n = 8, 10
+    matrix = rng.random((m, n)) * (rng.random((m, n)) < 0.5)
+    matrix[:, matrix.max(axis=0) == 0] = 0.5
+    obj = rng.integers(1, 10, size=n).astype(float)
+    optimum = get_lp_optimum(matrix, obj)
+    upper_bounds = 1 / matrix.max(axis=0)
+
+    # q lies below a convex combination of the rows and the origin, and f = obj / gamma
+    gamma = optimum * rng.uniform(0.3, 1.0)
+    f = obj / gamma
+    weights = rng.dirichlet(numpy.ones(m + 1))[:m]
+    q = numpy.minimum(weights @ matrix, f) * rng.uniform(0.5, 1.0)
+
+    bound = get_cheap_dual_bound(q.tolist(), f.tolist(), gamma, upper_bounds)
+    assert bound >= optimum * (1 - 1e-9)
+
+    # lambda = 1 is among the candidates
+    slack = numpy.maximum(f - q, 0.0)
+    assert bound <= gamma * (1 + upper_bounds @ slack) * (1 + 1e-9)
+
+
+def test_cheap_dual_bound_is_tight():
+    # the single constraint x_1 + x_2 <= 1 with objective (2,1)
+    upper_bounds = numpy.array([1.0, 1.0])
+    assert get_cheap_dual_bound([1.0, 1.0], [1.0, 0.5], 2.0, upper_bounds) == pytest.approx(2.0)
+
+
+def test_cheap_dual_bound_infinite():
+    upper_bounds = numpy.array([numpy.inf, 1.0])
+    bound = get_cheap_dual_bound([0.0, 1.0], [1.0, 1.0], 1.0, upper_bounds)
+    assert bound == numpy.inf
+    assert numpy.isnan(update_cheap_dual_bound(numpy.nan, [0.0, 1.0], [1.0, 1.0], 1.0,
+                                               upper_bounds))
+    assert update_cheap_dual_bound(numpy.nan, [1.0, 1.0], [1.0, 1.0], 1.0, upper_bounds) == 1.0
+    assert update_cheap_dual_bound(0.5, [1.0, 1.0], [1.0, 1.0], 1.0, upper_bounds) == 0.5
+
+
+def test_solve_with_cheap_dual(tmp_path):
+    pytest.importorskip("pyscipopt")
+    from solve import solve
+
+    instancefile = str(tmp_path / "matching.col")
+    write_graph(instancefile, *generate_matching_graph(16, 3, 3, 1, True))
+    params = {"solver": "scip", "maxiter": 100, "corr_freq": 5, "gap": 1e-3}
+    expected = solve(instancefile, "weightmatching", params)
+    result = solve(instancefile, "weightmatching", dict(params, cheap_dual=True))
+
+    # the cheap bounds are valid and replace the LP solve of the termination check
+    assert result["stats"]["status"] == expected["stats"]["status"] == "converged"
+    assert result["stats"]["cheap_dual_bound"] >= expected["primal"] - 1e-6
+    assert result["stats"]["dual_bound"] <= result["primal"] * (1 + 1e-3)
+    assert result["stats"]["nlpsolves"] < expected["stats"]["nlpsolves"]
@@ -0,0 +1,46 @@
+import numpy
+import pytest
+
+from generators import generate_packing_polytope, write_polytope
+from instance import load_instance
+
+
+@pytest.fixture
+def polytopefile(tmp_path):
+    filename = str(tmp_path / "polytope.npz")
+    write_polytope(filename, *generate_packing_polytope(30, 50, 4, 1))
+    return filename
+
+
+def test_get_row(polytopefile):
+    indptr, indices, data, obj = generate_packing_polytope(30, 50, 4, 1)
+    polytope = load_instance(polytopefile, "polytope")
+    for i in range(30):
+        row = polytope.get_row(i)
+        columns = numpy.sort(indices[indptr[i]:indptr[i + 1]])
+        assert isinstance(row, numpy.ndarray)
+        numpy.testing.assert_array_equal(numpy.flatnonzero(row), columns)
+
+
+def test_record_points(polytopefile):
+    pytest.importorskip("pyscipopt")
+    from solve import solve
+
+    params = {"solver": "scip", "maxiter": 40}
+    recorded = solve(polytopefile, "polytope", dict(params, record_points=True))
+    result = solve(polytopefile, "polytope", params)
+    assert result["primal"] == pytest.approx(recorded["primal"])
+    assert len(recorded["all_q"]) == len(recorded["gamma_vals"]) == 41
+
+    # only the final points are kept by default
+    assert len(result["all_f"]) == len(result["all_q"]) == 1
+    numpy.testing.assert_allclose(result["all_q"][0], recorded["all_q"][-1])
+    numpy.testing.assert_allclose(result["all_f"][0], recorded["all_f"][-1])
+
+    # the cuts are rows of the polytope, and the solutions are feasible lists
+    polytope = load_instance(polytopefile, "polytope")
+    rows = set(tuple(polytope.get_row(i)) for i in range(30))
+    assert all(tuple(cut) in rows for cut in result["cuts"][1:])
+    for x in result["solutions"]:
+        assert isinstance(x, list)
+        assert polytope.multiply(numpy.asarray(x)).max() <= 1 + 1e-6
@@ -0,0 +1,90 @@
+import itertools
+
+import numpy
+import pytest
+
+from instance import INSTANCE
+from presolve import presolve
+
+
+def is_feasible(nnodes, edges, x, matching):
+    '''
+    returns whether a 0/1 vector is a matching or stable set (edges are labeled 0,...,n-1)
+    '''
+    if matching:
+        return numpy.bincount(edges[x > 0].ravel(), minlength=nnodes).max(initial=0) <= 1
+    return bool(numpy.all(x[edges[:, 0]] + x[edges[:, 1]] <= 1))
+
+
+def get_optimum(nnodes, edges, obj, matching):
+    '''
+    returns the optimal value and an optimal solution of a small matching or stable set problem
+    by enumeration
+    '''
+    best = (0.0, numpy.zeros(len(obj)))
+    for chosen in itertools.product([0, 1], repeat=len(obj)):
+        x = numpy.array(chosen, dtype=float)
+        if x @ obj > best[0] and is_feasible(nnodes, edges, x, matching):
+            best = (x @ obj, x)
+    return best
+
+
+def get_random_instance(seed):
+    # sparse graphs with pendant nodes and random (also nonpositive) weights
+    rng = numpy.random.default_rng(seed)
+    nnodes = 9
+    edges = set()
+    for v in range(1, nnodes):
+        edges.add((int(rng.integers(v)), v))
+    while len(edges) < 11:
+        u, v = sorted(rng.choice(nnodes, 2, replace=False).tolist())
+        edges.add((u, v))
+    edges = numpy.array(sorted(edges)) + 1
+    weights = rng.integers(-1, 6, size=len(edges)).astype(float)
+    return INSTANCE(nnodes, edges, weights)
+
+
+@pytest.mark.parametrize("problemtype", ["matching", "weightmatching", "stableset",
+                                         "weightstableset"])
+@pytest.mark.parametrize("seed", range(8))
+def test_presolve_preserves_optimum(problemtype, seed):
+    instance = get_random_instance(seed)
+    matching = problemtype in ["matching", "weightmatching"]
+    obj = numpy.asarray(instance.get_objective(problemtype), dtype=float)
+    edges = instance.get_edge_array() - 1
+    optimum, x = get_optimum(instance.nnodes, edges, obj, matching)
+
+    presolved = presolve(instance, problemtype)
+    reduced = presolved.instance
+    assert presolved.reducedtype == ("matching" if matching else "stableset")
+    assert presolved.stats["variables"] == [len(obj), len(presolved.variables)]
+    assert presolved.stats["fixed_zero"] + presolved.stats["fixed_one"] == \
+        len(obj) - len(presolved.variables)
+
+    # the reduced instance keeps the original objective of its variables
+    reducedobj = numpy.asarray(reduced.get_objective(presolved.reducedtype), dtype=float)
+    numpy.testing.assert_array_equal(reducedobj, obj[presolved.variables])
+    reducedopt, y = get_optimum(reduced.nnodes, reduced.get_edge_array() - 1, reducedobj,
+                                matching)
+    assert reducedopt + presolved.offset == pytest.approx(optimum)
+
+    # postsolving an optimal solution of the reduced instance yields one of the original instance
+    x = numpy.array(presolved.postsolve(y))
+    assert x @ obj == pytest.approx(optimum)
+    assert is_feasible(instance.nnodes, edges, x, matching)
+
+
+def test_solve_with_presolve():
+    pytest.importorskip("pyscipopt")
+    from solve import solve
+
+    instance = get_random_instance(0)
+    params = {"solver": "scip", "maxiter": 100, "corr_freq": 5, "dual_freq": 1, "gap": 1e-4}
+    expected = solve(instance, "matching", params)
+    result = solve(instance, "matching", dict(params, presolving=True))
+
+    assert result["stats"]["presolve"]["variables"][1] < len(instance.edge_list)
+    assert result["primal"] == pytest.approx(expected["primal"], rel=1e-3)
+    assert result["dual_bounds"][-1] == pytest.approx(expected["dual_bounds"][-1], rel=1e-3)
+    for x in result["solutions"]:
+        assert len(x) == len(instance.edge_list)
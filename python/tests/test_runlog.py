@@ -0,0 +1,65 @@
+import os
+
+import numpy
+
+from runlog import *
+
+
+def test_round_trip(tmp_path):
+    basename = str(tmp_path / "logs" / "run")
+    series = {"dualDHHW": [3.0, 2.5, 1.0 / 3.0], "primalDHHW": [0.0, 1e-17, 2.0]}
+    write_run_log(basename, {"precision": 0.001, "solver": "scip"}, series, {"LPtime": 1.5})
+
+    for filename in [basename, basename + ".jsonl", basename + ".npz"]:
+        log = read_run_log(filename)
+        assert log.complete
+        assert log.params == {"precision": 0.001, "solver": "scip"}
+        assert log.timing == {"LPtime": 1.5}
+        assert sorted(log.get_series_names()) == ["dualDHHW", "primalDHHW"]
+        for name in series:
+            numpy.testing.assert_array_equal(log.get_series(name), series[name])
+        assert not log.has_series("dualLP")
+        assert log.get_series("dualLP", []) == []
+
+
+def test_streamed_rows(tmp_path):
+    basename = str(tmp_path / "run")
+    writer = RUNLOGWRITER(basename, {"maxiter": 3})
+    values = [1.0 / 3.0, 0.1, 2.0 ** 0.5]
+    for val in values:
+        writer.add_row({"dualDHHW": val, "primalDHHW": numpy.float64(-val)})
+
+    # a run that has not been closed yet is read from its rows, which are exact
+    log = read_run_log(basename)
+    assert not log.complete
+    assert not os.path.exists(basename + ".npz")
+    numpy.testing.assert_array_equal(log.get_series("dualDHHW"), values)
+    numpy.testing.assert_array_equal(log.get_series("primalDHHW"), numpy.negative(values))
+
+    # series added explicitly take precedence over rows when the log is closed
+    writer.add_series("primalDHHW", [5.0])
+    writer.add_timing({"DHHWtime": 0.25})
+    writer.close()
+    log = read_run_log(basename)
+    assert log.complete
+    assert log.timing == {"DHHWtime": 0.25}
+    numpy.testing.assert_array_equal(log.get_series("dualDHHW"), values)
+    numpy.testing.assert_array_equal(log.get_series("primalDHHW"), [5.0])
+
+
+def test_legacy_log(tmp_path):
+    filename = str(tmp_path / "run.txt")
+    with open(filename, "w") as f:
+        f.write("dualDHHW\n3.000000 2.000000 \nprimalDHHW\n1.000000 2.000000 \n")
+
+    log = read_run_log(filename)
+    assert log.complete
+    numpy.testing.assert_array_equal(log.get_series("dualDHHW"), [3.0, 2.0])
+    numpy.testing.assert_array_equal(log.get_series("primalDHHW"), [1.0, 2.0])
+
+
+def test_find_run_log(tmp_path):
+    logdir = str(tmp_path)
+    assert find_run_log(logdir, "run") == os.path.join(logdir, "run.txt")
+    write_run_log(os.path.join(logdir, "run"), {}, {"dualLP": [1.0]}, {})
+    assert find_run_log(logdir, "run") == os.path.join(logdir, "run.jsonl")
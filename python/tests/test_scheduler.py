@@ -0,0 +1,63 @@
+import numpy
+import pytest
+
+from scheduler import *
+
+
+def test_fixed_scheduler():
+    assert not FIXEDSCHEDULER(-1).is_active()
+    assert not any(FIXEDSCHEDULER(0).decide(k) for k in range(10))
+    assert [k for k in range(10) if FIXEDSCHEDULER(4).decide(k)] == [0, 4, 8]
+
+
+def run_scheduler(scheduler, niter, rate_cheap, rate_corr):
+    '''
+    returns the iterations in which the scheduler performs fully corrective steps if the distance
+    decreases by the given factors per second
+    '''
+    corrective = []
+    for k in range(niter):
+        decision = scheduler.decide(k)
+        if decision:
+            corrective.append(k)
+        rate = rate_corr if decision else rate_cheap
+        scheduler.update(decision, 1.0, numpy.exp(-rate), 1.0)
+    return corrective
+
+
+def test_adaptive_scheduler_warmup():
+    scheduler = ADAPTIVESCHEDULER(warmup=5, max_interval=20)
+    assert scheduler.is_active()
+
+    # slow fully corrective steps are only refreshed after max_interval cheap steps
+    assert run_scheduler(scheduler, 60, 1.0, 0.1) == [5, 26, 47]
+    assert scheduler.rate_cheap == pytest.approx(1.0)
+    assert scheduler.rate_corr == pytest.approx(0.1)
+
+
+def test_adaptive_scheduler_prefers_faster_steps():
+    # fast fully corrective steps are performed in every iteration after the warmup
+    scheduler = ADAPTIVESCHEDULER(warmup=5, max_interval=20)
+    assert run_scheduler(scheduler, 20, 0.1, 1.0) == list(range(5, 20))
+
+    # the smoothed rates follow a change of the progress
+    scheduler = ADAPTIVESCHEDULER(warmup=0, smoothing=0.5)
+    scheduler.update(True, 1.0, numpy.exp(-2.0), 1.0)
+    scheduler.update(True, 1.0, numpy.exp(-1.0), 2.0)
+    assert scheduler.rate_corr == pytest.approx(1.25)
+    scheduler.update(False, 1.0, 2.0, 1.0)
+    assert scheduler.rate_cheap == 0.0
+    assert scheduler.decide(3)
+
+
+def test_solve_adaptive(tmp_path):
+    pytest.importorskip("pyscipopt")
+    from generators import generate_matching_graph, write_graph
+    from solve import solve
+
+    instancefile = str(tmp_path / "matching.col")
+    write_graph(instancefile, *generate_matching_graph(16, 3, 3, 1, True))
+    params = {"solver": "scip", "maxiter": 60, "dual_freq": 1, "adaptive_corrective": True}
+    result = solve(instancefile, "weightmatching", params)
+    assert result["stats"]["ncorrective"] >= 1
+    assert result["dual_bounds"][-1] >= result["primal"] - 1e-6
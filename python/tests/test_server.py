@@ -0,0 +1,99 @@
+import json
+import os
+import threading
+
+import pytest
+
+import server
+
+
+INSTANCE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "matching",
+                        "matching1.col")
+
+
+class RECORDER:
+    '''
+    collects the responses sent by the server
+    '''
+
+    def __init__(self):
+        self.responses = []
+        self.lock = threading.Lock()
+
+    def __call__(self, response):
+        with self.lock:
+            self.responses.append(response)
+
+    def get(self, reqid, event):
+        return [r for r in self.responses if r.get("id") == reqid and r["event"] == event]
+
+
+def test_group_sender():
+    sent = []
+    send = server.get_group_sender(sent.append, 3)
+    send({"id": 1, "event": "loaded"})
+    send({"id": 1, "event": "error", "message": "a"})
+    assert sent == []
+    send({"id": 1, "event": "loaded"})
+    assert sent == [{"id": 1, "event": "error", "message": "a"}]
+
+
+@pytest.fixture(scope="module")
+def solveserver():
+    pytest.importorskip("pyscipopt")
+    solveserver = server.SOLVESERVER("scip", 2)
+    yield solveserver
+    solveserver.close()
+
+
+def submit(solveserver, send, **request):
+    futures = []
+    assert solveserver.handle(json.dumps(request), send, futures)
+    for future in futures:
+        future.result(timeout=300)
+
+
+def test_invalid_requests(solveserver):
+    send = RECORDER()
+    assert solveserver.handle("{", send)
+    assert solveserver.handle("[1]", send)
+    assert solveserver.handle(json.dumps({"command": "unknown", "id": 5}), send)
+    assert [r["event"] for r in send.responses] == ["error"] * 3
+    assert not solveserver.handle(json.dumps({"command": "shutdown"}), send)
+
+
+def test_load_and_solve(solveserver):
+    send = RECORDER()
+    submit(solveserver, send, command="load", id="l", instance=INSTANCE, type="matching")
+    assert send.responses == [{"id": "l", "event": "loaded"}]
+
+    submit(solveserver, send, id=1, instance=INSTANCE, type="matching", maxiter=6, progress=3)
+    assert len(send.get(1, "accepted")) == 1
+    assert [r["iteration"] for r in send.get(1, "progress")] == [3, 6]
+    result = send.get(1, "result")[0]
+    assert result["niter"] == 6 and result["status"] == "maxiter"
+    assert len(result["solution"]) > 0
+
+    submit(solveserver, send, id=2, instance="nofile", type="matching")
+    assert "FileNotFoundError" in send.get(2, "error")[0]["message"]
+
+
+def test_cancel(solveserver):
+    send = RECORDER()
+
+    # a cancel of an unknown id is ignored and does not cancel a later request with this id
+    solveserver.handle(json.dumps({"command": "cancel", "id": 7}), send)
+    submit(solveserver, send, id=7, instance=INSTANCE, type="matching", maxiter=3)
+    assert send.get(7, "result")[0]["status"] == "maxiter"
+
+    # the queued request is cancelled at its first iteration
+    futures = []
+    for reqid in [8, 9, 10]:
+        solveserver.handle(json.dumps({"id": reqid, "instance": INSTANCE, "type": "matching",
+                                       "maxiter": 3}), send, futures)
+    solveserver.handle(json.dumps({"command": "cancel", "id": 10}), send)
+    for future in futures:
+        future.result(timeout=300)
+    assert send.get(8, "result")[0]["status"] == "maxiter"
+    assert send.get(10, "result")[0]["status"] == "interrupted"
+    assert solveserver.tasks == {}
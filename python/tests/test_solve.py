@@ -0,0 +1,142 @@
+import pytest
+
+from solve import SOLVE_PARAMS, check_conflicts, get_solve_params, parse_arguments
+
+
+def test_get_solve_params():
+    assert get_solve_params() == dict(SOLVE_PARAMS, dual_freq=0)
+
+    # entries that are no parameters of solve() are dropped, keyword arguments win
+    params = get_solve_params({"instancefile": "a.csv", "maxiter": 7, "gap": 0.1}, gap=0.5)
+    assert not "instancefile" in params
+    assert params["maxiter"] == 7
+    assert params["gap"] == 0.5
+
+    with pytest.raises(ValueError):
+        get_solve_params(maxiterations=7)
+
+
+def test_parse_arguments():
+    params, unknown = parse_arguments(["--type=maxcut", "--maxiter=5", "--other=1"])
+    assert params["problemtype"] == "maxcut"
+    assert params["maxiter"] == 5
+    assert params["dual_freq"] is None
+    assert unknown == ["--other=1"]
+    assert get_solve_params(params)["dual_freq"] == 0
+
+
+@pytest.mark.parametrize("argv", [["--record=a", "--heuristics"],
+                                  ["--objectives=a", "--decompose=2"],
+                                  ["--edit=a", "--cutstore=b"],
+                                  ["--presolve", "--replay=a"]])
+def test_check_conflicts(argv):
+    with pytest.raises(SystemExit):
+        check_conflicts(argv)
+    with pytest.raises(SystemExit):
+        check_conflicts(argv[::-1])
+
+
+def test_check_conflicts_compatible():
+    check_conflicts(["--objectives=a", "--continuation", "--update=away", "--cheapdual"])
+    check_conflicts(["--decompose=2", "--heuristics"])
+
+
+def test_initial_conss(tmp_path):
+    pytest.importorskip("pyscipopt")
+    from instance import load_instance
+    from oracles import ORACLE
+
+    filename = str(tmp_path / "square.csv")
+    with open(filename, "w") as f:
+        f.write("1,2,1\n2,3,1\n3,4,1\n4,1,1\n")
+    oracle = ORACLE(load_instance(filename, "matching"), "matching", "scip")
+
+    assert oracle.get_initial_conss(0) == []
+    assert oracle.get_initial_conss(1) == [[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]]
+    all_conss = oracle.get_initial_conss(2)
+    assert len(all_conss) == 4 + len(oracle.get_standard_cuts())
+
+
+@pytest.fixture
+def matchingfile(tmp_path):
+    from generators import generate_matching_graph, write_graph
+
+    instancefile = str(tmp_path / "matching.col")
+    write_graph(instancefile, *generate_matching_graph(16, 3, 3, 1, True))
+    return instancefile
+
+
+def test_limits(matchingfile):
+    pytest.importorskip("pyscipopt")
+    from solve import solve
+
+    params = {"solver": "scip", "maxiter": 100, "corr_freq": 5, "dual_freq": 1,
+              "heuristics": False}
+    result = solve(matchingfile, "weightmatching", dict(params, gap=1e-4))
+    niter = len(result["gamma_vals"]) - 1
+
+    # a larger gap stops earlier, and the dual bound is within the gap of gamma
+    loose = solve(matchingfile, "weightmatching", dict(params, gap=0.2))
+    assert loose["stats"]["status"] == "converged"
+    assert len(loose["gamma_vals"]) - 1 < niter
+    assert loose["stats"]["dual_bound"] <= 1.2 * loose["primal"]
+
+    stopped = solve(matchingfile, "weightmatching", params,
+                    progress=lambda niter, gamma, dual: niter == 3)
+    assert stopped["stats"]["status"] == "interrupted"
+    assert len(stopped["gamma_vals"]) == 4
+    assert stopped["gamma_vals"] == result["gamma_vals"][:4]
+
+    stopped = solve(matchingfile, "weightmatching", dict(params, timelimit=1e-9))
+    assert stopped["stats"]["status"] == "timelimit"
+    assert stopped["primal"] == result["gamma_vals"][0]
+
+
+def test_signal(matchingfile):
+    pytest.importorskip("pyscipopt")
+    import os
+    import signal
+    from solve import solve
+
+    def progress(niter, gamma, dual):
+        if niter == 2:
+            os.kill(os.getpid(), signal.SIGINT)
+
+    params = {"solver": "scip", "maxiter": 100, "heuristics": False}
+    result = solve(matchingfile, "weightmatching", params, progress=progress)
+    assert result["stats"]["status"] == "interrupted"
+    assert len(result["gamma_vals"]) == 3
+
+
+def test_solve_batch(matchingfile):
+    pytest.importorskip("pyscipopt")
+    import numpy
+    from instance import load_instance
+    from solve import solve_batch
+
+    weights = load_instance(matchingfile, "weightmatching").get_objective("weightmatching")
+    rng = numpy.random.default_rng(0)
+    objectives = [[1.0] * len(weights), weights, rng.integers(1, 10, size=len(weights)).tolist()]
+    params = {"solver": "scip", "maxiter": 100, "corr_freq": 5, "dual_freq": 1, "gap": 1e-3}
+    batch = solve_batch(matchingfile, "weightmatching", objectives, params)
+    stats = batch["stats"]
+    assert len(batch["results"]) == len(stats["objective_times"]) == len(objectives)
+    assert stats["pool_sizes"][0] == 0
+    assert numpy.all(numpy.diff(stats["pool_sizes"]) >= 0)
+    assert stats["pool_sizes"][-1] <= stats["ncuts"]
+    assert stats["time_per_objective"] == pytest.approx(stats["time"] / len(objectives))
+
+    # each objective is solved as well as by a run of its own, and the pool saves iterations
+    for obj, result in zip(objectives, batch["results"]):
+        single = solve_batch(matchingfile, "weightmatching", [obj], params)["results"][0]
+        assert result["stats"]["status"] == single["stats"]["status"] == "converged"
+        assert result["primal"] == pytest.approx(single["primal"], rel=1e-3)
+        assert result["primal"] <= result["dual_bounds"][-1] * (1 + 1e-6)
+        assert len(result["gamma_vals"]) <= len(single["gamma_vals"])
+        for x in result["solutions"]:
+            assert numpy.asarray(x) @ obj <= result["dual_bounds"][-1] * (1 + 1e-6)
+
+    with pytest.raises(ValueError):
+        solve_batch(matchingfile, "weightmatching", [[1.0]], params)
+    with pytest.raises(ValueError):
+        solve_batch(matchingfile, "maxcut", objectives, params)
@@ -0,0 +1,87 @@
+import numpy
+import pytest
+
+from generators import generate_matching_graph, write_graph
+from strategies import *
+
+
+def test_domain_box():
+    domain = DOMAIN(numpy.zeros(3), numpy.array([1.0, 2.0, 2.0]), True)
+    assert domain.dim == 3
+    assert domain.radius == pytest.approx(1.5)
+    numpy.testing.assert_allclose(domain.lift(numpy.zeros(3)), [0.5, 1.0, 1.0])
+
+    coefs, rhs = domain.project_inequality([1.0, 1.0, 0.0], 1.0)
+    z = numpy.array([0.2, -0.4, 0.3])
+    assert coefs @ z - rhs == pytest.approx(numpy.array([1.0, 1.0, 0.0]) @ domain.lift(z) - 1.0)
+
+    assert domain.get_violated_bound(numpy.array([0.5, 2.0, 0.0]), 1e-6) is None
+    coefs, rhs = domain.get_violated_bound(numpy.array([0.5, 2.5, -1.0]), 1e-6)
+    assert coefs.tolist() == [0.0, 0.0, -1.0] and rhs == 0.0
+    coefs, rhs = domain.get_violated_bound(numpy.array([1.5, 1.0, 0.0]), 1e-6)
+    assert coefs.tolist() == [1.0, 0.0, 0.0] and rhs == 1.0
+    assert len(domain.get_bounds()) == 6
+
+
+def test_domain_equations():
+    # the distributions in [0,1]^3 lie in the plane x_1 + x_2 + x_3 = 1
+    domain = DOMAIN(numpy.zeros(3), numpy.ones(3), False, numpy.ones(3), numpy.ones(1))
+    assert domain.dim == 2
+    assert domain.radius == pytest.approx(numpy.sqrt(0.75 - 1.0 / 12.0))
+
+    rng = numpy.random.default_rng(0)
+    cut = rng.normal(size=3)
+    coefs, rhs = domain.project_inequality(cut, 0.5)
+    for k in range(10):
+        z = rng.normal(size=2)
+        x = domain.lift(z)
+        assert x.sum() == pytest.approx(1.0)
+        assert numpy.linalg.norm(x - 1.0 / 3.0) == pytest.approx(numpy.linalg.norm(z))
+        assert coefs @ z - rhs == pytest.approx(cut @ x - 0.5)
+
+
+def test_analytic_center():
+    # the analytic center of a symmetric box inside a ball is the origin
+    rows = numpy.array([[1.0, 0.0], [-1.0, 0.0], [0.0, 1.0], [0.0, -1.0]])
+    rhs = numpy.array([1.0, 1.0, 2.0, 2.0])
+    x = numpy.array([0.5, -0.3])
+    assert analytic_center(rows, rhs, 10.0, x)
+    numpy.testing.assert_allclose(x, 0.0, atol=1e-6)
+
+    # the center of an interval maximizes log(1 - x) + log(x) + log(r^2 - x^2)
+    x = numpy.array([0.9])
+    assert analytic_center(numpy.array([[1.0], [-1.0]]), numpy.array([1.0, 0.0]), 2.0, x)
+    grad = -1 / (1 - x[0]) + 1 / x[0] - 2 * x[0] / (4.0 - x[0] ** 2)
+    assert abs(grad) <= 1e-6
+    assert 0 < x[0] < 0.5
+
+
+def test_unknown_strategy():
+    with pytest.raises(ValueError):
+        run_strategies("", "weightmatching", ["cutloop", "newton"])
+
+
+def test_run_strategies(tmp_path):
+    pytest.importorskip("pyscipopt")
+
+    instancefile = str(tmp_path / "matching.col")
+    write_graph(instancefile, *generate_matching_graph(16, 3, 3, 1, True))
+    results = run_strategies(instancefile, "weightmatching", STRATEGY_TYPES,
+                             {"solver": "scip", "maxiter": 60})
+
+    # all strategies start with the same lower bound and compute valid bounds
+    best_lb = max(max(result["lower_bounds"]) for result in results.values())
+    best_ub = min(min(result["upper_bounds"]) for result in results.values())
+    assert best_lb <= best_ub * (1 + 1e-6)
+    assert len(set(result["lower_bounds"][0] for result in results.values())) == 1
+    for method, result in results.items():
+        stats = result["stats"]
+        assert len(result["lower_bounds"]) == len(result["upper_bounds"]) == stats["niter"]
+        assert numpy.all(numpy.diff(result["lower_bounds"]) >= 0)
+        assert numpy.all(numpy.diff(result["upper_bounds"]) <= 1e-6)
+        assert stats["ndual"] == len(stats["cuts"])
+        assert stats["nprimal"] <= len(stats["solutions"])
+
+    # the cutting plane loop and the analytic centers solve matching problems
+    assert results["cutloop"]["stats"]["status"] == "converged"
+    assert results["analytic"]["stats"]["status"] == "converged"
@@ -0,0 +1,79 @@
+import numpy
+import pytest
+
+from generators import generate_matching_graph, write_graph
+from tracing import *
+
+
+def test_hash_vector():
+    assert hash_vector([1.0, 0.5]) == hash_vector([1.000000001, 0.5])
+    assert hash_vector([0.0, 1.0]) == hash_vector([-0.0, 1.0])
+    assert hash_vector([1.0, 0.5]) != hash_vector([1.0, 0.51])
+    assert hash_vector([1.0, 0.5], digits=1) == hash_vector([1.0, 0.54], digits=1)
+
+
+@pytest.fixture
+def recorded(tmp_path):
+    '''
+    returns the parameters, result, and path of the trace of a recorded run
+    '''
+    pytest.importorskip("pyscipopt")
+    from oracles import ORACLE
+    from problems import PROBLEM
+    from solve import solve
+
+    instancefile = str(tmp_path / "matching.col")
+    write_graph(instancefile, *generate_matching_graph(16, 3, 3, 1, True))
+    params = {"solver": "scip", "maxiter": 40, "corr_freq": 5, "dual_freq": 1,
+              "heuristics": False}
+
+    trace = TRACE()
+    oracle = RECORDINGORACLE(ORACLE(instancefile, "weightmatching", "scip"), trace)
+    verif_model = RECORDINGPROBLEM(PROBLEM(instancefile, "weightmatching", "scip", 1), trace)
+    result = solve(instancefile, "weightmatching", params, oracle=oracle,
+                   verif_model=verif_model)
+    tracefile = str(tmp_path / "trace.npz")
+    trace.save(tracefile)
+
+    return params, result, tracefile
+
+
+def test_replay(recorded):
+    from solve import solve
+
+    params, expected, tracefile = recorded
+    trace = load_trace(tracefile)
+    assert trace.initconss == 1
+    assert len(trace.separations) > 0
+
+    oracle = REPLAYORACLE(trace)
+    verif_model = REPLAYPROBLEM(trace)
+    result = solve("", "weightmatching", params, oracle=oracle, verif_model=verif_model)
+    assert result["primal"] == expected["primal"]
+    assert result["gamma_vals"] == expected["gamma_vals"]
+    assert result["dual_bounds"] == expected["dual_bounds"]
+    numpy.testing.assert_array_equal(numpy.array(result["cuts"], dtype=float),
+                                     numpy.array(expected["cuts"], dtype=float))
+    assert oracle.ncalls == len(trace.separations)
+    assert verif_model.ncalls == len(trace.events)
+    assert oracle.ndiverged == verif_model.ndiverged == 0
+
+
+def test_replay_diverged(recorded):
+    from solve import solve
+
+    params, expected, tracefile = recorded
+    trace = load_trace(tracefile)
+    with pytest.raises(RuntimeError):
+        solve("", "weightmatching", dict(params, precision=0.01), oracle=REPLAYORACLE(trace),
+              verif_model=REPLAYPROBLEM(trace))
+
+    # the initial constraints have been recorded for initconss=1 only
+    with pytest.raises(RuntimeError):
+        REPLAYORACLE(trace).get_initial_conss(2)
+
+    # a trace without initial constraints derives them from the upper bounds
+    oracle = REPLAYORACLE(trace, strict=False)
+    recorded_conss = oracle.get_initial_conss(1)
+    trace.initial_conss = None
+    assert oracle.get_initial_conss(1) == recorded_conss
@@ -0,0 +1,402 @@
+import hashlib
+
+import numpy
+
+from oracles import get_initial_conss
+
+####################################################################################################
+#
+# RECORDING AND REPLAYING ORACLE TRACES
+#
+####################################################################################################
+#
+# A trace stores the responses of an oracle and of a verification problem (see PROBLEM) during a
+# run. Replaying a trace serves the same responses without solving any IP or LP, such that the
+# remaining parts of packing_algorithm (projections, bookkeeping) can be profiled on their own.
+# The points passed to the oracle and the cuts added to the problem are stored as hashes only;
+# if a replayed run asks for a different point than the recorded run, the run has diverged.
+
+
+def hash_vector(vector, digits=8):
+    '''
+    returns a hash of a vector of numbers rounded to a number of decimal digits
+    vector - list of numbers
+    digits - (optional) number of decimal digits that are taken into account
+    '''
+    values = numpy.round(numpy.asarray(vector, dtype=numpy.float64), digits) + 0.0
+    return hashlib.sha1(values.tobytes()).hexdigest()
+
+
+class TRACE:
+    '''
+    responses of an oracle and a problem recorded during a run
+
+    class variables:
+    obj           - objective vector of the oracle
+    inner_radius  - radius of inner ball of the oracle
+    standard_cuts - standard cuts of the oracle
+    upper_bounds  - upper bounds on the variables of the oracle (None if there are none)
+    initconss     - value of initconss for which initial_conss have been recorded
+    initial_conss - constraints of the fully corrective steps of the oracle (None if they have
+                    not been requested)
+    separations   - list of (hash of point, precision, cut) of calls of separate_point
+    events        - list of (kind, hash, value, solution) of calls of the problem, where kind is
+                    "add_cut" (hash of cut), "optimize" (value), or "solution" (solution)
+    digits        - number of decimal digits taken into account by hashes
+    '''
+
+    def __init__(self, digits=8):
+        '''
+        initializes an empty trace
+        digits - (optional) number of decimal digits taken into account by hashes
+        '''
+        self.obj = None
+        self.inner_radius = None
+        self.standard_cuts = None
+        self.upper_bounds = None
+        self.initconss = None
+        self.initial_conss = None
+        self.separations = []
+        self.events = []
+        self.digits = digits
+
+    def save(self, filename):
+        '''
+        stores the trace in a compressed NumPy file
+        filename - path to file (should end with .npz)
+        '''
+        cuts = [cut for (h, p, cut) in self.separations]
+        solutions = [sol for (k, h, v, sol) in self.events]
+        standard_cuts = self.standard_cuts if self.standard_cuts is not None else []
+        initial_conss = self.initial_conss if self.initial_conss is not None else []
+
+        numpy.savez_compressed(
+            filename,
+            digits=numpy.array(self.digits),
+            obj=numpy.asarray(self.obj if self.obj is not None else [], dtype=numpy.float64),
+            inner_radius=numpy.array(self.inner_radius if self.inner_radius is not None
+                                     else numpy.nan),
+            has_standard_cuts=numpy.array(self.standard_cuts is not None),
+            standard_cut_lengths=numpy.array([len(c) for c in standard_cuts], dtype=numpy.int64),
+            standard_cuts=numpy.array([v for c in standard_cuts for v in c], dtype=numpy.float64),
+            has_initial_conss=numpy.array(self.initial_conss is not None),
+            initconss=numpy.array(self.initconss if self.initconss is not None else -1),
+            initial_cons_lengths=numpy.array([len(c) for c in initial_conss], dtype=numpy.int64),
+            initial_conss=numpy.array([v for c in initial_conss for v in c], dtype=numpy.float64),
+            has_upper_bounds=numpy.array(self.upper_bounds is not None),
+            upper_bounds=numpy.asarray(self.upper_bounds if self.upper_bounds is not None else [],
+                                       dtype=numpy.float64),
+            sepa_hashes=numpy.array([h for (h, p, cut) in self.separations], dtype=str),
+            sepa_precisions=numpy.array([p for (h, p, cut) in self.separations],
+                                        dtype=numpy.float64),
+            cut_lengths=numpy.array([len(c) for c in cuts], dtype=numpy.int64),
+            cuts=numpy.array([v for c in cuts for v in c], dtype=numpy.float64),
+            event_kinds=numpy.array([k for (k, h, v, sol) in self.events], dtype=str),
+            event_hashes=numpy.array([h for (k, h, v, sol) in self.events], dtype=str),
+            event_values=numpy.array([v for (k, h, v, sol) in self.events], dtype=numpy.float64),
+            solution_lengths=numpy.array([len(s) for s in solutions], dtype=numpy.int64),
+            solutions=numpy.array([v for s in solutions for v in s], dtype=numpy.float64))
+
+
+def split_vectors(values, lengths):
+    '''
+    splits a concatenation of vectors into a list of lists
+    values  - array containing the concatenated vectors
+    lengths - array of lengths of the vectors
+    '''
+    return [part.tolist() for part in numpy.split(values, numpy.cumsum(lengths)[:-1])] \
+        if len(lengths) > 0 else []
+
+
+def load_trace(filename):
+    '''
+    reads a trace stored by TRACE.save()
+    filename - path to file
+    '''
+    data = numpy.load(filename)
+
+    trace = TRACE(int(data["digits"]))
+    trace.obj = data["obj"].tolist()
+    trace.inner_radius = float(data["inner_radius"])
+    if bool(data["has_standard_cuts"]):
+        trace.standard_cuts = split_vectors(data["standard_cuts"], data["standard_cut_lengths"])
+    if "has_initial_conss" in data and bool(data["has_initial_conss"]):
+        trace.initconss = int(data["initconss"])
+        trace.initial_conss = split_vectors(data["initial_conss"], data["initial_cons_lengths"])
+    if "has_upper_bounds" in data and bool(data["has_upper_bounds"]):
+        trace.upper_bounds = data["upper_bounds"].tolist()
+
+    cuts = split_vectors(data["cuts"], data["cut_lengths"])
+    trace.separations = list(zip(data["sepa_hashes"].tolist(), data["sepa_precisions"].tolist(),
+                                 cuts))
+
+    solutions = split_vectors(data["solutions"], data["solution_lengths"])
+    trace.events = list(zip(data["event_kinds"].tolist(), data["event_hashes"].tolist(),
+                            data["event_values"].tolist(), solutions))
+    data.close()
+
+    return trace
+
+
+class RECORDINGORACLE:
+    '''
+    oracle that forwards all calls to another oracle and records its responses in a trace
+
+    class variables:
+    oracle - oracle whose responses are recorded
+    trace  - TRACE the responses are recorded in
+    '''
+
+    def __init__(self, oracle, trace):
+        '''
+        initializes the oracle
+        oracle - oracle whose responses are recorded
+        trace  - TRACE the responses are recorded in
+        '''
+        self.oracle = oracle
+        self.trace = trace
+        self.trace.obj = list(oracle.get_obj())
+        self.trace.inner_radius = oracle.get_inner_radius()
+        self.trace.upper_bounds = oracle.get_upper_bounds()
+
+    def get_obj(self):
+        '''
+        returns objective vector
+        '''
+        return self.oracle.get_obj()
+
+    def get_inner_radius(self):
+        '''
+        returns radius of inner ball
+        '''
+        return self.oracle.get_inner_radius()
+
+    def get_standard_cuts(self):
+        '''
+        return standard cuts of problem
+        '''
+        cuts = self.oracle.get_standard_cuts()
+        self.trace.standard_cuts = [list(cut) for cut in cuts]
+        return cuts
+
+    def get_upper_bounds(self):
+        '''
+        returns upper bounds on the variables
+        '''
+        return self.oracle.get_upper_bounds()
+
+    def get_initial_conss(self, initconss):
+        '''
+        returns the constraints used in all fully corrective steps and records them
+        initconss - {0,1,2} to encode whether no/box/standard constraints shall be used
+        '''
+        conss = self.oracle.get_initial_conss(initconss)
+        self.trace.initconss = initconss
+        self.trace.initial_conss = [list(cons) for cons in conss]
+        return conss
+
+    def separate_point(self, point, precision, timelimit=None, mipgap=None):
+        '''
+        separates a given point up to a certain precision and records the result
+        point     - point to separate
+        precision - precision to decide whether a violated cut exists
+        timelimit - (optional) time limit of the separation in seconds (None if unlimited)
+        mipgap    - (optional) relative gap at which separation MIPs stop (None for the default
+                    gap of the solver)
+        '''
+        cut = self.oracle.separate_point(point, precision, timelimit, mipgap)
+        self.trace.separations.append((hash_vector(point, self.trace.digits), precision,
+                                       list(cut)))
+        return cut
+
+
+class RECORDINGPROBLEM:
+    '''
+    problem that forwards all calls to another problem and records its responses in a trace
+
+    class variables:
+    problem - problem whose responses are recorded
+    trace   - TRACE the responses are recorded in
+    '''
+
+    def __init__(self, problem, trace):
+        '''
+        initializes the problem
+        problem - problem whose responses are recorded
+        trace   - TRACE the responses are recorded in
+        '''
+        self.problem = problem
+        self.trace = trace
+
+    def add_cut(self, cut):
+        '''
+        adds cut to problem
+        cut - cut to be added
+        '''
+        self.trace.events.append(("add_cut", hash_vector(cut, self.trace.digits), numpy.nan, []))
+        self.problem.add_cut(cut)
+
+    def optimize(self):
+        '''
+        returns the optimal solution value of the problem
+        '''
+        value = self.problem.optimize()
+        self.trace.events.append(("optimize", "", value, []))
+        return value
+
+    def get_opt_solution(self):
+        '''
+        returns an optimal solution of the problem
+        '''
+        solution = self.problem.get_opt_solution()
+        self.trace.events.append(("solution", "", numpy.nan, list(solution)))
+        return solution
+
+
+class REPLAYORACLE:
+    '''
+    oracle that serves the responses recorded in a trace by the index of the call
+
+    class variables:
+    trace     - TRACE containing the responses
+    strict    - whether a divergence from the recorded run raises an error
+    ncalls    - number of calls of separate_point so far
+    ndiverged - number of calls whose point differs from the recorded point
+    '''
+
+    def __init__(self, trace, strict=True):
+        '''
+        initializes the oracle
+        trace  - TRACE containing the responses
+        strict - (optional) whether a divergence from the recorded run raises an error; otherwise,
+                 divergences are counted in ndiverged and the recorded responses are served anyway
+        '''
+        self.trace = trace
+        self.strict = strict
+        self.ncalls = 0
+        self.ndiverged = 0
+
+    def get_obj(self):
+        '''
+        returns objective vector
+        '''
+        return self.trace.obj
+
+    def get_inner_radius(self):
+        '''
+        returns radius of inner ball
+        '''
+        return self.trace.inner_radius
+
+    def get_standard_cuts(self):
+        '''
+        return standard cuts of problem
+        '''
+        if self.trace.standard_cuts is None:
+            raise RuntimeError("trace does not contain standard cuts")
+        return self.trace.standard_cuts
+
+    def get_upper_bounds(self):
+        '''
+        returns upper bounds on the variables (None if the trace does not contain any, e.g., since
+        it has been recorded before they were stored)
+        '''
+        return self.trace.upper_bounds
+
+    def get_initial_conss(self, initconss):
+        '''
+        returns the recorded constraints used in all fully corrective steps; for traces recorded
+        before they were stored, they are derived from the recorded upper bounds and standard
+        cuts (see get_initial_conss in oracles.py)
+        initconss - {0,1,2} to encode whether no/box/standard constraints shall be used
+        '''
+        if self.trace.initial_conss is None:
+            return get_initial_conss(self, initconss)
+        if self.trace.initconss != initconss:
+            raise RuntimeError("trace contains the initial constraints for initconss=%d, not %d"
+                               % (self.trace.initconss, initconss))
+        return self.trace.initial_conss
+
+    def separate_point(self, point, precision, timelimit=None, mipgap=None):
+        '''
+        returns the recorded cut of the next call
+        point     - point to separate
+        precision - precision to decide whether a violated cut exists
+        timelimit - (optional) time limit of the separation (not used)
+        mipgap    - (optional) relative gap of separation MIPs (not used)
+        '''
+        if self.ncalls >= len(self.trace.separations):
+            raise RuntimeError("trace contains only %d separation calls"
+                               % len(self.trace.separations))
+
+        pointhash, recprecision, cut = self.trace.separations[self.ncalls]
+        if pointhash != hash_vector(point, self.trace.digits) or recprecision != precision:
+            self.ndiverged += 1
+            if self.strict:
+                raise RuntimeError("replayed run diverged from trace at separation call %d"
+                                   % self.ncalls)
+        self.ncalls += 1
+
+        return list(cut)
+
+
+class REPLAYPROBLEM:
+    '''
+    problem that serves the responses recorded in a trace in the order of the calls
+
+    class variables:
+    trace     - TRACE containing the responses
+    strict    - whether a divergence from the recorded run raises an error
+    ncalls    - number of calls so far
+    ndiverged - number of calls that differ from the recorded calls
+    '''
+
+    def __init__(self, trace, strict=True):
+        '''
+        initializes the problem
+        trace  - TRACE containing the responses
+        strict - (optional) whether a divergence from the recorded run raises an error
+        '''
+        self.trace = trace
+        self.strict = strict
+        self.ncalls = 0
+        self.ndiverged = 0
+
+    def next_event(self, kind, cuthash=""):
+        '''
+        returns the next recorded event and checks whether it matches the current call
+        kind    - kind of the current call
+        cuthash - (optional) hash of the cut of the current call
+        '''
+        if self.ncalls >= len(self.trace.events):
+            raise RuntimeError("trace contains only %d calls of the problem"
+                               % len(self.trace.events))
+
+        event = self.trace.events[self.ncalls]
+        if event[0] != kind or event[1] != cuthash:
+            self.ndiverged += 1
+            if self.strict:
+                raise RuntimeError("replayed run diverged from trace at problem call %d "
+                                   "(recorded %s, called %s)" % (self.ncalls, event[0], kind))
+        self.ncalls += 1
+
+        return event
+
+    def add_cut(self, cut):
+        '''
+        checks that the cut has been added in the recorded run
+        cut - cut to be added
+        '''
+        self.next_event("add_cut", hash_vector(cut, self.trace.digits))
+
+    def optimize(self):
+        '''
+        returns the recorded optimal solution value of the problem
+        '''
+        return self.next_event("optimize")[2]
+
+    def get_opt_solution(self):
+        '''
+        returns the recorded optimal solution of the problem
+        '''
+        return list(self.next_event("solution")[3])